@@ -0,0 +1,5 @@
+"""Portable index bundle adapters for export and import."""
+
+from .jsonl_bundle import JsonlBundleReader, JsonlBundleWriter
+
+__all__ = ["JsonlBundleReader", "JsonlBundleWriter"]
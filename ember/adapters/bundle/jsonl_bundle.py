@@ -0,0 +1,328 @@
+"""Gzip-compressed JSON Lines implementation of the bundle ports.
+
+Layout, one JSON object per line:
+
+    {"format": "ember-index-bundle", "version": 1, ...header fields}
+    {"type": "file", "path": ..., "hash": ..., "size": ...}      (per file)
+    {"type": "chunk", "path": ..., "vector": <base64>, ...}      (per chunk)
+    {"type": "end", "files": N, "chunks": M}
+
+Records are written and read one at a time, so neither side holds the index
+in memory. Vectors are little-endian float32, or int8 with a per-vector
+scale (a quarter of the size, with negligible effect on cosine ranking).
+The trailer lets readers detect truncated downloads.
+"""
+
+import base64
+import binascii
+import gzip
+import json
+import os
+import struct
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from ember.domain.entities import Chunk
+from ember.ports.bundle import (
+    BUNDLE_FORMAT_VERSION,
+    VECTOR_ENCODINGS,
+    BundleFile,
+    BundleHeader,
+)
+
+FORMAT_NAME = "ember-index-bundle"
+
+
+def encode_vector(vector: list[float], encoding: str) -> tuple[str, float | None]:
+    """Encode a vector for a bundle record.
+
+    Args:
+        vector: Embedding vector.
+        encoding: "float32" or "int8".
+
+    Returns:
+        Tuple of (base64 payload, scale for int8 or None).
+    """
+    if encoding == "int8":
+        peak = max((abs(x) for x in vector), default=0.0)
+        scale = peak / 127 if peak > 0 else 1.0
+        quantized = [max(-127, min(127, round(x / scale))) for x in vector]
+        payload = struct.pack(f"<{len(vector)}b", *quantized)
+        return base64.b64encode(payload).decode("ascii"), scale
+    payload = struct.pack(f"<{len(vector)}f", *vector)
+    return base64.b64encode(payload).decode("ascii"), None
+
+
+def decode_vector(data: str, encoding: str, scale: float | None = None) -> list[float]:
+    """Decode a vector from a bundle record.
+
+    Args:
+        data: Base64 payload.
+        encoding: "float32" or "int8".
+        scale: Per-vector scale (int8 only).
+
+    Returns:
+        Embedding vector as floats.
+    """
+    payload = base64.b64decode(data)
+    if encoding == "int8":
+        values = struct.unpack(f"<{len(payload)}b", payload)
+        return [v * (scale or 1.0) for v in values]
+    return list(struct.unpack(f"<{len(payload) // 4}f", payload))
+
+
+class JsonlBundleWriter:
+    """Writes a bundle to a temporary file and moves it into place on close."""
+
+    def __init__(self, path: Path, compresslevel: int = 6) -> None:
+        """Initialize writer (the file is created by write_header).
+
+        Args:
+            path: Destination bundle path.
+            compresslevel: gzip compression level (1-9).
+        """
+        self.path = path
+        self._partial_path = path.with_name(path.name + ".partial")
+        self._compresslevel = compresslevel
+        self._stream: Any = None
+        self._encoding = "float32"
+        self._include_content = True
+        self._files = 0
+        self._chunks = 0
+
+    def _write(self, record: dict[str, Any]) -> None:
+        """Write one record as a JSON line."""
+        if self._stream is None:
+            raise RuntimeError("write_header() must be called first")
+        self._stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def write_header(self, header: BundleHeader) -> None:
+        """Create the bundle and write its header.
+
+        Args:
+            header: Bundle metadata.
+
+        Raises:
+            ValueError: If the vector encoding is not supported.
+        """
+        if header.vector_encoding not in VECTOR_ENCODINGS:
+            raise ValueError(f"Unsupported vector encoding: {header.vector_encoding}")
+        self._encoding = header.vector_encoding
+        self._include_content = header.include_content
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Stays open across write_* calls; close() or abort() closes it
+        self._stream = gzip.open(  # noqa: SIM115
+            self._partial_path, "wt", encoding="utf-8", compresslevel=self._compresslevel
+        )
+        self._write(
+            {
+                "format": FORMAT_NAME,
+                "version": header.format_version,
+                "model_fingerprint": header.model_fingerprint,
+                "tree_sha": header.tree_sha,
+                "sync_mode": header.sync_mode,
+                "vector_encoding": header.vector_encoding,
+                "include_content": header.include_content,
+                "created_at": header.created_at,
+            }
+        )
+
+    def write_file(self, file: BundleFile) -> None:
+        """Append a file record.
+
+        Args:
+            file: Indexed file state.
+        """
+        self._write(
+            {"type": "file", "path": file.path.as_posix(), "hash": file.file_hash, "size": file.size}
+        )
+        self._files += 1
+
+    def write_chunk(self, chunk: Chunk, embedding: list[float] | None) -> None:
+        """Append a chunk record.
+
+        Args:
+            chunk: Chunk to store (content is omitted if the header says so).
+            embedding: The chunk's vector, or None.
+        """
+        record: dict[str, Any] = {
+            "type": "chunk",
+            "path": chunk.path.as_posix(),
+            "lang": chunk.lang,
+            "symbol": chunk.symbol,
+            "start": chunk.start_line,
+            "end": chunk.end_line,
+            "content_hash": chunk.content_hash,
+            "file_hash": chunk.file_hash,
+            "tree_sha": chunk.tree_sha,
+            "rev": chunk.rev,
+            "vector": None,
+        }
+        if self._include_content:
+            record["content"] = chunk.content
+        if embedding is not None:
+            record["vector"], scale = encode_vector(embedding, self._encoding)
+            if scale is not None:
+                record["scale"] = scale
+        self._write(record)
+        self._chunks += 1
+
+    def close(self) -> int:
+        """Write the trailer and move the bundle into place.
+
+        Returns:
+            Size of the bundle in bytes.
+        """
+        self._write({"type": "end", "files": self._files, "chunks": self._chunks})
+        self._stream.close()
+        self._stream = None
+        os.replace(self._partial_path, self.path)
+        return self.path.stat().st_size
+
+    def abort(self) -> None:
+        """Discard a partially written bundle."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        self._partial_path.unlink(missing_ok=True)
+
+
+class JsonlBundleReader:
+    """Reads a bundle record by record."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize reader (the file is opened by read_header).
+
+        Args:
+            path: Bundle path.
+        """
+        self.path = path
+        self._stream: Any = None
+        self._header: BundleHeader | None = None
+        self._pending: dict[str, Any] | None = None
+        self._files = 0
+        self._chunks = 0
+
+    def _next_record(self) -> dict[str, Any] | None:
+        """Read the next record, or None at end of file.
+
+        Raises:
+            ValueError: If the bundle is not valid gzip-compressed JSON.
+        """
+        if self._pending is not None:
+            record, self._pending = self._pending, None
+            return record
+        try:
+            line = self._stream.readline()
+            return json.loads(line) if line else None
+        except (OSError, EOFError, zlib.error, json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ValueError(f"Corrupt bundle {self.path}: {e}") from e
+
+    def read_header(self) -> BundleHeader:
+        """Open the bundle and read its header.
+
+        Returns:
+            The bundle header.
+
+        Raises:
+            ValueError: If the file is not a bundle or its version is unsupported.
+        """
+        if self._header is not None:
+            return self._header
+
+        # Stays open while the iter_* methods stream records; close() closes it
+        self._stream = gzip.open(self.path, "rt", encoding="utf-8")  # noqa: SIM115
+        record = self._next_record()
+        if not record or record.get("format") != FORMAT_NAME:
+            raise ValueError(f"{self.path} is not an ember index bundle")
+        version = record.get("version")
+        if not isinstance(version, int) or version > BUNDLE_FORMAT_VERSION:
+            raise ValueError(
+                f"Bundle format version {version} is not supported "
+                f"(this ember reads up to version {BUNDLE_FORMAT_VERSION})"
+            )
+        encoding = record.get("vector_encoding", "float32")
+        if encoding not in VECTOR_ENCODINGS:
+            raise ValueError(f"Unsupported vector encoding in bundle: {encoding}")
+
+        self._header = BundleHeader(
+            format_version=version,
+            model_fingerprint=record["model_fingerprint"],
+            tree_sha=record["tree_sha"],
+            sync_mode=record.get("sync_mode", "worktree"),
+            vector_encoding=encoding,
+            include_content=record.get("include_content", True),
+            created_at=record.get("created_at", 0.0),
+        )
+        return self._header
+
+    def iter_files(self) -> Iterator[BundleFile]:
+        """Iterate over file records.
+
+        Yields:
+            Indexed file states.
+        """
+        self.read_header()
+        while (record := self._next_record()) is not None:
+            if record.get("type") != "file":
+                self._pending = record
+                return
+            self._files += 1
+            yield BundleFile(path=Path(record["path"]), file_hash=record["hash"], size=record["size"])
+
+    def iter_chunks(self) -> Iterator[tuple[Chunk, list[float] | None]]:
+        """Iterate over chunk records, skipping any unread file records.
+
+        Yields:
+            Tuples of (chunk with empty id and project_id, embedding or None).
+
+        Raises:
+            ValueError: If the bundle is corrupt or truncated.
+        """
+        header = self.read_header()
+        for _ in self.iter_files():
+            pass
+
+        while (record := self._next_record()) is not None:
+            kind = record.get("type")
+            if kind == "end":
+                if record.get("files") != self._files or record.get("chunks") != self._chunks:
+                    raise ValueError(f"Corrupt bundle {self.path}: record counts do not match")
+                return
+            if kind != "chunk":
+                raise ValueError(f"Corrupt bundle {self.path}: unexpected record {kind!r}")
+
+            try:
+                embedding = None
+                if record.get("vector") is not None:
+                    embedding = decode_vector(
+                        record["vector"], header.vector_encoding, record.get("scale")
+                    )
+                chunk = Chunk(
+                    id="",
+                    project_id="",
+                    path=Path(record["path"]),
+                    lang=record["lang"],
+                    symbol=record.get("symbol"),
+                    start_line=record["start"],
+                    end_line=record["end"],
+                    content=record.get("content", ""),
+                    content_hash=record["content_hash"],
+                    file_hash=record["file_hash"],
+                    tree_sha=record["tree_sha"],
+                    rev=record["rev"],
+                )
+            except (KeyError, TypeError, struct.error, binascii.Error) as e:
+                raise ValueError(f"Corrupt bundle {self.path}: bad chunk record ({e})") from e
+            self._chunks += 1
+            yield chunk, embedding
+
+        raise ValueError(f"Bundle {self.path} is truncated (missing end record)")
+
+    def close(self) -> None:
+        """Close the bundle."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
@@ -46,6 +46,9 @@ class DaemonEmbedderClient:
         batch_size: int = 32,
         daemon_timeout: int = 900,
         model_name: str | None = None,
+        backend: str = "torch",
+        quantize: bool = True,
+        workers: int = 1,
     ):
         """Initialize daemon client.
 
@@ -57,6 +60,9 @@ class DaemonEmbedderClient:
             batch_size: Batch size for fallback embedder
             daemon_timeout: Daemon idle timeout in seconds
             model_name: Embedding model preset or HuggingFace ID
+            backend: Inference backend ("torch" or "onnx")
+            quantize: Use int8 dynamic quantization (onnx backend only)
+            workers: Daemon embedding worker processes (used when auto-starting)
         """
         self.socket_path = socket_path or (Path.home() / ".ember" / "daemon.sock")
         self.fallback_enabled = fallback
@@ -65,6 +71,9 @@ class DaemonEmbedderClient:
         self.batch_size = batch_size
         self.daemon_timeout = daemon_timeout
         self.model_name = model_name
+        self.backend = backend
+        self.quantize = quantize
+        self.workers = workers
 
         # Lazy-loaded fallback embedder
         self._fallback_embedder: Embedder | None = None
@@ -117,6 +126,8 @@ class DaemonEmbedderClient:
             model_name=self.model_name,
             max_seq_length=self.max_seq_length,
             batch_size=self.batch_size,
+            backend=self.backend,
+            quantize=self.quantize,
         )
         return temp_embedder.fingerprint()
 
@@ -137,6 +148,8 @@ class DaemonEmbedderClient:
                 model_name=self.model_name,
                 max_seq_length=self.max_seq_length,
                 batch_size=self.batch_size,
+                backend=self.backend,
+                quantize=self.quantize,
             )
         return self._fallback_embedder
 
@@ -164,6 +177,9 @@ class DaemonEmbedderClient:
                 socket_path=self.socket_path,
                 idle_timeout=self.daemon_timeout,
                 model_name=self.model_name,
+                backend=self.backend,
+                quantize=self.quantize,
+                workers=self.workers,
             )
             self._daemon_start_attempted = True
             return lifecycle.ensure_running()
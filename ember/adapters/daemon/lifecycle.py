@@ -26,6 +26,12 @@ class DaemonLifecycle:
         log_file: Path | None = None,
         idle_timeout: int = 900,
         model_name: str | None = None,
+        backend: str = "torch",
+        quantize: bool = True,
+        workers: int = 1,
+        batch_size: int = 32,
+        max_seq_length: int | None = None,
+        threads: int = 0,
     ):
         """Initialize lifecycle manager.
 
@@ -35,6 +41,12 @@ class DaemonLifecycle:
             log_file: Path to log file (default: ~/.ember/daemon.log)
             idle_timeout: Daemon idle timeout in seconds
             model_name: Embedding model preset or HuggingFace ID
+            backend: Inference backend ("torch" or "onnx")
+            quantize: Use int8 dynamic quantization (onnx backend only)
+            workers: Embedding worker processes (1 = in-process, 0 = auto)
+            batch_size: Embedding batch size
+            max_seq_length: Token truncation length (None = model default)
+            threads: Intra-op inference threads (0 = library default)
         """
         ember_dir = Path.home() / ".ember"
         self.socket_path = socket_path or (ember_dir / "daemon.sock")
@@ -42,6 +54,12 @@ class DaemonLifecycle:
         self.log_file = log_file or (ember_dir / "daemon.log")
         self.idle_timeout = idle_timeout
         self.model_name = model_name
+        self.backend = backend
+        self.quantize = quantize
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_seq_length = max_seq_length
+        self.threads = threads
 
         # Ensure ember directory exists
         ember_dir.mkdir(parents=True, exist_ok=True)
@@ -310,6 +328,24 @@ class DaemonLifecycle:
         if self.model_name:
             cmd.extend(["--model", self.model_name])
 
+        # Add inference backend if not the default
+        if self.backend != "torch":
+            cmd.extend(["--backend", self.backend])
+            if not self.quantize:
+                cmd.append("--no-quantize")
+
+        # Add worker pool size if not the single in-process default
+        if self.workers != 1:
+            cmd.extend(["--workers", str(self.workers)])
+
+        # Add calibrated embedding settings if not the defaults
+        if self.batch_size != 32:
+            cmd.extend(["--batch-size", str(self.batch_size)])
+        if self.max_seq_length:
+            cmd.extend(["--max-seq-length", str(self.max_seq_length)])
+        if self.threads > 0:
+            cmd.extend(["--threads", str(self.threads)])
+
         try:
             if foreground:
                 return self._start_foreground(cmd)
@@ -12,6 +12,7 @@ import signal
 import socket
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -24,6 +25,7 @@ from ember.adapters.daemon.protocol import (
 )
 
 if TYPE_CHECKING:
+    from ember.core.hardware import WorkerLayout
     from ember.ports.embedders import Embedder
 
 logger = logging.getLogger(__name__)
@@ -39,6 +41,10 @@ class DaemonServer:
         model_name: str | None = None,
         model_max_seq_length: int | None = None,
         model_batch_size: int = 32,
+        model_backend: str = "torch",
+        model_quantize: bool = True,
+        model_workers: int = 1,
+        model_threads: int = 0,
     ):
         """Initialize daemon server.
 
@@ -48,12 +54,24 @@ class DaemonServer:
             model_name: Embedding model name (preset or HuggingFace ID)
             model_max_seq_length: Max sequence length for embedder
             model_batch_size: Batch size for embedder
+            model_backend: Inference backend ("torch" or "onnx")
+            model_quantize: Use int8 dynamic quantization (onnx backend only)
+            model_workers: Embedding worker processes (1 = load the model in
+                the daemon process, 0 = size the pool from the hardware)
+            model_threads: Intra-op threads for the in-process model
+                (0 = library default; pool workers size their own)
         """
         self.socket_path = socket_path
         self.idle_timeout = idle_timeout
         self.model_name = model_name
         self.model_max_seq_length = model_max_seq_length
         self.model_batch_size = model_batch_size
+        self.model_backend = model_backend
+        self.model_quantize = model_quantize
+        self.model_workers = model_workers
+        self.model_threads = model_threads
+        # Connections served concurrently (one per worker process)
+        self.max_concurrent_clients = 1
 
         self.embedder: Embedder | None = None
         self.server_socket: socket.socket | None = None
@@ -79,17 +97,63 @@ class DaemonServer:
         logger.info(f"Loading embedding model: {model_display}...")
         start = time.time()
 
-        self.embedder = create_embedder(
-            model_name=self.model_name,
-            max_seq_length=self.model_max_seq_length,
-            batch_size=self.model_batch_size,
-        )
+        layout = self._worker_layout()
+        if layout is not None and layout.workers > 1:
+            from ember.adapters.daemon.worker_pool import EmbeddingWorkerPool
+
+            self.embedder = EmbeddingWorkerPool(
+                workers=layout.workers,
+                threads_per_worker=layout.threads_per_worker,
+                model_name=self.model_name,
+                max_seq_length=self.model_max_seq_length,
+                batch_size=self.model_batch_size,
+                backend=self.model_backend,
+                quantize=self.model_quantize,
+            )
+            self.max_concurrent_clients = layout.workers
+        else:
+            from ember.adapters.local_models.runtime import apply_thread_limit
+
+            apply_thread_limit(self.model_threads, self.model_backend)
+            self.embedder = create_embedder(
+                model_name=self.model_name,
+                max_seq_length=self.model_max_seq_length,
+                batch_size=self.model_batch_size,
+                backend=self.model_backend,
+                quantize=self.model_quantize,
+            )
         # Force model loading now
         self.embedder.ensure_loaded()
 
         elapsed = time.time() - start
         logger.info(f"Model {self.embedder.name} loaded in {elapsed:.2f}s")
 
+    def _worker_layout(self) -> "WorkerLayout | None":
+        """Decide how many embedding worker processes to run.
+
+        Returns:
+            WorkerLayout, or None to load the model in the daemon process.
+        """
+        if self.model_workers == 1:
+            return None
+
+        from ember.adapters.local_models.registry import (
+            DEFAULT_MODEL,
+            MODEL_PRESETS,
+            resolve_model_name,
+        )
+        from ember.core.hardware import MODEL_MEMORY_GB, recommend_worker_layout
+
+        # Memory estimates are keyed by preset name
+        resolved = resolve_model_name(self.model_name) if self.model_name else DEFAULT_MODEL
+        preset = next((p for p in MODEL_MEMORY_GB if MODEL_PRESETS[p] == resolved), resolved)
+        layout = recommend_worker_layout(preset, workers=self.model_workers)
+        logger.info(
+            f"Embedding worker layout: {layout.workers} worker(s) x "
+            f"{layout.threads_per_worker} thread(s)"
+        )
+        return layout
+
     def create_socket(self) -> None:
         """Create and bind Unix socket.
 
@@ -252,12 +316,22 @@ class DaemonServer:
         logger.info("Daemon server started")
         self.running = True
 
+        # With a worker pool, serve clients concurrently so each can use a worker
+        client_executor = (
+            ThreadPoolExecutor(max_workers=self.max_concurrent_clients)
+            if self.max_concurrent_clients > 1
+            else None
+        )
+
         while self.running:
             try:
                 # Accept connection (with timeout to allow periodic checks)
                 try:
                     client_socket, _ = self.server_socket.accept()
-                    self.handle_client(client_socket)
+                    if client_executor is not None:
+                        client_executor.submit(self.handle_client, client_socket)
+                    else:
+                        self.handle_client(client_socket)
                 except TimeoutError:
                     # No connection, check idle timeout
                     if self.check_idle_timeout():
@@ -271,6 +345,8 @@ class DaemonServer:
                     # Add backoff to prevent tight loop on persistent errors
                     time.sleep(0.1)
 
+        if client_executor is not None:
+            client_executor.shutdown(wait=True)
         logger.info("Daemon server stopped")
 
     def cleanup(self) -> None:
@@ -281,8 +357,11 @@ class DaemonServer:
         if self.socket_path.exists():
             self.socket_path.unlink()
 
-        # Release model resources
+        # Release model resources (and stop worker processes, if any)
         if self.embedder is not None:
+            close = getattr(self.embedder, "close", None)
+            if close is not None:
+                close()
             self.embedder = None
             logger.debug("Released embedder model reference")
 
@@ -331,6 +410,42 @@ def main() -> None:
         default=None,
         help="Embedding model preset or HuggingFace ID",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["torch", "onnx"],
+        default="torch",
+        help="Inference backend",
+    )
+    parser.add_argument(
+        "--quantize",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Use int8 dynamic quantization (onnx backend only)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Embedding worker processes (1 = in-process, 0 = auto from hardware)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        help="Embedding batch size",
+    )
+    parser.add_argument(
+        "--max-seq-length",
+        type=int,
+        default=None,
+        help="Token truncation length (default: model default)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=0,
+        help="Intra-op inference threads (0 = library default)",
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -354,6 +469,12 @@ def main() -> None:
         socket_path=args.socket,
         idle_timeout=args.idle_timeout,
         model_name=args.model,
+        model_backend=args.backend,
+        model_quantize=args.quantize,
+        model_workers=args.workers,
+        model_batch_size=args.batch_size,
+        model_max_seq_length=args.max_seq_length,
+        model_threads=args.threads,
     )
     server.run()
 
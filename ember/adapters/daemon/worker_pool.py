@@ -0,0 +1,233 @@
+"""Multi-process embedding worker pool for the daemon.
+
+PyTorch intra-op threading scales poorly for the small batches produced while
+indexing, so a single model process leaves most cores of a large machine
+idle. The pool runs N worker processes, each holding its own model copy
+pinned to a fixed thread count. Large requests are split into contiguous
+shards that are embedded concurrently and reassembled in input order.
+
+Implements the Embedder protocol, so the daemon server can use it in place
+of a single embedder.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ember.ports.embedders import Embedder
+
+logger = logging.getLogger(__name__)
+
+# Smallest shard worth a round trip to another worker. Per-file requests
+# during sync carry tens of chunks, so shards must be small to spread them.
+MIN_SHARD_SIZE = 4
+
+# Per-process embedder, created by the worker initializer
+_worker_embedder: "Embedder | None" = None
+
+
+def _init_worker(
+    model_name: str | None,
+    max_seq_length: int | None,
+    batch_size: int,
+    backend: str,
+    quantize: bool,
+    threads: int,
+) -> None:
+    """Load the model inside a worker process with a fixed thread budget.
+
+    Args:
+        model_name: Embedding model preset or HuggingFace ID.
+        max_seq_length: Max sequence length for the embedder.
+        batch_size: Batch size for the embedder.
+        backend: Inference backend ("torch" or "onnx").
+        quantize: Use int8 dynamic quantization (onnx backend only).
+        threads: Intra-op threads for this worker.
+    """
+    global _worker_embedder
+
+    from ember.adapters.local_models.registry import create_embedder
+    from ember.adapters.local_models.runtime import apply_thread_limit
+
+    apply_thread_limit(threads, backend)
+
+    _worker_embedder = create_embedder(
+        model_name=model_name,
+        max_seq_length=max_seq_length,
+        batch_size=batch_size,
+        backend=backend,
+        quantize=quantize,
+    )
+    _worker_embedder.ensure_loaded()
+
+
+def _worker_ready() -> int:
+    """Report that the worker's model is loaded.
+
+    Returns:
+        Worker process ID.
+    """
+    if _worker_embedder is None:
+        raise RuntimeError("Worker model not loaded")
+    return os.getpid()
+
+
+def _worker_embed(texts: list[str]) -> list[list[float]]:
+    """Embed one shard inside a worker process.
+
+    Args:
+        texts: Texts to embed.
+
+    Returns:
+        Embeddings in input order.
+    """
+    if _worker_embedder is None:
+        raise RuntimeError("Worker model not loaded")
+    return _worker_embedder.embed_texts(texts)
+
+
+class EmbeddingWorkerPool:
+    """Embedder that fans batches out to a pool of model worker processes."""
+
+    def __init__(
+        self,
+        workers: int,
+        threads_per_worker: int,
+        model_name: str | None = None,
+        max_seq_length: int | None = None,
+        batch_size: int = 32,
+        backend: str = "torch",
+        quantize: bool = True,
+    ):
+        """Initialize the pool (workers start on ensure_loaded).
+
+        Args:
+            workers: Number of worker processes.
+            threads_per_worker: Intra-op threads per worker.
+            model_name: Embedding model preset or HuggingFace ID.
+            max_seq_length: Max sequence length for the embedders.
+            batch_size: Batch size for the embedders.
+            backend: Inference backend ("torch" or "onnx").
+            quantize: Use int8 dynamic quantization (onnx backend only).
+        """
+        from ember.adapters.local_models.registry import create_embedder
+
+        self.workers = max(1, workers)
+        self.threads_per_worker = max(1, threads_per_worker)
+        self.batch_size = batch_size
+        self._init_args = (
+            model_name,
+            max_seq_length,
+            batch_size,
+            backend,
+            quantize,
+            self.threads_per_worker,
+        )
+        # Unloaded embedder in this process for name/dim/fingerprint
+        self._reference = create_embedder(
+            model_name=model_name,
+            max_seq_length=max_seq_length,
+            batch_size=batch_size,
+            backend=backend,
+            quantize=quantize,
+        )
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def name(self) -> str:
+        """Model name."""
+        return self._reference.name
+
+    @property
+    def dim(self) -> int:
+        """Embedding dimension."""
+        return self._reference.dim
+
+    def fingerprint(self) -> str:
+        """Fingerprint of the model configuration (same as a single embedder)."""
+        return self._reference.fingerprint()
+
+    def ensure_loaded(self) -> None:
+        """Start all workers and wait until each has loaded its model.
+
+        Raises:
+            RuntimeError: If a worker fails to load the model.
+        """
+        if self._executor is not None:
+            return
+
+        # spawn: forking a process that may already hold torch/tokenizer
+        # thread pools is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=self._init_args,
+        )
+        try:
+            # One submission per worker makes the executor spawn them all
+            futures = [self._executor.submit(_worker_ready) for _ in range(self.workers)]
+            for future in futures:
+                future.result()
+        except Exception as e:
+            self.close()
+            raise RuntimeError(f"Failed to start embedding workers: {e}") from e
+
+        logger.info(
+            f"Started {self.workers} embedding worker(s) "
+            f"with {self.threads_per_worker} thread(s) each"
+        )
+
+    def _shard(self, texts: list[str]) -> list[list[str]]:
+        """Split texts into contiguous shards, one per worker at most.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Shards in input order; small inputs (e.g. queries) stay whole.
+        """
+        size = max(MIN_SHARD_SIZE, math.ceil(len(texts) / self.workers))
+        return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts across the worker pool.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Embeddings in input order.
+
+        Raises:
+            RuntimeError: If a worker fails or the pool has crashed.
+        """
+        if not texts:
+            return []
+
+        self.ensure_loaded()
+        assert self._executor is not None
+
+        try:
+            futures = [self._executor.submit(_worker_embed, shard) for shard in self._shard(texts)]
+            embeddings: list[list[float]] = []
+            for future in futures:
+                embeddings.extend(future.result())
+            return embeddings
+        except BrokenProcessPool as e:
+            # A worker died (e.g. OOM kill); restart the pool on next use
+            self.close()
+            raise RuntimeError(f"Embedding worker pool crashed: {e}") from e
+        except Exception as e:
+            raise RuntimeError(f"Failed to embed {len(texts)} texts: {e}") from e
+
+    def close(self) -> None:
+        """Shut down all worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -4,6 +4,10 @@ Implements the FileSystem port using the standard library pathlib.
 This is the default adapter for file system operations.
 """
 
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -28,6 +32,41 @@ class LocalFileSystem:
         """
         return path.read_bytes()
 
+    def size(self, path: Path) -> int:
+        """Get the size of a file without reading it.
+
+        Args:
+            path: Absolute path to file.
+
+        Returns:
+            File size in bytes.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+        """
+        return path.stat().st_size
+
+    @contextmanager
+    def map(self, path: Path) -> Iterator[bytes]:
+        """Map a file into memory for reading.
+
+        Args:
+            path: Absolute path to file.
+
+        Yields:
+            Read-only memory map of the file (empty bytes for an empty file,
+            which cannot be mapped).
+
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+        """
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped  # type: ignore[misc]
+
     def write(self, path: Path, content: bytes) -> None:
         """Write content to file.
 
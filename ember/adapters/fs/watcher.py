@@ -0,0 +1,289 @@
+"""File watcher adapters.
+
+Implements the FileWatcher port with Linux inotify (via ctypes, no extra
+dependencies) and a portable mtime-polling fallback.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Directories that never contain indexable changes
+DEFAULT_IGNORED_DIRS = frozenset({".git", ".ember"})
+
+# inotify(7) event masks
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher for a directory tree (Linux only).
+
+    inotify watches are per-directory, so every directory under the root is
+    registered up front and newly created directories are added as their
+    creation events arrive.
+    """
+
+    def __init__(self, root: Path, ignored_dirs: frozenset[str] = DEFAULT_IGNORED_DIRS) -> None:
+        """Initialize watcher and register watches for the whole tree.
+
+        Args:
+            root: Directory tree to watch.
+            ignored_dirs: Directory names to skip (at any depth).
+
+        Raises:
+            RuntimeError: If inotify is unavailable or the watch limit is hit.
+        """
+        if not sys.platform.startswith("linux"):
+            raise RuntimeError("inotify is only available on Linux")
+
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        try:
+            self._libc = ctypes.CDLL(libc_name, use_errno=True)
+            self._libc.inotify_init1  # noqa: B018 - probe for symbol
+        except (OSError, AttributeError) as e:
+            raise RuntimeError(f"inotify is not available: {e}") from e
+
+        self.root = root.resolve()
+        self.ignored_dirs = ignored_dirs
+        self._wd_to_dir: dict[int, Path] = {}
+
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise RuntimeError(f"inotify_init1 failed: {os.strerror(err)}")
+
+        try:
+            self._add_tree(self.root)
+        except RuntimeError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: Path) -> None:
+        """Register a single directory watch.
+
+        Raises:
+            RuntimeError: If the kernel watch limit is exhausted.
+        """
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise RuntimeError(
+                    "inotify watch limit reached "
+                    "(raise fs.inotify.max_user_watches or use polling)"
+                )
+            # Directory vanished or is unreadable - nothing to watch
+            logger.debug(f"Could not watch {directory}: {os.strerror(err)}")
+            return
+        self._wd_to_dir[wd] = directory
+
+    def _add_tree(self, top: Path) -> None:
+        """Register watches for a directory and all its subdirectories."""
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames if d not in self.ignored_dirs]
+            self._add_watch(Path(dirpath))
+
+    def _read_events(self) -> set[Path]:
+        """Drain all queued inotify events into a set of changed paths."""
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & _IN_Q_OVERFLOW:
+                    # Events were dropped - caller must treat everything as changed
+                    changed.add(self.root)
+                    continue
+                if mask & _IN_IGNORED:
+                    self._wd_to_dir.pop(wd, None)
+                    continue
+
+                directory = self._wd_to_dir.get(wd)
+                if directory is None:
+                    continue
+                if not raw_name:
+                    changed.add(directory)
+                    continue
+
+                name = os.fsdecode(raw_name)
+                if name in self.ignored_dirs:
+                    continue
+                path = directory / name
+                changed.add(path)
+
+                if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    # New directory (e.g. from checkout): watch it and report
+                    # files that may have been created before the watch existed
+                    self._add_tree(path)
+                    for dirpath, dirnames, filenames in os.walk(path):
+                        dirnames[:] = [d for d in dirnames if d not in self.ignored_dirs]
+                        changed.update(Path(dirpath) / f for f in filenames)
+        return changed
+
+    def wait_for_changes(self, timeout: float | None = None) -> set[Path]:
+        """Block until files change or the timeout elapses.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            Set of changed absolute paths (empty on timeout).
+        """
+        if self._fd < 0:
+            return set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        return self._read_events()
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._wd_to_dir.clear()
+
+
+class PollingWatcher:
+    """Portable watcher that detects changes by polling file mtimes and sizes.
+
+    Used where inotify is unavailable (macOS, Windows) or its watch limit
+    is too low for the repository.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        ignored_dirs: frozenset[str] = DEFAULT_IGNORED_DIRS,
+        interval: float = 1.0,
+    ) -> None:
+        """Initialize watcher and take the initial snapshot.
+
+        Args:
+            root: Directory tree to watch.
+            ignored_dirs: Directory names to skip (at any depth).
+            interval: Seconds between polls.
+        """
+        self.root = root.resolve()
+        self.ignored_dirs = ignored_dirs
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """Snapshot (mtime_ns, size) for every file under the root."""
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in self.ignored_dirs]
+            for name in filenames:
+                path = Path(dirpath) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _poll(self) -> set[Path]:
+        """Rescan and return paths that differ from the previous snapshot."""
+        current = self._scan()
+        previous = self._snapshot
+        self._snapshot = current
+        changed = {p for p, sig in current.items() if previous.get(p) != sig}
+        changed.update(p for p in previous if p not in current)
+        return changed
+
+    def wait_for_changes(self, timeout: float | None = None) -> set[Path]:
+        """Block until files change or the timeout elapses.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            Set of changed absolute paths (empty on timeout).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self._poll()
+            if changed:
+                return changed
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        """Release the snapshot."""
+        self._snapshot = {}
+
+
+def create_watcher(
+    root: Path,
+    ignored_dirs: frozenset[str] = DEFAULT_IGNORED_DIRS,
+    polling_interval: float = 1.0,
+) -> InotifyWatcher | PollingWatcher:
+    """Create the best available watcher for this platform.
+
+    Args:
+        root: Directory tree to watch.
+        ignored_dirs: Directory names to skip (at any depth).
+        polling_interval: Poll interval if falling back to polling.
+
+    Returns:
+        InotifyWatcher on Linux, PollingWatcher otherwise.
+    """
+    try:
+        return InotifyWatcher(root, ignored_dirs=ignored_dirs)
+    except RuntimeError as e:
+        logger.info(f"Using polling file watcher: {e}")
+        return PollingWatcher(root, ignored_dirs=ignored_dirs, interval=polling_interval)
@@ -0,0 +1,103 @@
+"""Code-aware tokenization for full-text search.
+
+FTS5 tokenizers cannot be written in Python, so code-aware tokenization is
+done around a stock tokenizer instead. Identifiers are kept whole by
+treating "_" as a token character, and the parts of every compound
+identifier (camelCase, snake_case, digit boundaries) are stored in an extra
+indexed column, so `getUserById`, `get_user_by_id` and `user` all find each
+other. Stemming is not applied, since it mangles identifiers.
+"""
+
+import re
+
+# FTS5 tokenizer of each full-text search mode
+FTS_TOKENIZERS = {
+    "code": "unicode61 tokenchars '_'",
+    "porter": "porter unicode61",
+}
+
+# Identifiers as FTS5 tokenizes them in code mode
+_IDENTIFIER = re.compile(r"[A-Za-z0-9_]+")
+
+# Parts of an identifier segment: acronyms, capitalised or lowercase words, numbers
+_PART = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def split_identifier(identifier: str) -> list[str]:
+    """Split an identifier at snake_case, camelCase and digit boundaries.
+
+    Args:
+        identifier: Identifier such as "getHTTPResponse2_async".
+
+    Returns:
+        Lowercase parts, e.g. ["get", "http", "response", "2", "async"].
+    """
+    return [
+        part.lower()
+        for segment in identifier.split("_")
+        for part in _PART.findall(segment)
+    ]
+
+
+def identifier_terms(text: str) -> str:
+    """Get the parts of every compound identifier in a text.
+
+    Args:
+        text: Text to index, usually code.
+
+    Returns:
+        One line per occurrence of a compound identifier (or one with
+        leading or trailing underscores), listing its parts in order so
+        phrase queries on them match; empty if there are none.
+    """
+    lines = []
+    for match in _IDENTIFIER.finditer(text):
+        identifier = match.group()
+        terms = " ".join(split_identifier(identifier))
+        if terms and terms != identifier.lower():
+            lines.append(terms)
+    return "\n".join(lines)
+
+
+def _expand_identifier(match: re.Match[str]) -> str:
+    """Expand a compound identifier to also match its parts.
+
+    Args:
+        match: Identifier matched in a query.
+
+    Returns:
+        FTS5 expression matching the identifier itself or its parts in order.
+    """
+    identifier = match.group()
+    if match.string.startswith("*", match.end()):
+        return identifier  # Prefix query
+    if match.string[: match.start()].rstrip().endswith(":"):
+        return identifier  # Column filter, e.g. symbol:getUser
+    terms = " ".join(split_identifier(identifier))
+    if not terms or terms == identifier.lower():
+        return identifier
+    return f'({identifier} OR "{terms}")'
+
+
+def expand_query(query: str) -> str:
+    """Rewrite an FTS5 query so compound identifiers match in any style.
+
+    Outside quoted phrases, each compound identifier matches either itself
+    or its parts as a phrase, which ranks exact matches highest. Inside
+    phrases it is replaced by its parts.
+
+    Args:
+        query: FTS5 query.
+
+    Returns:
+        Query for a code-mode index.
+    """
+    segments = query.split('"')
+    for index, segment in enumerate(segments):
+        if index % 2 == 0:
+            segments[index] = _IDENTIFIER.sub(_expand_identifier, segment)
+        else:
+            segments[index] = _IDENTIFIER.sub(
+                lambda m: " ".join(split_identifier(m.group())) or m.group(), segment
+            )
+    return '"'.join(segments)
@@ -3,6 +3,10 @@
 import sqlite3
 from pathlib import Path
 
+from ember.adapters.fts.code_tokens import expand_query
+from ember.adapters.sqlite.connection import get_manager
+from ember.adapters.sqlite.schema import get_fts_tokenizer
+
 
 class SQLiteFTS:
     """SQLite FTS5 implementation of TextSearch for BM25-style full-text search.
@@ -10,6 +14,9 @@ class SQLiteFTS:
     This adapter uses the FTS5 virtual table 'chunk_text' which is automatically
     kept in sync with the 'chunks' table via triggers. Therefore, the add() method
     is a no-op - chunks are indexed automatically when added to chunks table.
+
+    In the database's "code" mode, queries are expanded so compound
+    identifiers also match their parts (see ember.adapters.fts.code_tokens).
     """
 
     def __init__(self, db_path: Path) -> None:
@@ -19,26 +26,26 @@ class SQLiteFTS:
             db_path: Path to SQLite database file.
         """
         self.db_path = db_path
+        self._manager = get_manager(db_path)
         self._conn: sqlite3.Connection | None = None
+        self._tokenizer: str | None = None
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection.
 
-        Reuses an existing connection if available, otherwise creates a new one.
-        Uses check_same_thread=False to allow use from different threads, which
-        is required for interactive search where queries run in a thread executor.
+        Checks a read-only connection out of the database's reader pool.
 
         Returns:
             SQLite connection object.
         """
         if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn = self._manager.acquire_reader()
         return self._conn
 
     def close(self) -> None:
-        """Close the database connection if open."""
+        """Release the database connection if held."""
         if self._conn is not None:
-            self._conn.close()
+            self._manager.release(self._conn)
             self._conn = None
 
     def __enter__(self) -> "SQLiteFTS":
@@ -65,7 +72,11 @@ class SQLiteFTS:
         pass
 
     def query(
-        self, q: str, topk: int = 100, path_filter: str | None = None
+        self,
+        q: str,
+        topk: int = 100,
+        path_filter: str | None = None,
+        ref: str | None = None,
     ) -> list[tuple[str, float]]:
         """Query the FTS5 index using SQLite full-text search.
 
@@ -73,6 +84,7 @@ class SQLiteFTS:
             q: Query string (supports FTS5 query syntax like AND, OR, NEAR, quotes).
             topk: Maximum number of results to return.
             path_filter: Optional glob pattern to filter results by path.
+            ref: Optional indexed ref to search instead of the live index.
 
         Returns:
             List of (chunk_id, score) tuples, sorted by relevance (descending).
@@ -81,39 +93,47 @@ class SQLiteFTS:
         conn = self._get_connection()
         cursor = conn.cursor()
 
+        if self._tokenizer is None:
+            self._tokenizer = get_fts_tokenizer(conn)
+        if self._tokenizer == "code":
+            q = expand_query(q)
+
         # Query FTS5 table and join with chunks to get chunk_id and score
         # FTS5's rank is negative (closer to 0 = better), so we negate it
         # to get a positive score where higher = more relevant
-        # Add path filtering if specified
-        if path_filter:
-            cursor.execute(
-                """
+        if ref is None:
+            sql = """
                 SELECT
                     c.chunk_id,
                     -rank AS score
                 FROM chunk_text
                 JOIN chunks c ON chunk_text.rowid = c.id
                 WHERE chunk_text MATCH ?
-                  AND c.path GLOB ?
-                ORDER BY rank
-                LIMIT ?
-                """,
-                (q, path_filter, topk),
-            )
+                  AND c.live = 1
+            """
+            params: list[str | int] = [q]
         else:
-            cursor.execute(
-                """
+            # A ref contains the chunks of the file versions recorded for it
+            sql = """
                 SELECT
                     c.chunk_id,
                     -rank AS score
                 FROM chunk_text
                 JOIN chunks c ON chunk_text.rowid = c.id
+                JOIN ref_files rf
+                  ON rf.ref = ? AND rf.path = c.path AND rf.file_hash = c.file_hash
                 WHERE chunk_text MATCH ?
-                ORDER BY rank
-                LIMIT ?
-                """,
-                (q, topk),
-            )
+            """
+            params = [ref, q]
+
+        # Add path filtering if specified
+        if path_filter:
+            sql += " AND c.path GLOB ?"
+            params.append(path_filter)
+
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(topk)
+        cursor.execute(sql, params)
 
         rows = cursor.fetchall()
         results = []
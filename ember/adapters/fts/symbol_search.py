@@ -0,0 +1,268 @@
+"""SQLite adapter implementing SymbolSearch for exact, prefix and fuzzy symbol lookup.
+
+The symbol column of the chunk_text FTS5 table indexes every name in
+chunks.symbol, including each name of a packed chunk ("a, b"), so exact and
+prefix lookups are single index probes. Candidates are verified against the
+stored names, since FTS5 matching ignores case (and stems in porter mode).
+Porter mode stems prefix queries too ("userrepository*" becomes
+"userrepositori*"), so prefix lookups there scan chunks.symbol instead.
+Fuzzy matching compares the query with every distinct symbol name, so it
+only runs when nothing matches exactly or by prefix.
+"""
+
+import difflib
+import sqlite3
+from pathlib import Path
+
+from ember.adapters.sqlite.connection import get_manager
+from ember.adapters.sqlite.schema import get_fts_tokenizer
+
+# Scores of the match kinds; see SymbolSearch.lookup
+EXACT_CASE_SCORE = 3.0
+EXACT_SCORE = 2.0
+PREFIX_SCORE = 1.0
+
+# Scale of fuzzy similarity, keeping fuzzy matches below prefix matches
+FUZZY_SCALE = 0.9
+
+# Lowest similarity ratio (0-1) of a fuzzy match
+FUZZY_CUTOFF = 0.75
+
+# Candidates fetched per requested result for prefix lookups
+PREFIX_POOL_FACTOR = 10
+
+# Separator between the names of a packed chunk's symbol
+SYMBOL_SEPARATOR = ", "
+
+
+def score_symbol(name: str, symbol: str) -> float:
+    """Score how well a chunk's symbol matches a name exactly or by prefix.
+
+    Args:
+        name: Name looked up.
+        symbol: Symbol of a chunk, possibly several packed names.
+
+    Returns:
+        Score of the best matching name (0.0 if none matches). Among prefix
+        matches, shorter completions score higher.
+    """
+    best = 0.0
+    lowered = name.lower()
+    for candidate in symbol.split(SYMBOL_SEPARATOR):
+        if candidate == name:
+            return EXACT_CASE_SCORE
+        if candidate.lower() == lowered:
+            best = max(best, EXACT_SCORE)
+        elif candidate.lower().startswith(lowered):
+            best = max(best, PREFIX_SCORE + 0.5 * len(name) / len(candidate))
+    return best
+
+
+class SQLiteSymbolSearch:
+    """SQLite implementation of SymbolSearch over the full-text index."""
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize symbol search adapter.
+
+        Args:
+            db_path: Path to SQLite database file.
+        """
+        self.db_path = db_path
+        self._manager = get_manager(db_path)
+        self._conn: sqlite3.Connection | None = None
+        self._tokenizer: str | None = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a database connection.
+
+        Checks a read-only connection out of the database's reader pool.
+
+        Returns:
+            SQLite connection object.
+        """
+        if self._conn is None:
+            self._conn = self._manager.acquire_reader()
+        return self._conn
+
+    def close(self) -> None:
+        """Release the database connection if held."""
+        if self._conn is not None:
+            self._manager.release(self._conn)
+            self._conn = None
+
+    def __enter__(self) -> "SQLiteSymbolSearch":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Exit context manager, closing the database connection."""
+        self.close()
+        return False
+
+    def lookup(
+        self,
+        name: str,
+        topk: int = 100,
+        path_filter: str | None = None,
+        ref: str | None = None,
+        prefix: bool = True,
+        fuzzy: bool = True,
+    ) -> list[tuple[str, float]]:
+        """Find the chunks whose symbol matches a name.
+
+        Args:
+            name: Symbol name to look up.
+            topk: Maximum number of results to return.
+            path_filter: Optional glob pattern to filter results by path.
+            ref: Optional indexed ref to search instead of the live index.
+            prefix: Also match symbols starting with the name.
+            fuzzy: If nothing matches exactly or by prefix, match similar names.
+
+        Returns:
+            List of (chunk_id, score) tuples, sorted by score (descending),
+            then by path and line.
+        """
+        phrase = '"' + name.replace('"', '""') + '"'
+        rows = self._candidates(f"symbol : {phrase}", path_filter, ref)
+        if prefix:
+            rows += self._prefix_candidates(
+                name, phrase, path_filter, ref, limit=topk * PREFIX_POOL_FACTOR
+            )
+
+        scored: dict[str, tuple[float, str, int]] = {}
+        for chunk_id, symbol, path, start_line in rows:
+            score = score_symbol(name, symbol)
+            if score >= (PREFIX_SCORE if prefix else EXACT_SCORE):
+                scored[chunk_id] = (score, path, start_line)
+
+        if not scored and fuzzy:
+            scored = self._fuzzy(name, path_filter, ref)
+
+        ranked = sorted(scored.items(), key=lambda item: (-item[1][0], item[1][1], item[1][2]))
+        return [(chunk_id, score) for chunk_id, (score, _, _) in ranked[:topk]]
+
+    def _scope(self, path_filter: str | None, ref: str | None) -> tuple[str, list[str]]:
+        """Build the SQL selecting the chunks of the live index or a ref.
+
+        Args:
+            path_filter: Optional glob pattern to filter chunks by path.
+            ref: Optional indexed ref to search instead of the live index.
+
+        Returns:
+            JOIN and WHERE clauses over chunks aliased c, and their parameters.
+        """
+        params: list[str] = []
+        if ref is None:
+            sql = " WHERE c.live = 1"
+        else:
+            # A ref contains the chunks of the file versions recorded for it
+            sql = """
+                JOIN ref_files rf
+                  ON rf.ref = ? AND rf.path = c.path AND rf.file_hash = c.file_hash
+                WHERE 1 = 1
+            """
+            params.append(ref)
+        if path_filter:
+            sql += " AND c.path GLOB ?"
+            params.append(path_filter)
+        return sql, params
+
+    def _candidates(
+        self, match: str, path_filter: str | None, ref: str | None, limit: int = -1
+    ) -> list[tuple[str, str, str, int]]:
+        """Find chunks whose symbol matches an FTS5 expression.
+
+        Args:
+            match: FTS5 expression over the symbol column.
+            path_filter: Optional glob pattern to filter chunks by path.
+            ref: Optional indexed ref to search instead of the live index.
+            limit: Maximum number of rows (-1 for no limit).
+
+        Returns:
+            (chunk_id, symbol, path, start_line) rows.
+        """
+        scope, params = self._scope(path_filter, ref)
+        sql = f"""
+            SELECT c.chunk_id, c.symbol, c.path, c.start_line
+            FROM chunk_text
+            JOIN chunks c ON chunk_text.rowid = c.id
+            {scope} AND chunk_text MATCH ? AND c.symbol IS NOT NULL
+            LIMIT ?
+        """
+        return self._get_connection().execute(sql, [*params, match, limit]).fetchall()
+
+    def _prefix_candidates(
+        self, name: str, phrase: str, path_filter: str | None, ref: str | None, limit: int
+    ) -> list[tuple[str, str, str, int]]:
+        """Find chunks with a symbol name starting with a name.
+
+        Args:
+            name: Name looked up.
+            phrase: Name quoted as an FTS5 phrase.
+            path_filter: Optional glob pattern to filter chunks by path.
+            ref: Optional indexed ref to search instead of the live index.
+            limit: Maximum number of rows.
+
+        Returns:
+            (chunk_id, symbol, path, start_line) rows.
+        """
+        conn = self._get_connection()
+        if self._tokenizer is None:
+            self._tokenizer = get_fts_tokenizer(conn)
+        if self._tokenizer == "code":
+            return self._candidates(f"symbol : {phrase} *", path_filter, ref, limit=limit)
+
+        # LIKE ignores ASCII case, like the full-text index
+        escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        scope, params = self._scope(path_filter, ref)
+        sql = f"""
+            SELECT c.chunk_id, c.symbol, c.path, c.start_line
+            FROM chunks c
+            {scope} AND (c.symbol LIKE ? ESCAPE '\\' OR c.symbol LIKE ? ESCAPE '\\')
+            LIMIT ?
+        """
+        patterns = [f"{escaped}%", f"%{SYMBOL_SEPARATOR}{escaped}%"]
+        return conn.execute(sql, [*params, *patterns, limit]).fetchall()
+
+    def _fuzzy(
+        self, name: str, path_filter: str | None, ref: str | None
+    ) -> dict[str, tuple[float, str, int]]:
+        """Find chunks whose symbol names are similar to a name.
+
+        Args:
+            name: Name looked up.
+            path_filter: Optional glob pattern to filter chunks by path.
+            ref: Optional indexed ref to search instead of the live index.
+
+        Returns:
+            (score, path, start_line) per matching chunk ID.
+        """
+        scope, params = self._scope(path_filter, ref)
+        rows = self._get_connection().execute(
+            f"""
+            SELECT c.chunk_id, c.symbol, c.path, c.start_line
+            FROM chunks c
+            {scope} AND c.symbol IS NOT NULL
+            """,
+            params,
+        ).fetchall()
+
+        by_name: dict[str, list[tuple[str, str, int]]] = {}
+        for chunk_id, symbol, path, start_line in rows:
+            for candidate in symbol.split(SYMBOL_SEPARATOR):
+                by_name.setdefault(candidate.lower(), []).append((chunk_id, path, start_line))
+        if not by_name:
+            return {}
+
+        lowered = name.lower()
+        matcher = difflib.SequenceMatcher(b=lowered)
+        scored: dict[str, tuple[float, str, int]] = {}
+        for candidate in difflib.get_close_matches(
+            lowered, by_name, n=len(by_name), cutoff=FUZZY_CUTOFF
+        ):
+            matcher.set_seq1(candidate)
+            score = FUZZY_SCALE * matcher.ratio()
+            for chunk_id, path, start_line in by_name[candidate]:
+                if score > scored.get(chunk_id, (0.0,))[0]:
+                    scored[chunk_id] = (score, path, start_line)
+        return scored
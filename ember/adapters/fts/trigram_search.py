@@ -0,0 +1,260 @@
+"""SQLite trigram adapter implementing LiteralSearch for substring and regex search.
+
+FTS5 word tokens cannot match partial identifiers or fragments such as
+"retry_after" inside "max_retry_after_s" or "/v2/users". The optional
+chunk_trigrams table indexes every three-character sequence of chunk content
+instead, so candidates containing all the trigrams of a substring, or of the
+literal parts of a regular expression, are found without scanning the chunks.
+Candidates are then verified against the exact pattern. Without the table, or
+for patterns with no literal of three characters, chunks are scanned.
+"""
+
+import re
+import sqlite3
+from pathlib import Path
+
+from ember.adapters.sqlite.connection import get_manager
+from ember.adapters.sqlite.schema import has_trigram_index
+
+# Shortest literal the trigram index can look up
+MIN_TRIGRAM_LITERAL = 3
+
+# Quantifier giving the preceding atom a minimum count, e.g. {2,5}
+_REPEAT = re.compile(r"\{(\d*)(?:,\d*)?\}")
+
+
+def _skip_class(pattern: str, start: int) -> int:
+    """Find the end of a character class.
+
+    Args:
+        pattern: Regular expression.
+        start: Index of the opening "[".
+
+    Returns:
+        Index just past the closing "]".
+    """
+    i = start + 1
+    if pattern.startswith("^", i):
+        i += 1
+    if pattern.startswith("]", i):
+        i += 1  # A leading "]" is a literal
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def required_literals(pattern: str) -> list[str]:
+    """Extract substrings every match of a regular expression must contain.
+
+    Only literal runs outside groups and alternations are used, and any
+    top-level alternation gives up, so the result is conservative: an
+    empty list means the expression cannot be prefiltered.
+
+    Args:
+        pattern: Python regular expression.
+
+    Returns:
+        Literal substrings of at least MIN_TRIGRAM_LITERAL characters.
+
+    Raises:
+        re.error: If the pattern is not a valid expression.
+    """
+    if re.compile(pattern).flags & re.VERBOSE:
+        return []  # Whitespace and comments are not literal
+
+    literals: list[str] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if len(run) >= MIN_TRIGRAM_LITERAL:
+            literals.append("".join(run))
+        run.clear()
+
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            if escaped and not escaped.isalnum() and depth == 0:
+                run.append(escaped)  # Escaped punctuation is literal
+            elif not escaped or escaped.isalnum():
+                flush()  # Character classes, anchors and control escapes
+            i += 2
+            continue
+        if char == "[":
+            flush()
+            i = _skip_class(pattern, i)
+            continue
+        if char == "{":
+            repeat = _REPEAT.match(pattern, i)
+            if repeat:
+                if depth == 0 and run and repeat.group(1) in ("", "0"):
+                    run.pop()  # The repeated atom is optional
+                flush()
+                i = repeat.end()
+                continue
+        if char == "(":
+            flush()
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|":
+            if depth == 0:
+                return []
+        elif char in "*?":
+            if depth == 0 and run:
+                run.pop()  # The repeated atom is optional
+            flush()
+        elif char in "+.^$":
+            flush()
+        elif depth == 0:
+            run.append(char)
+        i += 1
+    flush()
+    return literals
+
+
+def _phrase(literal: str) -> str:
+    """Quote a literal as an FTS5 phrase.
+
+    Args:
+        literal: Substring to look up.
+
+    Returns:
+        FTS5 string literal matching the substring.
+    """
+    return '"' + literal.replace('"', '""') + '"'
+
+
+class SQLiteTrigramSearch:
+    """SQLite implementation of LiteralSearch, prefiltered by a trigram index.
+
+    The chunk_trigrams table is kept in sync with the chunks table by
+    triggers, like chunk_text, when the index was created with it (see
+    index.trigram_index and `ember rebuild-fts`).
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize trigram search adapter.
+
+        Args:
+            db_path: Path to SQLite database file.
+        """
+        self.db_path = db_path
+        self._manager = get_manager(db_path)
+        self._conn: sqlite3.Connection | None = None
+        self._has_index: bool | None = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a database connection.
+
+        Checks a read-only connection out of the database's reader pool.
+
+        Returns:
+            SQLite connection object.
+        """
+        if self._conn is None:
+            self._conn = self._manager.acquire_reader()
+        return self._conn
+
+    def close(self) -> None:
+        """Release the database connection if held."""
+        if self._conn is not None:
+            self._manager.release(self._conn)
+            self._conn = None
+
+    def __enter__(self) -> "SQLiteTrigramSearch":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Exit context manager, closing the database connection."""
+        self.close()
+        return False
+
+    def has_index(self) -> bool:
+        """Check whether the database has a trigram index.
+
+        Returns:
+            True if the chunk_trigrams table exists.
+        """
+        if self._has_index is None:
+            self._has_index = has_trigram_index(self._get_connection())
+        return self._has_index
+
+    def match(
+        self,
+        pattern: str,
+        regex: bool = False,
+        topk: int = 100,
+        path_filter: str | None = None,
+        ref: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """Find the chunks whose content contains a pattern.
+
+        Literal matches are case-sensitive; regular expressions follow Python
+        syntax, so use (?i) for case-insensitive matching.
+
+        Args:
+            pattern: Substring to find, or a regular expression if regex is set.
+            regex: Treat pattern as a Python regular expression.
+            topk: Maximum number of results to return.
+            path_filter: Optional glob pattern to filter results by path.
+            ref: Optional indexed ref to search instead of the live index.
+
+        Returns:
+            List of (chunk_id, number of matches) tuples, most matches first,
+            then by path and line.
+
+        Raises:
+            re.error: If regex is set and pattern is not a valid expression.
+        """
+        compiled = re.compile(pattern) if regex else None
+        literals = required_literals(pattern) if regex else [pattern]
+        literals = [lit for lit in literals if len(lit) >= MIN_TRIGRAM_LITERAL]
+        prefilter = bool(literals) and self.has_index()
+
+        params: list[str] = []
+        if prefilter:
+            sql = """
+                SELECT c.chunk_id, c.content, c.path, c.start_line
+                FROM chunk_trigrams
+                JOIN chunks c ON chunk_trigrams.rowid = c.id
+            """
+        else:
+            sql = "SELECT c.chunk_id, c.content, c.path, c.start_line FROM chunks c"
+
+        if ref is None:
+            sql += " WHERE c.live = 1"
+        else:
+            # A ref contains the chunks of the file versions recorded for it
+            sql += """
+                JOIN ref_files rf
+                  ON rf.ref = ? AND rf.path = c.path AND rf.file_hash = c.file_hash
+                WHERE 1 = 1
+            """
+            params.append(ref)
+
+        if prefilter:
+            sql += " AND chunk_trigrams MATCH ?"
+            params.append(" AND ".join(_phrase(lit) for lit in literals))
+        elif not regex:
+            sql += " AND instr(c.content, ?) > 0"
+            params.append(pattern)
+
+        if path_filter:
+            sql += " AND c.path GLOB ?"
+            params.append(path_filter)
+
+        matches = []
+        for chunk_id, content, path, start_line in self._get_connection().execute(sql, params):
+            if compiled is not None:
+                count = sum(1 for _ in compiled.finditer(content))
+            else:
+                count = content.count(pattern)
+            if count:
+                matches.append((count, path, start_line, chunk_id))
+
+        matches.sort(key=lambda m: (-m[0], m[1], m[2]))
+        return [(chunk_id, float(count)) for count, _, _, chunk_id in matches[:topk]]
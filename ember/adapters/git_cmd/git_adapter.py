@@ -2,6 +2,7 @@
 
 import logging
 import subprocess
+import threading
 from pathlib import Path
 
 from ember.ports.vcs import FileStatus
@@ -56,6 +57,100 @@ def _parse_status_code(parts: list[str]) -> tuple[str, Path] | None:
     return None
 
 
+class _CatFileBatch:
+    """Long-lived ``git cat-file --batch`` process for reading blobs.
+
+    Spawning ``git show`` once per file dominates rev/staged sync time on
+    large repositories. This keeps a single cat-file process open and
+    streams object requests through its stdin/stdout pipes instead.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        """Initialize the batch reader (process is started lazily).
+
+        Args:
+            repo_root: Absolute path to git repository root.
+        """
+        self.repo_root = repo_root
+        self._process: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_process(self) -> subprocess.Popen[bytes]:
+        """Start the cat-file process if it is not already running."""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "-C", str(self.repo_root), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    def read(self, object_name: str) -> bytes | None:
+        """Read a blob by object name (e.g. ``<tree-ish>:<path>`` or an oid).
+
+        Args:
+            object_name: Any object name accepted by ``git cat-file``.
+                Must not contain newlines.
+
+        Returns:
+            Blob content, or None if the object is missing or is not a blob.
+
+        Raises:
+            RuntimeError: If the cat-file process dies unexpectedly.
+        """
+        with self._lock:
+            process = self._ensure_process()
+            assert process.stdin is not None and process.stdout is not None
+            try:
+                process.stdin.write(object_name.encode("utf-8") + b"\n")
+                process.stdin.flush()
+                header = process.stdout.readline()
+            except OSError as e:
+                self._terminate()
+                raise RuntimeError(f"git cat-file --batch failed: {e}") from e
+
+            if not header:
+                self._terminate()
+                raise RuntimeError("git cat-file --batch exited unexpectedly")
+
+            # "<oid> <type> <size>" on success, "<name> missing" (or
+            # "<name> ambiguous") when the object can't be resolved
+            fields = header.rstrip(b"\n").rsplit(b" ", 2)
+            if len(fields) != 3 or not fields[2].isdigit():
+                return None
+
+            size = int(fields[2])
+            content = process.stdout.read(size)
+            process.stdout.read(1)  # Trailing LF after content
+            if len(content) != size:
+                self._terminate()
+                raise RuntimeError("git cat-file --batch returned truncated output")
+
+            return content if fields[1] == b"blob" else None
+
+    def _terminate(self) -> None:
+        """Stop the cat-file process without waiting for more output."""
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout:
+                process.stdout.close()
+
+    def close(self) -> None:
+        """Close the cat-file process if running."""
+        with self._lock:
+            self._terminate()
+
+
 class GitAdapter:
     """Git VCS adapter using subprocess calls to git CLI."""
 
@@ -72,6 +167,21 @@ class GitAdapter:
         # Verify this is a git repo
         if not self._is_git_repo():
             raise RuntimeError(f"Not a git repository: {self.repo_root}")
+        # Persistent blob reader shared by all get_file_content() calls
+        self._blob_reader = _CatFileBatch(self.repo_root)
+
+    def close(self) -> None:
+        """Stop the persistent cat-file process if running."""
+        self._blob_reader.close()
+
+    def __enter__(self) -> "GitAdapter":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Exit context manager, stopping the cat-file process."""
+        self.close()
+        return False
 
     def _is_git_repo(self) -> bool:
         """Check if repo_root is a git repository."""
@@ -247,6 +357,25 @@ class GitAdapter:
                     "'git reset' to restore a clean state."
                 ) from restoration_error
 
+    def get_current_branch(self) -> str | None:
+        """Get the name of the checked-out branch.
+
+        Returns:
+            Short branch name, or None if HEAD is detached.
+
+        Raises:
+            RuntimeError: If not a git repository.
+        """
+        try:
+            result = self._run_git(["symbolic-ref", "--quiet", "--short", "HEAD"])
+        except subprocess.CalledProcessError as e:
+            # Exit code 1 without output means HEAD is detached
+            if e.returncode == 1 and not e.stderr:
+                return None
+            error_msg = self._format_git_error(e, "Failed to read current branch")
+            raise RuntimeError(error_msg) from e
+        return result.stdout.decode("utf-8", errors="replace").strip() or None
+
     def diff_files(
         self,
         from_sha: str | None,
@@ -301,12 +430,65 @@ class GitAdapter:
             error_msg = self._format_git_error(e, f"Failed to diff trees {from_sha} -> {to_sha}")
             raise RuntimeError(error_msg) from e
 
+    def get_staged_tree_sha(self) -> str:
+        """Get tree SHA representing the current index (staged changes).
+
+        Returns:
+            Tree SHA of the index as written by ``git write-tree``.
+
+        Raises:
+            RuntimeError: If the index cannot be written as a tree.
+        """
+        try:
+            result = self._run_git(["write-tree"])
+            return result.stdout.decode("utf-8", errors="replace").strip()
+        except subprocess.CalledProcessError as e:
+            error_msg = self._format_git_error(e, "Failed to compute staged tree SHA")
+            raise RuntimeError(error_msg) from e
+
     def get_file_content(self, path: Path, ref: str = "HEAD") -> bytes:
         """Get file content at a specific ref.
 
+        Content is read through a persistent ``git cat-file --batch`` process,
+        so reading many files at the same ref costs one process spawn rather
+        than one per file.
+
+        Args:
+            path: Path relative to repository root.
+            ref: Git ref or tree SHA. Default: HEAD.
+
+        Returns:
+            File content as bytes.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist at ref.
+            RuntimeError: If ref is invalid.
+        """
+        object_name = f"{ref}:{Path(path).as_posix()}"
+        if "\n" in object_name:
+            # cat-file --batch is line-oriented; fall back for exotic names
+            return self._show_file_content(path, ref)
+
+        content = self._blob_reader.read(object_name)
+        if content is not None:
+            return content
+
+        # Missing object: distinguish a bad ref from a missing path
+        try:
+            self._run_git(["rev-parse", "--verify", f"{ref}^{{tree}}"])
+        except subprocess.CalledProcessError as e:
+            error_msg = self._format_git_error(
+                e, f"Failed to get content for '{path}' at ref '{ref}'"
+            )
+            raise RuntimeError(error_msg) from e
+        raise FileNotFoundError(f"File '{path}' not found at ref '{ref}'")
+
+    def _show_file_content(self, path: Path, ref: str) -> bytes:
+        """Get file content at a ref with a one-off ``git show``.
+
         Args:
             path: Path relative to repository root.
-            ref: Git ref. Default: HEAD.
+            ref: Git ref or tree SHA.
 
         Returns:
             File content as bytes.
@@ -316,7 +498,6 @@ class GitAdapter:
             RuntimeError: If ref is invalid.
         """
         try:
-            # Use git show to get file content at ref
             result = self._run_git(["show", f"{ref}:{path}"])
             return result.stdout
         except subprocess.CalledProcessError as e:
@@ -328,6 +509,29 @@ class GitAdapter:
             )
             raise RuntimeError(error_msg) from e
 
+    def list_files_at(self, tree_sha: str) -> list[Path]:
+        """Get list of all files recorded in a tree.
+
+        Unlike list_tracked_files(), this ignores the worktree entirely and
+        is used for rev/staged syncs where the tree is the source of truth.
+
+        Args:
+            tree_sha: Tree SHA (or any tree-ish) to list.
+
+        Returns:
+            List of paths relative to repository root.
+
+        Raises:
+            RuntimeError: If the tree cannot be read.
+        """
+        try:
+            result = self._run_git(["ls-tree", "-r", "-z", "--name-only", tree_sha])
+            files_output = result.stdout.decode("utf-8", errors="replace")
+            return [Path(f) for f in files_output.split("\0") if f]
+        except subprocess.CalledProcessError as e:
+            error_msg = self._format_git_error(e, f"Failed to list files in tree {tree_sha}")
+            raise RuntimeError(error_msg) from e
+
     def list_tracked_files(self) -> list[Path]:
         """Get list of all files in the repository (including untracked).
 
@@ -0,0 +1,172 @@
+"""Length-bucketed batching shared by the sentence-transformers embedders.
+
+Code chunks vary from one-line helpers to whole class bodies. Encoding them
+in arrival order with a fixed batch size pads every short input in a batch
+up to its longest member, so most of the compute goes to padding. Here the
+inputs are tokenized first, sorted by token length, and packed into batches
+whose padded size (items x longest item) stays under a token budget. Short
+inputs therefore share large batches, long inputs get small ones, and the
+embeddings are written back in the original input order.
+
+If a batch runs out of memory, it is split in half and the remaining inputs
+are re-planned under the smaller budget, which the caller can keep for
+later requests.
+"""
+
+import logging
+from collections import deque
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from ember.adapters.local_models.runtime import is_out_of_memory
+
+logger = logging.getLogger(__name__)
+
+
+class EncoderModel(Protocol):
+    """The part of the SentenceTransformer API that batching relies on.
+
+    Implemented by SentenceTransformer and OnnxEncoder. A `tokenizer`
+    attribute, if the model has one, is used to measure inputs.
+    """
+
+    def encode(
+        self,
+        sentences: list[str],
+        /,
+        *,
+        batch_size: int,
+        show_progress_bar: bool,
+        convert_to_numpy: bool,
+        normalize_embeddings: bool,
+    ) -> Any:
+        """Embed texts, returning one vector (with tolist()) per input."""
+        ...
+
+
+def estimate_token_lengths(
+    model: EncoderModel, texts: list[str], max_seq_length: int
+) -> list[int]:
+    """Count tokens per text as the model will see them (after truncation).
+
+    Args:
+        model: Loaded model.
+        texts: Texts to measure.
+        max_seq_length: Truncation length used by the model.
+
+    Returns:
+        Token count per text, in input order. Falls back to a character-based
+        estimate if the model exposes no usable tokenizer.
+    """
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is not None:
+        try:
+            encoded = tokenizer(
+                texts,
+                add_special_tokens=True,
+                truncation=True,
+                max_length=max_seq_length,
+                return_attention_mask=False,
+                return_token_type_ids=False,
+            )
+            lengths = [len(ids) for ids in encoded["input_ids"]]
+            if len(lengths) == len(texts):
+                return lengths
+        except (TypeError, KeyError, ValueError):
+            pass
+
+    # Roughly 4 characters per token for code, plus special tokens
+    return [min(max_seq_length, len(text) // 4 + 2) for text in texts]
+
+
+def plan_batches(lengths: list[int], max_batch_tokens: int) -> list[list[int]]:
+    """Group input indices into length-sorted batches under a token budget.
+
+    Inputs are sorted longest first, so each batch's padded length is the
+    length of its first member and batches contain similarly sized inputs.
+    A batch grows until adding another input would push items x padded
+    length over the budget; an input longer than the budget gets its own
+    batch.
+
+    Args:
+        lengths: Token length per input.
+        max_batch_tokens: Maximum padded tokens per batch.
+
+    Returns:
+        Batches of indices into the original input list.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+
+    batches: list[list[int]] = []
+    current: list[int] = []
+    padded_length = 0
+    for idx in order:
+        if current and (len(current) + 1) * padded_length > max_batch_tokens:
+            batches.append(current)
+            current = []
+        if not current:
+            padded_length = max(1, lengths[idx])
+        current.append(idx)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def encode_bucketed(
+    model: EncoderModel,
+    texts: list[str],
+    max_seq_length: int,
+    max_batch_tokens: int,
+    on_backoff: Callable[[int], None] | None = None,
+) -> list[list[float]]:
+    """Encode texts in length-bucketed batches, preserving input order.
+
+    Args:
+        model: Loaded model (SentenceTransformer or OnnxEncoder).
+        texts: Texts to embed.
+        max_seq_length: Truncation length used by the model.
+        max_batch_tokens: Maximum padded tokens per batch.
+        on_backoff: Called with the reduced token budget after a batch runs
+            out of memory. May raise to abort instead of retrying.
+
+    Returns:
+        Normalized embedding per text, in input order.
+
+    Raises:
+        Exception: The model's error if it is not out-of-memory, or if a
+            single input does not fit in memory.
+    """
+    lengths = estimate_token_lengths(model, texts, max_seq_length)
+    embeddings: list[list[float]] = [[] for _ in texts]
+
+    pending = deque(plan_batches(lengths, max_batch_tokens))
+    while pending:
+        batch = pending.popleft()
+        try:
+            batch_embeddings = model.encode(
+                [texts[i] for i in batch],
+                batch_size=len(batch),
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True,  # L2 normalization
+            )
+        except Exception as e:
+            if len(batch) == 1 or not is_out_of_memory(e):
+                raise
+            # Halve the failed batch's padded size and re-plan what is left
+            max_batch_tokens = max(1, len(batch) * lengths[batch[0]] // 2)
+            logger.warning(
+                f"Out of memory embedding {len(batch)} texts; "
+                f"reducing batch budget to {max_batch_tokens} tokens"
+            )
+            if on_backoff is not None:
+                on_backoff(max_batch_tokens)
+            remaining = batch + [i for b in pending for i in b]
+            replanned = plan_batches([lengths[i] for i in remaining], max_batch_tokens)
+            pending = deque([remaining[j] for j in b] for b in replanned)
+            continue
+
+        for idx, emb in zip(batch, batch_embeddings, strict=True):
+            embeddings[idx] = emb.tolist()
+
+    return embeddings
@@ -7,10 +7,14 @@ Small retrieval-focused model (~130MB RAM, 33M params).
 import hashlib
 from typing import TYPE_CHECKING
 
+from ember.adapters.local_models.batching import encode_bucketed
+
 # Lazy import - only load when actually needed
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
+    from ember.adapters.local_models.onnx_backend import OnnxEncoder
+
 
 class BGESmallEmbedder:
     """Embedder using bge-small-en-v1.5 model.
@@ -39,24 +43,36 @@ class BGESmallEmbedder:
         max_seq_length: int = DEFAULT_MAX_SEQ_LENGTH,
         batch_size: int = DEFAULT_BATCH_SIZE,
         device: str | None = None,
+        max_batch_tokens: int | None = None,
+        backend: str = "torch",
+        quantize: bool = True,
     ):
         """Initialize the BGE-small Embedder.
 
         Args:
             max_seq_length: Maximum sequence length for tokenization (1-512).
-            batch_size: Batch size for encoding.
+            batch_size: Batch size for encoding. Together with max_seq_length
+                it sets the default per-batch token budget.
             device: Device to run on ('cpu', 'cuda', 'mps', or None for auto).
+            max_batch_tokens: Maximum padded tokens per encode batch
+                (default: batch_size * max_seq_length).
+            backend: Inference backend - "torch" (sentence-transformers) or
+                "onnx" (onnxruntime, exported graph cached in ~/.ember/models).
+            quantize: Use int8 dynamic quantization (onnx backend only).
         """
         self._max_seq_length = max_seq_length
         self._batch_size = batch_size
         self._device = device
-        self._model: SentenceTransformer | None = None
+        self._max_batch_tokens = max_batch_tokens or batch_size * max_seq_length
+        self._backend = backend
+        self._quantize = quantize
+        self._model: SentenceTransformer | OnnxEncoder | None = None
 
-    def _ensure_model_loaded(self) -> "SentenceTransformer":
+    def _ensure_model_loaded(self) -> "SentenceTransformer | OnnxEncoder":
         """Lazy-load the model on first use.
 
         Returns:
-            Loaded SentenceTransformer model.
+            Loaded SentenceTransformer model (or ONNX encoder).
 
         Raises:
             RuntimeError: If model fails to load.
@@ -70,6 +86,9 @@ class BGESmallEmbedder:
 
             os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
 
+            if self._backend == "onnx":
+                return self._load_onnx_model()
+
             # Import here to avoid loading heavy dependencies at module import time
             from sentence_transformers import SentenceTransformer
 
@@ -94,6 +113,27 @@ class BGESmallEmbedder:
                 raise RuntimeError(f"Failed to load {self.MODEL_NAME}: {e}") from e
         return self._model
 
+    def _load_onnx_model(self) -> "OnnxEncoder":
+        """Load the ONNX graph, exporting it on first use.
+
+        Returns:
+            Loaded ONNX encoder.
+
+        Raises:
+            RuntimeError: If the backend is unavailable or export fails.
+        """
+        from ember.adapters.local_models.onnx_backend import load_onnx_encoder
+
+        try:
+            self._model = load_onnx_encoder(
+                self.MODEL_NAME,
+                max_seq_length=self._max_seq_length,
+                quantize=self._quantize,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to load {self.MODEL_NAME} (onnx): {e}") from e
+        return self._model
+
     @property
     def name(self) -> str:
         """Model name."""
@@ -104,6 +144,11 @@ class BGESmallEmbedder:
         """Embedding dimension."""
         return self.MODEL_DIM
 
+    @property
+    def max_seq_length(self) -> int:
+        """Token truncation length."""
+        return self._max_seq_length
+
     def fingerprint(self) -> str:
         """Generate deterministic fingerprint for this model configuration.
 
@@ -120,6 +165,10 @@ class BGESmallEmbedder:
             "mean_pooling",  # BGE uses mean pooling
             "normalize",  # Normalized embeddings
         ]
+        if self._backend != "torch":
+            # Torch fingerprints are unchanged so existing indexes stay valid
+            config_parts.append(self._backend)
+            config_parts.append("int8" if self._quantize else "fp32")
         config_str = "|".join(config_parts)
         config_hash = hashlib.sha256(config_str.encode()).hexdigest()[:16]
         return f"{self.MODEL_NAME}:v1:{config_hash}"
@@ -135,6 +184,25 @@ class BGESmallEmbedder:
         """
         self._ensure_model_loaded()
 
+    def load(self) -> "SentenceTransformer | OnnxEncoder":
+        """Load the model if needed and return it.
+
+        Returns:
+            Loaded SentenceTransformer model (or ONNX encoder).
+
+        Raises:
+            RuntimeError: If model fails to load.
+        """
+        return self._ensure_model_loaded()
+
+    def _reduce_batch_tokens(self, max_batch_tokens: int) -> None:
+        """Keep a token budget lowered after running out of memory.
+
+        Args:
+            max_batch_tokens: Reduced maximum padded tokens per batch.
+        """
+        self._max_batch_tokens = min(self._max_batch_tokens, max_batch_tokens)
+
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """Embed a batch of texts into vectors.
 
@@ -154,18 +222,14 @@ class BGESmallEmbedder:
         try:
             model = self._ensure_model_loaded()
 
-            # sentence-transformers handles batching internally
-            # but we can specify batch_size for control
-            embeddings = model.encode(
+            # Bucket by token length so short chunks aren't padded to long ones
+            return encode_bucketed(
+                model,
                 texts,
-                batch_size=self._batch_size,
-                show_progress_bar=False,
-                convert_to_numpy=True,
-                normalize_embeddings=True,  # L2 normalization
+                max_seq_length=self._max_seq_length,
+                max_batch_tokens=self._max_batch_tokens,
+                on_backoff=self._reduce_batch_tokens,
             )
 
-            # Convert numpy arrays to lists
-            return [emb.tolist() for emb in embeddings]
-
         except Exception as e:
             raise RuntimeError(f"Failed to embed {len(texts)} texts: {e}") from e
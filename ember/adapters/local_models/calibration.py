@@ -0,0 +1,115 @@
+"""Benchmark adapter that times the local embedders for auto-tuning.
+
+Implements the EmbeddingBenchmark port. The model is loaded once per
+sequence length (and, for onnx, per thread count, since the session's thread
+pool is fixed at creation) and reused across batch sizes, so a calibration
+run costs a few model loads rather than one per trial.
+"""
+
+import time
+from collections.abc import Callable
+
+from ember.adapters.local_models.batching import EncoderModel, encode_bucketed
+from ember.adapters.local_models.registry import Embedder, create_embedder
+from ember.adapters.local_models.runtime import apply_thread_limit, is_out_of_memory
+
+
+def _abort_on_backoff(max_batch_tokens: int) -> None:
+    """Fail a trial instead of retrying with a smaller batch."""
+    raise MemoryError(f"Out of memory (would back off to {max_batch_tokens} tokens)")
+
+
+class LocalEmbedderBenchmark:
+    """Times a local embedding model under different settings."""
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        backend: str = "torch",
+        quantize: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """Initialize the benchmark (models load on first measurement).
+
+        Args:
+            model_name: Embedding model preset or HuggingFace ID.
+            backend: Inference backend ("torch" or "onnx").
+            quantize: Use int8 dynamic quantization (onnx backend only).
+            clock: Monotonic clock in seconds.
+        """
+        self.model_name = model_name
+        self.backend = backend
+        self.quantize = quantize
+        self._clock = clock
+        self._embedders: dict[tuple[int, int], Embedder] = {}
+
+    @property
+    def default_max_seq_length(self) -> int:
+        """The model's default truncation length in tokens."""
+        return create_embedder(
+            model_name=self.model_name, backend=self.backend, quantize=self.quantize
+        ).max_seq_length
+
+    def _load(self, max_seq_length: int, threads: int) -> EncoderModel:
+        """Get a loaded model for the settings, dropping previously loaded ones."""
+        key = (max_seq_length, threads if self.backend == "onnx" else 0)
+        if key not in self._embedders:
+            # Keep one model in memory so memory headroom checks stay honest
+            self._embedders.clear()
+            embedder = create_embedder(
+                model_name=self.model_name,
+                max_seq_length=max_seq_length,
+                backend=self.backend,
+                quantize=self.quantize,
+            )
+            embedder.ensure_loaded()
+            # First inference pays one-time allocation costs; keep it untimed
+            embedder.embed_texts(["warm up"])
+            self._embedders[key] = embedder
+        return self._embedders[key].load()
+
+    def measure(
+        self,
+        texts: list[str],
+        batch_size: int,
+        max_seq_length: int,
+        threads: int,
+    ) -> float:
+        """Embed texts once with the given settings and time it.
+
+        Args:
+            texts: Sample texts to embed.
+            batch_size: Batch size (sets the per-batch token budget).
+            max_seq_length: Token truncation length.
+            threads: Intra-op inference threads.
+
+        Returns:
+            Throughput in texts per second.
+
+        Raises:
+            MemoryError: If the settings run out of memory.
+        """
+        apply_thread_limit(threads, self.backend)
+        try:
+            model = self._load(max_seq_length, threads)
+            start = self._clock()
+            encode_bucketed(
+                model,
+                texts,
+                max_seq_length=max_seq_length,
+                max_batch_tokens=batch_size * max_seq_length,
+                on_backoff=_abort_on_backoff,
+            )
+            elapsed = self._clock() - start
+        except MemoryError:
+            raise
+        except Exception as e:
+            if is_out_of_memory(e):
+                raise MemoryError(str(e)) from e
+            raise
+
+        return len(texts) / max(elapsed, 1e-9)
+
+    def close(self) -> None:
+        """Release loaded models."""
+        self._embedders.clear()
@@ -0,0 +1,298 @@
+"""ONNX Runtime inference backend for the local embedders.
+
+PyTorch inference through sentence-transformers is slow on CPU-only machines.
+This backend exports a supported model to ONNX once (optionally with dynamic
+int8 weight quantization), caches the graph under ~/.ember/models, and serves
+embeddings with onnxruntime afterwards. The export step needs the regular
+torch stack; later runs only need onnxruntime and the saved tokenizer.
+
+Requires the optional dependencies: pip install "ember[onnx]"
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ONNX_CACHE_DIR = Path.home() / ".ember" / "models"
+
+# Bump when the export format changes so stale graphs are re-exported
+EXPORT_VERSION = 1
+
+_METADATA_FILE = "ember_onnx.json"
+
+
+def model_cache_dir(model_name: str, cache_dir: Path | None = None) -> Path:
+    """Get the cache directory for one model's exported graphs.
+
+    Args:
+        model_name: HuggingFace model ID.
+        cache_dir: Cache root (default: ~/.ember/models).
+
+    Returns:
+        Directory holding the tokenizer, metadata, and ONNX graphs.
+    """
+    root = cache_dir or ONNX_CACHE_DIR
+    return root / model_name.replace("/", "__")
+
+
+def _graph_path(model_dir: Path, quantize: bool) -> Path:
+    """Path of the fp32 or int8 graph inside a model cache directory."""
+    return model_dir / ("model_int8.onnx" if quantize else "model.onnx")
+
+
+def _read_metadata(model_dir: Path) -> dict | None:
+    """Read export metadata, or None if missing, unreadable, or outdated."""
+    try:
+        metadata = json.loads((model_dir / _METADATA_FILE).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if metadata.get("export_version") != EXPORT_VERSION:
+        return None
+    return metadata
+
+
+def export_model(model_name: str, model_dir: Path) -> dict:
+    """Export a sentence-transformers model to ONNX (fp32).
+
+    Args:
+        model_name: HuggingFace model ID.
+        model_dir: Destination cache directory.
+
+    Returns:
+        Export metadata (pooling mode, whether token_type_ids are used).
+
+    Raises:
+        RuntimeError: If export fails.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    logger.info(f"Exporting {model_name} to ONNX (one-time)...")
+    st_model = SentenceTransformer(model_name, trust_remote_code=True, device="cpu")
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+
+    # Pooling must match the sentence-transformers pipeline exactly
+    pooling = "mean"
+    for module in st_model:
+        if hasattr(module, "get_pooling_mode_str"):
+            pooling = module.get_pooling_mode_str()
+            break
+
+    model_dir.mkdir(parents=True, exist_ok=True)
+    tokenizer.save_pretrained(str(model_dir / "tokenizer"))
+
+    sample = tokenizer(["def example(): pass"], return_tensors="pt")
+    use_token_type_ids = "token_type_ids" in sample
+    input_names = ["input_ids", "attention_mask"]
+    args: tuple = (sample["input_ids"], sample["attention_mask"])
+    if use_token_type_ids:
+        input_names.append("token_type_ids")
+        args = (*args, sample["token_type_ids"])
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    tmp_path = model_dir / "model.onnx.tmp"
+    try:
+        with torch.no_grad():
+            torch.onnx.export(
+                transformer,
+                args,
+                str(tmp_path),
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=17,
+            )
+        tmp_path.replace(_graph_path(model_dir, quantize=False))
+        # A quantized graph from an earlier export no longer matches
+        _graph_path(model_dir, quantize=True).unlink(missing_ok=True)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        raise RuntimeError(f"ONNX export of {model_name} failed: {e}") from e
+
+    metadata = {
+        "export_version": EXPORT_VERSION,
+        "model_name": model_name,
+        "pooling": pooling,
+        "token_type_ids": use_token_type_ids,
+    }
+    (model_dir / _METADATA_FILE).write_text(json.dumps(metadata), encoding="utf-8")
+    return metadata
+
+
+def quantize_model(model_dir: Path) -> None:
+    """Write an int8 dynamically quantized copy of the fp32 graph.
+
+    Args:
+        model_dir: Cache directory containing model.onnx.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    target = _graph_path(model_dir, quantize=True)
+    tmp_path = model_dir / "model_int8.onnx.tmp"
+    logger.info(f"Quantizing {model_dir.name} to int8 (one-time)...")
+    try:
+        quantize_dynamic(
+            str(_graph_path(model_dir, quantize=False)),
+            str(tmp_path),
+            weight_type=QuantType.QInt8,
+        )
+        tmp_path.replace(target)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class OnnxEncoder:
+    """onnxruntime-backed stand-in for the SentenceTransformer encode API.
+
+    Exposes the subset the embedders use (`tokenizer`, `max_seq_length`,
+    `encode`), so length-bucketed batching works unchanged.
+    """
+
+    def __init__(
+        self,
+        model_dir: Path,
+        metadata: dict,
+        quantize: bool,
+        max_seq_length: int,
+    ) -> None:
+        """Load the tokenizer and ONNX session.
+
+        Args:
+            model_dir: Cache directory produced by export_model.
+            metadata: Export metadata.
+            quantize: Load the int8 graph instead of fp32.
+            max_seq_length: Truncation length for tokenization.
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        self.max_seq_length = max_seq_length
+        self.tokenizer = AutoTokenizer.from_pretrained(str(model_dir / "tokenizer"))
+        self._pooling = metadata.get("pooling", "mean")
+        self._use_token_type_ids = bool(metadata.get("token_type_ids"))
+
+        from ember.adapters.local_models.runtime import configured_threads
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        # onnxruntime ignores OMP_NUM_THREADS, so pass the budget explicitly
+        options.intra_op_num_threads = configured_threads()
+        self._session = ort.InferenceSession(
+            str(_graph_path(model_dir, quantize)),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+
+    def _pool(self, hidden: "np.ndarray", attention_mask: "np.ndarray") -> "np.ndarray":
+        """Reduce token states to one vector per input."""
+        import numpy as np
+
+        if self._pooling == "cls":
+            return hidden[:, 0]
+        mask = attention_mask[..., None].astype(hidden.dtype)
+        summed = (hidden * mask).sum(axis=1)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)
+        return summed / counts
+
+    def encode(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = True,
+        **_: Any,
+    ) -> "np.ndarray":
+        """Embed texts (same signature subset as SentenceTransformer.encode).
+
+        Args:
+            texts: Texts to embed.
+            batch_size: Inputs per inference call.
+            show_progress_bar: Ignored (kept for API compatibility).
+            convert_to_numpy: Ignored; numpy arrays are always returned.
+            normalize_embeddings: L2-normalize the pooled vectors.
+
+        Returns:
+            Array of shape (len(texts), dim).
+        """
+        import numpy as np
+
+        outputs = []
+        for start in range(0, len(texts), max(1, batch_size)):
+            encoded = self.tokenizer(
+                texts[start : start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            feeds = {
+                "input_ids": encoded["input_ids"].astype(np.int64),
+                "attention_mask": encoded["attention_mask"].astype(np.int64),
+            }
+            if self._use_token_type_ids:
+                token_type_ids = encoded.get("token_type_ids")
+                if token_type_ids is None:
+                    token_type_ids = np.zeros_like(encoded["input_ids"])
+                feeds["token_type_ids"] = token_type_ids.astype(np.int64)
+
+            hidden = self._session.run(["last_hidden_state"], feeds)[0]
+            pooled = self._pool(hidden, encoded["attention_mask"])
+            if normalize_embeddings:
+                norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+                pooled = pooled / np.clip(norms, 1e-12, None)
+            outputs.append(pooled.astype(np.float32))
+
+        return np.concatenate(outputs) if outputs else np.zeros((0, 0), dtype=np.float32)
+
+
+def load_onnx_encoder(
+    model_name: str,
+    max_seq_length: int,
+    quantize: bool = True,
+    cache_dir: Path | None = None,
+) -> OnnxEncoder:
+    """Load an ONNX encoder, exporting and quantizing on first use.
+
+    Args:
+        model_name: HuggingFace model ID.
+        max_seq_length: Truncation length for tokenization.
+        quantize: Use the int8 dynamically quantized graph.
+        cache_dir: Cache root (default: ~/.ember/models).
+
+    Returns:
+        Ready-to-use OnnxEncoder.
+
+    Raises:
+        ImportError: If onnxruntime is not installed.
+        RuntimeError: If export fails.
+    """
+    try:
+        import onnxruntime  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "The onnx backend requires onnxruntime. "
+            'Install it with: pip install "ember[onnx]"'
+        ) from e
+
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+    model_dir = model_cache_dir(model_name, cache_dir)
+    metadata = _read_metadata(model_dir)
+    if metadata is None or not _graph_path(model_dir, quantize=False).exists():
+        metadata = export_model(model_name, model_dir)
+    if quantize and not _graph_path(model_dir, quantize=True).exists():
+        quantize_model(model_dir)
+
+    return OnnxEncoder(model_dir, metadata, quantize=quantize, max_seq_length=max_seq_length)
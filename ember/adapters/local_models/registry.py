@@ -7,7 +7,7 @@ Provides a factory function to create the appropriate embedder based on config.
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    pass
+    from ember.adapters.local_models.batching import EncoderModel
 
 
 class Embedder(Protocol):
@@ -19,12 +19,17 @@ class Embedder(Protocol):
     @property
     def dim(self) -> int: ...
 
+    @property
+    def max_seq_length(self) -> int: ...
+
     def fingerprint(self) -> str: ...
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]: ...
 
     def ensure_loaded(self) -> None: ...
 
+    def load(self) -> "EncoderModel": ...
+
 
 # Preset names map to HuggingFace model IDs
 # Users can use either the preset name or the full HF ID
@@ -53,6 +58,16 @@ SUPPORTED_MODELS: set[str] = {
 # Default model when none specified
 DEFAULT_MODEL = "jinaai/jina-embeddings-v2-base-code"
 
+# Token truncation length each embedder uses unless configured otherwise
+DEFAULT_MAX_SEQ_LENGTHS: dict[str, int] = {
+    "jinaai/jina-embeddings-v2-base-code": 512,
+    "sentence-transformers/all-MiniLM-L6-v2": 256,
+    "BAAI/bge-small-en-v1.5": 512,
+}
+
+# Inference backends: sentence-transformers (PyTorch) or exported ONNX graphs
+SUPPORTED_BACKENDS: tuple[str, ...] = ("torch", "onnx")
+
 
 def resolve_model_name(model_name: str) -> str:
     """Resolve a model name to its canonical HuggingFace ID.
@@ -92,11 +107,28 @@ def resolve_model_name(model_name: str) -> str:
     )
 
 
+def default_max_seq_length(model_name: str) -> int:
+    """Get the token truncation length a model's embedder uses by default.
+
+    Args:
+        model_name: Model preset name or HuggingFace ID
+
+    Returns:
+        Default max_seq_length of the model's embedder
+
+    Raises:
+        ValueError: If model name is not recognized
+    """
+    return DEFAULT_MAX_SEQ_LENGTHS[resolve_model_name(model_name)]
+
+
 def create_embedder(
     model_name: str | None = None,
     max_seq_length: int | None = None,
     batch_size: int = 32,
     device: str | None = None,
+    backend: str = "torch",
+    quantize: bool = True,
 ) -> Embedder:
     """Create an embedder instance based on model name.
 
@@ -105,13 +137,21 @@ def create_embedder(
         max_seq_length: Maximum sequence length (default: model-specific)
         batch_size: Batch size for encoding
         device: Device to run on ('cpu', 'cuda', 'mps', or None for auto)
+        backend: Inference backend ("torch" or "onnx")
+        quantize: Use int8 dynamic quantization (onnx backend only)
 
     Returns:
         Embedder instance implementing the Embedder protocol
 
     Raises:
-        ValueError: If model name is not recognized
+        ValueError: If model name or backend is not recognized
     """
+    if backend not in SUPPORTED_BACKENDS:
+        raise ValueError(
+            f"Unknown inference backend: '{backend}'. "
+            f"Valid options are: {', '.join(SUPPORTED_BACKENDS)}"
+        )
+
     # Resolve to canonical model ID
     resolved = DEFAULT_MODEL if model_name is None else resolve_model_name(model_name)
 
@@ -124,6 +164,9 @@ def create_embedder(
             kwargs["device"] = device
         if max_seq_length is not None:
             kwargs["max_seq_length"] = max_seq_length
+        if backend != "torch":
+            kwargs["backend"] = backend
+            kwargs["quantize"] = quantize
         return JinaCodeEmbedder(**kwargs)
 
     elif resolved == "sentence-transformers/all-MiniLM-L6-v2":
@@ -134,6 +177,9 @@ def create_embedder(
             kwargs["device"] = device
         if max_seq_length is not None:
             kwargs["max_seq_length"] = max_seq_length
+        if backend != "torch":
+            kwargs["backend"] = backend
+            kwargs["quantize"] = quantize
         return MiniLMEmbedder(**kwargs)
 
     elif resolved == "BAAI/bge-small-en-v1.5":
@@ -144,6 +190,9 @@ def create_embedder(
             kwargs["device"] = device
         if max_seq_length is not None:
             kwargs["max_seq_length"] = max_seq_length
+        if backend != "torch":
+            kwargs["backend"] = backend
+            kwargs["quantize"] = quantize
         return BGESmallEmbedder(**kwargs)
 
     else:
@@ -0,0 +1,65 @@
+"""Process-wide inference runtime settings for the local embedders.
+
+Thread pools in torch and onnxruntime are per process, so the thread budget
+is applied once per process (the daemon, a pool worker, or a calibration
+run) rather than per embedder.
+"""
+
+import os
+
+# Substrings of allocator errors raised by torch, onnxruntime, and the OS
+OUT_OF_MEMORY_MARKERS = (
+    "out of memory",
+    "can't allocate memory",
+    "cannot allocate memory",
+    "failed to allocate",
+    "bad_alloc",
+)
+
+
+def apply_thread_limit(threads: int, backend: str = "torch") -> None:
+    """Pin the intra-op thread count for this process.
+
+    Args:
+        threads: Intra-op threads (0 or less leaves the library default).
+        backend: Inference backend ("torch" or "onnx").
+    """
+    if threads <= 0:
+        return
+
+    # Must be set before torch/onnxruntime create their thread pools
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+    if backend == "torch":
+        import torch
+
+        torch.set_num_threads(threads)
+
+
+def configured_threads() -> int:
+    """Thread count set by apply_thread_limit, or 0 if none was set.
+
+    Returns:
+        Intra-op thread count for sessions created in this process.
+    """
+    try:
+        return max(0, int(os.environ.get("OMP_NUM_THREADS", "0")))
+    except ValueError:
+        return 0
+
+
+def is_out_of_memory(error: BaseException) -> bool:
+    """Check whether an inference error was caused by running out of memory.
+
+    Args:
+        error: Exception raised while encoding.
+
+    Returns:
+        True for MemoryError or allocator failures reported by the backend.
+    """
+    if isinstance(error, MemoryError):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in OUT_OF_MEMORY_MARKERS)
@@ -0,0 +1,87 @@
+"""Token counting with an embedding model's tokenizer.
+
+Loads only the model's fast tokenizer (tokenizer.json), not the model, so
+chunking can size chunks to the model's context window cheaply, even when
+embeddings are computed by the daemon.
+"""
+
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from ember.adapters.local_models.registry import resolve_model_name
+
+if TYPE_CHECKING:
+    from tokenizers import Tokenizer
+
+logger = logging.getLogger(__name__)
+
+# Characters per token assumed when the tokenizer cannot be loaded; code
+# tokenizes densely, so this errs towards smaller chunks
+FALLBACK_CHARS_PER_TOKEN = 3
+
+
+class HFTokenCounter:
+    """Counts tokens with a Hugging Face model's fast tokenizer.
+
+    The tokenizer is loaded on first use, from the local Hugging Face cache
+    if possible. If it cannot be loaded, token counts are estimated from
+    text length instead.
+    """
+
+    def __init__(self, model_name: str) -> None:
+        """Initialize the token counter.
+
+        Args:
+            model_name: Model preset name or HuggingFace ID.
+        """
+        self._model_id = resolve_model_name(model_name)
+        self._tokenizer: Tokenizer | None = None
+        self._unavailable = False
+
+    def _ensure_tokenizer_loaded(self) -> "Tokenizer | None":
+        """Lazy-load the tokenizer on first use.
+
+        Returns:
+            Loaded tokenizer, or None if it is unavailable.
+        """
+        if self._tokenizer is None and not self._unavailable:
+            os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+            try:
+                from huggingface_hub import hf_hub_download
+                from tokenizers import Tokenizer
+
+                try:
+                    path = hf_hub_download(
+                        self._model_id, "tokenizer.json", local_files_only=True
+                    )
+                except Exception:
+                    # Not cached yet, download it (a few MB at most)
+                    path = hf_hub_download(self._model_id, "tokenizer.json")
+                tokenizer = Tokenizer.from_file(path)
+                # Count full lengths; truncation is what chunk sizing avoids
+                tokenizer.no_truncation()
+                tokenizer.no_padding()
+                self._tokenizer = tokenizer
+            except Exception as e:
+                logger.warning(
+                    f"Could not load tokenizer for {self._model_id}, "
+                    f"estimating chunk sizes instead: {e}"
+                )
+                self._unavailable = True
+        return self._tokenizer
+
+    def count_tokens(self, texts: list[str]) -> list[int]:
+        """Count the tokens of each text, excluding special tokens.
+
+        Args:
+            texts: Texts to count.
+
+        Returns:
+            Token count per text, in the same order.
+        """
+        tokenizer = self._ensure_tokenizer_loaded()
+        if tokenizer is None:
+            return [-(-len(text) // FALLBACK_CHARS_PER_TOKEN) for text in texts]
+        encodings = tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [len(encoding.ids) for encoding in encodings]
@@ -3,19 +3,10 @@
 Provides centralized configuration and lazy initialization for supported languages.
 """
 
+import importlib
 from dataclasses import dataclass
-from typing import Any
 
-import tree_sitter_c
-import tree_sitter_c_sharp
-import tree_sitter_cpp
-import tree_sitter_go
-import tree_sitter_java
-import tree_sitter_python
-import tree_sitter_ruby
-import tree_sitter_rust
-import tree_sitter_typescript
-from tree_sitter import Language, Parser
+from tree_sitter import Language, Parser, Query
 
 
 @dataclass
@@ -24,14 +15,14 @@ class LanguageConfig:
 
     Attributes:
         name: Canonical language name (e.g., "python", "typescript").
-        module: tree-sitter module containing language parser.
+        module: Name of the tree-sitter grammar package, imported on first use.
         module_func: Function name to call on module to get language.
         identifiers: List of file extensions and aliases (e.g., ["py", "python"]).
         query: Tree-sitter query string for extracting code definitions.
     """
 
     name: str
-    module: Any
+    module: str
     module_func: str
     identifiers: list[str]
     query: str
@@ -42,7 +33,7 @@ class LanguageRegistry:
 
     Provides:
     - Single source of truth for language configurations
-    - Lazy initialization of parsers (load on first use)
+    - Lazy loading of grammars, parsers and compiled queries (load on first use)
     - Lookup by extension or canonical name
     """
 
@@ -50,7 +41,7 @@ class LanguageRegistry:
     _CONFIGS = [
         LanguageConfig(
             name="python",
-            module=tree_sitter_python,
+            module="tree_sitter_python",
             module_func="language",
             identifiers=["py", "python"],
             query="""
@@ -62,7 +53,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="typescript",
-            module=tree_sitter_typescript,
+            module="tree_sitter_typescript",
             module_func="language_typescript",
             identifiers=["ts", "typescript"],
             query="""
@@ -88,7 +79,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="tsx",
-            module=tree_sitter_typescript,
+            module="tree_sitter_typescript",
             module_func="language_tsx",
             identifiers=["tsx"],
             query="""
@@ -114,7 +105,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="javascript",
-            module=tree_sitter_typescript,
+            module="tree_sitter_typescript",
             module_func="language_typescript",
             identifiers=["js", "javascript"],
             query="""
@@ -136,7 +127,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="jsx",
-            module=tree_sitter_typescript,
+            module="tree_sitter_typescript",
             module_func="language_tsx",
             identifiers=["jsx"],
             query="""
@@ -158,7 +149,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="go",
-            module=tree_sitter_go,
+            module="tree_sitter_go",
             module_func="language",
             identifiers=["go"],
             query="""
@@ -178,7 +169,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="rust",
-            module=tree_sitter_rust,
+            module="tree_sitter_rust",
             module_func="language",
             identifiers=["rs", "rust"],
             query="""
@@ -195,7 +186,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="java",
-            module=tree_sitter_java,
+            module="tree_sitter_java",
             module_func="language",
             identifiers=["java"],
             query="""
@@ -211,7 +202,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="c",
-            module=tree_sitter_c,
+            module="tree_sitter_c",
             module_func="language",
             identifiers=["c", "h"],
             query="""
@@ -224,7 +215,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="cpp",
-            module=tree_sitter_cpp,
+            module="tree_sitter_cpp",
             module_func="language",
             identifiers=["cpp", "cc", "cxx", "c++", "hpp"],
             query="""
@@ -243,7 +234,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="csharp",
-            module=tree_sitter_c_sharp,
+            module="tree_sitter_c_sharp",
             module_func="language",
             identifiers=["cs", "csharp"],
             query="""
@@ -259,7 +250,7 @@ class LanguageRegistry:
         ),
         LanguageConfig(
             name="ruby",
-            module=tree_sitter_ruby,
+            module="tree_sitter_ruby",
             module_func="language",
             identifiers=["rb", "ruby"],
             query="""
@@ -287,6 +278,7 @@ class LanguageRegistry:
         # Lazy initialization caches
         self._language_cache: dict[str, Language] = {}
         self._parser_cache: dict[str, Parser] = {}
+        self._query_cache: dict[str, Query] = {}
 
     @property
     def supported_identifiers(self) -> set[str]:
@@ -331,8 +323,8 @@ class LanguageRegistry:
         if not config:
             return None
 
-        # Initialize language
-        lang_func = getattr(config.module, config.module_func)
+        # Import the grammar package only now, so unused grammars cost nothing
+        lang_func = getattr(importlib.import_module(config.module), config.module_func)
         language = Language(lang_func())
         self._language_cache[name] = language
         return language
@@ -357,3 +349,27 @@ class LanguageRegistry:
         parser = Parser(language)
         self._parser_cache[name] = parser
         return parser
+
+    def get_query(self, name: str) -> Query | None:
+        """Get the compiled definition query for a language (lazy initialization).
+
+        Compiling a query is far slower than running it, so each language's
+        query is compiled once and reused for every file.
+
+        Args:
+            name: Canonical language name.
+
+        Returns:
+            Compiled Query if found, None otherwise.
+        """
+        if name in self._query_cache:
+            return self._query_cache[name]
+
+        config = self.get_by_name(name)
+        language = self.get_language(name)
+        if not config or not language:
+            return None
+
+        query = Query(language, config.query)
+        self._query_cache[name] = query
+        return query
@@ -4,6 +4,8 @@ Simple sliding window chunker for files where tree-sitter is unavailable
 or for unknown/unsupported file types.
 """
 
+from collections import deque
+from collections.abc import Iterator
 from pathlib import Path
 
 from ember.ports.chunkers import ChunkData
@@ -106,3 +108,53 @@ class LineChunker:
                 break
 
         return chunks
+
+    def iter_chunks(self, data: bytes, lang: str) -> Iterator[ChunkData]:
+        """Lazily chunk raw file content using line-based sliding windows.
+
+        Produces the same windows as chunk_file without decoding the file or
+        splitting it into lines: only the byte offsets of the current
+        window's lines are kept, and each window is decoded on its own.
+        Windows containing only whitespace are skipped.
+
+        Args:
+            data: File content as bytes, or a bytes-like memory map.
+            lang: Language identifier (passed through to ChunkData).
+
+        Yields:
+            ChunkData with line-based chunks, in file order.
+        """
+        size = len(data)
+        # (start, end) byte offsets of the window's lines, excluding newlines
+        window: deque[tuple[int, int]] = deque()
+        next_offset = 0
+        at_end = False
+        start_line = 1
+
+        while True:
+            while len(window) < self.window_size and not at_end:
+                newline = data.find(b"\n", next_offset)
+                end = size if newline == -1 else newline
+                window.append((next_offset, end))
+                at_end = newline == -1
+                next_offset = end + 1
+
+            chunk_content = data[window[0][0] : window[-1][1]].decode(
+                "utf-8", errors="replace"
+            )
+            if chunk_content.strip():
+                yield ChunkData(
+                    start_line=start_line,
+                    end_line=start_line + len(window) - 1,
+                    content=chunk_content,
+                    symbol=None,
+                    lang=lang,
+                )
+
+            # The window reached the last line
+            if at_end:
+                return
+
+            for _ in range(self.stride):
+                window.popleft()
+            start_line += self.stride
@@ -4,9 +4,10 @@ Extracts semantic code units (functions, classes, methods) using tree-sitter AST
 """
 
 import logging
+from collections import OrderedDict
 from pathlib import Path
 
-from tree_sitter import Query, QueryCursor
+from tree_sitter import Parser, QueryCursor, Tree
 
 from ember.adapters.parsers.definition_matcher import DefinitionMatcher
 from ember.adapters.parsers.language_registry import LanguageRegistry
@@ -14,17 +15,53 @@ from ember.ports.chunkers import ChunkData
 
 logger = logging.getLogger(__name__)
 
+# Number of recently parsed files whose trees are kept for incremental reparsing
+DEFAULT_TREE_CACHE_SIZE = 64
+
+
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    """Get the length of the longest common prefix of two byte strings.
+
+    Binary search over slice comparisons keeps the work in C, which matters
+    for large files.
+    """
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _point_at(source: bytes, offset: int) -> tuple[int, int]:
+    """Get the (row, byte column) point of a byte offset in source."""
+    row = source.count(b"\n", 0, offset)
+    return row, offset - (source.rfind(b"\n", 0, offset) + 1)
+
 
 class TreeSitterChunker:
     """Code-aware chunker using tree-sitter for AST-based extraction.
 
     Supports Python, TypeScript, JavaScript, Go, Rust, Java, C/C++, C#, and Ruby.
     Extracts functions, methods, and classes as semantic chunks.
+
+    The trees of recently chunked files are kept in a bounded LRU cache, so
+    re-chunking a file after an edit (as watch mode does) reparses only the
+    changed region instead of the whole file.
     """
 
-    def __init__(self) -> None:
-        """Initialize tree-sitter chunker with language registry."""
+    def __init__(self, tree_cache_size: int = DEFAULT_TREE_CACHE_SIZE) -> None:
+        """Initialize tree-sitter chunker with language registry.
+
+        Args:
+            tree_cache_size: Number of files whose source and parse tree are
+                kept for incremental reparsing (0 disables the cache).
+        """
         self._registry = LanguageRegistry()
+        self._tree_cache_size = tree_cache_size
+        self._trees: OrderedDict[tuple[str, str], tuple[bytes, Tree]] = OrderedDict()
 
     @property
     def supported_languages(self) -> set[str]:
@@ -57,19 +94,25 @@ class TreeSitterChunker:
             logger.warning(f"Failed to initialize parser for {config.name} (file: {path})")
             return []
 
-        # Parse the content
+        # Parse the content, reusing the file's previous tree if cached
+        cache_key = (str(path), config.name)
         try:
-            tree = parser.parse(bytes(content, "utf-8"))
+            source = content.encode("utf-8")
+            tree = self._parse(parser, source, cache_key)
         except UnicodeEncodeError as e:
             logger.warning(f"Failed to encode {path} as UTF-8: {e}")
             return []
         except Exception as e:
+            self._trees.pop(cache_key, None)
             logger.warning(f"Failed to parse {path} as {config.name}: {e}")
             return []
 
         # Execute query to find definitions
         try:
-            query = Query(language, config.query)
+            query = self._registry.get_query(config.name)
+            if query is None:
+                logger.warning(f"Failed to initialize query for {config.name} (file: {path})")
+                return []
             cursor = QueryCursor(query)
             captures = cursor.captures(tree.root_node)
         except Exception as e:
@@ -107,3 +150,50 @@ class TreeSitterChunker:
 
         logger.debug(f"Extracted {len(chunks)} chunks from {path} ({config.name})")
         return chunks
+
+    def _parse(self, parser: Parser, source: bytes, cache_key: tuple[str, str]) -> Tree:
+        """Parse source, incrementally if an earlier version's tree is cached.
+
+        The edit between the cached and new source is described as the single
+        byte range between their common prefix and common suffix, which lets
+        tree-sitter reuse every subtree outside it.
+
+        Args:
+            parser: Parser for the file's language.
+            source: New file content as UTF-8 bytes.
+            cache_key: (path, language) key of the file in the tree cache.
+
+        Returns:
+            Parse tree of the new source.
+        """
+        if self._tree_cache_size <= 0:
+            return parser.parse(source)
+
+        cached = self._trees.pop(cache_key, None)
+        if cached is None:
+            tree = parser.parse(source)
+        elif cached[0] == source:
+            tree = cached[1]
+        else:
+            old_source, old_tree = cached
+            start = _common_prefix_length(old_source, source)
+            # The common suffix must not overlap the common prefix in either version
+            max_suffix = min(len(old_source), len(source)) - start
+            suffix = _common_prefix_length(old_source[::-1], source[::-1])
+            suffix = min(suffix, max_suffix)
+            old_end = len(old_source) - suffix
+            new_end = len(source) - suffix
+            old_tree.edit(
+                start_byte=start,
+                old_end_byte=old_end,
+                new_end_byte=new_end,
+                start_point=_point_at(source, start),
+                old_end_point=_point_at(old_source, old_end),
+                new_end_point=_point_at(source, new_end),
+            )
+            tree = parser.parse(source, old_tree)
+
+        self._trees[cache_key] = (source, tree)
+        while len(self._trees) > self._tree_cache_size:
+            self._trees.popitem(last=False)
+        return tree
@@ -0,0 +1,104 @@
+"""SQLite adapter implementing SyncCheckpointRepository for resumable syncs."""
+
+import sqlite3
+import time
+from pathlib import Path
+
+from ember.adapters.sqlite.connection import get_manager
+from ember.adapters.sqlite.schema import migrate_database
+
+
+class SQLiteSyncCheckpointRepository:
+    """SQLite implementation of SyncCheckpointRepository."""
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize checkpoint repository.
+
+        Args:
+            db_path: Path to SQLite database file.
+        """
+        self.db_path = db_path
+        self._manager = get_manager(db_path)
+        self._conn: sqlite3.Connection | None = None
+
+        # Older databases predate the sync_checkpoints table
+        if db_path.exists():
+            migrate_database(db_path)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a database connection.
+
+        Uses the writer connection shared by all repositories of the database.
+
+        Returns:
+            SQLite connection object.
+        """
+        if self._conn is None:
+            self._conn = self._manager.acquire_writer()
+        return self._conn
+
+    def close(self) -> None:
+        """Release the database connection if held."""
+        if self._conn is not None:
+            self._manager.release(self._conn)
+            self._conn = None
+
+    def __enter__(self) -> "SQLiteSyncCheckpointRepository":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Exit context manager, closing the database connection."""
+        self.close()
+        return False
+
+    def get_completed(self, tree_sha: str, model_fingerprint: str) -> set[Path]:
+        """Get files already completed for a target tree and model.
+
+        Args:
+            tree_sha: Tree SHA the sync is indexing.
+            model_fingerprint: Fingerprint of the embedding model in use.
+
+        Returns:
+            Set of paths (relative to repository root) already indexed.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT path FROM sync_checkpoints
+            WHERE tree_sha = ? AND model_fingerprint = ?
+            """,
+            (tree_sha, model_fingerprint),
+        )
+        return {Path(row[0]) for row in cursor.fetchall()}
+
+    def mark_completed(
+        self, tree_sha: str, model_fingerprint: str, paths: list[Path]
+    ) -> None:
+        """Durably record a batch of completed files in one transaction.
+
+        Args:
+            tree_sha: Tree SHA the sync is indexing.
+            model_fingerprint: Fingerprint of the embedding model in use.
+            paths: Paths (relative to repository root) that finished indexing.
+        """
+        if not paths:
+            return
+        conn = self._get_connection()
+        now = time.time()
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO sync_checkpoints
+                (tree_sha, model_fingerprint, path, completed_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(tree_sha, model_fingerprint, str(p), now) for p in paths],
+        )
+        conn.commit()
+
+    def clear(self) -> None:
+        """Remove all checkpoints (called once a sync completes)."""
+        conn = self._get_connection()
+        conn.execute("DELETE FROM sync_checkpoints")
+        conn.commit()
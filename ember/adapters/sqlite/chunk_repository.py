@@ -4,6 +4,8 @@ import sqlite3
 import time
 from pathlib import Path
 
+from ember.adapters.fts.code_tokens import identifier_terms
+from ember.adapters.sqlite.connection import get_manager
 from ember.adapters.sqlite.schema import migrate_database
 from ember.domain.entities import Chunk
 
@@ -18,6 +20,7 @@ class SQLiteChunkRepository:
             db_path: Path to SQLite database file.
         """
         self.db_path = db_path
+        self._manager = get_manager(db_path)
         self._conn: sqlite3.Connection | None = None
 
         # Run any pending migrations
@@ -27,22 +30,19 @@ class SQLiteChunkRepository:
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with foreign keys enabled.
 
-        Reuses an existing connection if available, otherwise creates a new one.
-        Uses check_same_thread=False to allow use from different threads, which
-        is required for interactive search where queries run in a thread executor.
+        Uses the writer connection shared by all repositories of the database.
 
         Returns:
             SQLite connection object.
         """
         if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn = self._manager.acquire_writer()
         return self._conn
 
     def close(self) -> None:
-        """Close the database connection if open."""
+        """Release the database connection if held."""
         if self._conn is not None:
-            self._conn.close()
+            self._manager.release(self._conn)
             self._conn = None
 
     def __enter__(self) -> "SQLiteChunkRepository":
@@ -73,9 +73,9 @@ class SQLiteChunkRepository:
                 """
                 INSERT INTO chunks (
                     chunk_id, project_id, path, lang, symbol, start_line, end_line,
-                    content, content_hash, file_hash, tree_sha, rev, created_at
+                    content, content_hash, file_hash, tree_sha, rev, created_at, terms
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(tree_sha, path, start_line, end_line) DO UPDATE SET
                     chunk_id = excluded.chunk_id,
                     project_id = excluded.project_id,
@@ -84,7 +84,9 @@ class SQLiteChunkRepository:
                     content = excluded.content,
                     content_hash = excluded.content_hash,
                     file_hash = excluded.file_hash,
-                    rev = excluded.rev
+                    rev = excluded.rev,
+                    terms = excluded.terms,
+                    live = 1
                 """,
                 (
                     chunk.id,  # chunk.id is the computed chunk_id
@@ -100,6 +102,7 @@ class SQLiteChunkRepository:
                     chunk.tree_sha,
                     chunk.rev,
                     now,
+                    identifier_terms(chunk.content),
                 ),
         )
         conn.commit()
@@ -210,7 +213,7 @@ class SQLiteChunkRepository:
                 SELECT project_id, path, lang, symbol, start_line, end_line,
                        content, content_hash, file_hash, tree_sha, rev
                 FROM chunks
-                WHERE content_hash = ?
+                WHERE content_hash = ? AND live = 1
                 """,
                 (content_hash,),
         )
@@ -241,6 +244,60 @@ class SQLiteChunkRepository:
 
         return chunks
 
+    def find_parent(self, chunk: Chunk) -> Chunk | None:
+        """Find the innermost chunk containing the given chunk.
+
+        Args:
+            chunk: The nested chunk.
+
+        Returns:
+            The smallest other chunk of the same file version whose line range
+            contains the chunk's, or None for top-level chunks.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        # Uses idx_chunks_path; a file has few enough chunks to scan them
+        cursor.execute(
+                """
+                SELECT chunk_id, project_id, path, lang, symbol, start_line, end_line,
+                       content, content_hash, file_hash, tree_sha, rev
+                FROM chunks
+                WHERE path = ? AND file_hash = ?
+                  AND start_line <= ? AND end_line >= ?
+                  AND NOT (start_line = ? AND end_line = ?)
+                ORDER BY end_line - start_line, live DESC, chunk_id
+                LIMIT 1
+                """,
+                (
+                    str(chunk.path),
+                    chunk.file_hash,
+                    chunk.start_line,
+                    chunk.end_line,
+                    chunk.start_line,
+                    chunk.end_line,
+                ),
+        )
+
+        row = cursor.fetchone()
+        if row is None:
+            return None
+
+        return Chunk(
+            id=row[0],
+            project_id=row[1],
+            path=Path(row[2]),
+            lang=row[3],
+            symbol=row[4],
+            start_line=row[5],
+            end_line=row[6],
+            content=row[7],
+            content_hash=row[8],
+            file_hash=row[9],
+            tree_sha=row[10],
+            rev=row[11],
+        )
+
     def delete(self, chunk_id: str) -> None:
         """Delete a chunk by ID.
 
@@ -365,7 +422,7 @@ class SQLiteChunkRepository:
                 SELECT project_id, path, lang, symbol, start_line, end_line,
                        content, content_hash, file_hash, tree_sha, rev
                 FROM chunks
-                WHERE 1=1
+                WHERE live = 1
         """
         params: list[str] = []
 
@@ -411,12 +468,14 @@ class SQLiteChunkRepository:
     def count_chunks(self) -> int:
         """Get total number of chunks in the repository.
 
+        Chunks retained only for other indexed refs are not counted.
+
         Returns:
-            Total count of all chunks.
+            Total count of live chunks.
         """
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM chunks")
+        cursor.execute("SELECT COUNT(*) FROM chunks WHERE live = 1")
         result = cursor.fetchone()
         return result[0] if result else 0
 
@@ -428,6 +487,6 @@ class SQLiteChunkRepository:
         """
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(DISTINCT path) FROM chunks")
+        cursor.execute("SELECT COUNT(DISTINCT path) FROM chunks WHERE live = 1")
         result = cursor.fetchone()
         return result[0] if result else 0
@@ -0,0 +1,245 @@
+"""Shared SQLite connections for the adapters of a database.
+
+All adapters of a database in a process get their connections from one
+ConnectionManager: repositories share a single writer connection, and
+search adapters check reader connections out of a pool. Databases run in
+WAL mode, so a sync writing the index does not block searches reading it,
+and busy timeouts make concurrent writers (e.g. a background sync and
+`ember watch`) wait for each other instead of failing with
+"database is locked".
+
+A commit or rollback on the shared writer applies to every adapter's
+pending writes, so adapters using it must commit before returning and
+never leave a transaction open. Adapters running multi-statement
+transactions that may roll back take a private writer from open_writer()
+instead.
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+
+# Time to wait for another connection's lock before failing, in milliseconds
+BUSY_TIMEOUT_MS = 30_000
+
+# In WAL mode, NORMAL only risks the last transactions on power loss, and
+# saves an fsync per commit
+SYNCHRONOUS = "NORMAL"
+
+# Bytes of the database file memory-mapped for reads
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Page cache per connection, in KiB
+CACHE_SIZE_KIB = 32 * 1024
+
+# Idle reader connections kept open per database
+MAX_IDLE_READERS = 4
+
+
+def configure_connection(conn: sqlite3.Connection, readonly: bool = False) -> None:
+    """Apply the connection settings shared by all adapters.
+
+    Args:
+        conn: Open SQLite connection.
+        readonly: Refuse writes on this connection.
+    """
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute(f"PRAGMA synchronous = {SYNCHRONOUS}")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    if readonly:
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        conn.execute("PRAGMA foreign_keys = ON")
+
+
+def enable_wal(conn: sqlite3.Connection) -> str:
+    """Switch a database to write-ahead logging.
+
+    The journal mode is stored in the database file, so this only changes
+    anything the first time. It fails silently while another connection
+    holds a lock, leaving the switch to a later connection.
+
+    Args:
+        conn: Open SQLite connection.
+
+    Returns:
+        The database's journal mode afterwards ("wal" on success).
+    """
+    try:
+        return conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+    except sqlite3.OperationalError:
+        return conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+
+class ConnectionManager:
+    """Connections to one database, shared by all adapters in a process.
+
+    The writer connection is opened on first use and closed once every
+    adapter using it has released it. Reader connections are refused
+    writes and returned to a pool when released, up to MAX_IDLE_READERS.
+    All connections can be used from any thread.
+    """
+
+    def __init__(self, db_path: Path, max_idle_readers: int = MAX_IDLE_READERS) -> None:
+        """Initialize connection manager.
+
+        Args:
+            db_path: Path to SQLite database file.
+            max_idle_readers: Reader connections kept open when released.
+        """
+        self.db_path = db_path
+        self.max_idle_readers = max_idle_readers
+        # Identity of the database file, to notice it being replaced
+        self.inode: int | None = None
+        self._lock = threading.Lock()
+        self._writer: sqlite3.Connection | None = None
+        self._writer_users = 0
+        self._extensions: set[str] = set()
+        self._private_writers: set[sqlite3.Connection] = set()
+        self._idle_readers: list[sqlite3.Connection] = []
+
+    def _connect(self, readonly: bool) -> sqlite3.Connection:
+        """Open and configure a connection.
+
+        Args:
+            readonly: Refuse writes on the connection.
+
+        Returns:
+            SQLite connection object.
+        """
+        conn = sqlite3.connect(
+            self.db_path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False
+        )
+        configure_connection(conn, readonly=readonly)
+        if self.inode is None:
+            self.inode = os.stat(self.db_path).st_ino
+        return conn
+
+    def acquire_writer(self) -> sqlite3.Connection:
+        """Get the writer connection, opening it if needed.
+
+        Every call must be matched by a call to release().
+
+        Returns:
+            The shared writer connection, with foreign keys enabled.
+        """
+        with self._lock:
+            if self._writer is None:
+                self._writer = self._connect(readonly=False)
+                enable_wal(self._writer)
+                self._extensions = set()
+            self._writer_users += 1
+            return self._writer
+
+    def open_writer(self) -> sqlite3.Connection:
+        """Open a writer connection for the caller's exclusive use.
+
+        Transactions on it are isolated from the shared writer's, so rolling
+        one back discards only its own writes. Writers still take turns: a
+        transaction waits (up to the busy timeout) while another connection's
+        write transaction is open. Must be matched by a call to release().
+
+        Returns:
+            A new writer connection, with foreign keys enabled.
+        """
+        conn = self._connect(readonly=False)
+        enable_wal(conn)
+        with self._lock:
+            self._private_writers.add(conn)
+        return conn
+
+    def acquire_reader(self) -> sqlite3.Connection:
+        """Check a reader connection out of the pool, opening one if none is idle.
+
+        Every call must be matched by a call to release().
+
+        Returns:
+            A query-only connection for the caller's exclusive use.
+        """
+        with self._lock:
+            if self._idle_readers:
+                return self._idle_readers.pop()
+        return self._connect(readonly=True)
+
+    def load_extension(
+        self, conn: sqlite3.Connection, name: str, load: Callable[[sqlite3.Connection], None]
+    ) -> None:
+        """Load a SQLite extension into the writer connection once.
+
+        Args:
+            conn: The writer connection.
+            name: Name identifying the extension.
+            load: Function loading the extension into a connection.
+        """
+        with self._lock:
+            if name in self._extensions:
+                return
+            conn.enable_load_extension(True)
+            try:
+                load(conn)
+            finally:
+                conn.enable_load_extension(False)
+            self._extensions.add(name)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Release a connection acquired from this manager.
+
+        Args:
+            conn: Connection returned by acquire_writer(), open_writer() or
+                acquire_reader().
+        """
+        with self._lock:
+            if conn is self._writer:
+                self._writer_users -= 1
+                if self._writer_users > 0:
+                    return
+                self._writer = None
+            elif conn in self._private_writers:
+                self._private_writers.discard(conn)
+            elif len(self._idle_readers) < self.max_idle_readers:
+                self._idle_readers.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close the idle reader connections."""
+        with self._lock:
+            idle, self._idle_readers = self._idle_readers, []
+        for conn in idle:
+            conn.close()
+
+
+# Managers in use, by absolute database path. Adapters hold their manager,
+# which is dropped (closing its connections) once no adapter uses it.
+_managers: "weakref.WeakValueDictionary[str, ConnectionManager]" = weakref.WeakValueDictionary()
+_managers_lock = threading.Lock()
+
+
+def get_manager(db_path: Path) -> ConnectionManager:
+    """Get the connection manager of a database.
+
+    A database file replaced since its manager connected (e.g. recreated
+    by a test or restored from a backup) gets a new manager, so new
+    connections do not keep using the old file.
+
+    Args:
+        db_path: Path to SQLite database file.
+
+    Returns:
+        The manager shared by all adapters of the database in this process.
+    """
+    key = os.path.abspath(db_path)
+    try:
+        inode: int | None = os.stat(key).st_ino
+    except FileNotFoundError:
+        inode = None
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None or (manager.inode is not None and manager.inode != inode):
+            manager = ConnectionManager(Path(key))
+            _managers[key] = manager
+        return manager
@@ -0,0 +1,214 @@
+"""SQLite adapter implementing EmbeddingCache, shared by all repositories.
+
+Each repository keeps its own index.db, so clones and worktrees of the same
+code would otherwise embed identical chunks again. This cache lives in the
+user's home directory and maps (model fingerprint, chunk content hash) to a
+vector. Several syncs may use it at once, so it runs in WAL mode with a busy
+timeout, and its size is capped by evicting least recently used entries.
+"""
+
+import math
+import sqlite3
+import struct
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+DEFAULT_CACHE_PATH = Path.home() / ".ember" / "cache" / "embeddings.db"
+
+# Bound parameters per IN (...) query, well below SQLite's limit
+_LOOKUP_BATCH = 500
+
+# Evict down to this fraction of the cap so eviction doesn't run on every write
+_EVICT_TARGET = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model_fingerprint TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    UNIQUE(model_fingerprint, content_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used);
+"""
+
+
+class SQLiteEmbeddingCache:
+    """SQLite implementation of EmbeddingCache with size-capped LRU eviction."""
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        max_size_mb: int = 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache (the database is created on first use).
+
+        Args:
+            db_path: Path to the cache database (default: ~/.ember/cache/embeddings.db).
+            max_size_mb: Maximum total size of stored vectors in megabytes.
+            clock: Wall clock in seconds, used for recency.
+        """
+        self.db_path = db_path or DEFAULT_CACHE_PATH
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self._clock = clock
+        self._conn: sqlite3.Connection | None = None
+        # Running estimate of stored vector bytes (None = not yet measured)
+        self._size_bytes: int | None = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a database connection, creating the cache on first use.
+
+        Returns:
+            SQLite connection object.
+        """
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            # Concurrent syncs in different repositories share this file
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "SQLiteEmbeddingCache":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Exit context manager, closing the database connection."""
+        self.close()
+        return False
+
+    def _encode_vector(self, vector: list[float]) -> bytes:
+        """Encode a vector as a float32 BLOB (same format as the index)."""
+        return struct.pack(f"{len(vector)}f", *vector)
+
+    def _decode_vector(self, blob: bytes) -> list[float]:
+        """Decode a float32 BLOB into a vector."""
+        return list(struct.unpack(f"{len(blob) // 4}f", blob))
+
+    def get_many(
+        self, model_fingerprint: str, content_hashes: list[str]
+    ) -> dict[str, list[float]]:
+        """Look up cached embeddings and mark them as recently used.
+
+        Args:
+            model_fingerprint: Fingerprint of the embedding model.
+            content_hashes: Chunk content hashes to look up.
+
+        Returns:
+            Embeddings for the hashes found in the cache, keyed by hash.
+        """
+        unique = list(dict.fromkeys(content_hashes))
+        if not unique:
+            return {}
+
+        conn = self._get_connection()
+        found: dict[str, list[float]] = {}
+        for start in range(0, len(unique), _LOOKUP_BATCH):
+            batch = unique[start : start + _LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            cursor = conn.execute(
+                f"""
+                SELECT content_hash, vector FROM embeddings
+                WHERE model_fingerprint = ? AND content_hash IN ({placeholders})
+                """,
+                (model_fingerprint, *batch),
+            )
+            for content_hash, blob in cursor.fetchall():
+                found[content_hash] = self._decode_vector(blob)
+
+        if found:
+            self._touch(model_fingerprint, list(found))
+        return found
+
+    def _touch(self, model_fingerprint: str, content_hashes: list[str]) -> None:
+        """Update recency of entries that were just read."""
+        conn = self._get_connection()
+        now = self._clock()
+        for start in range(0, len(content_hashes), _LOOKUP_BATCH):
+            batch = content_hashes[start : start + _LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            conn.execute(
+                f"""
+                UPDATE embeddings SET last_used = ?
+                WHERE model_fingerprint = ? AND content_hash IN ({placeholders})
+                """,
+                (now, model_fingerprint, *batch),
+            )
+        conn.commit()
+
+    def put_many(self, model_fingerprint: str, embeddings: dict[str, list[float]]) -> None:
+        """Store embeddings, evicting least recently used entries if over capacity.
+
+        Args:
+            model_fingerprint: Fingerprint of the embedding model.
+            embeddings: Embeddings keyed by chunk content hash.
+        """
+        if not embeddings:
+            return
+
+        conn = self._get_connection()
+        now = self._clock()
+        rows = [
+            (model_fingerprint, content_hash, self._encode_vector(vector), now)
+            for content_hash, vector in embeddings.items()
+        ]
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO embeddings
+                (model_fingerprint, content_hash, vector, last_used)
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+        )
+        conn.commit()
+
+        if self._size_bytes is None:
+            self._size_bytes = self.size_bytes()
+        else:
+            self._size_bytes += sum(len(row[2]) for row in rows)
+
+        if self._size_bytes > self.max_size_bytes:
+            self._evict()
+
+    def size_bytes(self) -> int:
+        """Total size of stored vectors in bytes."""
+        cursor = self._get_connection().execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        )
+        return int(cursor.fetchone()[0])
+
+    def count(self) -> int:
+        """Number of cached embeddings."""
+        cursor = self._get_connection().execute("SELECT COUNT(*) FROM embeddings")
+        return int(cursor.fetchone()[0])
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under the eviction target."""
+        conn = self._get_connection()
+        # Other processes may have written too; measure before deleting
+        total = self.size_bytes()
+        entries = self.count()
+        target = int(self.max_size_bytes * _EVICT_TARGET)
+        if total > self.max_size_bytes and entries:
+            average = total / entries
+            excess = math.ceil((total - target) / average)
+            conn.execute(
+                """
+                DELETE FROM embeddings WHERE rowid IN (
+                    SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?
+                )
+                """,
+                (excess,),
+            )
+            conn.commit()
+        self._size_bytes = self.size_bytes()
@@ -0,0 +1,391 @@
+"""SQLite adapter implementing RefRepository for multi-ref indexes."""
+
+import sqlite3
+import struct
+import time
+from pathlib import Path
+
+from ember.adapters.fts.code_tokens import identifier_terms
+from ember.adapters.sqlite.connection import get_manager
+from ember.adapters.sqlite.schema import migrate_database
+from ember.domain.entities import Chunk
+from ember.ports.repositories import IndexedRef
+
+
+class SQLiteRefRepository:
+    """SQLite implementation of RefRepository.
+
+    Retained chunks stay in the chunks table with live = 0 and a chunk id that
+    includes their file hash, so they never collide with the live chunk at the
+    same lines. Their FTS rows and vectors are kept as they are, so restoring a
+    version is an UPDATE rather than a re-index.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize ref repository.
+
+        Args:
+            db_path: Path to SQLite database file.
+        """
+        self.db_path = db_path
+        self._manager = get_manager(db_path)
+        self._conn: sqlite3.Connection | None = None
+
+        # Older databases predate the refs tables
+        if db_path.exists():
+            migrate_database(db_path)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a database connection with foreign keys enabled.
+
+        Uses a writer connection of its own, so rolling back a failed
+        transaction cannot discard writes other repositories have pending.
+
+        Returns:
+            SQLite connection object.
+        """
+        if self._conn is None:
+            self._conn = self._manager.open_writer()
+        return self._conn
+
+    def close(self) -> None:
+        """Release the database connection if held."""
+        if self._conn is not None:
+            self._manager.release(self._conn)
+            self._conn = None
+
+    def __enter__(self) -> "SQLiteRefRepository":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Exit context manager, closing the database connection."""
+        self.close()
+        return False
+
+    def _select_refs(self, where: str = "", params: tuple = ()) -> list[IndexedRef]:
+        """Select refs with their file counts, most recently synced first."""
+        cursor = self._get_connection().execute(
+            f"""
+            SELECT r.name, r.tree_sha, r.synced_at, COUNT(rf.path)
+            FROM refs r
+            LEFT JOIN ref_files rf ON rf.ref = r.name
+            {where}
+            GROUP BY r.name
+            ORDER BY r.synced_at DESC, r.rowid DESC
+            """,
+            params,
+        )
+        return [
+            IndexedRef(name=row[0], tree_sha=row[1], synced_at=row[2], files=row[3])
+            for row in cursor.fetchall()
+        ]
+
+    def get(self, name: str) -> IndexedRef | None:
+        """Get an indexed ref by name.
+
+        Args:
+            name: Ref name.
+
+        Returns:
+            The ref, or None if it is not indexed.
+        """
+        refs = self._select_refs("WHERE r.name = ?", (name,))
+        return refs[0] if refs else None
+
+    def find_by_tree(self, tree_sha: str) -> IndexedRef | None:
+        """Get the most recently synced ref at a tree.
+
+        Args:
+            tree_sha: Tree SHA.
+
+        Returns:
+            The ref, or None if no indexed ref is at this tree.
+        """
+        refs = self._select_refs("WHERE r.tree_sha = ?", (tree_sha,))
+        return refs[0] if refs else None
+
+    def list_refs(self) -> list[IndexedRef]:
+        """List indexed refs, most recently synced first.
+
+        Returns:
+            Indexed refs.
+        """
+        return self._select_refs()
+
+    def live_files(self) -> dict[Path, str]:
+        """Get the file versions in the live index.
+
+        Returns:
+            Mapping of path (relative to repository root) to file hash.
+        """
+        cursor = self._get_connection().execute(
+            "SELECT path, MIN(file_hash) FROM chunks WHERE live = 1 GROUP BY path"
+        )
+        return {Path(path): file_hash for path, file_hash in cursor.fetchall()}
+
+    def has_version(self, path: Path, file_hash: str) -> bool:
+        """Check whether chunks of a file version are stored (live or retained).
+
+        Args:
+            path: File path relative to repository root.
+            file_hash: Hash of the file content.
+
+        Returns:
+            True if the version's chunks are stored.
+        """
+        cursor = self._get_connection().execute(
+            "SELECT 1 FROM chunks WHERE path = ? AND file_hash = ? LIMIT 1",
+            (str(path), file_hash),
+        )
+        return cursor.fetchone() is not None
+
+    def _retire(self, conn: sqlite3.Connection, path: str, replacing: str | None) -> int:
+        """Move a path's live chunks out of the live index (without committing)."""
+        if replacing is not None:
+            conn.execute(
+                "DELETE FROM chunks WHERE path = ? AND file_hash = ?", (path, replacing)
+            )
+
+        # A version that is already retained must not be stored twice
+        conn.execute(
+            """
+            DELETE FROM chunks
+            WHERE path = ? AND live = 1 AND file_hash IN (
+                SELECT file_hash FROM chunks WHERE path = ? AND live = 0
+            )
+            """,
+            (path, path),
+        )
+
+        rows = conn.execute(
+            """
+            SELECT id, project_id, start_line, end_line, file_hash
+            FROM chunks
+            WHERE path = ? AND live = 1
+            """,
+            (path,),
+        ).fetchall()
+        conn.executemany(
+            "UPDATE chunks SET live = 0, chunk_id = ? WHERE id = ?",
+            [
+                (Chunk.compute_id(project_id, Path(path), start, end, version=file_hash), db_id)
+                for db_id, project_id, start, end, file_hash in rows
+            ],
+        )
+        return len(rows)
+
+    def retire(self, path: Path, replacing: str | None = None) -> int:
+        """Take a file's chunks out of the live index, retaining them for other refs.
+
+        Args:
+            path: File path relative to repository root.
+            replacing: Hash of the version about to be indexed in their place.
+                Stored chunks of that version are deleted rather than retained.
+
+        Returns:
+            Number of chunks taken out of the live index.
+        """
+        conn = self._get_connection()
+        try:
+            retired = self._retire(conn, str(path), replacing)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return retired
+
+    def restore(self, path: Path, file_hash: str) -> int:
+        """Make a retained file version live again, retiring the current one.
+
+        Args:
+            path: File path relative to repository root.
+            file_hash: Hash of the version to restore.
+
+        Returns:
+            Number of chunks restored (0 if the version is not retained).
+        """
+        conn = self._get_connection()
+        path_str = str(path)
+        rows = conn.execute(
+            """
+            SELECT id, project_id, start_line, end_line
+            FROM chunks
+            WHERE path = ? AND file_hash = ? AND live = 0
+            """,
+            (path_str, file_hash),
+        ).fetchall()
+        if not rows:
+            return 0
+
+        try:
+            self._retire(conn, path_str, replacing=None)
+            conn.executemany(
+                "UPDATE chunks SET live = 1, chunk_id = ? WHERE id = ?",
+                [
+                    (Chunk.compute_id(project_id, path, start, end), db_id)
+                    for db_id, project_id, start, end in rows
+                ],
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return len(rows)
+
+    def store_version(
+        self,
+        chunks: list[Chunk],
+        embeddings: list[list[float]],
+        model_fingerprint: str,
+    ) -> int:
+        """Store chunks of a file version for other refs, outside the live index.
+
+        Args:
+            chunks: Chunks of the version, with versioned ids.
+            embeddings: Embedding per chunk, in order.
+            model_fingerprint: Fingerprint of the embedding model.
+
+        Returns:
+            Number of chunks stored.
+        """
+        conn = self._get_connection()
+        now = time.time()
+        stored = 0
+        try:
+            for chunk, embedding in zip(chunks, embeddings, strict=True):
+                cursor = conn.execute(
+                    """
+                    INSERT OR IGNORE INTO chunks (
+                        chunk_id, project_id, path, lang, symbol, start_line, end_line,
+                        content, content_hash, file_hash, tree_sha, rev, created_at, terms, live
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+                    """,
+                    (
+                        chunk.id,
+                        chunk.project_id,
+                        str(chunk.path),
+                        chunk.lang,
+                        chunk.symbol,
+                        chunk.start_line,
+                        chunk.end_line,
+                        chunk.content,
+                        chunk.content_hash,
+                        chunk.file_hash,
+                        chunk.tree_sha,
+                        chunk.rev,
+                        now,
+                        identifier_terms(chunk.content),
+                    ),
+                )
+                if cursor.rowcount != 1:
+                    continue  # Already stored
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO vectors (chunk_id, embedding, dim, model_fingerprint)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (
+                        cursor.lastrowid,
+                        struct.pack(f"{len(embedding)}f", *embedding),
+                        len(embedding),
+                        model_fingerprint,
+                    ),
+                )
+                stored += 1
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return stored
+
+    def record(
+        self,
+        name: str,
+        tree_sha: str,
+        files: dict[Path, str] | None = None,
+    ) -> None:
+        """Record a ref and the file versions it contains, replacing any previous record.
+
+        Args:
+            name: Ref name.
+            tree_sha: Tree SHA the ref was synced at.
+            files: Mapping of path to file hash, or None for the versions
+                currently in the live index.
+        """
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                """
+                INSERT INTO refs (name, tree_sha, synced_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    tree_sha = excluded.tree_sha,
+                    synced_at = excluded.synced_at
+                """,
+                (name, tree_sha, time.time()),
+            )
+            conn.execute("DELETE FROM ref_files WHERE ref = ?", (name,))
+            if files is None:
+                conn.execute(
+                    """
+                    INSERT INTO ref_files (ref, path, file_hash)
+                    SELECT ?, path, MIN(file_hash) FROM chunks WHERE live = 1 GROUP BY path
+                    """,
+                    (name,),
+                )
+            else:
+                conn.executemany(
+                    "INSERT INTO ref_files (ref, path, file_hash) VALUES (?, ?, ?)",
+                    [(name, str(path), file_hash) for path, file_hash in files.items()],
+                )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def prune(self, keep: int) -> int:
+        """Forget the oldest refs and delete chunks no ref or the live index uses.
+
+        Args:
+            keep: Number of most recently synced refs to keep.
+
+        Returns:
+            Number of retained chunks deleted.
+        """
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                """
+                DELETE FROM refs WHERE name IN (
+                    SELECT name FROM refs
+                    ORDER BY synced_at DESC, rowid DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (max(0, keep),),
+            )
+            conn.execute("DELETE FROM ref_files WHERE ref NOT IN (SELECT name FROM refs)")
+            # Vectors and tags go with their chunks via ON DELETE CASCADE
+            cursor = conn.execute(
+                """
+                DELETE FROM chunks
+                WHERE live = 0 AND NOT EXISTS (
+                    SELECT 1 FROM ref_files rf
+                    WHERE rf.path = chunks.path AND rf.file_hash = chunks.file_hash
+                )
+                """
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Forget all refs and delete all retained chunks."""
+        conn = self._get_connection()
+        conn.execute("DELETE FROM ref_files")
+        conn.execute("DELETE FROM refs")
+        conn.execute("DELETE FROM chunks WHERE live = 0")
+        conn.commit()
@@ -7,27 +7,53 @@ with git-aware incremental indexing.
 Schema follows PRD §4 requirements:
 - chunks: Core chunk metadata with git tracking
 - chunk_text: FTS5 virtual table for full-text search
+- chunk_trigrams: Optional FTS5 trigram table for substring and regex search
 - vectors: Vector embeddings for semantic search
 - meta: System metadata (model, version, etc.)
 - tags: Custom metadata tags
 - files: File tracking for incremental sync
+- sync_checkpoints: Per-file progress of an in-flight sync (for resuming)
+- refs / ref_files: Refs kept indexed alongside the live index, and the file
+  version each one contains
+
+In "code" full-text search mode, chunks.terms holds the parts of compound
+identifiers in the chunk (see ember.adapters.fts.code_tokens) and is indexed
+alongside the content; "porter" mode indexes stemmed words only.
+
+Chunks of the live index have live = 1. Chunks of file versions that only
+other refs contain are retained with live = 0 and shared by every ref with
+that (path, file_hash), so their vectors are computed once.
 """
 
 import sqlite3
 from pathlib import Path
 
+from ember.adapters.fts.code_tokens import FTS_TOKENIZERS, identifier_terms
+from ember.adapters.sqlite.connection import BUSY_TIMEOUT_MS, enable_wal
+
 # Schema version for migrations
-SCHEMA_VERSION = 2
+SCHEMA_VERSION = 5
 
+# Full-text search mode of new databases
+DEFAULT_FTS_TOKENIZER = "code"
 
-def init_database(db_path: Path) -> None:
+
+def init_database(
+    db_path: Path,
+    fts_tokenizer: str = DEFAULT_FTS_TOKENIZER,
+    trigram_index: bool = False,
+) -> None:
     """Initialize a new ember index database with complete schema.
 
     Creates all tables, indexes, and default metadata entries.
     This is called by the init command to set up a new .ember/ directory.
+    The database uses write-ahead logging, so searches can read it while a
+    sync writes to it.
 
     Args:
         db_path: Path to the SQLite database file (typically .ember/index.db)
+        fts_tokenizer: Full-text search mode, "code" or "porter"
+        trigram_index: Also create the chunk_trigrams table
 
     Raises:
         sqlite3.Error: If database creation fails
@@ -35,21 +61,25 @@ def init_database(db_path: Path) -> None:
     # Ensure parent directory exists
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000)
     try:
-        _create_tables(conn)
+        enable_wal(conn)
+        _create_tables(conn, fts_tokenizer)
+        if trigram_index:
+            _create_trigram_index(conn.cursor())
         _create_indexes(conn)
-        _insert_default_meta(conn)
+        _insert_default_meta(conn, fts_tokenizer)
         conn.commit()
     finally:
         conn.close()
 
 
-def _create_tables(conn: sqlite3.Connection) -> None:
+def _create_tables(conn: sqlite3.Connection, tokenizer: str) -> None:
     """Create all database tables.
 
     Args:
         conn: Open SQLite connection
+        tokenizer: Full-text search mode, "code" or "porter"
     """
     cursor = conn.cursor()
 
@@ -70,45 +100,13 @@ def _create_tables(conn: sqlite3.Connection) -> None:
             tree_sha TEXT,
             rev TEXT,
             created_at REAL NOT NULL,
+            live INTEGER NOT NULL DEFAULT 1,
+            terms TEXT NOT NULL DEFAULT '',
             UNIQUE(tree_sha, path, start_line, end_line)
         )
     """)
 
-    # chunk_text: FTS5 virtual table for full-text search
-    # tokenize='porter' uses Porter stemming for better English matching
-    cursor.execute("""
-        CREATE VIRTUAL TABLE IF NOT EXISTS chunk_text USING fts5(
-            content,
-            path,
-            symbol,
-            lang,
-            content='chunks',
-            content_rowid='id',
-            tokenize='porter unicode61'
-        )
-    """)
-
-    # Triggers to keep FTS5 table in sync with chunks table
-    cursor.execute("""
-        CREATE TRIGGER IF NOT EXISTS chunks_ai AFTER INSERT ON chunks BEGIN
-            INSERT INTO chunk_text(rowid, content, path, symbol, lang)
-            VALUES (new.id, new.content, new.path, new.symbol, new.lang);
-        END
-    """)
-
-    cursor.execute("""
-        CREATE TRIGGER IF NOT EXISTS chunks_ad AFTER DELETE ON chunks BEGIN
-            DELETE FROM chunk_text WHERE rowid = old.id;
-        END
-    """)
-
-    cursor.execute("""
-        CREATE TRIGGER IF NOT EXISTS chunks_au AFTER UPDATE ON chunks BEGIN
-            DELETE FROM chunk_text WHERE rowid = old.id;
-            INSERT INTO chunk_text(rowid, content, path, symbol, lang)
-            VALUES (new.id, new.content, new.path, new.symbol, new.lang);
-        END
-    """)
+    _create_fts(cursor, tokenizer)
 
     # vectors: Vector embeddings for semantic search
     cursor.execute("""
@@ -151,6 +149,218 @@ def _create_tables(conn: sqlite3.Connection) -> None:
         )
     """)
 
+    _create_sync_checkpoints_table(cursor)
+    _create_ref_tables(cursor)
+
+
+def _create_fts(cursor: sqlite3.Cursor, tokenizer: str) -> None:
+    """Create the chunk_text FTS5 table and the triggers syncing it.
+
+    Args:
+        cursor: Cursor on an open SQLite connection
+        tokenizer: Full-text search mode, "code" or "porter"
+    """
+    if tokenizer == "porter":
+        # chunk_text: FTS5 virtual table for full-text search
+        # tokenize='porter' uses Porter stemming for better English matching
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS chunk_text USING fts5(
+                content,
+                path,
+                symbol,
+                lang,
+                content='chunks',
+                content_rowid='id',
+                tokenize='porter unicode61'
+            )
+        """)
+
+        # Triggers to keep FTS5 table in sync with chunks table
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS chunks_ai AFTER INSERT ON chunks BEGIN
+                INSERT INTO chunk_text(rowid, content, path, symbol, lang)
+                VALUES (new.id, new.content, new.path, new.symbol, new.lang);
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS chunks_ad AFTER DELETE ON chunks BEGIN
+                DELETE FROM chunk_text WHERE rowid = old.id;
+            END
+        """)
+
+        _create_fts_update_trigger(cursor, tokenizer)
+        return
+
+    # chunk_text: FTS5 virtual table over content and identifier parts.
+    # "_" is a token character so identifiers stay whole, and nothing is
+    # stemmed, since stemming mangles identifiers.
+    cursor.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS chunk_text USING fts5(
+            content,
+            terms,
+            path,
+            symbol,
+            lang,
+            content='chunks',
+            content_rowid='id',
+            tokenize="{FTS_TOKENIZERS[tokenizer]}"
+        )
+    """)
+
+    # Triggers to keep FTS5 table in sync with chunks table. Removing a row
+    # from an external-content table needs its old values, via 'delete'.
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS chunks_ai AFTER INSERT ON chunks BEGIN
+            INSERT INTO chunk_text(rowid, content, terms, path, symbol, lang)
+            VALUES (new.id, new.content, new.terms, new.path, new.symbol, new.lang);
+        END
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS chunks_ad AFTER DELETE ON chunks BEGIN
+            INSERT INTO chunk_text(chunk_text, rowid, content, terms, path, symbol, lang)
+            VALUES ('delete', old.id, old.content, old.terms, old.path, old.symbol, old.lang);
+        END
+    """)
+
+    _create_fts_update_trigger(cursor, tokenizer)
+
+
+def _create_fts_update_trigger(cursor: sqlite3.Cursor, tokenizer: str) -> None:
+    """Create the trigger reindexing a chunk in chunk_text when it changes.
+
+    Only updates of indexed columns fire it, so toggling live or chunk_id
+    when switching refs does not re-tokenize the chunk.
+
+    Args:
+        cursor: Cursor on an open SQLite connection
+        tokenizer: Full-text search mode, "code" or "porter"
+    """
+    if tokenizer == "porter":
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS chunks_au
+            AFTER UPDATE OF content, path, symbol, lang ON chunks BEGIN
+                DELETE FROM chunk_text WHERE rowid = old.id;
+                INSERT INTO chunk_text(rowid, content, path, symbol, lang)
+                VALUES (new.id, new.content, new.path, new.symbol, new.lang);
+            END
+        """)
+        return
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS chunks_au
+        AFTER UPDATE OF content, terms, path, symbol, lang ON chunks BEGIN
+            INSERT INTO chunk_text(chunk_text, rowid, content, terms, path, symbol, lang)
+            VALUES ('delete', old.id, old.content, old.terms, old.path, old.symbol, old.lang);
+            INSERT INTO chunk_text(rowid, content, terms, path, symbol, lang)
+            VALUES (new.id, new.content, new.terms, new.path, new.symbol, new.lang);
+        END
+    """)
+
+
+def _create_trigram_index(cursor: sqlite3.Cursor) -> None:
+    """Create the chunk_trigrams FTS5 table and the triggers syncing it.
+
+    Indexes every three-character sequence of chunk content, so substrings
+    and the literal parts of regular expressions can be looked up. It takes
+    about as much space again as the content, so it is optional.
+
+    Args:
+        cursor: Cursor on an open SQLite connection
+    """
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS chunk_trigrams USING fts5(
+            content,
+            content='chunks',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS chunk_trigrams_ai AFTER INSERT ON chunks BEGIN
+            INSERT INTO chunk_trigrams(rowid, content) VALUES (new.id, new.content);
+        END
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS chunk_trigrams_ad AFTER DELETE ON chunks BEGIN
+            INSERT INTO chunk_trigrams(chunk_trigrams, rowid, content)
+            VALUES ('delete', old.id, old.content);
+        END
+    """)
+
+    # Only content is indexed, so other updates (e.g. of live) are skipped
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS chunk_trigrams_au AFTER UPDATE OF content ON chunks BEGIN
+            INSERT INTO chunk_trigrams(chunk_trigrams, rowid, content)
+            VALUES ('delete', old.id, old.content);
+            INSERT INTO chunk_trigrams(rowid, content) VALUES (new.id, new.content);
+        END
+    """)
+
+
+def _create_sync_checkpoints_table(cursor: sqlite3.Cursor) -> None:
+    """Create the sync_checkpoints table.
+
+    Records files completed by a sync that has not finished yet, keyed by the
+    target tree SHA and model fingerprint, so an interrupted sync can resume.
+
+    Args:
+        cursor: Cursor on an open SQLite connection
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sync_checkpoints (
+            tree_sha TEXT NOT NULL,
+            model_fingerprint TEXT NOT NULL,
+            path TEXT NOT NULL,
+            completed_at REAL NOT NULL,
+            PRIMARY KEY (tree_sha, model_fingerprint, path)
+        )
+    """)
+
+
+def _create_ref_tables(cursor: sqlite3.Cursor) -> None:
+    """Create the refs and ref_files tables.
+
+    refs records each indexed ref (branch name, rev, or "worktree") and the
+    tree it was synced at; ref_files records which version of each file the
+    ref contains, which is how ref-scoped queries select chunks.
+
+    Args:
+        cursor: Cursor on an open SQLite connection
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS refs (
+            name TEXT PRIMARY KEY,
+            tree_sha TEXT NOT NULL,
+            synced_at REAL NOT NULL
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ref_files (
+            ref TEXT NOT NULL,
+            path TEXT NOT NULL,
+            file_hash TEXT NOT NULL,
+            PRIMARY KEY (ref, path),
+            FOREIGN KEY (ref) REFERENCES refs(name) ON DELETE CASCADE
+        )
+    """)
+
+    # Index for finding the chunks of a file version
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_chunks_version
+        ON chunks(path, file_hash)
+    """)
+
+    # Index for checking whether any other ref's chunks are retained
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_chunks_retained
+        ON chunks(live) WHERE live = 0
+    """)
+
 
 def _create_indexes(conn: sqlite3.Connection) -> None:
     """Create database indexes for query performance.
@@ -191,11 +401,12 @@ def _create_indexes(conn: sqlite3.Connection) -> None:
     """)
 
 
-def _insert_default_meta(conn: sqlite3.Connection) -> None:
+def _insert_default_meta(conn: sqlite3.Connection, tokenizer: str) -> None:
     """Insert default metadata entries.
 
     Args:
         conn: Open SQLite connection
+        tokenizer: Full-text search mode, "code" or "porter"
     """
     cursor = conn.cursor()
 
@@ -204,9 +415,10 @@ def _insert_default_meta(conn: sqlite3.Connection) -> None:
         INSERT OR IGNORE INTO meta (key, value) VALUES
         ('schema_version', ?),
         ('created_at', datetime('now')),
-        ('index_version', '0.1.0')
+        ('index_version', '0.1.0'),
+        ('fts_tokenizer', ?)
     """,
-        (str(SCHEMA_VERSION),),
+        (str(SCHEMA_VERSION), tokenizer),
     )
 
 
@@ -222,7 +434,7 @@ def check_schema_version(db_path: Path) -> int:
     if not db_path.exists():
         return 0
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000)
     try:
         cursor = conn.cursor()
         cursor.execute("SELECT value FROM meta WHERE key = 'schema_version'")
@@ -245,7 +457,7 @@ def migrate_database(db_path: Path) -> None:
     if current_version >= SCHEMA_VERSION:
         return  # Already at latest version
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000)
     try:
         # Migration from version 1 to version 2: Add chunk_id column
         if current_version < 2:
@@ -289,5 +501,136 @@ def migrate_database(db_path: Path) -> None:
             )
 
             conn.commit()
+
+        # Migration from version 2 to version 3: Add sync_checkpoints table
+        if current_version < 3:
+            cursor = conn.cursor()
+            _create_sync_checkpoints_table(cursor)
+            cursor.execute(
+                "UPDATE meta SET value = ? WHERE key = 'schema_version'",
+                (str(3),)
+            )
+            conn.commit()
+
+        # Migration from version 3 to version 4: Add live column and ref tables
+        if current_version < 4:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA table_info(chunks)")
+            columns = [row[1] for row in cursor.fetchall()]
+            if "live" not in columns:
+                cursor.execute(
+                    "ALTER TABLE chunks ADD COLUMN live INTEGER NOT NULL DEFAULT 1"
+                )
+            _create_ref_tables(cursor)
+            cursor.execute(
+                "UPDATE meta SET value = ? WHERE key = 'schema_version'",
+                (str(4),)
+            )
+            conn.commit()
+
+        # Migration from version 4 to version 5: Add terms column. The FTS
+        # table keeps its porter tokenizer until rebuild_fts is run, but its
+        # update trigger is scoped to the indexed columns.
+        if current_version < 5:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA table_info(chunks)")
+            columns = [row[1] for row in cursor.fetchall()]
+            if "terms" not in columns:
+                cursor.execute(
+                    "ALTER TABLE chunks ADD COLUMN terms TEXT NOT NULL DEFAULT ''"
+                )
+            cursor.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('fts_tokenizer', 'porter')"
+            )
+            cursor.execute("DROP TRIGGER IF EXISTS chunks_au")
+            _create_fts_update_trigger(cursor, get_fts_tokenizer(conn))
+            cursor.execute(
+                "UPDATE meta SET value = ? WHERE key = 'schema_version'",
+                (str(5),)
+            )
+            conn.commit()
+    finally:
+        conn.close()
+
+
+def get_fts_tokenizer(conn: sqlite3.Connection) -> str:
+    """Get the full-text search mode of a database.
+
+    Args:
+        conn: Open SQLite connection
+
+    Returns:
+        "code" or "porter" (databases from before modes were recorded are "porter")
+    """
+    row = conn.execute("SELECT value FROM meta WHERE key = 'fts_tokenizer'").fetchone()
+    return row[0] if row else "porter"
+
+
+def has_trigram_index(conn: sqlite3.Connection) -> bool:
+    """Check whether a database has the chunk_trigrams table.
+
+    Args:
+        conn: Open SQLite connection
+
+    Returns:
+        True if substring and regex search can use the trigram index
+    """
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chunk_trigrams'"
+    ).fetchone()
+    return row is not None
+
+
+def rebuild_fts(db_path: Path, tokenizer: str, trigram_index: bool | None = None) -> int:
+    """Rebuild the full-text indexes of a database.
+
+    Recomputes the identifier terms of every chunk and reindexes the stored
+    content, so switching modes needs no re-chunking or re-embedding.
+
+    Args:
+        db_path: Path to the SQLite database
+        tokenizer: Full-text search mode, "code" or "porter"
+        trigram_index: Create (True) or drop (False) the chunk_trigrams
+            table, or rebuild it only if it exists (None)
+
+    Returns:
+        Number of chunks reindexed
+
+    Raises:
+        ValueError: If the tokenizer is unknown
+    """
+    if tokenizer not in FTS_TOKENIZERS:
+        raise ValueError(f"Unknown FTS tokenizer: {tokenizer!r}")
+
+    migrate_database(db_path)
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000)
+    try:
+        cursor = conn.cursor()
+        if trigram_index is None:
+            trigram_index = has_trigram_index(conn)
+        for table in ("chunks", "chunk_trigrams"):
+            for event in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {table}_{event}")
+        cursor.execute("DROP TABLE IF EXISTS chunk_text")
+        cursor.execute("DROP TABLE IF EXISTS chunk_trigrams")
+
+        # Terms are only indexed in code mode, but kept current in both
+        rows = cursor.execute("SELECT id, content FROM chunks").fetchall()
+        cursor.executemany(
+            "UPDATE chunks SET terms = ? WHERE id = ?",
+            [(identifier_terms(content), db_id) for db_id, content in rows],
+        )
+
+        _create_fts(cursor, tokenizer)
+        cursor.execute("INSERT INTO chunk_text(chunk_text) VALUES ('rebuild')")
+        if trigram_index:
+            _create_trigram_index(cursor)
+            cursor.execute("INSERT INTO chunk_trigrams(chunk_trigrams) VALUES ('rebuild')")
+        cursor.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('fts_tokenizer', ?)",
+            (tokenizer,),
+        )
+        conn.commit()
+        return len(rows)
     finally:
         conn.close()
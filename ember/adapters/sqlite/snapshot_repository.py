@@ -0,0 +1,220 @@
+"""SQLite adapter implementing IndexSnapshotRepository for export and import."""
+
+import sqlite3
+import struct
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from ember.adapters.fts.code_tokens import identifier_terms
+from ember.adapters.sqlite.connection import get_manager
+from ember.adapters.sqlite.schema import migrate_database
+from ember.domain.entities import Chunk
+
+# Vector rows inserted per executemany call during a load
+_VECTOR_BATCH = 500
+
+
+class SQLiteIndexSnapshotRepository:
+    """SQLite implementation of IndexSnapshotRepository.
+
+    Reads iterate over live cursors so exporting a large index does not hold
+    it in memory. replace_all runs in one transaction and inserts without
+    per-row commits, which is what makes importing a prebuilt index fast.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize snapshot repository.
+
+        Args:
+            db_path: Path to SQLite database file.
+        """
+        self.db_path = db_path
+        self._manager = get_manager(db_path)
+        self._conn: sqlite3.Connection | None = None
+
+        # Run any pending migrations
+        if db_path.exists():
+            migrate_database(db_path)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a database connection with foreign keys enabled.
+
+        Uses a writer connection of its own, so rolling back a failed
+        transaction cannot discard writes other repositories have pending.
+
+        Returns:
+            SQLite connection object.
+        """
+        if self._conn is None:
+            self._conn = self._manager.open_writer()
+        return self._conn
+
+    def close(self) -> None:
+        """Release the database connection if held."""
+        if self._conn is not None:
+            self._manager.release(self._conn)
+            self._conn = None
+
+    def __enter__(self) -> "SQLiteIndexSnapshotRepository":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Exit context manager, closing the database connection."""
+        self.close()
+        return False
+
+    def iter_chunks(self, model_fingerprint: str) -> Iterator[tuple[Chunk, list[float] | None]]:
+        """Iterate over every live chunk with its vector.
+
+        Args:
+            model_fingerprint: Only vectors from this model are returned.
+
+        Yields:
+            Tuples of (chunk, embedding or None), ordered by path and line.
+        """
+        cursor = self._get_connection().execute(
+            """
+            SELECT c.chunk_id, c.project_id, c.path, c.lang, c.symbol, c.start_line,
+                   c.end_line, c.content, c.content_hash, c.file_hash, c.tree_sha, c.rev,
+                   v.embedding, v.dim
+            FROM chunks c
+            LEFT JOIN vectors v ON v.chunk_id = c.id AND v.model_fingerprint = ?
+            WHERE c.live = 1
+            ORDER BY c.path, c.start_line
+            """,
+            (model_fingerprint,),
+        )
+        for row in cursor:
+            chunk = Chunk(
+                id=row[0],
+                project_id=row[1],
+                path=Path(row[2]),
+                lang=row[3],
+                symbol=row[4],
+                start_line=row[5],
+                end_line=row[6],
+                content=row[7],
+                content_hash=row[8],
+                file_hash=row[9],
+                tree_sha=row[10],
+                rev=row[11],
+            )
+            embedding = None
+            if row[12] is not None:
+                embedding = list(struct.unpack(f"{row[13]}f", row[12]))
+            yield chunk, embedding
+
+    def iter_files(self) -> Iterator[tuple[Path, str, int]]:
+        """Iterate over tracked files.
+
+        Yields:
+            Tuples of (absolute path, file hash, size in bytes).
+        """
+        cursor = self._get_connection().execute(
+            "SELECT path, file_hash, size FROM files ORDER BY path"
+        )
+        for path, file_hash, size in cursor:
+            yield Path(path), file_hash, size
+
+    def replace_all(
+        self,
+        files: Iterable[tuple[Path, str, int]],
+        chunks: Iterable[tuple[Chunk, list[float] | None]],
+        model_fingerprint: str,
+    ) -> tuple[int, int, int]:
+        """Replace all chunks, vectors, and tracked files in one transaction.
+
+        The FTS index is rebuilt from chunk content by the schema's triggers.
+        If either iterable raises, the transaction is rolled back and the
+        previous index is kept.
+
+        Args:
+            files: Tuples of (absolute path, file hash, size in bytes).
+            chunks: Tuples of (chunk, embedding or None).
+            model_fingerprint: Fingerprint recorded with the vectors.
+
+        Returns:
+            Tuple of (files stored, chunks stored, vectors stored).
+        """
+        conn = self._get_connection()
+        now = time.time()
+        files_stored = chunks_stored = vectors_stored = 0
+
+        try:
+            # Vectors and tags go with their chunks via ON DELETE CASCADE
+            conn.execute("DELETE FROM chunks")
+            conn.execute("DELETE FROM files")
+            conn.execute("DELETE FROM sync_checkpoints")
+            conn.execute("DELETE FROM refs")
+            conn.execute("DELETE FROM ref_files")
+
+            for path, file_hash, size in files:
+                # mtime 0: the file on disk has not been seen by this machine yet
+                conn.execute(
+                    """
+                    INSERT INTO files (path, file_hash, size, mtime, last_indexed_at)
+                    VALUES (?, ?, ?, 0, ?)
+                    """,
+                    (str(path), file_hash, size, now),
+                )
+                files_stored += 1
+
+            vector_rows: list[tuple[int, bytes, int, str]] = []
+            for chunk, embedding in chunks:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO chunks (
+                        chunk_id, project_id, path, lang, symbol, start_line, end_line,
+                        content, content_hash, file_hash, tree_sha, rev, created_at, terms
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        chunk.id,
+                        chunk.project_id,
+                        str(chunk.path),
+                        chunk.lang,
+                        chunk.symbol,
+                        chunk.start_line,
+                        chunk.end_line,
+                        chunk.content,
+                        chunk.content_hash,
+                        chunk.file_hash,
+                        chunk.tree_sha,
+                        chunk.rev,
+                        now,
+                        identifier_terms(chunk.content),
+                    ),
+                )
+                chunks_stored += 1
+                if embedding is not None:
+                    chunk_db_id = cursor.lastrowid
+                    assert chunk_db_id is not None  # Always set after an INSERT
+                    blob = struct.pack(f"{len(embedding)}f", *embedding)
+                    vector_rows.append((chunk_db_id, blob, len(embedding), model_fingerprint))
+                    if len(vector_rows) >= _VECTOR_BATCH:
+                        vectors_stored += self._insert_vectors(conn, vector_rows)
+                        vector_rows = []
+            vectors_stored += self._insert_vectors(conn, vector_rows)
+
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        return files_stored, chunks_stored, vectors_stored
+
+    def _insert_vectors(
+        self, conn: sqlite3.Connection, rows: list[tuple[int, bytes, int, str]]
+    ) -> int:
+        """Insert a batch of vector rows keyed by internal chunk id."""
+        conn.executemany(
+            """
+            INSERT INTO vectors (chunk_id, embedding, dim, model_fingerprint)
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+        )
+        return len(rows)
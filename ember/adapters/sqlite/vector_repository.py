@@ -4,6 +4,8 @@ import sqlite3
 import struct
 from pathlib import Path
 
+from ember.adapters.sqlite.connection import get_manager
+
 
 class SQLiteVectorRepository:
     """SQLite implementation of VectorRepository for storing embeddings.
@@ -23,25 +25,25 @@ class SQLiteVectorRepository:
         """
         self.db_path = db_path
         self.expected_dim = expected_dim
+        self._manager = get_manager(db_path)
         self._conn: sqlite3.Connection | None = None
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with foreign keys enabled.
 
-        Reuses an existing connection if available, otherwise creates a new one.
+        Uses the writer connection shared by all repositories of the database.
 
         Returns:
             SQLite connection object.
         """
         if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
-            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn = self._manager.acquire_writer()
         return self._conn
 
     def close(self) -> None:
-        """Close the database connection if open."""
+        """Release the database connection if held."""
         if self._conn is not None:
-            self._conn.close()
+            self._manager.release(self._conn)
             self._conn = None
 
     def __enter__(self) -> "SQLiteVectorRepository":
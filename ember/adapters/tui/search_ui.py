@@ -1,12 +1,15 @@
 """Main interactive search UI controller.
 
 Implements an fzf-style interactive search interface using prompt_toolkit.
+In hybrid mode, each query shows fast full-text results first and refines
+them with hybrid results once the query is embedded.
 """
 
 import asyncio
 import logging
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -27,9 +30,9 @@ from prompt_toolkit.layout.layout import Layout
 from prompt_toolkit.styles import Style
 
 from ember.core.presentation.colors import EmberColors, render_syntax_highlighted
-from ember.core.retrieval.interactive import InteractiveSearchSession
+from ember.core.retrieval.interactive import InteractiveSearchSession, PrefixCache
 from ember.domain.config import EmberConfig
-from ember.domain.entities import Query, SearchResult
+from ember.domain.entities import Query, SearchMode, SearchResult
 
 
 class InteractiveSearchUI:
@@ -47,6 +50,8 @@ class InteractiveSearchUI:
         show_preview: bool = True,
         min_query_length: int = 2,
         debounce_ms: int = 150,
+        text_search_fn: Callable[[Query], list[SearchResult]] | None = None,
+        search_mode: SearchMode = "hybrid",
     ):
         """Initialize interactive search UI.
 
@@ -61,8 +66,13 @@ class InteractiveSearchUI:
             show_preview: Whether to show preview pane by default.
             min_query_length: Minimum query length before searching.
             debounce_ms: Debounce delay in milliseconds.
+            text_search_fn: Optional function executing full-text search only,
+                whose results are shown until search_fn returns in hybrid mode.
+            search_mode: Initial search mode ("hybrid", "fts" or "vector"),
+                passed to search_fn with each query.
         """
         self.search_fn = search_fn
+        self.text_search_fn = text_search_fn
         self.config = config
         self.topk = topk
         self.path_filter = path_filter
@@ -75,11 +85,20 @@ class InteractiveSearchUI:
         self.session = InteractiveSearchSession(
             query_text=initial_query,
             preview_visible=show_preview,
+            search_mode=search_mode,
         )
 
         # Search task management
         self.current_search_task: asyncio.Task | None = None
         self.debounce_task: asyncio.Task | None = None
+        self.refining = False
+
+        # Full searches run one at a time, so a search that is superseded
+        # before it starts is cancelled instead of embedding a stale query
+        self._search_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ember-tui-search"
+        )
+        self.prefix_cache = PrefixCache()
 
         # UI state
         self.selected_file: Path | None = None
@@ -240,6 +259,7 @@ class InteractiveSearchUI:
         @kb.add("c-r")
         def cycle_mode(event: KeyPressEvent) -> None:
             self.session.cycle_search_mode()
+            self.prefix_cache.clear()
             # Trigger new search with new mode
             if event.app.loop:
                 event.app.loop.create_task(self._execute_search())
@@ -280,17 +300,31 @@ class InteractiveSearchUI:
                 self.debounce_task = loop.create_task(debounced_search())
 
     async def _execute_search(self) -> None:
-        """Execute search with current query."""
+        """Execute search with current query.
+
+        Results are shown in stages: cached results of a shorter query that
+        still match, then full-text results, then the full search results.
+        Starting a new search cancels the previous one.
+        """
         # Cancel existing search
         if self.current_search_task and not self.current_search_task.done():
             self.current_search_task.cancel()
+        self.refining = False
 
         # Check minimum query length
-        if len(self.session.query_text) < self.min_query_length:
+        text = self.session.query_text
+        if len(text) < self.min_query_length:
             self.session.update_results([], 0.0)
             self.app.invalidate()
             return
 
+        # Searched recently (e.g. before a backspace): nothing to refine
+        cached = self.prefix_cache.get(text)
+        if cached is not None:
+            self.session.update_results(cached, 0.0)
+            self.app.invalidate()
+            return
+
         # Execute search
         async def search_task() -> None:
             try:
@@ -298,32 +332,69 @@ class InteractiveSearchUI:
 
                 # Create query object
                 query = Query(
-                    text=self.session.query_text,
+                    text=text,
                     topk=self.topk,
                     path_filter=self.path_filter,
                     lang_filter=self.lang_filter,
                     json_output=False,
+                    mode=self.session.search_mode,
+                )
+                # Only hybrid results are worth previewing with full-text results
+                text_search_fn = self.text_search_fn if query.mode == "hybrid" else None
+
+                self.refining = True
+                candidates = self.prefix_cache.candidates(text)
+                if candidates:
+                    self._show_results(candidates, start_time, keep_selection=False)
+
+                # Run searches (synchronous functions in executors)
+                loop = asyncio.get_running_loop()
+                if text_search_fn is not None:
+                    results = await loop.run_in_executor(None, text_search_fn, query)
+                    self._show_results(results, start_time, keep_selection=bool(candidates))
+
+                # Cancelling this task cancels the full search if still queued
+                results = await loop.run_in_executor(self._search_executor, self.search_fn, query)
+                self.refining = False
+                self.prefix_cache.put(text, results)
+                self._show_results(
+                    results,
+                    start_time,
+                    keep_selection=bool(candidates) or text_search_fn is not None,
                 )
-
-                # Run search (synchronous function in executor)
-                loop = asyncio.get_event_loop()
-                results = await loop.run_in_executor(None, self.search_fn, query)
-
-                # Update session
-                elapsed_ms = (time.time() - start_time) * 1000
-                self.session.update_results(results, elapsed_ms)
-                self.app.invalidate()
 
             except asyncio.CancelledError:
                 pass
             except Exception as e:
                 # Extract meaningful error message
+                self.refining = False
                 error_msg = str(e) if str(e) else type(e).__name__
                 self.session.set_error(f"Search error: {error_msg}")
                 self.app.invalidate()
 
         self.current_search_task = asyncio.create_task(search_task())
 
+    def _show_results(
+        self, results: list[SearchResult], start_time: float, keep_selection: bool
+    ) -> None:
+        """Display a stage of search results.
+
+        Args:
+            results: Results to display.
+            start_time: Time the search started, from time.time().
+            keep_selection: Keep the selected result selected if it is still
+                listed, when refining earlier results of the same query.
+        """
+        selected = self.session.get_selected_result() if keep_selection else None
+        elapsed_ms = (time.time() - start_time) * 1000
+        self.session.update_results(results, elapsed_ms)
+        if selected is not None:
+            for idx, result in enumerate(results):
+                if result.chunk.id == selected.chunk.id:
+                    self.session.selected_index = idx
+                    break
+        self.app.invalidate()
+
     def _get_error_text(self) -> list[tuple[str, str]]:
         """Get formatted error text for display in the error window.
 
@@ -442,6 +513,8 @@ class InteractiveSearchUI:
             count = len(self.session.current_results)
             time_ms = int(self.session.last_search_time_ms)
             parts.append(("class:status", f" {count} results in {time_ms}ms"))
+            if self.refining:
+                parts.append(("class:dimmed", " (refining...)"))
         else:
             parts.append(("class:status", " Ready"))
 
@@ -466,7 +539,10 @@ class InteractiveSearchUI:
             asyncio.create_task(self._execute_search())
 
         # Run application
-        await self.app.run_async()
+        try:
+            await self.app.run_async()
+        finally:
+            self._search_executor.shutdown(wait=False, cancel_futures=True)
 
         if self.should_exit and self.selected_file:
             return (self.selected_file, self.selected_line)
@@ -83,12 +83,16 @@ class SimpleVectorSearch:
         self,
         vector: list[float],
         topk: int = 100,
+        path_filter: str | None = None,
+        ref: str | None = None,
     ) -> list[tuple[str, float]]:
         """Query for nearest neighbors using brute-force cosine similarity.
 
         Args:
             vector: Query embedding vector.
             topk: Maximum number of results to return.
+            path_filter: Optional glob pattern to filter results by path.
+            ref: Optional indexed ref to search instead of the live index.
 
         Returns:
             List of (chunk_id, similarity) tuples, sorted by similarity (descending).
@@ -99,16 +103,28 @@ class SimpleVectorSearch:
             cursor = conn.cursor()
 
             # Load all vectors with their stored chunk_id
-            cursor.execute(
-                """
+            sql = """
                 SELECT
                     c.chunk_id,
                     v.embedding,
                     v.dim
                 FROM vectors v
                 JOIN chunks c ON v.chunk_id = c.id
+            """
+            params: list[str] = []
+            if ref is None:
+                sql += " WHERE c.live = 1"
+            else:
+                sql += """
+                JOIN ref_files rf
+                  ON rf.ref = ? AND rf.path = c.path AND rf.file_hash = c.file_hash
+                WHERE 1=1
                 """
-            )
+                params.append(ref)
+            if path_filter:
+                sql += " AND c.path GLOB ?"
+                params.append(path_filter)
+            cursor.execute(sql, params)
 
             rows = cursor.fetchall()
             results = []
@@ -11,6 +11,11 @@ from pathlib import Path
 
 import sqlite_vec
 
+from ember.adapters.sqlite.connection import get_manager
+
+# Candidate multiplier for k-NN queries when other refs' vectors are present
+_REF_OVERFETCH = 4
+
 
 class SqliteVecAdapter:
     """Vector search adapter using sqlite-vec extension.
@@ -32,13 +37,14 @@ class SqliteVecAdapter:
         """
         self.db_path = db_path
         self.vector_dim = vector_dim
+        self._manager = get_manager(db_path)
         self._conn: sqlite3.Connection | None = None
         self._ensure_vec_table()
 
     def close(self) -> None:
-        """Close the database connection if open."""
+        """Release the database connection if held."""
         if self._conn is not None:
-            self._conn.close()
+            self._manager.release(self._conn)
             self._conn = None
 
     def __enter__(self) -> "SqliteVecAdapter":
@@ -53,19 +59,20 @@ class SqliteVecAdapter:
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with sqlite-vec extension loaded.
 
-        Reuses an existing connection if available, otherwise creates a new one.
-        The sqlite-vec extension is loaded only once when the connection is created.
-        Uses check_same_thread=False to allow use from different threads, which
-        is required for interactive search where queries run in a thread executor.
+        Uses the writer connection shared by all repositories of the database.
+        The sqlite-vec extension is loaded only once into that connection.
 
         Returns:
             SQLite connection object with vec extension enabled.
         """
         if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self._conn.enable_load_extension(True)
-            sqlite_vec.load(self._conn)
-            self._conn.enable_load_extension(False)
+            conn = self._manager.acquire_writer()
+            try:
+                self._manager.load_extension(conn, "sqlite_vec", sqlite_vec.load)
+            except BaseException:
+                self._manager.release(conn)
+                raise
+            self._conn = conn
         return self._conn
 
     def _ensure_vec_table(self) -> None:
@@ -172,6 +179,11 @@ class SqliteVecAdapter:
         if vectors_to_add:
             conn.commit()
 
+    def _has_retained_chunks(self, cursor: sqlite3.Cursor) -> bool:
+        """Check whether chunks of other indexed refs share vec_chunks."""
+        cursor.execute("SELECT 1 FROM chunks WHERE live = 0 LIMIT 1")
+        return cursor.fetchone() is not None
+
     def _encode_vector(self, vector: list[float]) -> bytes:
         """Encode a vector to binary format for sqlite-vec.
 
@@ -203,6 +215,7 @@ class SqliteVecAdapter:
         vector: list[float],
         topk: int = 100,
         path_filter: str | None = None,
+        ref: str | None = None,
     ) -> list[tuple[str, float]]:
         """Query for nearest neighbors using sqlite-vec.
 
@@ -212,6 +225,7 @@ class SqliteVecAdapter:
             vector: Query embedding vector.
             topk: Maximum number of results to return.
             path_filter: Optional glob pattern to filter results by path.
+            ref: Optional indexed ref to search instead of the live index.
 
         Returns:
             List of (chunk_id, similarity) tuples, sorted by similarity (descending).
@@ -226,57 +240,48 @@ class SqliteVecAdapter:
         # Serialize query vector for sqlite-vec
         serialized_vector = sqlite_vec.serialize_float32(vector)
 
+        # vec_chunks holds the vectors of every indexed ref, and the k nearest
+        # neighbours are selected before the join filters, so fetch extra
+        # candidates to leave topk after dropping other refs' chunks
+        k = topk * _REF_OVERFETCH if self._has_retained_chunks(cursor) else topk
+
         # Query vec0 table for nearest neighbors
         # sqlite-vec returns distance, we need to convert to similarity
-        # Add path filtering if specified
         # Join with chunks table to get the stored chunk_id
-        if path_filter:
-            cursor.execute(
-                """
-                SELECT
-                    c.chunk_id,
-                    v.distance
-                FROM vec_chunks v
-                JOIN vec_chunk_mapping m ON v.rowid = m.vec_rowid
-                JOIN chunks c ON m.chunk_db_id = c.id
-                WHERE v.embedding MATCH ?
-                  AND k = ?
-                  AND m.path GLOB ?
-                ORDER BY v.distance
-                LIMIT ?
-                """,
-                (serialized_vector, topk, path_filter, topk),
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT
-                    c.chunk_id,
-                    v.distance
-                FROM vec_chunks v
-                JOIN vec_chunk_mapping m ON v.rowid = m.vec_rowid
-                JOIN chunks c ON m.chunk_db_id = c.id
-                WHERE v.embedding MATCH ?
-                  AND k = ?
-                ORDER BY v.distance
-                LIMIT ?
-                """,
-                (serialized_vector, topk, topk),
-            )
+        sql = """
+            SELECT
+                c.chunk_id,
+                v.distance
+            FROM vec_chunks v
+            JOIN vec_chunk_mapping m ON v.rowid = m.vec_rowid
+            JOIN chunks c ON m.chunk_db_id = c.id
+        """
+        params: list[bytes | str | int] = []
+        if ref is not None:
+            sql += """
+            JOIN ref_files rf
+              ON rf.ref = ? AND rf.path = c.path AND rf.file_hash = c.file_hash
+            """
+            params.append(ref)
+        sql += " WHERE v.embedding MATCH ? AND k = ?"
+        params.extend([serialized_vector, k])
+        if ref is None:
+            sql += " AND c.live = 1"
 
-        rows = cursor.fetchall()
-        results = []
+        # Add path filtering if specified
+        if path_filter:
+            sql += " AND m.path GLOB ?"
+            params.append(path_filter)
 
-        for row in rows:
-            # Use the stored chunk_id from database instead of computing it
-            chunk_id = row[0]
-            distance = row[1]
+        sql += " ORDER BY v.distance LIMIT ?"
+        params.append(topk)
+        cursor.execute(sql, params)
 
+        results = []
+        for chunk_id, distance in cursor.fetchall():
             # Convert distance to similarity
             # For cosine distance: similarity = 1 - distance
             # This makes it compatible with the existing API where higher = more similar
-            similarity = 1.0 - distance
-
-            results.append((chunk_id, similarity))
+            results.append((chunk_id, 1.0 - distance))
 
         return results
@@ -4,10 +4,13 @@ This module provides the business logic for chunking files using tree-sitter
 when available, falling back to line-based chunking for unsupported languages.
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
-from ember.ports.chunkers import ChunkData, Chunker
+from ember.core.chunking.hierarchy import build_skeletons
+from ember.core.chunking.token_sizing import ChunkSizer
+from ember.ports.chunkers import ChunkData, Chunker, StreamingChunker
 
 
 @dataclass
@@ -47,22 +50,32 @@ class ChunkFileUseCase:
 
     Tries tree-sitter code-aware chunking first for supported languages,
     then falls back to line-based chunking for unsupported languages or
-    if tree-sitter parsing fails.
+    if tree-sitter parsing fails. In hierarchical mode, containers such as
+    classes are reduced to skeletons so nested bodies are embedded once.
+    Definitions are resized to the embedding model's token limit when a
+    sizer is given.
     """
 
     def __init__(
         self,
         tree_sitter_chunker: Chunker,
-        line_chunker: Chunker,
+        line_chunker: StreamingChunker,
+        sizer: ChunkSizer | None = None,
+        hierarchical: bool = False,
     ) -> None:
         """Initialize chunking use case.
 
         Args:
             tree_sitter_chunker: Tree-sitter based code-aware chunker.
             line_chunker: Line-based fallback chunker.
+            sizer: Optional token-aware sizer for tree-sitter chunks.
+            hierarchical: Replace the content of tree-sitter chunks containing
+                other definitions with their skeletons.
         """
         self.tree_sitter = tree_sitter_chunker
         self.line_chunker = line_chunker
+        self.sizer = sizer
+        self.hierarchical = hierarchical
 
     def execute(self, request: ChunkFileRequest) -> ChunkFileResponse:
         """Execute chunking on a file with automatic fallback.
@@ -92,6 +105,10 @@ class ChunkFileUseCase:
 
             # If tree-sitter succeeded and returned chunks, use them
             if chunks:
+                if self.hierarchical:
+                    chunks = build_skeletons(chunks, request.content)
+                if self.sizer is not None:
+                    chunks = self.sizer.fit(chunks, request.content)
                 return ChunkFileResponse(
                     chunks=chunks,
                     strategy="tree-sitter",
@@ -114,3 +131,18 @@ class ChunkFileUseCase:
             success=True,
             error=None,
         )
+
+    def stream(self, data: bytes, lang: str) -> Iterator[ChunkData]:
+        """Lazily chunk a file too large to hold in memory.
+
+        Tree-sitter needs the whole source in memory, so large files are
+        always chunked into line windows, one window at a time.
+
+        Args:
+            data: File content as bytes, or a bytes-like memory map.
+            lang: Language identifier.
+
+        Returns:
+            Iterator over the file's chunks, in file order.
+        """
+        return self.line_chunker.iter_chunks(data, lang)
@@ -0,0 +1,115 @@
+"""Hierarchical chunking of nested definitions.
+
+With symbol chunking a class chunk contains the full source of each of its
+methods, which are chunks of their own, so every nested body is embedded
+twice. Hierarchical chunking turns each container into a skeleton instead:
+its own lines (signature, docstring, fields) plus the signature line of
+every nested definition, whose body is elided. The container keeps the line
+range of the whole definition, so its children stay linked to it by line
+containment and search results can be rolled up from child to parent.
+"""
+
+from ember.ports.chunkers import ChunkData
+
+# Replaces the body of a nested definition in its container's skeleton
+ELIDED_BODY = "..."
+
+
+def _contains(outer: ChunkData, inner: ChunkData) -> bool:
+    """Check whether a chunk strictly contains another.
+
+    Args:
+        outer: Possible container.
+        inner: Possible nested chunk.
+
+    Returns:
+        True if inner lies within outer's line range and is not outer itself.
+    """
+    return (
+        outer.start_line <= inner.start_line
+        and inner.end_line <= outer.end_line
+        and (outer.start_line, outer.end_line) != (inner.start_line, inner.end_line)
+    )
+
+
+def direct_children(chunks: list[ChunkData]) -> dict[int, list[ChunkData]]:
+    """Find the chunks directly nested in each chunk.
+
+    Args:
+        chunks: Chunks of one file.
+
+    Returns:
+        Mapping from the index of a container in chunks to its direct
+        children, sorted by start line. Chunks without children are omitted.
+    """
+    order = sorted(
+        range(len(chunks)), key=lambda i: (chunks[i].start_line, -chunks[i].end_line)
+    )
+    children: dict[int, list[ChunkData]] = {}
+    stack: list[int] = []
+    for index in order:
+        chunk = chunks[index]
+        while stack and not _contains(chunks[stack[-1]], chunk):
+            stack.pop()
+        if stack:
+            children.setdefault(stack[-1], []).append(chunk)
+        stack.append(index)
+    return children
+
+
+def _skeleton(
+    container: ChunkData, children: list[ChunkData], lines: list[str]
+) -> str:
+    """Build a container's content with the bodies of its children elided.
+
+    Args:
+        container: Chunk containing the children.
+        children: Direct children of the container, sorted by start line.
+        lines: Lines of the file.
+
+    Returns:
+        The container's lines, keeping only the first line of each child.
+    """
+    out: list[str] = []
+    line = container.start_line
+    for child in children:
+        out.extend(lines[line - 1 : child.start_line])
+        if child.end_line > child.start_line:
+            # Indent the placeholder like the body it replaces
+            body = lines[child.start_line : child.end_line]
+            first = next((text for text in body if text.strip()), "")
+            indent = first[: len(first) - len(first.lstrip())]
+            out.append(f"{indent}{ELIDED_BODY}")
+        line = child.end_line + 1
+    out.extend(lines[line - 1 : container.end_line])
+    return "\n".join(out)
+
+
+def build_skeletons(chunks: list[ChunkData], content: str) -> list[ChunkData]:
+    """Replace the content of containers with their skeletons.
+
+    Args:
+        chunks: Chunks of one file, sorted by start line.
+        content: Content of the file the chunks were extracted from.
+
+    Returns:
+        Chunks in the same order, with every container's content reduced to
+        its skeleton and its line range unchanged.
+    """
+    children = direct_children(chunks)
+    if not children:
+        return chunks
+
+    lines = content.split("\n")
+    return [
+        ChunkData(
+            start_line=chunk.start_line,
+            end_line=chunk.end_line,
+            content=_skeleton(chunk, children[index], lines),
+            symbol=chunk.symbol,
+            lang=chunk.lang,
+        )
+        if index in children
+        else chunk
+        for index, chunk in enumerate(chunks)
+    ]
@@ -0,0 +1,184 @@
+"""Token-aware sizing of code chunks.
+
+Embedding models truncate their input at max_seq_length tokens, so the tail
+of a long definition would never be embedded, while tiny definitions each
+cost a forward pass of their own. Chunks are therefore resized with the
+model's tokenizer: oversized definitions are split into overlapping
+sub-chunks sharing the definition's symbol, and runs of tiny adjacent
+definitions are packed into one chunk. Container skeletons from hierarchical
+chunking are not a contiguous run of file lines, so they are kept as is.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from ember.ports.chunkers import ChunkData, TokenCounter
+
+# Tokens the model adds around every input (e.g. [CLS] and [SEP])
+SPECIAL_TOKENS = 2
+
+# Maximum blank or comment lines between definitions packed together
+MAX_PACK_GAP_LINES = 2
+
+
+@dataclass(frozen=True)
+class TokenBudget:
+    """Token limits for sizing chunks.
+
+    Attributes:
+        max_tokens: Model token limit; longer chunks are split.
+        overlap_lines: Lines repeated between consecutive sub-chunks.
+        min_tokens: Adjacent chunks shorter than this are packed together
+            (0 disables packing).
+    """
+
+    max_tokens: int
+    overlap_lines: int = 0
+    min_tokens: int = 0
+
+
+class ChunkSizer:
+    """Resizes chunks of a file to fit a token budget."""
+
+    def __init__(self, counter: TokenCounter, budget: TokenBudget) -> None:
+        """Initialize chunk sizer.
+
+        Args:
+            counter: Token counter matching the embedding model.
+            budget: Token limits to fit chunks to.
+        """
+        self.counter = counter
+        self.budget = budget
+
+    def fit(self, chunks: list[ChunkData], content: str) -> list[ChunkData]:
+        """Split oversized chunks and pack tiny adjacent ones.
+
+        Args:
+            chunks: Chunks of one file, sorted by start line.
+            content: Content of the file the chunks were extracted from.
+
+        Returns:
+            Resized chunks, sorted by start line.
+        """
+        if not chunks:
+            return chunks
+
+        lines = content.split("\n")
+        # Tokens per line, plus one for its newline
+        line_tokens = [count + 1 for count in self.counter.count_tokens(lines)]
+
+        def tokens(start_line: int, end_line: int) -> int:
+            return sum(line_tokens[start_line - 1 : end_line])
+
+        def verbatim(chunk: ChunkData) -> bool:
+            return chunk.content == "\n".join(lines[chunk.start_line - 1 : chunk.end_line])
+
+        skeletons = {chunk for chunk in chunks if not verbatim(chunk)}
+        packed = self._pack(chunks, lines, tokens, skeletons)
+        fitted: list[ChunkData] = []
+        for chunk in packed:
+            if chunk in skeletons:
+                fitted.append(chunk)
+            else:
+                fitted.extend(self._split(chunk, lines, line_tokens))
+        fitted.sort(key=lambda c: c.start_line)
+        return fitted
+
+    def _pack(
+        self,
+        chunks: list[ChunkData],
+        lines: list[str],
+        tokens: Callable[[int, int], int],
+        skeletons: set[ChunkData],
+    ) -> list[ChunkData]:
+        """Merge runs of tiny adjacent chunks until each reaches min_tokens.
+
+        Args:
+            chunks: Chunks sorted by start line.
+            lines: Lines of the file.
+            tokens: Returns the token count of a line range.
+            skeletons: Container skeletons, which are never merged.
+
+        Returns:
+            Chunks with tiny neighbours merged; merged chunks list every
+            definition's symbol.
+        """
+        min_tokens = self.budget.min_tokens
+        if min_tokens <= 0:
+            return chunks
+
+        packed: list[ChunkData] = []
+        group: list[ChunkData] = []
+
+        def flush() -> None:
+            if len(group) == 1:
+                packed.append(group[0])
+            elif group:
+                start, end = group[0].start_line, group[-1].end_line
+                symbols = [c.symbol for c in group if c.symbol]
+                packed.append(
+                    ChunkData(
+                        start_line=start,
+                        end_line=end,
+                        content="\n".join(lines[start - 1 : end]),
+                        symbol=", ".join(dict.fromkeys(symbols)) or None,
+                        lang=group[0].lang,
+                    )
+                )
+            group.clear()
+
+        for chunk in chunks:
+            if chunk in skeletons or tokens(chunk.start_line, chunk.end_line) >= min_tokens:
+                flush()
+                packed.append(chunk)
+                continue
+            if group:
+                last = group[-1]
+                adjacent = 0 < chunk.start_line - last.end_line <= MAX_PACK_GAP_LINES + 1
+                if not adjacent or tokens(group[0].start_line, last.end_line) >= min_tokens:
+                    flush()
+            group.append(chunk)
+        flush()
+        return packed
+
+    def _split(
+        self, chunk: ChunkData, lines: list[str], line_tokens: list[int]
+    ) -> list[ChunkData]:
+        """Split a chunk into overlapping line windows that fit the budget.
+
+        A single line longer than the budget becomes a window of its own.
+
+        Args:
+            chunk: Chunk to split.
+            lines: Lines of the file.
+            line_tokens: Token count per line of the file.
+
+        Returns:
+            The chunk itself if it fits, otherwise its sub-chunks.
+        """
+        budget = self.budget.max_tokens - SPECIAL_TOKENS
+        if sum(line_tokens[chunk.start_line - 1 : chunk.end_line]) <= budget:
+            return [chunk]
+
+        windows: list[ChunkData] = []
+        start = chunk.start_line
+        while True:
+            end = start
+            total = line_tokens[start - 1]
+            while end < chunk.end_line and total + line_tokens[end] <= budget:
+                total += line_tokens[end]
+                end += 1
+            windows.append(
+                ChunkData(
+                    start_line=start,
+                    end_line=end,
+                    content="\n".join(lines[start - 1 : end]),
+                    symbol=chunk.symbol,
+                    lang=chunk.lang,
+                )
+            )
+            if end >= chunk.end_line:
+                return windows
+            # Overlap at most half a window so every step makes progress
+            overlap = min(self.budget.overlap_lines, (end - start + 1) // 2)
+            start = max(end + 1 - overlap, start + 1)
@@ -13,11 +13,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, NoReturn
 
 import click
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
 from ember.core.presentation.colors import EmberColors, highlight_symbol
 
+# Rich is imported inside the functions that draw progress, keeping it off
+# the startup path of commands that never show any (e.g. 'ember cat')
 if TYPE_CHECKING:
+    from rich.progress import Progress
+
     from ember.domain.entities import Chunk
     from ember.ports.chunk_repository import ChunkRepository
     from ember.ports.daemon import DaemonManager
@@ -31,7 +34,8 @@ __all__ = ["RichProgressCallback", "progress_context", "load_cached_results",
            "display_content_with_highlighting", "open_file_in_editor",
            "get_editor_command", "EDITOR_PATTERNS", "EmberCliError",
            "repo_not_found_error", "no_search_results_error",
-           "path_not_in_repo_error", "index_out_of_range_error"]
+           "path_not_in_repo_error", "index_out_of_range_error",
+           "resolve_repo_list"]
 
 
 # =============================================================================
@@ -223,7 +227,7 @@ class RichProgressCallback:
     Uses Rich library to display a progress bar that updates as indexing progresses.
     """
 
-    def __init__(self, progress: Progress) -> None:
+    def __init__(self, progress: "Progress") -> None:
         """Initialize with a Rich Progress instance.
 
         Args:
@@ -276,6 +280,14 @@ def progress_context(
     if quiet_mode:
         yield None
     else:
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            SpinnerColumn,
+            TaskProgressColumn,
+            TextColumn,
+        )
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -397,6 +409,8 @@ def ensure_daemon_with_progress(
             return False
 
     # Show progress during startup
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -437,13 +451,13 @@ def lookup_result_from_cache(
 
 
 def lookup_result_by_hash(
-    identifier: str, chunk_repo: "ChunkRepository"
+    identifier: str, *chunk_repos: "ChunkRepository"
 ) -> dict[str, Any]:
     """Look up a result by chunk ID hash prefix.
 
     Args:
         identifier: Hash prefix (or full hash) to search for.
-        chunk_repo: Repository for chunk lookups.
+        *chunk_repos: Repositories for chunk lookups (one per index shard).
 
     Returns:
         Result dictionary with path, start_line, end_line, content, lang, symbol.
@@ -451,7 +465,9 @@ def lookup_result_by_hash(
     Raises:
         EmberCliError: If no chunk found or multiple chunks match the prefix.
     """
-    matches: list[Chunk] = chunk_repo.find_by_id_prefix(identifier)
+    matches: list[Chunk] = [
+        chunk for chunk_repo in chunk_repos for chunk in chunk_repo.find_by_id_prefix(identifier)
+    ]
 
     if len(matches) == 0:
         raise EmberCliError(
@@ -480,6 +496,56 @@ def lookup_result_by_hash(
     }
 
 
+def resolve_repo_list(spec: str, cwd: Path) -> list[Path]:
+    """Resolve the repositories named by a --repos value.
+
+    The value is either a comma-separated list of repository paths, or the
+    path to a group file listing one repository per line. Blank lines and
+    lines starting with '#' in a group file are ignored, and relative paths
+    in it are resolved against the file's directory.
+
+    Args:
+        spec: Comma-separated repository paths, or a group file path.
+        cwd: Directory that relative paths in a comma-separated list are
+            resolved against.
+
+    Returns:
+        Absolute repository roots, without duplicates, in the given order.
+
+    Raises:
+        EmberCliError: If no repository is given or one has no Ember index.
+    """
+    group_file = (cwd / Path(spec).expanduser()).resolve()
+    if "," not in spec and group_file.is_file():
+        base = group_file.parent
+        entries = [
+            line.strip()
+            for line in group_file.read_text().splitlines()
+            if line.strip() and not line.strip().startswith("#")
+        ]
+    else:
+        base = cwd
+        entries = [entry.strip() for entry in spec.split(",") if entry.strip()]
+
+    if not entries:
+        raise EmberCliError(
+            f"No repositories given in --repos '{spec}'",
+            hint="Pass comma-separated repository paths or a file listing one per line",
+        )
+
+    repos: list[Path] = []
+    for entry in entries:
+        root = (base / Path(entry).expanduser()).resolve()
+        if not (root / ".ember" / "index.db").exists():
+            raise EmberCliError(
+                f"No Ember index found in {root}",
+                hint=f"Run 'ember init' and 'ember sync' in {root}",
+            )
+        if root not in repos:
+            repos.append(root)
+    return repos
+
+
 def display_content_with_context(
     result: dict[str, Any],
     context: int,
@@ -490,12 +556,13 @@ def display_content_with_context(
     Args:
         result: Result dictionary with path, start_line, end_line, content.
         context: Number of lines to show before and after the chunk.
-        repo_root: Repository root for resolving file paths.
+        repo_root: Repository root for resolving file paths, unless the
+            result names its own repository (from 'find --repos').
 
     Returns:
         True if content was displayed successfully, False if fallback needed.
     """
-    file_path = repo_root / result["path"]
+    file_path = Path(result.get("repo") or repo_root) / result["path"]
     if not file_path.exists():
         click.echo(
             f"Warning: File {result['path']} not found, showing chunk only", err=True
@@ -0,0 +1,310 @@
+"""Autotune use case for calibrating embedding settings to the hardware.
+
+The best embedding batch size and thread count depend on the CPU, memory
+bandwidth, and model, so fixed defaults leave throughput on the table on
+large machines and run out of memory on small ones. This use case times the
+embedder on sample chunks across a small grid of settings and recommends
+the fastest one that fits in memory.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from ember.core.hardware import SystemResources, detect_system_resources
+from ember.ports.embedders import EmbeddingBenchmark
+
+logger = logging.getLogger(__name__)
+
+# Batch sizes tried, smallest first; growth stops at the first OOM
+BATCH_SIZE_CANDIDATES = (8, 16, 32, 64, 128)
+
+# max_seq_length is only halved (down to this floor) if no batch size fits
+MIN_MAX_SEQ_LENGTH = 128
+
+# Stop growing batches once available RAM drops below this fraction of total
+MIN_FREE_RAM_FRACTION = 0.1
+
+# Prefer smaller batches / fewer threads when within this throughput margin
+THROUGHPUT_TOLERANCE = 0.05
+
+# Number of texts timed per trial
+DEFAULT_SAMPLE_SIZE = 64
+
+
+@dataclass
+class TuningTrial:
+    """One timed run of the embedder.
+
+    Attributes:
+        batch_size: Batch size tried
+        threads: Thread count tried
+        max_seq_length: Truncation length tried
+        texts_per_second: Measured throughput (0 if out of memory)
+        out_of_memory: True if the run ran out of memory
+    """
+
+    batch_size: int
+    threads: int
+    max_seq_length: int
+    texts_per_second: float = 0.0
+    out_of_memory: bool = False
+
+
+@dataclass
+class AutotuneRequest:
+    """Request to calibrate embedding settings.
+
+    Attributes:
+        sample_texts: Representative chunk contents to embed
+        thread_candidates: Thread counts to try (default: from CPU count)
+    """
+
+    sample_texts: list[str]
+    thread_candidates: list[int] | None = None
+
+
+@dataclass
+class AutotuneResponse:
+    """Response from calibration.
+
+    Attributes:
+        batch_size: Recommended batch size
+        threads: Recommended intra-op thread count
+        max_seq_length: Recommended truncation length
+        max_seq_length_reduced: True if max_seq_length is below the model
+            default (only happens when even the smallest batch ran out of memory)
+        texts_per_second: Throughput with the recommended settings
+        trials: Every timed run, in order
+        success: Whether calibration found settings that fit in memory
+        error: Error message if calibration failed
+    """
+
+    batch_size: int = 0
+    threads: int = 0
+    max_seq_length: int = 0
+    max_seq_length_reduced: bool = False
+    texts_per_second: float = 0.0
+    trials: list[TuningTrial] = field(default_factory=list)
+    success: bool = True
+    error: str | None = None
+
+
+def thread_candidates(cpu_count: int) -> list[int]:
+    """Thread counts worth trying on a machine.
+
+    Args:
+        cpu_count: Usable CPUs.
+
+    Returns:
+        All CPUs, then halvings down to 1, largest first.
+    """
+    candidates: list[int] = []
+    threads = max(1, cpu_count)
+    while threads >= 1 and len(candidates) < 4:
+        candidates.append(threads)
+        threads //= 2
+    return candidates
+
+
+def _pick(trials: list[TuningTrial], cost: Callable[[TuningTrial], int]) -> TuningTrial:
+    """Choose the cheapest trial whose throughput is near the best.
+
+    Args:
+        trials: Successful trials to choose from (non-empty).
+        cost: Resource cost of a trial (smaller is preferred).
+
+    Returns:
+        Cheapest trial within THROUGHPUT_TOLERANCE of the fastest.
+    """
+    fastest = max(t.texts_per_second for t in trials)
+    near_best = [t for t in trials if t.texts_per_second >= fastest * (1 - THROUGHPUT_TOLERANCE)]
+    return min(near_best, key=cost)
+
+
+class AutotuneUseCase:
+    """Use case for calibrating batch size, threads, and sequence length.
+
+    Batch sizes are swept at the full thread count, growing until throughput
+    stops improving, memory runs out, or free RAM gets low. The winning batch
+    size is then timed at fewer threads. max_seq_length changes the model
+    fingerprint (and so forces a reindex), so it is only reduced when even
+    the smallest batch runs out of memory.
+    """
+
+    def __init__(
+        self,
+        benchmark: EmbeddingBenchmark,
+        resource_probe: Callable[[], SystemResources] = detect_system_resources,
+    ):
+        """Initialize the use case.
+
+        Args:
+            benchmark: Times the embedder with given settings.
+            resource_probe: Reports current RAM and CPU count.
+        """
+        self.benchmark = benchmark
+        self.resource_probe = resource_probe
+
+    def execute(self, request: AutotuneRequest) -> AutotuneResponse:
+        """Run the calibration.
+
+        Args:
+            request: Sample texts and optional thread candidates.
+
+        Returns:
+            AutotuneResponse with recommended settings and all trials.
+        """
+        if not request.sample_texts:
+            return AutotuneResponse(success=False, error="No sample texts to calibrate with")
+
+        threads_to_try = request.thread_candidates or thread_candidates(
+            self.resource_probe().cpu_count
+        )
+        max_threads = max(threads_to_try)
+        trials: list[TuningTrial] = []
+
+        try:
+            default_length = self.benchmark.default_max_seq_length
+            max_seq_length = default_length
+            best = self._sweep_batch_sizes(request.sample_texts, max_seq_length, max_threads, trials)
+            while best is None and max_seq_length // 2 >= MIN_MAX_SEQ_LENGTH:
+                max_seq_length //= 2
+                logger.info(f"Smallest batch ran out of memory; trying max_seq_length={max_seq_length}")
+                best = self._sweep_batch_sizes(
+                    request.sample_texts, max_seq_length, max_threads, trials
+                )
+
+            if best is None:
+                return AutotuneResponse(
+                    trials=trials,
+                    success=False,
+                    error=(
+                        f"Ran out of memory at batch size {BATCH_SIZE_CANDIDATES[0]} "
+                        f"and max_seq_length {max_seq_length}"
+                    ),
+                )
+
+            best = self._sweep_threads(request.sample_texts, best, threads_to_try, trials)
+        except Exception as e:
+            logger.exception("Calibration failed")
+            return AutotuneResponse(trials=trials, success=False, error=str(e))
+
+        return AutotuneResponse(
+            batch_size=best.batch_size,
+            threads=best.threads,
+            max_seq_length=best.max_seq_length,
+            max_seq_length_reduced=best.max_seq_length < default_length,
+            texts_per_second=best.texts_per_second,
+            trials=trials,
+        )
+
+    def _run_trial(
+        self, texts: list[str], batch_size: int, max_seq_length: int, threads: int
+    ) -> TuningTrial:
+        """Time one setting, recording out-of-memory as a failed trial."""
+        trial = TuningTrial(batch_size=batch_size, threads=threads, max_seq_length=max_seq_length)
+        try:
+            trial.texts_per_second = self.benchmark.measure(
+                texts, batch_size=batch_size, max_seq_length=max_seq_length, threads=threads
+            )
+        except MemoryError:
+            trial.out_of_memory = True
+        return trial
+
+    def _low_on_memory(self) -> bool:
+        """Check whether free RAM is too low to try a larger batch."""
+        resources = self.resource_probe()
+        return resources.available_ram_gb < resources.total_ram_gb * MIN_FREE_RAM_FRACTION
+
+    def _sweep_batch_sizes(
+        self,
+        texts: list[str],
+        max_seq_length: int,
+        threads: int,
+        trials: list[TuningTrial],
+    ) -> TuningTrial | None:
+        """Time increasing batch sizes at one sequence length.
+
+        Returns:
+            Best trial, or None if even the smallest batch ran out of memory.
+        """
+        fitted: list[TuningTrial] = []
+        for batch_size in BATCH_SIZE_CANDIDATES:
+            trial = self._run_trial(texts, batch_size, max_seq_length, threads)
+            trials.append(trial)
+            if trial.out_of_memory:
+                break
+            fitted.append(trial)
+            if self._low_on_memory():
+                break
+            # Larger batches rarely recover once throughput has dropped
+            if len(fitted) >= 2 and trial.texts_per_second < fitted[-2].texts_per_second * (
+                1 - THROUGHPUT_TOLERANCE
+            ):
+                break
+
+        if not fitted:
+            return None
+        return _pick(fitted, cost=lambda t: t.batch_size)
+
+    def _sweep_threads(
+        self,
+        texts: list[str],
+        best: TuningTrial,
+        threads_to_try: list[int],
+        trials: list[TuningTrial],
+    ) -> TuningTrial:
+        """Time the chosen batch size at each other thread count.
+
+        Returns:
+            Trial with the fewest threads whose throughput is near the best.
+        """
+        candidates = [best]
+        for threads in threads_to_try:
+            if threads == best.threads:
+                continue
+            trial = self._run_trial(texts, best.batch_size, best.max_seq_length, threads)
+            trials.append(trial)
+            if not trial.out_of_memory:
+                candidates.append(trial)
+        return _pick(candidates, cost=lambda t: t.threads)
+
+
+def synthetic_sample_texts(count: int = DEFAULT_SAMPLE_SIZE) -> list[str]:
+    """Build code-like sample texts of varied length for an empty index.
+
+    Args:
+        count: Number of texts.
+
+    Returns:
+        Texts ranging from one-line helpers to long function bodies.
+    """
+    body = (
+        "    result = compute_value(items[index], options)\n"
+        "    if result is None:\n"
+        "        raise ValueError(f'missing value for {index}')\n"
+    )
+    texts = []
+    for i in range(count):
+        # Mostly short chunks with a tail of long ones, like a real index
+        repeats = 1 + (i * 7) % 13 + (20 if i % 8 == 0 else 0)
+        texts.append(f"def handler_{i}(items, index, options):\n" + body * repeats)
+    return texts
+
+
+def sample_chunk_texts(contents: list[str], count: int = DEFAULT_SAMPLE_SIZE) -> list[str]:
+    """Pick evenly spaced chunk contents as calibration samples.
+
+    Args:
+        contents: Contents of indexed chunks.
+        count: Maximum number of samples.
+
+    Returns:
+        Up to count non-empty contents spread across the index.
+    """
+    contents = [c for c in contents if c.strip()]
+    if len(contents) <= count:
+        return contents
+    step = len(contents) / count
+    return [contents[int(i * step)] for i in range(count)]
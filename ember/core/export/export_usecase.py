@@ -0,0 +1,133 @@
+"""Export use case for writing the index to a portable bundle."""
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from ember.ports.bundle import BUNDLE_FORMAT_VERSION, BundleFile, BundleHeader, BundleWriter
+from ember.ports.repositories import IndexSnapshotRepository, MetaRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExportRequest:
+    """Request to export the index.
+
+    Attributes:
+        repo_root: Absolute path to repository root.
+        include_content: Store chunk content (False for --no-preview).
+        quantize: Store vectors as int8 instead of float32.
+    """
+
+    repo_root: Path
+    include_content: bool = True
+    quantize: bool = False
+
+
+@dataclass
+class ExportResponse:
+    """Response from exporting the index.
+
+    Attributes:
+        chunks_exported: Number of chunks written.
+        vectors_exported: Number of chunks written with a vector.
+        files_exported: Number of file records written.
+        bundle_bytes: Size of the bundle in bytes.
+        tree_sha: Tree SHA the exported index was synced to.
+        model_fingerprint: Fingerprint of the model that produced the vectors.
+        success: Whether the export succeeded.
+        error: Error message if the export failed.
+    """
+
+    chunks_exported: int = 0
+    vectors_exported: int = 0
+    files_exported: int = 0
+    bundle_bytes: int = 0
+    tree_sha: str | None = None
+    model_fingerprint: str | None = None
+    success: bool = True
+    error: str | None = None
+
+
+class ExportUseCase:
+    """Use case for streaming the index into a bundle.
+
+    Chunk ids and project ids are derived from the absolute repository path,
+    so they are left out and recomputed on import; file paths are stored
+    relative to the repository root for the same reason.
+    """
+
+    def __init__(
+        self,
+        snapshot_repo: IndexSnapshotRepository,
+        meta_repo: MetaRepository,
+        bundle_writer: BundleWriter,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize export use case.
+
+        Args:
+            snapshot_repo: Streams chunks, vectors, and files out of the index.
+            meta_repo: Metadata repository for the last synced tree and model.
+            bundle_writer: Destination bundle.
+            clock: Wall clock for the export timestamp.
+        """
+        self.snapshot_repo = snapshot_repo
+        self.meta_repo = meta_repo
+        self.bundle_writer = bundle_writer
+        self.clock = clock
+
+    def execute(self, request: ExportRequest) -> ExportResponse:
+        """Export the index.
+
+        Args:
+            request: Export options.
+
+        Returns:
+            ExportResponse with record counts and bundle size.
+        """
+        tree_sha = self.meta_repo.get("last_tree_sha")
+        model_fingerprint = self.meta_repo.get("model_fingerprint")
+        if tree_sha is None or model_fingerprint is None:
+            return ExportResponse(success=False, error="Index has not been synced yet")
+
+        header = BundleHeader(
+            format_version=BUNDLE_FORMAT_VERSION,
+            model_fingerprint=model_fingerprint,
+            tree_sha=tree_sha,
+            sync_mode=self.meta_repo.get("last_sync_mode") or "worktree",
+            vector_encoding="int8" if request.quantize else "float32",
+            include_content=request.include_content,
+            created_at=self.clock(),
+        )
+        response = ExportResponse(tree_sha=tree_sha, model_fingerprint=model_fingerprint)
+
+        try:
+            self.bundle_writer.write_header(header)
+
+            for path, file_hash, size in self.snapshot_repo.iter_files():
+                try:
+                    rel_path = path.relative_to(request.repo_root)
+                except ValueError:
+                    continue  # Tracked from a different checkout location
+                self.bundle_writer.write_file(BundleFile(rel_path, file_hash, size))
+                response.files_exported += 1
+
+            for chunk, embedding in self.snapshot_repo.iter_chunks(model_fingerprint):
+                if not request.include_content:
+                    chunk = replace(chunk, content="")
+                self.bundle_writer.write_chunk(chunk, embedding)
+                response.chunks_exported += 1
+                if embedding is not None:
+                    response.vectors_exported += 1
+
+            response.bundle_bytes = self.bundle_writer.close()
+        except Exception as e:
+            logger.error(f"Export failed: {e}")
+            self.bundle_writer.abort()
+            return ExportResponse(success=False, error=str(e))
+
+        return response
@@ -0,0 +1,204 @@
+"""Import use case for loading a prebuilt index from a bundle."""
+
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from ember.domain.entities import Chunk
+from ember.ports.bundle import BundleReader
+from ember.ports.repositories import EmbeddingCache, IndexSnapshotRepository, MetaRepository
+from ember.ports.vcs import VCS
+
+logger = logging.getLogger(__name__)
+
+# Embeddings handed to the shared cache per put_many call
+_CACHE_BATCH = 500
+
+
+@dataclass
+class ImportRequest:
+    """Request to import a bundle.
+
+    Attributes:
+        repo_root: Absolute path to repository root.
+        model_fingerprint: Fingerprint of the locally configured model.
+    """
+
+    repo_root: Path
+    model_fingerprint: str
+
+
+@dataclass
+class ImportResponse:
+    """Response from importing a bundle.
+
+    Attributes:
+        chunks_imported: Number of chunks loaded.
+        vectors_imported: Number of vectors loaded.
+        files_imported: Number of file records loaded.
+        tree_sha: Tree SHA the bundle was built from.
+        tree_available: Whether that tree exists in the local repository.
+            If not, the next sync is a full one (reusing the bundle's vectors
+            through the shared embedding cache).
+        include_content: False if the bundle had content stripped.
+        success: Whether the import succeeded.
+        error: Error message if the import failed.
+    """
+
+    chunks_imported: int = 0
+    vectors_imported: int = 0
+    files_imported: int = 0
+    tree_sha: str | None = None
+    tree_available: bool = False
+    include_content: bool = True
+    success: bool = True
+    error: str | None = None
+
+
+class ImportUseCase:
+    """Use case for replacing the index with the contents of a bundle.
+
+    The bundle's vectors are only usable with the model that produced them,
+    so imports are refused on a fingerprint mismatch. The index is replaced
+    in one transaction and the last synced tree is set to the bundle's, so a
+    normal incremental sync afterwards only indexes local changes.
+    """
+
+    def __init__(
+        self,
+        snapshot_repo: IndexSnapshotRepository,
+        meta_repo: MetaRepository,
+        bundle_reader: BundleReader,
+        vcs: VCS,
+        project_id: str,
+        embedding_cache: EmbeddingCache | None = None,
+    ) -> None:
+        """Initialize import use case.
+
+        Args:
+            snapshot_repo: Loads chunks, vectors, and files into the index.
+            meta_repo: Metadata repository for sync state.
+            bundle_reader: Source bundle.
+            vcs: Version control adapter, to check the bundle's tree exists.
+            project_id: Project identifier of the local repository.
+            embedding_cache: Optional shared cache to seed with the bundle's vectors
+                (float32 bundles only; int8 vectors are not exact model outputs).
+        """
+        self.snapshot_repo = snapshot_repo
+        self.meta_repo = meta_repo
+        self.bundle_reader = bundle_reader
+        self.vcs = vcs
+        self.project_id = project_id
+        self.embedding_cache = embedding_cache
+
+    def execute(self, request: ImportRequest) -> ImportResponse:
+        """Import the bundle.
+
+        Args:
+            request: Import request with the local model fingerprint.
+
+        Returns:
+            ImportResponse with record counts and sync state.
+        """
+        try:
+            header = self.bundle_reader.read_header()
+        except (OSError, ValueError) as e:
+            return ImportResponse(success=False, error=str(e))
+
+        if header.model_fingerprint != request.model_fingerprint:
+            return ImportResponse(
+                tree_sha=header.tree_sha,
+                success=False,
+                error=(
+                    f"Bundle was built with model {header.model_fingerprint}, "
+                    f"but this repository uses {request.model_fingerprint}"
+                ),
+            )
+
+        tree_available = self._has_tree(header.tree_sha)
+
+        files = (
+            (request.repo_root / file.path, file.file_hash, file.size)
+            for file in self.bundle_reader.iter_files()
+        )
+        chunks = self._localize(
+            self.bundle_reader.iter_chunks(),
+            header.model_fingerprint,
+            seed_cache=header.vector_encoding == "float32",
+        )
+
+        try:
+            files_imported, chunks_imported, vectors_imported = self.snapshot_repo.replace_all(
+                files, chunks, header.model_fingerprint
+            )
+        except Exception as e:
+            logger.error(f"Import failed: {e}")
+            return ImportResponse(tree_sha=header.tree_sha, success=False, error=str(e))
+
+        self.meta_repo.set("model_fingerprint", header.model_fingerprint)
+        self.meta_repo.set("last_sync_mode", header.sync_mode)
+        if tree_available:
+            self.meta_repo.set("last_tree_sha", header.tree_sha)
+        else:
+            # Can't diff against an unknown tree; the next sync is a full one
+            logger.warning(f"Bundle tree {header.tree_sha[:12]} not found locally")
+            self.meta_repo.delete("last_tree_sha")
+
+        return ImportResponse(
+            chunks_imported=chunks_imported,
+            vectors_imported=vectors_imported,
+            files_imported=files_imported,
+            tree_sha=header.tree_sha,
+            tree_available=tree_available,
+            include_content=header.include_content,
+        )
+
+    def _has_tree(self, tree_sha: str) -> bool:
+        """Check whether a tree exists in the local repository."""
+        try:
+            self.vcs.list_files_at(tree_sha)
+        except Exception:
+            return False
+        return True
+
+    def _localize(
+        self,
+        chunks: Iterator[tuple[Chunk, list[float] | None]],
+        model_fingerprint: str,
+        seed_cache: bool,
+    ) -> Iterator[tuple[Chunk, list[float] | None]]:
+        """Assign local chunk ids and seed the shared embedding cache.
+
+        Args:
+            chunks: Chunks from the bundle, without ids.
+            model_fingerprint: Fingerprint of the bundle's vectors.
+            seed_cache: Store the vectors in the shared cache. Only exact
+                vectors may be cached, since syncs reuse them as model outputs.
+
+        Yields:
+            Chunks with this repository's project id and chunk ids.
+        """
+        pending: dict[str, list[float]] = {}
+        for chunk, embedding in chunks:
+            chunk = replace(
+                chunk,
+                project_id=self.project_id,
+                id=Chunk.compute_id(self.project_id, chunk.path, chunk.start_line, chunk.end_line),
+            )
+            if seed_cache and embedding is not None and self.embedding_cache is not None:
+                pending[chunk.content_hash] = embedding
+                if len(pending) >= _CACHE_BATCH:
+                    self._seed_cache(model_fingerprint, pending)
+                    pending = {}
+            yield chunk, embedding
+        self._seed_cache(model_fingerprint, pending)
+
+    def _seed_cache(self, model_fingerprint: str, embeddings: dict[str, list[float]]) -> None:
+        """Store embeddings in the shared cache, ignoring cache failures."""
+        if not embeddings or self.embedding_cache is None:
+            return
+        try:
+            self.embedding_cache.put_many(model_fingerprint, embeddings)
+        except Exception as e:
+            logger.warning(f"Could not update shared embedding cache: {e}")
@@ -2,9 +2,11 @@
 
 This module detects system resources and recommends appropriate embedding models
 based on available RAM. It's used during `ember init` to suggest a model and
-to resolve `model = "auto"` in configuration.
+to resolve `model = "auto"` in configuration. It also sizes the daemon's
+embedding worker pool from the CPU count.
 """
 
+import os
 from dataclasses import dataclass
 
 # Memory requirements for each model (in GB)
@@ -21,6 +23,13 @@ JINA_THRESHOLD_GB = 4.0  # Need 4GB+ for Jina (1.6GB model + overhead)
 BGE_THRESHOLD_GB = 1.0  # Need 1GB+ for BGE-small (130MB model + overhead)
 # Below 1GB: use MiniLM (100MB model)
 
+# Intra-op threading scales poorly past a few threads for small batches, so
+# large machines are split into several workers of at least this many threads
+MIN_THREADS_PER_WORKER = 4
+
+# Fraction of available RAM the worker pool may use for model copies
+WORKER_RAM_FRACTION = 0.5
+
 
 @dataclass
 class SystemResources:
@@ -28,6 +37,27 @@ class SystemResources:
 
     available_ram_gb: float
     total_ram_gb: float
+    cpu_count: int = 1
+
+
+@dataclass
+class WorkerLayout:
+    """How to split CPU cores across embedding worker processes."""
+
+    workers: int
+    threads_per_worker: int
+
+
+def detect_cpu_count() -> int:
+    """Detect the number of CPUs this process may run on.
+
+    Returns:
+        Usable CPU count (respects affinity masks where supported).
+    """
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, os.cpu_count() or 1)
 
 
 def detect_system_resources() -> SystemResources:
@@ -47,6 +77,7 @@ def detect_system_resources() -> SystemResources:
         return SystemResources(
             available_ram_gb=mem.available / (1024**3),
             total_ram_gb=mem.total / (1024**3),
+            cpu_count=detect_cpu_count(),
         )
     except ImportError:
         # psutil not available - return generous defaults
@@ -55,6 +86,7 @@ def detect_system_resources() -> SystemResources:
         return SystemResources(
             available_ram_gb=8.0,
             total_ram_gb=16.0,
+            cpu_count=detect_cpu_count(),
         )
 
 
@@ -99,3 +131,32 @@ def get_model_recommendation_reason(model: str, resources: SystemResources) -> s
         return f"Available RAM ({memory_str}) is below 4GB; using compact model for better stability"
     else:  # minilm
         return f"Available RAM ({memory_str}) is limited; using lightweight model"
+
+
+def recommend_worker_layout(
+    model: str,
+    workers: int = 0,
+    resources: SystemResources | None = None,
+) -> WorkerLayout:
+    """Recommend embedding worker processes and threads per worker.
+
+    Args:
+        model: Model preset name (used to estimate per-worker memory)
+        workers: Requested worker count (0 = choose from hardware)
+        resources: System resources (auto-detected if None)
+
+    Returns:
+        WorkerLayout splitting the CPUs evenly across workers
+    """
+    if resources is None:
+        resources = detect_system_resources()
+
+    cpus = max(1, resources.cpu_count)
+    if workers <= 0:
+        by_cpu = max(1, cpus // MIN_THREADS_PER_WORKER)
+        model_gb = MODEL_MEMORY_GB.get(model, MODEL_MEMORY_GB["jina-code-v2"])
+        by_ram = int(resources.available_ram_gb * WORKER_RAM_FRACTION / model_gb)
+        workers = max(1, min(by_cpu, by_ram))
+
+    workers = min(workers, cpus)
+    return WorkerLayout(workers=workers, threads_per_worker=max(1, cpus // workers))
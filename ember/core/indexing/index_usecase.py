@@ -9,12 +9,15 @@ This use case orchestrates the complete indexing pipeline:
 
 import logging
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Protocol
 
 import blake3
 
 from ember.core.chunking.chunk_usecase import ChunkFileRequest, ChunkFileUseCase
+from ember.core.indexing.file_classifier import FileClassifier
 from ember.domain.entities import Chunk
 from ember.ports.chunkers import ChunkData
 from ember.ports.embedders import Embedder
@@ -22,14 +25,27 @@ from ember.ports.fs import FileSystem
 from ember.ports.progress import ProgressCallback
 from ember.ports.repositories import (
     ChunkRepository,
+    EmbeddingCache,
     FileRepository,
     MetaRepository,
+    RefRepository,
+    SyncCheckpointRepository,
     VectorRepository,
 )
 from ember.ports.vcs import VCS
 
 logger = logging.getLogger(__name__)
 
+# Worktree files larger than this are streamed from a memory map instead of
+# being read, decoded and chunked in memory
+STREAM_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Bytes hashed per step when hashing a streamed file
+STREAM_HASH_BLOCK_BYTES = 1024 * 1024
+
+# Chunks of a streamed file embedded and stored per batch
+STREAM_BATCH_CHUNKS = 64
+
 # Code file extensions to index (whitelist approach)
 # Only source code files are indexed - data, config, docs, and binary files are skipped
 CODE_FILE_EXTENSIONS = frozenset(
@@ -84,6 +100,25 @@ CODE_FILE_EXTENSIONS = frozenset(
 )
 
 
+def resolve_tree_sha(vcs: VCS, sync_mode: str) -> str:
+    """Get the tree SHA a sync mode refers to.
+
+    Args:
+        vcs: Version control adapter.
+        sync_mode: Sync mode (worktree, staged, or commit SHA).
+
+    Returns:
+        Tree SHA string.
+    """
+    if sync_mode == "worktree":
+        return vcs.get_worktree_tree_sha()
+    elif sync_mode == "staged":
+        return vcs.get_staged_tree_sha()
+    else:
+        # sync_mode is a commit SHA - get its tree SHA
+        return vcs.get_tree_sha(ref=sync_mode)
+
+
 @dataclass
 class IndexRequest:
     """Request to index (or re-index) files.
@@ -93,12 +128,19 @@ class IndexRequest:
         sync_mode: Mode to sync - "worktree" (uncommitted changes), "staged", or commit SHA.
         path_filters: Optional list of path patterns to filter (e.g., ["src/**/*.py"]).
         force_reindex: If True, reindex even if files haven't changed.
+        as_ref: If True, index the sync_mode's tree as an additional ref
+            (named after sync_mode) without changing the live index.
+        tree_sha: Optional tree SHA of sync_mode, when already resolved.
+            Lets several use cases index the same tree without each
+            computing the worktree tree SHA (which stages files).
     """
 
     repo_root: Path
     sync_mode: str = "worktree"
     path_filters: list[str] = field(default_factory=list)
     force_reindex: bool = False
+    as_ref: bool = False
+    tree_sha: str | None = None
 
 
 @dataclass
@@ -113,6 +155,14 @@ class IndexResponse:
         vectors_stored: Number of vectors stored.
         tree_sha: Git tree SHA that was indexed.
         files_failed: Number of files that failed to chunk.
+        files_resumed: Number of files skipped because an interrupted sync of
+            the same tree had already indexed them.
+        vectors_cached: Number of stored vectors taken from the shared
+            embedding cache instead of the embedding model.
+        files_restored: Number of files whose chunks were restored from
+            another indexed ref instead of being chunked and embedded.
+        files_skipped: Number of files not indexed because they are
+            generated, minified, vendored or too large.
         is_incremental: Whether this was an incremental sync (vs full reindex).
         success: Whether indexing succeeded.
         error: Error message if indexing failed.
@@ -125,11 +175,33 @@ class IndexResponse:
     vectors_stored: int
     tree_sha: str
     files_failed: int = 0
+    files_resumed: int = 0
+    vectors_cached: int = 0
+    files_restored: int = 0
+    files_skipped: int = 0
     is_incremental: bool = False
     success: bool = True
     error: str | None = None
 
 
+class Indexer(Protocol):
+    """Protocol for index sync operations (single or sharded index)."""
+
+    def execute(
+        self, request: IndexRequest, progress: ProgressCallback | None = None
+    ) -> IndexResponse:
+        """Execute an indexing operation.
+
+        Args:
+            request: Indexing request with mode and filters.
+            progress: Optional progress callback.
+
+        Returns:
+            IndexResponse with statistics.
+        """
+        ...
+
+
 class IndexingUseCase:
     """Use case for indexing code files into searchable chunks.
 
@@ -148,6 +220,14 @@ class IndexingUseCase:
         file_repo: FileRepository,
         meta_repo: MetaRepository,
         project_id: str,
+        checkpoint_repo: SyncCheckpointRepository | None = None,
+        checkpoint_interval: int = 25,
+        embedding_cache: EmbeddingCache | None = None,
+        ref_repo: RefRepository | None = None,
+        max_refs: int = 5,
+        path_scope: Callable[[Path], bool] | None = None,
+        file_classifier: FileClassifier | None = None,
+        stream_threshold_bytes: int = STREAM_THRESHOLD_BYTES,
     ) -> None:
         """Initialize indexing use case.
 
@@ -161,6 +241,24 @@ class IndexingUseCase:
             file_repo: Repository for tracking indexed files.
             meta_repo: Repository for metadata (last tree SHA, etc.).
             project_id: Project identifier (typically repo root hash).
+            checkpoint_repo: Optional repository for per-file sync progress.
+                When provided, interrupted syncs resume where they stopped.
+            checkpoint_interval: Number of completed files per durable
+                checkpoint batch.
+            embedding_cache: Optional content-addressed cache shared across
+                repositories, consulted before calling the embedder.
+            ref_repo: Optional repository keeping several refs indexed. When
+                provided, replaced file versions are retained for the refs
+                that contain them, so switching back to a ref restores its
+                chunks instead of re-embedding them.
+            max_refs: Number of most recently synced refs to keep indexed.
+            path_scope: Optional predicate on repository-relative paths. When
+                provided, only matching files are indexed or deleted, so
+                several use cases can each maintain one shard of the index.
+            file_classifier: Optional classifier of generated, minified and
+                vendored files, which are skipped instead of chunked.
+            stream_threshold_bytes: Worktree files larger than this are
+                indexed in bounded memory, as lazily produced line windows.
         """
         self.vcs = vcs
         self.fs = fs
@@ -171,6 +269,18 @@ class IndexingUseCase:
         self.file_repo = file_repo
         self.meta_repo = meta_repo
         self.project_id = project_id
+        self.checkpoint_repo = checkpoint_repo
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.embedding_cache = embedding_cache
+        self.ref_repo = ref_repo
+        self.max_refs = max(1, max_refs)
+        self.path_scope = path_scope
+        self.file_classifier = file_classifier
+        self.stream_threshold_bytes = stream_threshold_bytes
+
+    def _in_scope(self, rel_path: Path | str) -> bool:
+        """Check whether a repository-relative path belongs to this index."""
+        return self.path_scope is None or self.path_scope(Path(rel_path))
 
     def _create_error_response(self, error: str) -> IndexResponse:
         """Create a standardized error response with zero counts.
@@ -249,36 +359,55 @@ class IndexingUseCase:
 
         Returns:
             Dict with counts: files_indexed, chunks_created, chunks_updated,
-            vectors_stored, files_failed.
+            vectors_stored, vectors_cached, files_failed, files_restored,
+            files_skipped.
         """
         files_indexed = 0
         chunks_created = 0
         chunks_updated = 0
         vectors_stored = 0
+        vectors_cached = 0
         files_failed = 0
+        files_restored = 0
+        files_skipped = 0
+
+        # Files finished since the last checkpoint flush
+        completed: list[Path] = []
 
         # Report progress start
         if progress and files_to_index:
             progress.on_start(len(files_to_index), f"Indexing files ({sync_type})")
 
-        for idx, file_path in enumerate(files_to_index, start=1):
-            # Report progress for current file
-            if progress:
+        try:
+            for idx, file_path in enumerate(files_to_index, start=1):
                 rel_path = file_path.relative_to(repo_root)
-                progress.on_progress(idx, str(rel_path))
 
-            result = self._index_file(
-                file_path=file_path,
-                repo_root=repo_root,
-                tree_sha=tree_sha,
-                sync_mode=sync_mode,
-            )
+                # Report progress for current file
+                if progress:
+                    progress.on_progress(idx, str(rel_path))
+
+                result = self._index_file(
+                    file_path=file_path,
+                    repo_root=repo_root,
+                    tree_sha=tree_sha,
+                    sync_mode=sync_mode,
+                )
 
-            files_indexed += 1
-            chunks_created += result["chunks_created"]
-            chunks_updated += result["chunks_updated"]
-            vectors_stored += result["vectors_stored"]
-            files_failed += result["failed"]
+                files_indexed += 1 - result["skipped"]
+                chunks_created += result["chunks_created"]
+                chunks_updated += result["chunks_updated"]
+                vectors_stored += result["vectors_stored"]
+                vectors_cached += result["vectors_cached"]
+                files_failed += result["failed"]
+                files_restored += result["restored"]
+                files_skipped += result["skipped"]
+
+                completed.append(rel_path)
+                if len(completed) >= self.checkpoint_interval:
+                    self._flush_checkpoint(tree_sha, completed)
+        finally:
+            # Record finished files even when interrupted (Ctrl-C, errors)
+            self._flush_checkpoint(tree_sha, completed)
 
         # Report completion
         if progress and files_to_index:
@@ -289,9 +418,58 @@ class IndexingUseCase:
             "chunks_created": chunks_created,
             "chunks_updated": chunks_updated,
             "vectors_stored": vectors_stored,
+            "vectors_cached": vectors_cached,
             "files_failed": files_failed,
+            "files_restored": files_restored,
+            "files_skipped": files_skipped,
         }
 
+    def _flush_checkpoint(self, tree_sha: str, completed: list[Path]) -> None:
+        """Durably record completed files and reset the pending batch.
+
+        Args:
+            tree_sha: Tree SHA being indexed.
+            completed: Relative paths finished since the last flush (cleared).
+        """
+        if self.checkpoint_repo is None or not completed:
+            return
+        self.checkpoint_repo.mark_completed(
+            tree_sha, self.embedder.fingerprint(), list(completed)
+        )
+        completed.clear()
+
+    def _skip_checkpointed_files(
+        self,
+        files_to_index: list[Path],
+        repo_root: Path,
+        tree_sha: str,
+    ) -> tuple[list[Path], int]:
+        """Drop files an interrupted sync of the same tree already indexed.
+
+        Args:
+            files_to_index: Absolute paths selected for indexing.
+            repo_root: Repository root path.
+            tree_sha: Tree SHA being indexed.
+
+        Returns:
+            Tuple of (remaining files, number of files skipped).
+        """
+        if self.checkpoint_repo is None or not files_to_index:
+            return (files_to_index, 0)
+
+        done = self.checkpoint_repo.get_completed(tree_sha, self.embedder.fingerprint())
+        if not done:
+            return (files_to_index, 0)
+
+        remaining = [f for f in files_to_index if f.relative_to(repo_root) not in done]
+        skipped = len(files_to_index) - len(remaining)
+        if skipped:
+            logger.info(
+                f"Resuming interrupted sync of {tree_sha[:12]}: "
+                f"{skipped} file(s) already indexed"
+            )
+        return (remaining, skipped)
+
     def _update_metadata(self, tree_sha: str, sync_mode: str) -> None:
         """Update metadata after successful indexing.
 
@@ -303,6 +481,165 @@ class IndexingUseCase:
         self.meta_repo.set("last_sync_mode", sync_mode)
         self.meta_repo.set("model_fingerprint", self.embedder.fingerprint())
 
+        # Sync is complete - progress records are no longer needed
+        if self.checkpoint_repo is not None:
+            self.checkpoint_repo.clear()
+
+    def _record_live_ref(self, tree_sha: str, sync_mode: str) -> None:
+        """Record the live index as an indexed ref and prune old refs.
+
+        Args:
+            tree_sha: Tree SHA the live index was synced to.
+            sync_mode: Sync mode that was used.
+        """
+        if self.ref_repo is None:
+            return
+
+        name = (self.vcs.get_current_branch() or "HEAD") if sync_mode == "worktree" else sync_mode
+        self.ref_repo.record(name, tree_sha)
+
+        pruned = self.ref_repo.prune(self.max_refs)
+        if pruned:
+            logger.debug(f"Pruned {pruned} chunk(s) no longer used by any indexed ref")
+
+    def _index_ref(
+        self, request: IndexRequest, progress: ProgressCallback | None
+    ) -> IndexResponse:
+        """Index a rev as an additional ref, leaving the live index unchanged.
+
+        Files the rev shares with the live index are recorded as the live
+        version; only files that differ are read from git, and versions
+        already stored for another ref are reused rather than re-embedded.
+
+        Args:
+            request: Indexing request whose sync_mode names the rev.
+            progress: Optional progress callback.
+
+        Returns:
+            IndexResponse for the files indexed for the ref.
+
+        Raises:
+            ValueError: If no ref repository is configured.
+        """
+        if self.ref_repo is None:
+            raise ValueError("Indexing additional refs is disabled (index.max_refs = 0)")
+
+        name = request.sync_mode
+        tree_sha = request.tree_sha or self._get_tree_sha(request.repo_root, name)
+        existing = self.ref_repo.get(name)
+        if existing is not None and existing.tree_sha == tree_sha and not request.force_reindex:
+            return self._create_success_response(
+                files_indexed=0,
+                chunks_created=0,
+                chunks_updated=0,
+                chunks_deleted=0,
+                vectors_stored=0,
+                tree_sha=tree_sha,
+                is_incremental=True,
+            )
+
+        live_tree_sha = self.meta_repo.get("last_tree_sha")
+        live_files = self.ref_repo.live_files()
+        if live_tree_sha is None:
+            changed = None
+        else:
+            changed = {
+                path
+                for status, path in self.vcs.diff_files(from_sha=live_tree_sha, to_sha=tree_sha)
+                if status != "deleted"
+            }
+
+        files: dict[Path, str] = {}
+        to_index: list[Path] = []
+        for rel_path in self.vcs.list_files_at(tree_sha):
+            if not self._in_scope(rel_path):
+                continue
+            if changed is not None and rel_path not in changed:
+                if rel_path in live_files:
+                    files[rel_path] = live_files[rel_path]
+            elif self._is_code_file(rel_path):
+                to_index.append(rel_path)
+        if request.path_filters:
+            to_index = [
+                rel_path
+                for rel_path in to_index
+                if any(rel_path.match(pattern) for pattern in request.path_filters)
+            ]
+
+        if to_index:
+            self._ensure_model_loaded(progress)
+            if progress:
+                progress.on_start(len(to_index), f"Indexing files ({name})")
+
+        chunks_created = 0
+        vectors_stored = 0
+        vectors_cached = 0
+        files_failed = 0
+        files_restored = 0
+        files_skipped = 0
+        model_fingerprint = self.embedder.fingerprint()
+        for idx, rel_path in enumerate(to_index, start=1):
+            if progress:
+                progress.on_progress(idx, str(rel_path))
+
+            content_bytes = self.vcs.get_file_content(rel_path, ref=tree_sha)
+            if self._skip_reason(rel_path, content_bytes) is not None:
+                files_skipped += 1
+                continue
+            file_hash = blake3.blake3(content_bytes).hexdigest()
+            if self.ref_repo.has_version(rel_path, file_hash):
+                files[rel_path] = file_hash
+                files_restored += 1
+                continue
+
+            chunk_response = self.chunk_usecase.execute(
+                ChunkFileRequest(
+                    content=content_bytes.decode("utf-8", errors="replace"),
+                    path=rel_path,
+                    lang=self._detect_language(rel_path),
+                )
+            )
+            if not chunk_response.success:
+                logger.warning(f"Failed to chunk {rel_path} at {name}: {chunk_response.error}")
+                files_failed += 1
+                continue
+
+            chunks = self._create_chunks(
+                chunk_data_list=chunk_response.chunks,
+                rel_path=rel_path,
+                file_hash=file_hash,
+                tree_sha=tree_sha,
+                rev=name,
+                versioned=True,
+            )
+            if chunks:
+                embeddings, cached = self._embed_chunks(chunks, model_fingerprint)
+                stored = self.ref_repo.store_version(chunks, embeddings, model_fingerprint)
+                chunks_created += stored
+                vectors_stored += stored
+                vectors_cached += cached
+            files[rel_path] = file_hash
+
+        if progress and to_index:
+            progress.on_complete()
+
+        self.ref_repo.record(name, tree_sha, files)
+        self.ref_repo.prune(self.max_refs)
+
+        return self._create_success_response(
+            files_indexed=len(to_index) - files_skipped,
+            chunks_created=chunks_created,
+            chunks_updated=0,
+            chunks_deleted=0,
+            vectors_stored=vectors_stored,
+            tree_sha=tree_sha,
+            is_incremental=changed is not None,
+            files_failed=files_failed,
+            vectors_cached=vectors_cached,
+            files_restored=files_restored,
+            files_skipped=files_skipped,
+        )
+
     def _create_success_response(
         self,
         files_indexed: int,
@@ -313,6 +650,10 @@ class IndexingUseCase:
         tree_sha: str,
         is_incremental: bool,
         files_failed: int = 0,
+        files_resumed: int = 0,
+        vectors_cached: int = 0,
+        files_restored: int = 0,
+        files_skipped: int = 0,
     ) -> IndexResponse:
         """Create a success response with indexing statistics.
 
@@ -325,6 +666,10 @@ class IndexingUseCase:
             tree_sha: Git tree SHA that was indexed.
             is_incremental: Whether this was an incremental sync.
             files_failed: Number of files that failed to chunk.
+            files_resumed: Number of files skipped from an interrupted sync.
+            vectors_cached: Number of vectors reused from the embedding cache.
+            files_restored: Number of files restored from another indexed ref.
+            files_skipped: Number of generated, minified or vendored files skipped.
 
         Returns:
             IndexResponse with success=True and all statistics.
@@ -336,6 +681,14 @@ class IndexingUseCase:
         )
         if files_failed > 0:
             log_msg += f", {files_failed} failed"
+        if files_resumed > 0:
+            log_msg += f", {files_resumed} resumed"
+        if vectors_cached > 0:
+            log_msg += f", {vectors_cached} from cache"
+        if files_restored > 0:
+            log_msg += f", {files_restored} files restored"
+        if files_skipped > 0:
+            log_msg += f", {files_skipped} files skipped"
         logger.info(log_msg)
 
         return IndexResponse(
@@ -346,6 +699,10 @@ class IndexingUseCase:
             vectors_stored=vectors_stored,
             tree_sha=tree_sha,
             files_failed=files_failed,
+            files_resumed=files_resumed,
+            vectors_cached=vectors_cached,
+            files_restored=files_restored,
+            files_skipped=files_skipped,
             is_incremental=is_incremental,
             success=True,
             error=None,
@@ -369,8 +726,17 @@ class IndexingUseCase:
             # Check if embedding model has changed
             self._verify_model_compatibility()
 
+            if request.as_ref:
+                return self._index_ref(request, progress)
+
+            # A full rebuild starts without any other refs
+            if request.force_reindex and self.ref_repo is not None:
+                self.ref_repo.clear()
+
             # Get current tree SHA based on sync mode
-            tree_sha = self._get_tree_sha(request.repo_root, request.sync_mode)
+            tree_sha = request.tree_sha or self._get_tree_sha(
+                request.repo_root, request.sync_mode
+            )
             logger.debug(f"Tree SHA for indexing: {tree_sha}")
 
             # Get files to index (returns tuple of files and is_incremental flag)
@@ -379,6 +745,12 @@ class IndexingUseCase:
                 tree_sha,
                 request.path_filters,
                 request.force_reindex,
+                sync_mode=request.sync_mode,
+            )
+
+            # Skip files an interrupted sync of this tree already finished
+            files_to_index, files_resumed = self._skip_checkpointed_files(
+                files_to_index, request.repo_root, tree_sha
             )
 
             sync_type = "incremental" if is_incremental else "full"
@@ -393,6 +765,8 @@ class IndexingUseCase:
                 )
                 if chunks_deleted > 0:
                     logger.info(f"Deleted {chunks_deleted} chunk(s) from removed files")
+            elif request.force_reindex and self.path_scope is not None:
+                chunks_deleted = self._drop_out_of_scope(request.repo_root)
 
             # Eagerly load embedding model before indexing
             if files_to_index:
@@ -410,6 +784,7 @@ class IndexingUseCase:
 
             # Update metadata with new tree SHA
             self._update_metadata(tree_sha, request.sync_mode)
+            self._record_live_ref(tree_sha, request.sync_mode)
 
             # Return success response
             return self._create_success_response(
@@ -421,6 +796,10 @@ class IndexingUseCase:
                 tree_sha=tree_sha,
                 is_incremental=is_incremental,
                 files_failed=stats["files_failed"],
+                files_resumed=files_resumed,
+                vectors_cached=stats["vectors_cached"],
+                files_restored=stats["files_restored"],
+                files_skipped=stats["files_skipped"],
             )
 
         except (KeyboardInterrupt, SystemExit):
@@ -476,14 +855,7 @@ class IndexingUseCase:
         Returns:
             Tree SHA string.
         """
-        if sync_mode == "worktree":
-            return self.vcs.get_worktree_tree_sha()
-        elif sync_mode == "staged":
-            # For now, use worktree SHA (staged support can be added later)
-            return self.vcs.get_worktree_tree_sha()
-        else:
-            # sync_mode is a commit SHA - get its tree SHA
-            return self.vcs.get_tree_sha(ref=sync_mode)
+        return resolve_tree_sha(self.vcs, sync_mode)
 
     def _get_files_to_index(
         self,
@@ -491,6 +863,7 @@ class IndexingUseCase:
         tree_sha: str,
         path_filters: list[str],
         force_reindex: bool,
+        sync_mode: str = "worktree",
     ) -> tuple[list[Path], bool]:
         """Get list of files that need to be indexed.
 
@@ -499,16 +872,18 @@ class IndexingUseCase:
             tree_sha: Current tree SHA.
             path_filters: Optional path patterns to filter.
             force_reindex: Whether to reindex all files.
+            sync_mode: Sync mode (worktree, staged, or commit SHA).
 
         Returns:
             Tuple of (list of absolute file paths to index, is_incremental flag).
         """
         # Determine which files need syncing based on git state
-        sync_result = self._determine_files_to_sync(tree_sha, force_reindex)
+        sync_result = self._determine_files_to_sync(tree_sha, force_reindex, sync_mode)
         if sync_result is None:
             return ([], False)  # No changes since last sync
 
         relative_files, is_incremental = sync_result
+        relative_files = [f for f in relative_files if self._in_scope(f)]
 
         # Convert to absolute paths
         files = [repo_root / f for f in relative_files]
@@ -526,12 +901,14 @@ class IndexingUseCase:
         self,
         tree_sha: str,
         force_reindex: bool,
-    ) -> tuple[list[str], bool] | None:
+        sync_mode: str = "worktree",
+    ) -> tuple[list[Path], bool] | None:
         """Determine which files need to be synced based on git state.
 
         Args:
             tree_sha: Current tree SHA.
             force_reindex: Whether to force a full reindex.
+            sync_mode: Sync mode (worktree, staged, or commit SHA).
 
         Returns:
             Tuple of (relative file paths, is_incremental) or None if no changes.
@@ -539,8 +916,11 @@ class IndexingUseCase:
         last_tree_sha = self.meta_repo.get("last_tree_sha")
 
         if force_reindex or last_tree_sha is None:
-            # Full reindex: get all tracked files
-            return (self.vcs.list_tracked_files(), False)
+            # Full reindex: get all tracked files (from the tree itself when
+            # syncing a rev/staged snapshot, so worktree noise is ignored)
+            if sync_mode == "worktree":
+                return (self.vcs.list_tracked_files(), False)
+            return (self.vcs.list_files_at(tree_sha), False)
 
         if last_tree_sha == tree_sha:
             # No changes since last sync
@@ -617,17 +997,45 @@ class IndexingUseCase:
 
         # Get deleted files from git diff
         changes = self.vcs.diff_files(from_sha=last_tree_sha, to_sha=tree_sha)
-        deleted_files = [path for status, path in changes if status == "deleted"]
+        deleted_files = [
+            path for status, path in changes if status == "deleted" and self._in_scope(path)
+        ]
 
         # Delete chunks for each deleted file
         total_deleted = 0
         for file_path in deleted_files:
+            if self.ref_repo is not None:
+                # Keep them for refs that still contain the file
+                total_deleted += self.ref_repo.retire(file_path)
+                continue
             # Delete all chunks for this file (using last_tree_sha since file no longer exists in new tree)
             deleted_count = self.chunk_repo.delete_by_path(path=file_path, tree_sha=last_tree_sha)
             total_deleted += deleted_count
 
         return total_deleted
 
+    def _drop_out_of_scope(self, repo_root: Path) -> int:
+        """Delete chunks of indexed files outside the path scope.
+
+        A full rebuild after the scope changed (e.g., a new shard layout)
+        must not keep files that now belong to another index.
+
+        Args:
+            repo_root: Repository root path.
+
+        Returns:
+            Number of chunks deleted.
+        """
+        deleted = 0
+        for file_path in self.file_repo.get_all_tracked_files():
+            try:
+                rel_path = file_path.relative_to(repo_root)
+            except ValueError:
+                continue
+            if not self._in_scope(rel_path):
+                deleted += self.chunk_repo.delete_all_for_path(rel_path)
+        return deleted
+
     def _index_file(
         self,
         file_path: Path,
@@ -644,18 +1052,58 @@ class IndexingUseCase:
             sync_mode: Sync mode (for rev field).
 
         Returns:
-            Dict with counts: chunks_created, chunks_updated, vectors_stored.
+            Dict with counts: chunks_created, chunks_updated, vectors_stored,
+            vectors_cached, failed, restored, skipped.
         """
         # Get relative path
         rel_path = file_path.relative_to(repo_root)
 
+        # Very large files are streamed rather than read into memory
+        if sync_mode == "worktree" and self.fs.size(file_path) > self.stream_threshold_bytes:
+            return self._index_large_file(file_path, rel_path, tree_sha)
+
         # Read file content (returns bytes)
-        content_bytes = self.fs.read(file_path)
+        content_bytes = self._read_file_content(file_path, rel_path, tree_sha, sync_mode)
 
         # Compute file hash and size from original bytes (avoids re-encoding)
         file_hash = blake3.blake3(content_bytes).hexdigest()
         file_size = len(content_bytes)
 
+        # Generated, minified and vendored files are tracked but not indexed;
+        # chunks from an earlier version of the file are removed
+        if self._skip_reason(rel_path, content_bytes) is not None:
+            if self.ref_repo is not None:
+                self.ref_repo.retire(rel_path, replacing=file_hash)
+            else:
+                self.chunk_repo.delete_all_for_path(path=rel_path)
+            self.file_repo.track_file(
+                path=file_path, file_hash=file_hash, size=file_size, mtime=time.time()
+            )
+            return {
+                "chunks_created": 0,
+                "chunks_updated": 0,
+                "vectors_stored": 0,
+                "vectors_cached": 0,
+                "failed": 0,
+                "restored": 0,
+                "skipped": 1,
+            }
+
+        # Another indexed ref may already hold this version (branch switch)
+        if self.ref_repo is not None and self.ref_repo.restore(rel_path, file_hash):
+            self.file_repo.track_file(
+                path=file_path, file_hash=file_hash, size=file_size, mtime=time.time()
+            )
+            return {
+                "chunks_created": 0,
+                "chunks_updated": 0,
+                "vectors_stored": 0,
+                "vectors_cached": 0,
+                "failed": 0,
+                "restored": 1,
+                "skipped": 0,
+            }
+
         # Decode to string for chunking (decode once)
         try:
             content = content_bytes.decode("utf-8")
@@ -681,14 +1129,26 @@ class IndexingUseCase:
                 f"Preserving existing chunks to avoid data loss."
             )
             # Skip files that fail to chunk - preserve existing chunks to avoid data loss
-            return {"chunks_created": 0, "chunks_updated": 0, "vectors_stored": 0, "failed": 1}
+            return {
+                "chunks_created": 0,
+                "chunks_updated": 0,
+                "vectors_stored": 0,
+                "vectors_cached": 0,
+                "failed": 1,
+                "restored": 0,
+                "skipped": 0,
+            }
 
         # Clean up ALL old chunks for this file from any previous tree SHA
         # This prevents accumulation of duplicate chunks across multiple syncs
         # Since we're re-indexing this file now, we want to completely replace
         # all old chunks with the new chunks
         # NOTE: This is done AFTER validation to prevent data loss if chunking fails
-        self.chunk_repo.delete_all_for_path(path=rel_path)
+        if self.ref_repo is not None:
+            # Retain them instead if other indexed refs contain them
+            self.ref_repo.retire(rel_path, replacing=file_hash)
+        else:
+            self.chunk_repo.delete_all_for_path(path=rel_path)
 
         # Create Chunk entities from ChunkData
         chunks = self._create_chunks(
@@ -719,16 +1179,13 @@ class IndexingUseCase:
                 chunks_updated += 1
 
         # Second pass: batch embed all chunks at once for efficiency
+        vectors_cached = 0
         if chunks:
-            # Collect all chunk contents
-            contents = [chunk.content for chunk in chunks]
-
-            # Single batch embedding call
-            embeddings = self.embedder.embed_texts(contents)
-
             # Compute fingerprint once (avoids repeated function calls)
             model_fingerprint = self.embedder.fingerprint()
 
+            embeddings, vectors_cached = self._embed_chunks(chunks, model_fingerprint)
+
             # Store vectors for each chunk
             for chunk, embedding in zip(chunks, embeddings, strict=True):
                 self.vector_repo.add(
@@ -750,8 +1207,198 @@ class IndexingUseCase:
             "chunks_created": chunks_created,
             "chunks_updated": chunks_updated,
             "vectors_stored": vectors_stored,
+            "vectors_cached": vectors_cached,
             "failed": 0,
+            "restored": 0,
+            "skipped": 0,
+        }
+
+    def _index_large_file(
+        self, file_path: Path, rel_path: Path, tree_sha: str
+    ) -> dict[str, int]:
+        """Index a large worktree file in bounded memory.
+
+        The file is memory-mapped and hashed block by block, then chunked
+        into line windows produced one at a time and embedded in batches, so
+        memory use does not grow with the file size.
+
+        Args:
+            file_path: Absolute path to file.
+            rel_path: Path relative to repository root.
+            tree_sha: Current tree SHA.
+
+        Returns:
+            Dict with counts: chunks_created, chunks_updated, vectors_stored,
+            vectors_cached, failed, restored, skipped.
+        """
+        counts = {
+            "chunks_created": 0,
+            "chunks_updated": 0,
+            "vectors_stored": 0,
+            "vectors_cached": 0,
+            "failed": 0,
+            "restored": 0,
+            "skipped": 0,
+        }
+
+        with self.fs.map(file_path) as data:
+            hasher = blake3.blake3()
+            for offset in range(0, len(data), STREAM_HASH_BLOCK_BYTES):
+                hasher.update(data[offset : offset + STREAM_HASH_BLOCK_BYTES])
+            file_hash = hasher.hexdigest()
+            file_size = len(data)
+
+            if self.ref_repo is not None and self.ref_repo.restore(rel_path, file_hash):
+                counts["restored"] = 1
+            else:
+                if self.ref_repo is not None:
+                    self.ref_repo.retire(rel_path, replacing=file_hash)
+                else:
+                    self.chunk_repo.delete_all_for_path(path=rel_path)
+
+                if self._skip_reason(rel_path, data) is not None:
+                    counts["skipped"] = 1
+                else:
+                    lang = self._detect_language(file_path)
+                    batch: list[ChunkData] = []
+                    for chunk_data in self.chunk_usecase.stream(data, lang):
+                        batch.append(chunk_data)
+                        if len(batch) >= STREAM_BATCH_CHUNKS:
+                            self._store_batch(batch, rel_path, file_hash, tree_sha, counts)
+                            batch = []
+                    if batch:
+                        self._store_batch(batch, rel_path, file_hash, tree_sha, counts)
+
+        self.file_repo.track_file(
+            path=file_path, file_hash=file_hash, size=file_size, mtime=time.time()
+        )
+        return counts
+
+    def _store_batch(
+        self,
+        batch: list[ChunkData],
+        rel_path: Path,
+        file_hash: str,
+        tree_sha: str,
+        counts: dict[str, int],
+    ) -> None:
+        """Store and embed one batch of a streamed file's chunks.
+
+        Args:
+            batch: Chunks to store.
+            rel_path: Path relative to repository root.
+            file_hash: Hash of the entire file.
+            tree_sha: Current tree SHA.
+            counts: Running counts of the file, updated in place.
+        """
+        chunks = self._create_chunks(
+            chunk_data_list=batch,
+            rel_path=rel_path,
+            file_hash=file_hash,
+            tree_sha=tree_sha,
+            rev="worktree",
+        )
+        for chunk in chunks:
+            is_new = not self.chunk_repo.find_by_content_hash(chunk.content_hash)
+            self.chunk_repo.add(chunk)
+            counts["chunks_created" if is_new else "chunks_updated"] += 1
+
+        model_fingerprint = self.embedder.fingerprint()
+        embeddings, cached = self._embed_chunks(chunks, model_fingerprint)
+        for chunk, embedding in zip(chunks, embeddings, strict=True):
+            self.vector_repo.add(
+                chunk_id=chunk.id, embedding=embedding, model_fingerprint=model_fingerprint
+            )
+        counts["vectors_stored"] += len(chunks)
+        counts["vectors_cached"] += cached
+
+    def _skip_reason(self, rel_path: Path, content: bytes) -> str | None:
+        """Get the reason a file is not worth indexing, if any.
+
+        Args:
+            rel_path: Path relative to repository root.
+            content: File content.
+
+        Returns:
+            Reason from the file classifier, or None if the file should be
+            indexed (always None without a classifier).
+        """
+        if self.file_classifier is None:
+            return None
+        reason = self.file_classifier.classify(rel_path, content)
+        if reason is not None:
+            logger.debug(f"Skipping {rel_path}: {reason}")
+        return reason
+
+    def _embed_chunks(
+        self, chunks: list[Chunk], model_fingerprint: str
+    ) -> tuple[list[list[float]], int]:
+        """Embed chunks, reusing vectors from the shared embedding cache.
+
+        Only content missing from the cache is sent to the embedder (once per
+        distinct content), and the new vectors are added to the cache. Cache
+        errors are logged and treated as misses so they never fail a sync.
+
+        Args:
+            chunks: Chunks to embed.
+            model_fingerprint: Fingerprint of the embedding model.
+
+        Returns:
+            Tuple of (embedding per chunk in order, number served from cache).
+        """
+        if self.embedding_cache is None:
+            return self.embedder.embed_texts([chunk.content for chunk in chunks]), 0
+
+        hashes = [chunk.content_hash for chunk in chunks]
+        try:
+            found = self.embedding_cache.get_many(model_fingerprint, hashes)
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            found = {}
+
+        # Distinct contents still to embed, in first-seen order
+        missing = {
+            chunk.content_hash: chunk.content
+            for chunk in chunks
+            if chunk.content_hash not in found
         }
+        if missing:
+            new_embeddings = self.embedder.embed_texts(list(missing.values()))
+            computed = dict(zip(missing, new_embeddings, strict=True))
+            try:
+                self.embedding_cache.put_many(model_fingerprint, computed)
+            except Exception as e:
+                logger.warning(f"Embedding cache update failed: {e}")
+            found = {**found, **computed}
+
+        vectors_cached = sum(1 for h in hashes if h not in missing)
+        return [found[h] for h in hashes], vectors_cached
+
+    def _read_file_content(
+        self,
+        file_path: Path,
+        rel_path: Path,
+        tree_sha: str,
+        sync_mode: str,
+    ) -> bytes:
+        """Read file content from the source matching the sync mode.
+
+        Worktree syncs read from disk. Rev and staged syncs read the blob from
+        the tree being indexed via the VCS (a persistent git cat-file process),
+        so the index reflects the snapshot rather than the working copy.
+
+        Args:
+            file_path: Absolute path to file.
+            rel_path: Path relative to repository root.
+            tree_sha: Tree SHA being indexed.
+            sync_mode: Sync mode (worktree, staged, or commit SHA).
+
+        Returns:
+            File content as bytes.
+        """
+        if sync_mode == "worktree":
+            return self.fs.read(file_path)
+        return self.vcs.get_file_content(rel_path, ref=tree_sha)
 
     def _create_chunks(
         self,
@@ -760,6 +1407,7 @@ class IndexingUseCase:
         file_hash: str,
         tree_sha: str,
         rev: str,
+        versioned: bool = False,
     ) -> list[Chunk]:
         """Create Chunk entities from ChunkData.
 
@@ -769,6 +1417,8 @@ class IndexingUseCase:
             file_hash: Hash of entire file.
             tree_sha: Git tree SHA.
             rev: Git revision or "worktree".
+            versioned: Include the file hash in chunk IDs (for chunks stored
+                for another ref rather than the live index).
 
         Returns:
             List of Chunk entities.
@@ -781,6 +1431,7 @@ class IndexingUseCase:
                 rel_path,
                 chunk_data.start_line,
                 chunk_data.end_line,
+                version=file_hash if versioned else None,
             )
 
             chunk = Chunk(
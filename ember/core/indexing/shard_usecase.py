@@ -0,0 +1,219 @@
+"""Sharded indexing use case for syncing directory-sharded indexes.
+
+Each shard is an independent index maintained by its own IndexingUseCase,
+scoped to the files of one directory prefix. Shards are synced in parallel;
+the root shard is synced last so its sync state only advances once every
+other shard is up to date.
+"""
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from pathlib import Path
+
+from ember.core.indexing.index_usecase import (
+    IndexingUseCase,
+    IndexRequest,
+    IndexResponse,
+    resolve_tree_sha,
+)
+from ember.domain.sharding import ROOT_SHARD, ShardLayout
+from ember.ports.embedders import Embedder
+from ember.ports.progress import ProgressCallback
+from ember.ports.repositories import MetaRepository
+from ember.ports.vcs import VCS
+
+logger = logging.getLogger(__name__)
+
+# Meta key recording the layout the shards were last synced with
+LAYOUT_META_KEY = "shard_layout"
+
+# Counters summed across shard responses
+_COUNT_FIELDS = (
+    "files_indexed",
+    "chunks_created",
+    "chunks_updated",
+    "chunks_deleted",
+    "vectors_stored",
+    "files_failed",
+    "files_resumed",
+    "vectors_cached",
+    "files_restored",
+    "files_skipped",
+)
+
+
+class ShardedIndexingUseCase:
+    """Use case for syncing an index split into directory shards.
+
+    The layout is resolved on every sync, so shards for new directories are
+    picked up without restarting a watcher. When the configured layout changes,
+    every shard is rebuilt, since files may have moved between shards.
+    """
+
+    def __init__(
+        self,
+        layout: Callable[[], ShardLayout],
+        create_shard: Callable[[str, Callable[[Path], bool]], IndexingUseCase],
+        vcs: VCS,
+        embedder: Embedder,
+        meta_repo: MetaRepository,
+        layout_key: str,
+        max_workers: int = 4,
+    ) -> None:
+        """Initialize sharded indexing use case.
+
+        Args:
+            layout: Returns the current shard layout.
+            create_shard: Creates the indexing use case of a shard, given its
+                name and a predicate selecting the shard's files.
+            vcs: Version control adapter, to resolve the tree all shards index.
+            embedder: Embedding model shared by all shards.
+            meta_repo: Metadata repository of the root shard.
+            layout_key: Identifies the configured layout; a change forces a
+                full rebuild.
+            max_workers: Maximum number of shards synced at once.
+        """
+        self.layout = layout
+        self.create_shard = create_shard
+        self.vcs = vcs
+        self.embedder = embedder
+        self.meta_repo = meta_repo
+        self.layout_key = layout_key
+        self.max_workers = max(1, max_workers)
+        self._layout = ShardLayout()
+        self._shards: dict[str, IndexingUseCase] = {}
+
+    def _shard(self, name: str) -> IndexingUseCase:
+        """Get the indexing use case of a shard, creating it on first use."""
+        if name not in self._shards:
+            self._shards[name] = self.create_shard(
+                name, lambda path: self._layout.shard_of(path) == name
+            )
+        return self._shards[name]
+
+    def execute(
+        self, request: IndexRequest, progress: ProgressCallback | None = None
+    ) -> IndexResponse:
+        """Sync every shard.
+
+        Args:
+            request: Indexing request, applied to each shard.
+            progress: Optional progress callback. With a single shard it
+                receives per-file progress, otherwise per-shard progress.
+
+        Returns:
+            IndexResponse with counts summed over all shards.
+        """
+        layout = self._layout = self.layout()
+        layout_changed = (self.meta_repo.get(LAYOUT_META_KEY) or "none") != self.layout_key
+        if layout_changed and not request.as_ref:
+            logger.info(f"Shard layout changed to {self.layout_key}, rebuilding all shards")
+            request = replace(request, force_reindex=True)
+
+        if not layout.is_sharded:
+            response = self._shard(ROOT_SHARD).execute(request, progress)
+        else:
+            response = self._execute_sharded(request, layout, progress)
+
+        if response.success and layout_changed and not request.as_ref:
+            self.meta_repo.set(LAYOUT_META_KEY, self.layout_key)
+        return response
+
+    def _execute_sharded(
+        self,
+        request: IndexRequest,
+        layout: ShardLayout,
+        progress: ProgressCallback | None,
+    ) -> IndexResponse:
+        """Sync the non-root shards in parallel, then the root shard.
+
+        Args:
+            request: Indexing request.
+            layout: Shard layout to sync.
+            progress: Optional progress callback for per-shard progress.
+
+        Returns:
+            Combined IndexResponse.
+        """
+        shards = [name for name in layout.shards() if name != ROOT_SHARD]
+        usecases = {name: self._shard(name) for name in [*shards, ROOT_SHARD]}
+
+        # Resolve the tree once; computing the worktree tree stages files,
+        # which must not happen concurrently
+        try:
+            tree_sha = request.tree_sha or resolve_tree_sha(self.vcs, request.sync_mode)
+        except RuntimeError as e:
+            logger.error(f"Runtime error during indexing: {e}")
+            return IndexResponse(
+                files_indexed=0,
+                chunks_created=0,
+                chunks_updated=0,
+                chunks_deleted=0,
+                vectors_stored=0,
+                tree_sha="",
+                success=False,
+                error=f"Indexing error: {e}",
+            )
+        request = replace(request, tree_sha=tree_sha)
+
+        # Load the shared model once rather than racing to load it per shard
+        if hasattr(self.embedder, "ensure_loaded"):
+            if progress:
+                progress.on_start(1, "Loading embedding model")
+            self.embedder.ensure_loaded()  # type: ignore[attr-defined]
+            if progress:
+                progress.on_complete()
+
+        if progress:
+            progress.on_start(len(shards) + 1, f"Syncing {len(shards) + 1} shards")
+
+        responses: dict[str, IndexResponse] = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(shards))) as pool:
+            futures = {pool.submit(usecases[name].execute, request): name for name in shards}
+            for done, future in enumerate(as_completed(futures), start=1):
+                name = futures[future]
+                responses[name] = future.result()
+                if progress:
+                    progress.on_progress(done, name)
+
+        failed = [name for name in shards if not responses[name].success]
+        if failed:
+            # Leave the root sync state alone so the next sync retries
+            if progress:
+                progress.on_complete()
+            return self._combine(responses, tree_sha=responses[failed[0]].tree_sha)
+
+        responses[ROOT_SHARD] = usecases[ROOT_SHARD].execute(request)
+        if progress:
+            progress.on_progress(len(shards) + 1, "(root)")
+            progress.on_complete()
+        return self._combine(responses, tree_sha=responses[ROOT_SHARD].tree_sha)
+
+    def _combine(self, responses: dict[str, IndexResponse], tree_sha: str) -> IndexResponse:
+        """Combine shard responses into one.
+
+        Args:
+            responses: Response per shard name.
+            tree_sha: Tree SHA to report.
+
+        Returns:
+            IndexResponse with summed counts; failed if any shard failed.
+        """
+        counts = {
+            name: sum(getattr(response, name) for response in responses.values())
+            for name in _COUNT_FIELDS
+        }
+        errors = [
+            f"{name or '(root)'}: {response.error}"
+            for name, response in responses.items()
+            if not response.success
+        ]
+        return IndexResponse(
+            **counts,
+            tree_sha=tree_sha,
+            is_incremental=all(r.is_incremental for r in responses.values()),
+            success=not errors,
+            error="; ".join(errors) if errors else None,
+        )
@@ -0,0 +1,187 @@
+"""Watch use case for continuous background indexing.
+
+Waits for filesystem change notifications, debounces bursts (branch
+checkouts, formatters, rebases), and runs incremental worktree syncs so the
+index is already fresh when a search arrives.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+
+from ember.core.indexing.index_usecase import Indexer, IndexRequest, IndexResponse
+from ember.domain.entities import WatchState
+from ember.ports.watcher import FileWatcher
+
+logger = logging.getLogger(__name__)
+
+
+class WatchUseCase:
+    """Use case for keeping the index in sync with the worktree as it changes.
+
+    Publishes a WatchState after every transition so other processes can tell
+    whether searches are running against a fully caught-up index.
+    """
+
+    def __init__(
+        self,
+        watcher: FileWatcher,
+        indexing_usecase: Indexer,
+        repo_root: Path,
+        on_state: Callable[[WatchState], None] | None = None,
+        on_sync: Callable[[IndexResponse], None] | None = None,
+        debounce_seconds: float = 0.5,
+        max_delay_seconds: float = 10.0,
+        sync_lock: AbstractContextManager | None = None,
+    ) -> None:
+        """Initialize watch use case.
+
+        Args:
+            watcher: Source of filesystem change notifications.
+            indexing_usecase: Use case that performs incremental syncs.
+            repo_root: Repository root path.
+            on_state: Optional callback receiving each published WatchState.
+            on_sync: Optional callback receiving each completed IndexResponse.
+            debounce_seconds: Quiet period required before a burst is synced.
+            max_delay_seconds: Upper bound on how long a continuous burst can
+                postpone a sync.
+            sync_lock: Optional lock held around each sync, serializing the
+                watcher with other processes writing the index.
+        """
+        self.watcher = watcher
+        self.indexing_usecase = indexing_usecase
+        self.repo_root = repo_root
+        self.on_state = on_state
+        self.on_sync = on_sync
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.sync_lock = sync_lock
+        self._last_tree_sha = ""
+
+    def _publish(self, status: str, error: str | None = None) -> None:
+        """Publish the current watcher state.
+
+        Args:
+            status: "idle", "pending", or "syncing".
+            error: Error from the last sync, if any.
+        """
+        if self.on_state is None:
+            return
+        state = WatchState(
+            pid=os.getpid(),
+            status=status,
+            last_tree_sha=self._last_tree_sha,
+            updated_at=time.time(),
+            last_error=error,
+        )
+        try:
+            self.on_state(state)
+        except OSError as e:
+            logger.warning(f"Could not publish watch state: {e}")
+
+    def _collect_burst(self, changed: set[Path]) -> set[Path]:
+        """Keep collecting changes until the filesystem goes quiet.
+
+        Args:
+            changed: Changes that started the burst.
+
+        Returns:
+            All changes seen during the burst.
+        """
+        deadline = time.monotonic() + self.max_delay_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            more = self.watcher.wait_for_changes(timeout=min(self.debounce_seconds, remaining))
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def _execute_sync(self) -> IndexResponse:
+        """Run one incremental worktree sync.
+
+        Returns:
+            IndexResponse from the indexing use case.
+        """
+        self._publish("syncing")
+        request = IndexRequest(repo_root=self.repo_root, sync_mode="worktree")
+        with self.sync_lock or nullcontext():
+            response = self.indexing_usecase.execute(request)
+
+        if response.success:
+            self._last_tree_sha = response.tree_sha or self._last_tree_sha
+            logger.info(
+                f"Watch sync complete: {response.files_indexed} file(s), "
+                f"{response.chunks_deleted} chunk(s) deleted"
+            )
+        else:
+            logger.warning(f"Watch sync failed: {response.error}")
+
+        if self.on_sync is not None:
+            self.on_sync(response)
+        return response
+
+    def sync(self) -> IndexResponse:
+        """Sync until no changes remain outstanding, then publish "idle".
+
+        Changes that arrive while a sync is running mean the index is already
+        behind, so they are debounced and synced before reporting idle.
+
+        Returns:
+            IndexResponse from the last sync performed.
+        """
+        while True:
+            response = self._execute_sync()
+            if not response.success:
+                self._publish("idle", error=response.error)
+                return response
+
+            pending = self.watcher.wait_for_changes(timeout=0)
+            if not pending:
+                self._publish("idle")
+                return response
+
+            self._publish("pending")
+            self._collect_burst(pending)
+
+    def sync_after_burst(self, changed: set[Path]) -> IndexResponse:
+        """Debounce a burst of changes, then sync.
+
+        Args:
+            changed: Changes that started the burst.
+
+        Returns:
+            IndexResponse from the sync.
+        """
+        self._publish("pending")
+        changed = self._collect_burst(changed)
+        logger.debug(f"Burst settled with {len(changed)} changed path(s)")
+        return self.sync()
+
+    def run(
+        self,
+        stop_event: threading.Event | None = None,
+        poll_timeout: float = 1.0,
+    ) -> None:
+        """Watch for changes until stopped.
+
+        Performs an initial sync so the index starts caught up, then syncs
+        after every debounced burst of changes.
+
+        Args:
+            stop_event: Event that ends the loop when set (None runs forever).
+            poll_timeout: Seconds between stop_event checks while idle.
+        """
+        stop_event = stop_event or threading.Event()
+        self.sync()
+
+        while not stop_event.is_set():
+            changed = self.watcher.wait_for_changes(timeout=poll_timeout)
+            if changed and not stop_event.is_set():
+                self.sync_after_burst(changed)
@@ -55,10 +55,10 @@ class ContextRenderer:
         Args:
             result: SearchResult object.
             context: Number of lines of context around the match start line.
-            repo_root: Repository root path.
+            repo_root: Repository root path, unless the result names its own.
             settings: Display settings dict (unused, kept for API compatibility).
         """
-        file_path = repo_root / result.chunk.path
+        file_path = (getattr(result, "repo", None) or repo_root) / result.chunk.path
         file_lines = self._fs.read_text_lines(file_path)
 
         if file_lines is None:
@@ -5,9 +5,11 @@ and formatted JSON for CLI output.
 """
 
 import json
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
+from ember.domain.entities import IndexFreshness
 from ember.ports.fs import FileSystem
 
 
@@ -39,28 +41,33 @@ class JsonResultFormatter:
         Returns:
             Dictionary suitable for JSON serialization and caching.
         """
-        return {
-            "query": query,
-            "results": [
-                {
-                    "rank": result.rank,
-                    "score": result.score,
-                    "path": str(result.chunk.path),
-                    "lang": result.chunk.lang,
-                    "symbol": result.chunk.symbol,
-                    "start_line": result.chunk.start_line,
-                    "end_line": result.chunk.end_line,
-                    "content": result.chunk.content,
-                    "chunk_id": result.chunk.id,
-                    "tree_sha": result.chunk.tree_sha,
-                    "explanation": result.explanation,
-                }
-                for result in results
-            ],
-        }
+        cached = []
+        for result in results:
+            item = {
+                "rank": result.rank,
+                "score": result.score,
+                "path": str(result.chunk.path),
+                "lang": result.chunk.lang,
+                "symbol": result.chunk.symbol,
+                "start_line": result.chunk.start_line,
+                "end_line": result.chunk.end_line,
+                "content": result.chunk.content,
+                "chunk_id": result.chunk.id,
+                "tree_sha": result.chunk.tree_sha,
+                "explanation": result.explanation,
+            }
+            # Results from other repositories carry their repository root
+            if getattr(result, "repo", None) is not None:
+                item["repo"] = str(result.repo)
+            cached.append(item)
+        return {"query": query, "results": cached}
 
     def format_output(
-        self, results: list[Any], context: int = 0, repo_root: Path | None = None
+        self,
+        results: list[Any],
+        context: int = 0,
+        repo_root: Path | None = None,
+        freshness: IndexFreshness | None = None,
     ) -> str:
         """Format results as JSON string.
 
@@ -68,6 +75,8 @@ class JsonResultFormatter:
             results: List of SearchResult objects.
             context: Number of lines of context to include (default: 0).
             repo_root: Repository root path for reading files (required if context > 0).
+            freshness: Freshness of the index searched, added to each result
+                as "index_freshness" (omitted if None).
 
         Returns:
             JSON-formatted string.
@@ -85,7 +94,12 @@ class JsonResultFormatter:
                 "end_line": result.chunk.end_line,
                 "content": result.chunk.content,
                 "explanation": result.explanation,
+                "stale": result.stale,
             }
+            if getattr(result, "repo", None) is not None:
+                item["repo"] = str(result.repo)
+            if freshness is not None:
+                item["index_freshness"] = asdict(freshness)
 
             # Add context if requested
             if context > 0 and repo_root is not None:
@@ -104,12 +118,12 @@ class JsonResultFormatter:
         Args:
             result: SearchResult object.
             context: Number of lines of context.
-            repo_root: Repository root path.
+            repo_root: Repository root path, unless the result names its own.
 
         Returns:
             Dictionary with context information, or None if file not readable.
         """
-        file_path = repo_root / result.chunk.path
+        file_path = (getattr(result, "repo", None) or repo_root) / result.chunk.path
         file_lines = self._fs.read_text_lines(file_path)
 
         if file_lines is None:
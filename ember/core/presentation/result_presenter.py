@@ -16,6 +16,7 @@ from ember.core.presentation.colors import EmberColors
 from ember.core.presentation.compact_renderer import CompactPreviewRenderer
 from ember.core.presentation.context_renderer import ContextRenderer
 from ember.core.presentation.json_formatter import JsonResultFormatter
+from ember.domain.entities import IndexFreshness
 from ember.ports.fs import FileSystem
 
 
@@ -56,7 +57,11 @@ class ResultPresenter:
         return JsonResultFormatter.serialize_for_cache(query, results)
 
     def format_json_output(
-        self, results: list[Any], context: int = 0, repo_root: Path | None = None
+        self,
+        results: list[Any],
+        context: int = 0,
+        repo_root: Path | None = None,
+        freshness: IndexFreshness | None = None,
     ) -> str:
         """Format results as JSON string.
 
@@ -66,11 +71,12 @@ class ResultPresenter:
             results: List of SearchResult objects.
             context: Number of lines of context to include (default: 0).
             repo_root: Repository root path for reading files (required if context > 0).
+            freshness: Freshness of the index searched, reported with each result.
 
         Returns:
             JSON-formatted string.
         """
-        return self._json_formatter.format_output(results, context, repo_root)
+        return self._json_formatter.format_output(results, context, repo_root, freshness)
 
     def format_human_output(
         self,
@@ -102,7 +108,10 @@ class ResultPresenter:
 
         for file_path, file_results in results_by_file.items():
             # Print filename using centralized color
-            click.echo(EmberColors.click_path(str(file_path)))
+            header = EmberColors.click_path(str(file_path))
+            if any(getattr(r, "stale", False) for r in file_results):
+                header += " " + EmberColors.click_warning("(changed since indexed)")
+            click.echo(header)
 
             for i, result in enumerate(file_results):
                 # Add blank line between results when using --context for readability
@@ -138,6 +147,9 @@ class ResultPresenter:
     def _group_results_by_file(results: list[Any]) -> dict[Path, list[Any]]:
         """Group results by file path.
 
+        Results from another repository are keyed by the repository's
+        directory name followed by the file path.
+
         Args:
             results: List of SearchResult objects.
 
@@ -146,7 +158,9 @@ class ResultPresenter:
         """
         results_by_file = defaultdict(list)
         for result in results:
-            results_by_file[result.chunk.path].append(result)
+            repo = getattr(result, "repo", None)
+            key = Path(repo.name) / result.chunk.path if repo else result.chunk.path
+            results_by_file[key].append(result)
         return dict(results_by_file)
 
     # === Backward compatibility methods ===
@@ -0,0 +1,134 @@
+"""Federated search use case querying several repositories' indexes.
+
+Each repository is searched with its own use case in parallel. The query is
+embedded once per embedding model, so repositories indexed with the same
+model share one query vector. Since repositories may use different models,
+their scores are not comparable and results are merged by rank alone with
+Reciprocal Rank Fusion.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from ember.core.retrieval.search_usecase import SearchUseCase
+from ember.core.retrieval.sharded_search import ShardedSearchUseCase
+from ember.domain.entities import Query, SearchResult
+from ember.ports.embedders import Embedder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FederatedRepo:
+    """A repository taking part in a federated search.
+
+    Attributes:
+        root: Absolute path to the repository root.
+        search: Search use case over the repository's index.
+        model_key: Identifies the embedding model of the repository's index;
+            repositories with the same key share a query embedding.
+    """
+
+    root: Path
+    search: SearchUseCase | ShardedSearchUseCase
+    model_key: str
+
+
+def merge_ranked(
+    result_lists: list[list[SearchResult]],
+    topk: int,
+    k: int = 60,
+) -> list[SearchResult]:
+    """Merge per-repository rankings with rank-based Reciprocal Rank Fusion.
+
+    Every list is a separate ranking, so the n-th result of each repository
+    gets the same fused score; ties are broken by the repository's own score.
+
+    Args:
+        result_lists: Ranked results per repository.
+        topk: Number of results to return.
+        k: RRF constant (default 60).
+
+    Returns:
+        Top results with fused scores and ranks starting at 1.
+    """
+    scored = [
+        (1.0 / (k + rank), result)
+        for results in result_lists
+        for rank, result in enumerate(results, start=1)
+    ]
+    scored.sort(key=lambda item: (item[0], item[1].score), reverse=True)
+    return [
+        replace(
+            result,
+            score=fused,
+            rank=rank,
+            explanation={**(result.explanation or {}), "fused_score": fused},
+        )
+        for rank, (fused, result) in enumerate(scored[:topk], start=1)
+    ]
+
+
+class FederatedSearchUseCase:
+    """Orchestrates one query across the indexes of several repositories."""
+
+    def __init__(
+        self,
+        repos: list[FederatedRepo],
+        embedders: dict[str, Embedder | None],
+        rrf_k: int = 60,
+        max_workers: int = 4,
+    ) -> None:
+        """Initialize federated search use case.
+
+        Args:
+            repos: Repositories to search.
+            embedders: Embedder per model key, used to embed the query once
+                for all repositories sharing that model (None values if only
+                used for "fts" mode queries).
+            rrf_k: RRF constant for merging repository results.
+            max_workers: Maximum number of repositories searched at once.
+        """
+        self.repos = repos
+        self.embedders = embedders
+        self.rrf_k = rrf_k
+        self.max_workers = max(1, max_workers)
+
+    def search(self, query: Query) -> list[SearchResult]:
+        """Search every repository and merge the results.
+
+        Args:
+            query: Search query with parameters, applied to each repository.
+
+        Returns:
+            Merged results, each tagged with the root of its repository.
+
+        Raises:
+            ValueError: If the query needs embedding and an embedder is missing.
+        """
+        if not self.repos:
+            return []
+
+        # Full-text search needs no embeddings (nor embedders)
+        embeddings: dict[str, list[float] | None] = dict.fromkeys(
+            repo.model_key for repo in self.repos
+        )
+        if query.mode != "fts":
+            for key in list(embeddings):
+                embedder = self.embedders[key]
+                if embedder is None:
+                    raise ValueError(f"{query.mode} search requires an embedder")
+                embeddings[key] = embedder.embed_texts([query.text])[0]
+        logger.debug(
+            f"Searching {len(self.repos)} repositories with {len(embeddings)} query embedding(s)"
+        )
+
+        def search_repo(repo: FederatedRepo) -> list[SearchResult]:
+            results = repo.search.search(query, embeddings[repo.model_key])
+            return [replace(result, repo=repo.root) for result in results]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.repos))) as pool:
+            result_lists = list(pool.map(search_repo, self.repos))
+        return merge_ranked(result_lists, query.topk, k=self.rrf_k)
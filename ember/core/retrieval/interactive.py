@@ -3,10 +3,11 @@
 Manages the state and flow of an interactive search session.
 """
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from typing import Protocol
 
-from ember.domain.entities import Query, SearchResult
+from ember.domain.entities import SEARCH_MODES, Query, SearchMode, SearchResult
 
 
 class Searcher(Protocol):
@@ -24,6 +25,78 @@ class Searcher(Protocol):
         ...
 
 
+class PrefixCache:
+    """Recent results per query text, reused while the user extends a query.
+
+    Typing "auth" then "authe" then "authen" searches each prefix in turn.
+    Results seen for a prefix that still contain the words typed since are
+    likely results for the longer query too, so they can be shown while the
+    longer query is searched. Revisiting a query (e.g. after backspacing)
+    reuses its results directly.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        """Initialize prefix cache.
+
+        Args:
+            max_entries: Number of queries to keep results for.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, list[SearchResult]] = OrderedDict()
+
+    def get(self, text: str) -> list[SearchResult] | None:
+        """Get the cached results of a query.
+
+        Args:
+            text: Query text.
+
+        Returns:
+            Results, or None if the query has not been searched recently.
+        """
+        results = self._entries.get(text)
+        if results is not None:
+            self._entries.move_to_end(text)
+        return results
+
+    def put(self, text: str, results: list[SearchResult]) -> None:
+        """Cache the results of a query.
+
+        Args:
+            text: Query text.
+            results: Results of the query.
+        """
+        self._entries[text] = results
+        self._entries.move_to_end(text)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def candidates(self, text: str) -> list[SearchResult] | None:
+        """Get the cached results of the longest prefix that still match a query.
+
+        A result still matches if its content contains each word of the
+        query, the last one possibly incomplete (ignoring case).
+
+        Args:
+            text: Query text.
+
+        Returns:
+            Matching results of the longest cached prefix, re-ranked from 1,
+            or None if no proper prefix of the query is cached.
+        """
+        for end in range(len(text) - 1, 0, -1):
+            results = self._entries.get(text[:end])
+            if results is None:
+                continue
+            words = text.lower().split()
+            kept = [r for r in results if all(w in r.chunk.content.lower() for w in words)]
+            return [replace(r, rank=rank) for rank, r in enumerate(kept, start=1)]
+        return None
+
+    def clear(self) -> None:
+        """Forget all cached results."""
+        self._entries.clear()
+
+
 @dataclass
 class InteractiveSearchSession:
     """Manages state for an interactive search session."""
@@ -31,7 +104,7 @@ class InteractiveSearchSession:
     query_text: str = ""
     current_results: list[SearchResult] | None = None
     selected_index: int = 0
-    search_mode: str = "hybrid"  # hybrid, bm25, vector
+    search_mode: SearchMode = "hybrid"
     preview_visible: bool = True
     last_search_time_ms: float = 0.0
     error_message: str | None = None
@@ -119,10 +192,9 @@ class InteractiveSearchSession:
         self.selected_index = max(self.selected_index - page_size, 0)
 
     def cycle_search_mode(self) -> None:
-        """Cycle through search modes: hybrid -> bm25 -> vector -> hybrid."""
-        modes = ["hybrid", "bm25", "vector"]
-        current_idx = modes.index(self.search_mode)
-        self.search_mode = modes[(current_idx + 1) % len(modes)]
+        """Cycle through search modes: hybrid -> fts -> vector -> hybrid."""
+        current_idx = SEARCH_MODES.index(self.search_mode)
+        self.search_mode = SEARCH_MODES[(current_idx + 1) % len(SEARCH_MODES)]
 
     def toggle_preview(self) -> None:
         """Toggle preview pane visibility."""
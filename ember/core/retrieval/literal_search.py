@@ -0,0 +1,122 @@
+"""Literal and regex search use case.
+
+Finds chunks containing an exact substring or a regular expression match,
+for fragments such as "retry_after" or "/v2/users" that word-based BM25 and
+embeddings match poorly. Results are ranked by number of matches, and no
+embedding model is needed.
+"""
+
+import re
+
+from ember.domain.entities import Chunk, Query, SearchResult
+from ember.ports.repositories import ChunkRepository
+from ember.ports.search import LiteralSearch
+
+
+def merge_results(result_lists: list[list[SearchResult]], topk: int) -> list[SearchResult]:
+    """Merge literal or symbol search results from several indexes.
+
+    Args:
+        result_lists: Results per index, each ranked by score.
+        topk: Number of results to return.
+
+    Returns:
+        Top results across all indexes, with ranks starting at 1.
+    """
+    merged = sorted(
+        (result for results in result_lists for result in results),
+        key=lambda r: (-r.score, str(r.chunk.path), r.chunk.start_line),
+    )
+    for rank, result in enumerate(merged[:topk], start=1):
+        result.rank = rank
+    return merged[:topk]
+
+
+class LiteralSearchUseCase:
+    """Finds chunks containing a substring or regular expression match."""
+
+    def __init__(self, literal_search: LiteralSearch, chunk_repo: ChunkRepository) -> None:
+        """Initialize literal search use case.
+
+        Args:
+            literal_search: Literal and regex search adapter.
+            chunk_repo: Repository for retrieving chunk metadata.
+        """
+        self.literal_search = literal_search
+        self.chunk_repo = chunk_repo
+
+    def search(self, query: Query, regex: bool = False) -> list[SearchResult]:
+        """Find chunks matching the query text exactly.
+
+        Args:
+            query: Search query; its text is the substring or expression.
+            regex: Treat the query text as a Python regular expression.
+
+        Returns:
+            List of SearchResult objects, most matches first. Each
+            explanation gives the number of matches and the line of the first.
+
+        Raises:
+            re.error: If regex is set and the query text is not a valid expression.
+        """
+        pattern = re.compile(query.text if regex else re.escape(query.text))
+        # Retrieve extra candidates so the language filter leaves enough
+        pool = max(query.topk * 5, 100) if query.lang_filter else query.topk
+        matches = self.literal_search.match(
+            query.text,
+            regex=regex,
+            topk=pool,
+            path_filter=query.path_filter,
+            ref=query.ref,
+        )
+
+        results: list[SearchResult] = []
+        for chunk_id, count in matches:
+            chunk = self.chunk_repo.get(chunk_id)
+            if chunk is None or (query.lang_filter and chunk.lang != query.lang_filter):
+                continue
+            line = self._first_match_line(chunk, pattern)
+            results.append(
+                SearchResult(
+                    chunk=chunk,
+                    score=count,
+                    rank=len(results) + 1,
+                    preview=self._generate_preview(chunk, line),
+                    explanation={"matches": count, "match_line": line},
+                )
+            )
+            if len(results) == query.topk:
+                break
+        return results
+
+    def _first_match_line(self, chunk: Chunk, pattern: re.Pattern[str]) -> int:
+        """Find the file line of the first match in a chunk.
+
+        Args:
+            chunk: Matching chunk.
+            pattern: Compiled query pattern.
+
+        Returns:
+            Line number in the file (the chunk's first line if not found).
+        """
+        match = pattern.search(chunk.content)
+        if match is None:
+            return chunk.start_line
+        return chunk.start_line + chunk.content.count("\n", 0, match.start())
+
+    def _generate_preview(self, chunk: Chunk, line: int, max_lines: int = 3) -> str:
+        """Generate a preview of chunk content starting at the first match.
+
+        Args:
+            chunk: The chunk to preview.
+            line: File line of the first match.
+            max_lines: Maximum number of lines to include.
+
+        Returns:
+            Preview string.
+        """
+        lines = chunk.content.split("\n")[line - chunk.start_line :]
+        preview_lines = lines[:max_lines]
+        if len(lines) > max_lines:
+            preview_lines.append("...")
+        return "\n".join(preview_lines)
@@ -1,18 +1,26 @@
 """Search use case implementing hybrid retrieval.
 
 Orchestrates full-text search (BM25) and vector search (semantic similarity)
-with Reciprocal Rank Fusion for optimal retrieval quality.
+with Reciprocal Rank Fusion for optimal retrieval quality. Queries naming a
+symbol also fuse in the chunks defining it, so definitions rank first.
+Queries in "fts" mode skip the embedder entirely; "vector" mode skips BM25.
 """
 
 import logging
+from dataclasses import replace
 
+from ember.core.retrieval.symbol_search import is_identifier
 from ember.domain.entities import Chunk, Query, SearchResult
 from ember.ports.embedders import Embedder
 from ember.ports.repositories import ChunkRepository
-from ember.ports.search import TextSearch, VectorSearch
+from ember.ports.search import SymbolSearch, TextSearch, VectorSearch
 
 logger = logging.getLogger(__name__)
 
+# Candidates retrieved per requested result when rolling up, since several
+# matching children can collapse into a single parent
+ROLLUP_POOL_FACTOR = 4
+
 
 class SearchUseCase:
     """Orchestrates hybrid search combining BM25 and vector retrieval.
@@ -20,6 +28,7 @@ class SearchUseCase:
     Uses Reciprocal Rank Fusion (RRF) to combine results from:
     1. Full-text search (BM25 via FTS5)
     2. Vector search (cosine similarity)
+    3. Exact symbol matches, if the query is an identifier
 
     RRF formula: score(d) = sum over all rankers of 1 / (k + rank(d))
     where k is typically 60 (balances importance of top results).
@@ -28,95 +37,200 @@ class SearchUseCase:
     def __init__(
         self,
         text_search: TextSearch,
-        vector_search: VectorSearch,
+        vector_search: VectorSearch | None,
         chunk_repo: ChunkRepository,
-        embedder: Embedder,
+        embedder: Embedder | None,
         rrf_k: int = 60,
+        symbol_search: SymbolSearch | None = None,
     ) -> None:
         """Initialize search use case.
 
         Args:
             text_search: Full-text search adapter (FTS5).
-            vector_search: Vector search adapter.
+            vector_search: Vector search adapter (None if only used for "fts"
+                mode queries).
             chunk_repo: Repository for retrieving chunk metadata.
-            embedder: Embedder for query vectorization.
+            embedder: Embedder for query vectorization (None if only used
+                for "fts" mode queries).
             rrf_k: RRF constant (default 60, higher = less weight to top ranks).
+            symbol_search: Optional symbol lookup adapter for boosting the
+                definitions of symbols named by the query.
         """
         self.text_search = text_search
         self.vector_search = vector_search
         self.chunk_repo = chunk_repo
         self.embedder = embedder
         self.rrf_k = rrf_k
+        self.symbol_search = symbol_search
 
-    def search(self, query: Query) -> list[SearchResult]:
-        """Execute hybrid search and return ranked results.
+    def search(
+        self, query: Query, query_embedding: list[float] | None = None
+    ) -> list[SearchResult]:
+        """Execute search in the query's mode and return ranked results.
 
         Args:
             query: Search query with parameters.
+            query_embedding: Optional precomputed embedding of the query text,
+                so a query fanned out to several indexes is embedded once
+                (ignored in "fts" mode).
 
         Returns:
             List of SearchResult objects, ranked by relevance.
+
+        Raises:
+            ValueError: If the query needs embedding and there is no embedder.
         """
-        # 1. Embed query text
-        query_embedding = self.embedder.embed_texts([query.text])[0]
+        # 1. Embed query text, unless only full-text search runs
+        if query.mode == "fts":
+            query_embedding = None
+        elif query_embedding is None:
+            if self.embedder is None or self.vector_search is None:
+                raise ValueError(f"{query.mode} search requires an embedder")
+            query_embedding = self.embedder.embed_texts([query.text])[0]
 
         # 2. Get BM25 results from full-text search
         # Use a larger retrieval pool for fusion (e.g., 100)
-        # Pass path_filter to filter during SQL query (not after)
+        # Pass path_filter and ref to filter during SQL query (not after)
         retrieval_pool = max(query.topk * 5, 100)
-        fts_results = self.text_search.query(
-            query.text, topk=retrieval_pool, path_filter=query.path_filter
-        )
+        fts_results: list[tuple[str, float]] = []
+        if query.mode != "vector":
+            fts_results = self.text_search.query(
+                query.text, topk=retrieval_pool, path_filter=query.path_filter, ref=query.ref
+            )
 
         # 3. Get vector search results
-        vector_results = self.vector_search.query(
-            query_embedding, topk=retrieval_pool, path_filter=query.path_filter
-        )
+        vector_results: list[tuple[str, float]] = []
+        if query_embedding is not None and self.vector_search is not None:
+            vector_results = self.vector_search.query(
+                query_embedding, topk=retrieval_pool, path_filter=query.path_filter, ref=query.ref
+            )
+
+        # 4. Get the chunks defining the symbol the query names, if any
+        symbol_results: list[tuple[str, float]] = []
+        if (
+            self.symbol_search is not None
+            and query.mode != "vector"
+            and is_identifier(query.text)
+        ):
+            symbol_results = self.symbol_search.lookup(
+                query.text.strip(),
+                topk=retrieval_pool,
+                path_filter=query.path_filter,
+                ref=query.ref,
+                prefix=False,
+                fuzzy=False,
+            )
 
-        # 4. Fuse results using Reciprocal Rank Fusion
+        # 5. Fuse results using Reciprocal Rank Fusion
         fused_scores = self._reciprocal_rank_fusion(
-            [fts_results, vector_results],
+            [fts_results, vector_results, symbol_results],
             k=self.rrf_k,
         )
 
-        # 5. Get top-k chunk IDs
-        top_chunk_ids = [cid for cid, _ in fused_scores[: query.topk]]
+        # 6. Get top-k chunk IDs
+        pool = query.topk * ROLLUP_POOL_FACTOR if query.rollup else query.topk
+        top_chunk_ids = [cid for cid, _ in fused_scores[:pool]]
 
-        # 6. Retrieve full chunk objects
+        # 7. Retrieve full chunk objects
         chunks = self._retrieve_chunks(top_chunk_ids)
 
-        # 7. Apply filters if specified
+        # 8. Apply filters if specified
         filtered_chunks = self._apply_filters(
             chunks,
             path_filter=query.path_filter,
             lang_filter=query.lang_filter,
         )
 
-        # 8. Create SearchResult objects with scores
+        # 9. Replace children with their parents if requested
         score_map = dict(fused_scores)
+        members: dict[str, list[str]] = {}
+        if query.rollup:
+            filtered_chunks, score_map, members = self._roll_up(filtered_chunks, score_map)
+
+        # 10. Create SearchResult objects with scores
         results = []
         for rank, chunk in enumerate(filtered_chunks[: query.topk], start=1):
             score = score_map.get(chunk.id, 0.0)
 
-            # Get individual scores for explanation
-            fts_score = self._get_score(fts_results, chunk.id)
-            vector_score = self._get_score(vector_results, chunk.id)
+            # Get individual scores for explanation; a parent reports the best
+            # of the chunks it stands for, so merging shards ranks it by them
+            ids = members.get(chunk.id, [chunk.id])
+            fts_score = max(self._get_score(fts_results, cid) for cid in ids)
+            vector_score = max(self._get_score(vector_results, cid) for cid in ids)
+
+            explanation: dict[str, float | str] = {
+                "fused_score": score,
+                "bm25_score": fts_score,
+                "vector_score": vector_score,
+            }
+            if symbol_results:
+                explanation["symbol_score"] = max(
+                    self._get_score(symbol_results, cid) for cid in ids
+                )
+            if query.rollup:
+                explanation["rolled_up"] = sum(cid != chunk.id for cid in ids)
 
             result = SearchResult(
                 chunk=chunk,
                 score=score,
                 rank=rank,
                 preview=self._generate_preview(chunk),
-                explanation={
-                    "fused_score": score,
-                    "bm25_score": fts_score,
-                    "vector_score": vector_score,
-                },
+                explanation=explanation,
             )
             results.append(result)
 
         return results
 
+    def search_text(self, query: Query) -> list[SearchResult]:
+        """Execute full-text search only, without embedding the query.
+
+        Ranks BM25 and symbol matches like search() does, so interactive
+        search can show these results while the query is still being embedded.
+
+        Args:
+            query: Search query with parameters (its mode is ignored).
+
+        Returns:
+            List of SearchResult objects, ranked by relevance.
+        """
+        return self.search(replace(query, mode="fts"))
+
+    def _roll_up(
+        self, chunks: list[Chunk], score_map: dict[str, float]
+    ) -> tuple[list[Chunk], dict[str, float], dict[str, list[str]]]:
+        """Replace each chunk with its parent, merging chunks with the same parent.
+
+        Each chunk is rolled up one level, to the innermost chunk containing
+        it; top-level chunks stand for themselves. A parent scores as its best
+        matching child, or itself if it matched better.
+
+        Args:
+            chunks: Matching chunks, sorted by score (descending).
+            score_map: Fused score per chunk ID.
+
+        Returns:
+            Tuple of the parents sorted by score (descending), the score per
+            parent ID, and the IDs of the matching chunks merged into each
+            parent ID (including the parent's own, if it matched).
+        """
+        parents: dict[str, Chunk] = {}
+        scores: dict[str, float] = {}
+        members: dict[str, list[str]] = {}
+
+        for chunk in chunks:
+            parent = self.chunk_repo.find_parent(chunk) or chunk
+            score = score_map.get(chunk.id, 0.0)
+            if parent.id not in parents:
+                parents[parent.id] = parent
+                scores[parent.id] = score
+                members[parent.id] = []
+            else:
+                scores[parent.id] = max(scores[parent.id], score)
+            members[parent.id].append(chunk.id)
+
+        ranked = sorted(parents.values(), key=lambda c: scores[c.id], reverse=True)
+        return ranked, scores, members
+
     def _reciprocal_rank_fusion(
         self,
         result_lists: list[list[tuple[str, float]]],
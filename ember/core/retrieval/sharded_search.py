@@ -0,0 +1,144 @@
+"""Sharded search use case fanning queries out to several indexes.
+
+The query is embedded once and searched in every relevant shard in parallel.
+Shard results are merged with Reciprocal Rank Fusion over global BM25 and
+vector rankings, since each shard's own fused scores only rank its own chunks.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from ember.core.retrieval.search_usecase import SearchUseCase
+from ember.domain.entities import Query, SearchResult
+from ember.domain.sharding import ShardLayout
+from ember.ports.embedders import Embedder
+
+logger = logging.getLogger(__name__)
+
+
+def fuse_results(
+    result_lists: list[list[SearchResult]],
+    topk: int,
+    k: int = 60,
+) -> list[SearchResult]:
+    """Merge ranked results from several indexes with Reciprocal Rank Fusion.
+
+    Results are re-ranked by their BM25, vector and symbol scores across all lists,
+    with the scores reported by each index as a tie-breaker.
+
+    Args:
+        result_lists: Ranked results per index.
+        topk: Number of results to return.
+        k: RRF constant (default 60).
+
+    Returns:
+        Top results with fused scores and ranks starting at 1.
+    """
+    candidates: dict[str, SearchResult] = {}
+    for results in result_lists:
+        for result in results:
+            candidates.setdefault(result.chunk.id, result)
+
+    fused = dict.fromkeys(candidates, 0.0)
+    for signal in ("bm25_score", "vector_score", "symbol_score"):
+        scored = [
+            (chunk_id, score)
+            for chunk_id, result in candidates.items()
+            if isinstance(score := result.explanation.get(signal, 0.0), float) and score > 0.0
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        for rank, (chunk_id, _score) in enumerate(scored, start=1):
+            fused[chunk_id] += 1.0 / (k + rank)
+
+    ranked = sorted(
+        candidates.values(),
+        key=lambda r: (fused[r.chunk.id], r.score),
+        reverse=True,
+    )
+    return [
+        replace(
+            result,
+            score=fused[result.chunk.id],
+            rank=rank,
+            explanation={**(result.explanation or {}), "fused_score": fused[result.chunk.id]},
+        )
+        for rank, result in enumerate(ranked[:topk], start=1)
+    ]
+
+
+class ShardedSearchUseCase:
+    """Orchestrates hybrid search over a directory-sharded index.
+
+    Shards that cannot hold files matching the query's path filter are
+    skipped. A query that reaches a single shard is answered by that shard
+    alone, with its scores unchanged.
+    """
+
+    def __init__(
+        self,
+        shards: dict[str, SearchUseCase],
+        layout: ShardLayout,
+        embedder: Embedder | None,
+        rrf_k: int = 60,
+        max_workers: int = 4,
+    ) -> None:
+        """Initialize sharded search use case.
+
+        Args:
+            shards: Search use case per shard name, for shards with an index.
+            layout: Shard layout, used to prune shards by path filter.
+            embedder: Embedder for query vectorization (None if only used
+                for "fts" mode queries).
+            rrf_k: RRF constant for merging shard results.
+            max_workers: Maximum number of shards searched at once.
+        """
+        self.shards = shards
+        self.layout = layout
+        self.embedder = embedder
+        self.rrf_k = rrf_k
+        self.max_workers = max(1, max_workers)
+
+    def search(
+        self, query: Query, query_embedding: list[float] | None = None
+    ) -> list[SearchResult]:
+        """Execute search in the relevant shards and merge the results.
+
+        Args:
+            query: Search query with parameters.
+            query_embedding: Optional precomputed embedding of the query text
+                (ignored in "fts" mode).
+
+        Returns:
+            List of SearchResult objects, ranked by relevance.
+
+        Raises:
+            ValueError: If the query needs embedding and there is no embedder.
+        """
+        names = [name for name in self.layout.shards_for(query.path_filter) if name in self.shards]
+        logger.debug(f"Searching {len(names)} of {len(self.shards)} shards")
+        if not names:
+            return []
+        if len(names) == 1:
+            return self.shards[names[0]].search(query, query_embedding)
+
+        if query.mode != "fts" and query_embedding is None:
+            if self.embedder is None:
+                raise ValueError(f"{query.mode} search requires an embedder")
+            query_embedding = self.embedder.embed_texts([query.text])[0]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(names))) as pool:
+            result_lists = list(
+                pool.map(lambda name: self.shards[name].search(query, query_embedding), names)
+            )
+        return fuse_results(result_lists, query.topk, k=self.rrf_k)
+
+    def search_text(self, query: Query) -> list[SearchResult]:
+        """Execute full-text search in the relevant shards, without embedding.
+
+        Args:
+            query: Search query with parameters (its mode is ignored).
+
+        Returns:
+            List of SearchResult objects, ranked by relevance.
+        """
+        return self.search(replace(query, mode="fts"))
@@ -0,0 +1,86 @@
+"""Detection of search results that come from files changed since indexing.
+
+Used when a search is answered from the current index while a sync runs in
+the background (stale-while-revalidate): results are returned immediately,
+and any whose source file no longer matches what was indexed are flagged.
+"""
+
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+
+import blake3
+
+from ember.domain.entities import SearchResult
+from ember.ports.fs import FileSystem
+from ember.ports.repositories import FileRepository
+
+
+class StaleResultDetector:
+    """Flags search results whose source file differs from the indexed copy.
+
+    Only the files behind the returned results are checked, so the cost is
+    bounded by topk rather than by repository size.
+    """
+
+    def __init__(
+        self,
+        fs: FileSystem,
+        file_repo: FileRepository,
+        repo_root: Path,
+        file_repo_for: Callable[[Path], FileRepository] | None = None,
+    ) -> None:
+        """Initialize detector.
+
+        Args:
+            fs: File system adapter for reading current file contents.
+            file_repo: Repository with per-file hashes recorded at index time.
+            repo_root: Repository root (chunk paths are relative to it).
+            file_repo_for: Optional function returning the repository that
+                tracks a relative path, for indexes split across several
+                databases (e.g. shards). Overrides file_repo.
+        """
+        self.fs = fs
+        self.file_repo = file_repo
+        self.repo_root = repo_root
+        self.file_repo_for = file_repo_for
+
+    def is_stale(self, rel_path: Path) -> bool:
+        """Check whether a file changed since it was indexed.
+
+        Args:
+            rel_path: Path relative to repository root.
+
+        Returns:
+            True if the file was deleted, modified, or never tracked.
+        """
+        abs_path = self.repo_root / rel_path
+        file_repo = self.file_repo_for(rel_path) if self.file_repo_for else self.file_repo
+        state = file_repo.get_file_state(abs_path)
+        if state is None:
+            return True
+        try:
+            content = self.fs.read(abs_path)
+        except (FileNotFoundError, IsADirectoryError, PermissionError):
+            return True
+        if len(content) != state["size"]:
+            return True
+        return blake3.blake3(content).hexdigest() != state["file_hash"]
+
+    def mark(self, results: list[SearchResult]) -> list[SearchResult]:
+        """Return results with the stale flag set for changed files.
+
+        Args:
+            results: Search results from the current index.
+
+        Returns:
+            New list of results; each file is checked at most once.
+        """
+        verdicts: dict[Path, bool] = {}
+        marked = []
+        for result in results:
+            path = result.chunk.path
+            if path not in verdicts:
+                verdicts[path] = self.is_stale(path)
+            marked.append(replace(result, stale=verdicts[path]) if verdicts[path] else result)
+        return marked
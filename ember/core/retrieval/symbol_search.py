@@ -0,0 +1,138 @@
+"""Symbol lookup use case.
+
+Answers queries naming a symbol, like `ember find UserRepository`, from the
+symbol index instead of embedding the query: exact matches first, then
+symbols starting with the name, then similar names.
+"""
+
+import re
+
+from ember.domain.entities import Chunk, Query, SearchResult
+from ember.ports.repositories import ChunkRepository
+from ember.ports.search import SymbolSearch
+
+# Lowest score of an exact match and of a prefix match (see SymbolSearch.lookup)
+EXACT_MATCH_SCORE = 2.0
+PREFIX_MATCH_SCORE = 1.0
+
+# A single identifier, such as "parse_config" or "$el"
+_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+
+# Code-style names: snake_case, camelCase or PascalCase with several words,
+# or with digits
+_CODE_STYLE = re.compile(r"_|[a-z][A-Z]|[A-Z]{2,}[a-z]|[A-Za-z][0-9]")
+
+
+def is_identifier(text: str) -> bool:
+    """Check whether a query is a single identifier.
+
+    Args:
+        text: Query text.
+
+    Returns:
+        True if the text could be a symbol name.
+    """
+    return _IDENTIFIER.fullmatch(text.strip()) is not None
+
+
+def looks_like_symbol(text: str) -> bool:
+    """Check whether a query names a symbol rather than describing code.
+
+    Single words like "authentication" are better served by semantic search,
+    so only identifiers written in a code style count.
+
+    Args:
+        text: Query text.
+
+    Returns:
+        True if the text is an identifier in snake_case, camelCase or
+        PascalCase with several words, or containing digits.
+    """
+    text = text.strip()
+    return is_identifier(text) and _CODE_STYLE.search(text.strip("_$")) is not None
+
+
+def match_kind(score: float) -> str:
+    """Name the kind of a symbol match from its score.
+
+    Args:
+        score: Score returned by SymbolSearch.lookup.
+
+    Returns:
+        "exact", "prefix" or "fuzzy".
+    """
+    if score >= EXACT_MATCH_SCORE:
+        return "exact"
+    if score >= PREFIX_MATCH_SCORE:
+        return "prefix"
+    return "fuzzy"
+
+
+class SymbolSearchUseCase:
+    """Finds the chunks defining a symbol."""
+
+    def __init__(self, symbol_search: SymbolSearch, chunk_repo: ChunkRepository) -> None:
+        """Initialize symbol search use case.
+
+        Args:
+            symbol_search: Symbol lookup adapter.
+            chunk_repo: Repository for retrieving chunk metadata.
+        """
+        self.symbol_search = symbol_search
+        self.chunk_repo = chunk_repo
+
+    def search(self, query: Query, fuzzy: bool = True) -> list[SearchResult]:
+        """Find chunks whose symbol matches the query text.
+
+        Args:
+            query: Search query; its text is the symbol name.
+            fuzzy: Fall back to similar names if nothing matches exactly or
+                by prefix.
+
+        Returns:
+            List of SearchResult objects, best matches first. Each explanation
+            gives the symbol score and the kind of match.
+        """
+        # Retrieve extra candidates so the language filter leaves enough
+        pool = max(query.topk * 5, 100) if query.lang_filter else query.topk
+        matches = self.symbol_search.lookup(
+            query.text.strip(),
+            topk=pool,
+            path_filter=query.path_filter,
+            ref=query.ref,
+            fuzzy=fuzzy,
+        )
+
+        results: list[SearchResult] = []
+        for chunk_id, score in matches:
+            chunk = self.chunk_repo.get(chunk_id)
+            if chunk is None or (query.lang_filter and chunk.lang != query.lang_filter):
+                continue
+            results.append(
+                SearchResult(
+                    chunk=chunk,
+                    score=score,
+                    rank=len(results) + 1,
+                    preview=self._generate_preview(chunk),
+                    explanation={"symbol_score": score, "symbol_match": match_kind(score)},
+                )
+            )
+            if len(results) == query.topk:
+                break
+        return results
+
+    def _generate_preview(self, chunk: Chunk, max_lines: int = 3) -> str:
+        """Generate a preview of chunk content.
+
+        Args:
+            chunk: The chunk to preview.
+            max_lines: Maximum number of lines to include.
+
+        Returns:
+            Preview string.
+        """
+        lines = chunk.content.split("\n")
+        preview_lines = lines[:max_lines]
+        if len(lines) > max_lines:
+            preview_lines.append("...")
+        return "\n".join(preview_lines)
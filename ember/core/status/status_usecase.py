@@ -60,6 +60,7 @@ class StatusUseCase:
         chunk_repo: ChunkRepository,
         meta_repo: MetaRepository,
         config: EmberConfig,
+        shard_repos: list[ChunkRepository] | None = None,
     ) -> None:
         """Initialize status use case.
 
@@ -68,11 +69,14 @@ class StatusUseCase:
             chunk_repo: Chunk repository for counting chunks/files.
             meta_repo: Metadata repository for last sync info.
             config: Configuration object.
+            shard_repos: Chunk repositories of the index's other shards,
+                counted together with chunk_repo.
         """
         self.vcs = vcs
         self.chunk_repo = chunk_repo
         self.meta_repo = meta_repo
         self.config = config
+        self.shard_repos = shard_repos or []
 
     def execute(self, request: StatusRequest) -> StatusResponse:
         """Execute status check.
@@ -94,8 +98,9 @@ class StatusUseCase:
             is_stale = last_tree_sha != current_tree_sha
 
             # Get counts
-            total_chunks = self.chunk_repo.count_chunks()
-            indexed_files = self.chunk_repo.count_unique_files()
+            repos = [self.chunk_repo, *self.shard_repos]
+            total_chunks = sum(repo.count_chunks() for repo in repos)
+            indexed_files = sum(repo.count_unique_files() for repo in repos)
 
             # Get model fingerprint
             model_fingerprint = self.meta_repo.get("model_fingerprint")
@@ -15,23 +15,59 @@ class IndexConfig:
 
     Attributes:
         model: Embedding model name (e.g., "local-default-code-embed")
-        chunk: Chunking strategy - "symbol" for tree-sitter, "lines" for sliding window
+        chunk: Chunking strategy - "symbol" for tree-sitter, "hierarchical" for
+            tree-sitter with containers reduced to skeletons of their nested
+            definitions, "lines" for sliding window
         line_window: Lines per chunk when using line-based chunking
         line_stride: Stride between chunks when using line-based chunking
-        overlap_lines: Overlap lines between chunks for context preservation
+        overlap_lines: Overlap lines between the sub-chunks of a definition
+            split to fit the model's token limit
+        max_chunk_tokens: Token limit of a chunk; longer definitions are split
+            into sub-chunks (0 = the model's max_seq_length)
+        min_chunk_tokens: Adjacent definitions shorter than this many tokens
+            are packed into one chunk (0 disables packing)
         include: Glob patterns for files to include (e.g., ["**/*.py"])
         ignore: Patterns for files/dirs to ignore (e.g., ["node_modules/"])
+        skip_generated: Skip generated, minified and vendored files, and
+            files larger than redaction.max_file_mb, detected from their
+            path and content
+        fts_tokenizer: Full-text search tokenization - "code" splits
+            identifiers at camelCase, snake_case and digit boundaries without
+            stemming, "porter" stems English words. Applied to new indexes;
+            `ember rebuild-fts` switches an existing one
+        trigram_index: Keep a trigram index of chunk content, so
+            `ember find --literal` and `--regex` look up candidates instead
+            of scanning every chunk. Takes about as much space as the
+            content; `ember rebuild-fts` adds or drops it on an existing index
+        embedding_cache: Reuse embeddings of identical chunks from other
+            repositories via the shared cache in ~/.ember/cache
+        embedding_cache_mb: Size cap of the shared embedding cache; least
+            recently used entries are evicted beyond it
+        max_refs: Number of refs (branches, revs) kept indexed at once, so
+            switching back to one restores its chunks instead of re-embedding
+            them; 0 keeps only the live index
+        sharding: Split the index into shards synced and searched in parallel -
+            "none" for a single index, "top_level" for one shard per top-level
+            directory, "prefixes" for one shard per entry in shard_prefixes
+        shard_prefixes: Repository-relative directories that get their own
+            shard when sharding is "prefixes" (e.g., ["services/api"])
 
     Raises:
-        ValueError: If line_window, line_stride are not positive,
-                   overlap_lines is negative, or overlap_lines >= line_window.
+        ValueError: If chunk or fts_tokenizer is not a known option, line_window,
+                   line_stride, or embedding_cache_mb are not positive,
+                   overlap_lines, max_chunk_tokens, min_chunk_tokens, or
+                   max_refs is negative,
+                   overlap_lines >= line_window, or a shard prefix is not a
+                   relative path inside the repository.
     """
 
     model: str = "local-default-code-embed"
-    chunk: Literal["symbol", "lines"] = "symbol"
+    chunk: Literal["symbol", "hierarchical", "lines"] = "symbol"
     line_window: int = 120
     line_stride: int = 100
     overlap_lines: int = 15
+    max_chunk_tokens: int = 0
+    min_chunk_tokens: int = 32
     include: list[str] = field(
         default_factory=lambda: [
             "**/*.py",
@@ -61,9 +97,25 @@ class IndexConfig:
             ".DS_Store",
         ]
     )
+    skip_generated: bool = True
+    fts_tokenizer: Literal["code", "porter"] = "code"
+    trigram_index: bool = False
+    embedding_cache: bool = True
+    embedding_cache_mb: int = 1024
+    max_refs: int = 5
+    sharding: Literal["none", "top_level", "prefixes"] = "none"
+    shard_prefixes: list[str] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         """Validate index config after initialization."""
+        if self.chunk not in ("symbol", "hierarchical", "lines"):
+            raise ValueError(
+                f"chunk must be 'symbol', 'hierarchical', or 'lines', got {self.chunk!r}"
+            )
+        if self.fts_tokenizer not in ("code", "porter"):
+            raise ValueError(
+                f"fts_tokenizer must be 'code' or 'porter', got {self.fts_tokenizer!r}"
+            )
         if self.line_window <= 0:
             raise ValueError(f"line_window must be positive, got {self.line_window}")
         if self.line_stride <= 0:
@@ -77,6 +129,31 @@ class IndexConfig:
                 f"overlap_lines ({self.overlap_lines}) must be less than "
                 f"line_window ({self.line_window})"
             )
+        if self.max_chunk_tokens < 0:
+            raise ValueError(
+                f"max_chunk_tokens cannot be negative, got {self.max_chunk_tokens}"
+            )
+        if self.min_chunk_tokens < 0:
+            raise ValueError(
+                f"min_chunk_tokens cannot be negative, got {self.min_chunk_tokens}"
+            )
+        if self.embedding_cache_mb <= 0:
+            raise ValueError(
+                f"embedding_cache_mb must be positive, got {self.embedding_cache_mb}"
+            )
+        if self.max_refs < 0:
+            raise ValueError(f"max_refs cannot be negative, got {self.max_refs}")
+        if self.sharding not in ("none", "top_level", "prefixes"):
+            raise ValueError(
+                f"sharding must be 'none', 'top_level', or 'prefixes', got {self.sharding!r}"
+            )
+        for prefix in self.shard_prefixes:
+            parts = prefix.strip("/").split("/")
+            if prefix.startswith("/") or not prefix.strip("/") or ".." in parts:
+                raise ValueError(
+                    f"shard_prefixes must be relative paths inside the repository, "
+                    f"got {prefix!r}"
+                )
         # Validate model name
         self._validate_model()
 
@@ -103,6 +180,8 @@ class SearchConfig:
         topk: Default number of results to return
         rerank: Whether to enable cross-encoder reranking
         filters: Default filters to apply (key=value pairs)
+        background_sync: Answer `ember find` from the current index and
+            refresh a stale index in a detached worker instead of waiting
 
     Raises:
         ValueError: If topk is not positive.
@@ -111,6 +190,7 @@ class SearchConfig:
     topk: int = 20
     rerank: bool = False
     filters: list[str] = field(default_factory=list)
+    background_sync: bool = False
 
     def __post_init__(self) -> None:
         """Validate search config after initialization."""
@@ -153,14 +233,32 @@ class ModelConfig:
         mode: Model loading mode - "daemon" (default) or "direct"
         daemon_timeout: Idle timeout for daemon in seconds (default: 900 = 15 min)
         daemon_startup_timeout: Max seconds to wait for daemon startup (default: 5)
+        backend: Inference backend - "torch" (default) or "onnx" (onnxruntime,
+            faster on CPU; requires the ember[onnx] extra)
+        quantize: Use int8 dynamic quantization with the onnx backend (default: True)
+        daemon_workers: Embedding worker processes in the daemon (default: 1 =
+            in-process model; 0 = size from CPU count and RAM)
+        batch_size: Embedding batch size; with max_seq_length it sets the
+            per-batch token budget (default: 32; set by `ember config tune`)
+        threads: Intra-op inference threads (default: 0 = library default)
+        max_seq_length: Token truncation length (default: 0 = model default).
+            Changing it changes the model fingerprint and forces a reindex.
 
     Raises:
-        ValueError: If daemon_timeout or daemon_startup_timeout is not positive.
+        ValueError: If daemon_timeout or daemon_startup_timeout is not positive,
+            backend is not recognized, daemon_workers, threads, or
+            max_seq_length is negative, or batch_size is not positive.
     """
 
     mode: Literal["daemon", "direct"] = "daemon"
     daemon_timeout: int = 900  # 15 minutes
     daemon_startup_timeout: int = 5
+    backend: Literal["torch", "onnx"] = "torch"
+    quantize: bool = True
+    daemon_workers: int = 1
+    batch_size: int = 32
+    threads: int = 0
+    max_seq_length: int = 0
 
     def __post_init__(self) -> None:
         """Validate model config after initialization."""
@@ -173,6 +271,22 @@ class ModelConfig:
                 f"daemon_startup_timeout must be positive, "
                 f"got {self.daemon_startup_timeout}"
             )
+        if self.backend not in ("torch", "onnx"):
+            raise ValueError(
+                f"backend must be 'torch' or 'onnx', got {self.backend!r}"
+            )
+        if self.daemon_workers < 0:
+            raise ValueError(
+                f"daemon_workers must be non-negative, got {self.daemon_workers}"
+            )
+        if self.batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {self.batch_size}")
+        if self.threads < 0:
+            raise ValueError(f"threads must be non-negative, got {self.threads}")
+        if self.max_seq_length < 0:
+            raise ValueError(
+                f"max_seq_length must be non-negative, got {self.max_seq_length}"
+            )
 
 
 @dataclass(frozen=True)
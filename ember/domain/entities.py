@@ -6,6 +6,7 @@ These are pure Python dataclasses with no dependencies on infrastructure.
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Literal
 
 import blake3
 
@@ -75,6 +76,7 @@ class Chunk:
         path: Path,
         start_line: int,
         end_line: int,
+        version: str | None = None,
     ) -> str:
         """Compute deterministic chunk ID.
 
@@ -83,11 +85,16 @@ class Chunk:
             path: File path.
             start_line: Starting line number.
             end_line: Ending line number.
+            version: File hash for chunks kept for another ref, so several
+                versions of the same lines can be stored side by side. None
+                for the live index.
 
         Returns:
             Hex-encoded blake3 hash serving as chunk ID.
         """
         key = f"{project_id}:{path}:{start_line}:{end_line}"
+        if version is not None:
+            key += f"@{version}"
         return blake3.blake3(key.encode("utf-8")).hexdigest()
 
 
@@ -112,6 +119,58 @@ class RepoState:
     indexed_at: str
 
 
+@dataclass
+class WatchState:
+    """State published by a running `ember watch` process.
+
+    Lets other commands tell whether the index is caught up with the
+    worktree without computing a tree SHA themselves.
+
+    Attributes:
+        pid: Process ID of the watcher.
+        status: "idle" (caught up), "pending" (changes seen, waiting for the
+            burst to settle), or "syncing" (incremental sync running).
+        last_tree_sha: Tree SHA of the last completed sync ("" if none yet).
+        updated_at: Unix timestamp of the last state change.
+        last_error: Error from the last sync attempt, if it failed.
+    """
+
+    pid: int
+    status: str
+    last_tree_sha: str
+    updated_at: float
+    last_error: str | None = None
+
+    @property
+    def is_caught_up(self) -> bool:
+        """True if the watcher has no outstanding changes to index."""
+        return self.status == "idle" and self.last_error is None
+
+
+@dataclass
+class IndexFreshness:
+    """Whether a search ran against an index caught up with the worktree.
+
+    Reported with JSON search results, so callers can tell whether results
+    may miss recent edits.
+
+    Attributes:
+        caught_up: True if every change was indexed when the search ran.
+        pending: True if changes are still being indexed (by `ember watch`
+            or a background sync).
+        last_error: Error from the last sync attempt, if it failed.
+    """
+
+    caught_up: bool
+    pending: bool = False
+    last_error: str | None = None
+
+
+# Search modes, by retrievers run: both, full-text only, vectors only
+SearchMode = Literal["hybrid", "fts", "vector"]
+SEARCH_MODES: tuple[SearchMode, ...] = ("hybrid", "fts", "vector")
+
+
 @dataclass
 class Query:
     """Search query with parameters.
@@ -122,9 +181,14 @@ class Query:
         path_filter: Optional glob pattern to filter by file path.
         lang_filter: Optional language code to filter by.
         json_output: Whether to output JSON instead of human-readable text.
+        ref: Name of an indexed ref to search instead of the live index.
+        rollup: Replace each matching chunk with the chunk containing it
+            (e.g. a method with its class), merging duplicates.
+        mode: Retrievers to run: "hybrid" (BM25 and vectors), "fts" (BM25
+            only, without embedding the query) or "vector" (vectors only).
 
     Raises:
-        ValueError: If text is empty or topk is not positive.
+        ValueError: If text is empty, topk is not positive, or mode is unknown.
     """
 
     text: str
@@ -132,6 +196,9 @@ class Query:
     path_filter: str | None = None
     lang_filter: str | None = None
     json_output: bool = False
+    ref: str | None = None
+    rollup: bool = False
+    mode: SearchMode = "hybrid"
 
     def __post_init__(self) -> None:
         """Validate query data after initialization."""
@@ -139,6 +206,8 @@ class Query:
             raise ValueError("Query text cannot be empty")
         if self.topk <= 0:
             raise ValueError(f"topk must be positive, got {self.topk}")
+        if self.mode not in SEARCH_MODES:
+            raise ValueError(f"mode must be one of {', '.join(SEARCH_MODES)}, got {self.mode!r}")
 
 
 @dataclass
@@ -151,6 +220,10 @@ class SearchResult:
         rank: Result rank (1-indexed).
         preview: Short preview of matching content.
         explanation: Optional explanation of why this matched.
+        stale: True if the source file changed after it was indexed (the
+            chunk may no longer match the file on disk).
+        repo: Root of the repository the chunk belongs to, set when searching
+            across repositories (None for the current repository).
     """
 
     chunk: Chunk
@@ -158,6 +231,8 @@ class SearchResult:
     rank: int
     preview: str = field(default="")
     explanation: dict[str, float | str] = field(default_factory=dict)
+    stale: bool = False
+    repo: Path | None = None
 
     def format_preview(self, max_lines: int = 3) -> str:
         """Generate preview text from chunk content.
@@ -0,0 +1,117 @@
+"""Shard layout for directory-sharded indexes.
+
+A sharded index stores each configured directory prefix in its own index,
+so shards can be synced independently and queried in parallel. Files outside
+every prefix belong to the root shard.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+# Name of the shard holding files outside every prefix
+ROOT_SHARD = ""
+
+# Characters that start a wildcard in a path filter glob
+_GLOB_CHARS = "*?["
+
+
+def _normalize_prefix(prefix: str) -> str:
+    """Strip leading and trailing slashes from a prefix."""
+    return prefix.strip("/")
+
+
+@dataclass(frozen=True)
+class ShardLayout:
+    """Assignment of repository paths to shards by directory prefix.
+
+    Prefixes may be nested; a path belongs to the longest prefix it lies
+    under, and to the root shard if it lies under none.
+
+    Attributes:
+        prefixes: Repository-relative directory prefixes, one per shard.
+    """
+
+    prefixes: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Normalize and deduplicate prefixes."""
+        normalized = sorted({_normalize_prefix(p) for p in self.prefixes} - {""})
+        object.__setattr__(self, "prefixes", tuple(normalized))
+
+    @classmethod
+    def top_level(cls, paths: Iterable[Path]) -> "ShardLayout":
+        """Create a layout with one shard per top-level directory.
+
+        Hidden directories (such as .github) are small enough to stay in the
+        root shard.
+
+        Args:
+            paths: Repository-relative file paths.
+
+        Returns:
+            Layout whose prefixes are the top-level directories of the paths.
+        """
+        parts = (Path(p).parts for p in paths)
+        return cls(tuple({p[0] for p in parts if len(p) > 1 and not p[0].startswith(".")}))
+
+    @property
+    def is_sharded(self) -> bool:
+        """Whether the layout has any shards besides the root shard."""
+        return bool(self.prefixes)
+
+    def shards(self) -> list[str]:
+        """List all shards, root shard first.
+
+        Returns:
+            Shard names (the root shard and every prefix).
+        """
+        return [ROOT_SHARD, *self.prefixes]
+
+    def _owner(self, path: str) -> str:
+        """Get the longest prefix containing a path, or the root shard."""
+        owner = ROOT_SHARD
+        for prefix in self.prefixes:
+            if path.startswith(prefix + "/") and len(prefix) > len(owner):
+                owner = prefix
+        return owner
+
+    def shard_of(self, path: Path) -> str:
+        """Get the shard a file belongs to.
+
+        Args:
+            path: Repository-relative file path.
+
+        Returns:
+            Name of the shard.
+        """
+        return self._owner(Path(path).as_posix())
+
+    def shards_for(self, path_filter: str | None) -> list[str]:
+        """Get the shards that can hold files matching a path filter.
+
+        Only the literal part of the glob before its first wildcard is used,
+        so the result may include shards without matches but never misses one.
+
+        Args:
+            path_filter: Glob pattern over repository-relative paths, or None.
+
+        Returns:
+            Names of the shards to query, root shard first if included.
+        """
+        if not path_filter:
+            return self.shards()
+
+        literal = path_filter.lstrip("/")
+        for i, char in enumerate(literal):
+            if char in _GLOB_CHARS:
+                literal = literal[:i]
+                break
+
+        owner = self._owner(literal)
+        relevant = [owner]
+        for prefix in self.prefixes:
+            # Shards under the literal part can hold matches too
+            if prefix != owner and prefix.startswith(literal):
+                relevant.append(prefix)
+        return relevant
@@ -7,8 +7,8 @@ import functools
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
-import blake3
 import click
 
 from ember.adapters.fs.local import LocalFileSystem
@@ -24,10 +24,14 @@ from ember.core.cli_utils import (
     path_not_in_repo_error,
     progress_context,
     repo_not_found_error,
+    resolve_repo_list,
     validate_result_index,
 )
 from ember.core.presentation import ResultPresenter
 
+if TYPE_CHECKING:
+    from ember.domain.entities import SearchMode
+
 
 def handle_cli_errors(command_name: str):
     """Decorator to handle common CLI errors.
@@ -73,6 +77,21 @@ def handle_cli_errors(command_name: str):
     return decorator
 
 
+def _model_tuning(config) -> dict:
+    """Calibrated embedding settings from config, as embedder keyword arguments.
+
+    Args:
+        config: EmberConfig with model settings
+
+    Returns:
+        batch_size, plus max_seq_length when it overrides the model default
+    """
+    tuning = {"batch_size": config.model.batch_size}
+    if config.model.max_seq_length:
+        tuning["max_seq_length"] = config.model.max_seq_length
+    return tuning
+
+
 def _create_embedder(config, show_progress: bool = True):
     """Create embedder based on configuration.
 
@@ -101,6 +120,11 @@ def _create_embedder(config, show_progress: bool = True):
         daemon_manager = DaemonLifecycle(
             idle_timeout=config.model.daemon_timeout,
             model_name=model_name,
+            backend=config.model.backend,
+            quantize=config.model.quantize,
+            workers=config.model.daemon_workers,
+            threads=config.model.threads,
+            **_model_tuning(config),
         )
 
         # If daemon is already running, nothing to do
@@ -118,12 +142,23 @@ def _create_embedder(config, show_progress: bool = True):
             auto_start=False,  # Daemon already started above
             daemon_timeout=config.model.daemon_timeout,
             model_name=model_name,
+            backend=config.model.backend,
+            quantize=config.model.quantize,
+            workers=config.model.daemon_workers,
+            **_model_tuning(config),
         )
     else:
         # Use direct mode (fallback or explicit config)
         from ember.adapters.local_models.registry import create_embedder
+        from ember.adapters.local_models.runtime import apply_thread_limit
 
-        return create_embedder(model_name=model_name)
+        apply_thread_limit(config.model.threads, config.model.backend)
+        return create_embedder(
+            model_name=model_name,
+            backend=config.model.backend,
+            quantize=config.model.quantize,
+            **_model_tuning(config),
+        )
 
 
 def get_ember_repo_root() -> tuple[Path, Path]:
@@ -148,24 +183,57 @@ def get_ember_repo_root() -> tuple[Path, Path]:
         repo_not_found_error()
 
 
-def _create_indexing_usecase(repo_root: Path, db_path: Path, config):
-    """Create IndexingUseCase with all dependencies.
+def _create_chunk_sizer(config):
+    """Create the sizer fitting chunks to the embedding model's token limit.
 
-    Helper function to avoid code duplication between sync command and auto-sync.
+    Args:
+        config: EmberConfig with index and model settings.
+
+    Returns:
+        ChunkSizer using the model's tokenizer.
+    """
+    from ember.adapters.local_models.registry import default_max_seq_length
+    from ember.adapters.local_models.tokenizer import HFTokenCounter
+    from ember.core.chunking.token_sizing import ChunkSizer, TokenBudget
+
+    max_tokens = (
+        config.index.max_chunk_tokens
+        or config.model.max_seq_length
+        or default_max_seq_length(config.index.model)
+    )
+    return ChunkSizer(
+        HFTokenCounter(config.index.model),
+        TokenBudget(
+            max_tokens=max_tokens,
+            overlap_lines=config.index.overlap_lines,
+            min_tokens=config.index.min_chunk_tokens,
+        ),
+    )
+
+
+def _create_shard_indexing_usecase(
+    repo_root: Path, db_path: Path, config, embedder, path_scope=None
+):
+    """Create the IndexingUseCase maintaining one shard's database.
 
     Args:
         repo_root: Repository root path.
-        db_path: Path to SQLite database.
+        db_path: Path to the shard's SQLite database.
         config: Configuration object with index settings.
+        embedder: Embedder shared by all shards.
+        path_scope: Optional predicate selecting the shard's files.
 
     Returns:
         Initialized IndexingUseCase instance.
     """
     # Lazy imports - only load heavy dependencies when needed
+    import blake3
+
     from ember.adapters.fs.local import LocalFileSystem
     from ember.adapters.git_cmd.git_adapter import GitAdapter
     from ember.adapters.parsers.line_chunker import LineChunker
     from ember.adapters.parsers.tree_sitter_chunker import TreeSitterChunker
+    from ember.adapters.sqlite.checkpoint_repository import SQLiteSyncCheckpointRepository
     from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
     from ember.adapters.sqlite.file_repository import SQLiteFileRepository
     from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
@@ -176,13 +244,27 @@ def _create_indexing_usecase(repo_root: Path, db_path: Path, config):
     # Initialize dependencies
     vcs = GitAdapter(repo_root)
     fs = LocalFileSystem()
-    embedder = _create_embedder(config)
 
     # Initialize repositories
     chunk_repo = SQLiteChunkRepository(db_path)
     vector_repo = SQLiteVectorRepository(db_path, expected_dim=embedder.dim)
     file_repo = SQLiteFileRepository(db_path)
     meta_repo = SQLiteMetaRepository(db_path)
+    checkpoint_repo = SQLiteSyncCheckpointRepository(db_path)
+
+    # Shared across repositories so clones reuse each other's embeddings
+    embedding_cache = None
+    if config.index.embedding_cache:
+        from ember.adapters.sqlite.embedding_cache import SQLiteEmbeddingCache
+
+        embedding_cache = SQLiteEmbeddingCache(max_size_mb=config.index.embedding_cache_mb)
+
+    # Keeps recently synced branches indexed so switching back is free
+    ref_repo = None
+    if config.index.max_refs > 0:
+        from ember.adapters.sqlite.ref_repository import SQLiteRefRepository
+
+        ref_repo = SQLiteRefRepository(db_path)
 
     # Initialize chunking use case with config settings
     tree_sitter = TreeSitterChunker()
@@ -190,7 +272,19 @@ def _create_indexing_usecase(repo_root: Path, db_path: Path, config):
         window_size=config.index.line_window,
         stride=config.index.line_stride,
     )
-    chunk_usecase = ChunkFileUseCase(tree_sitter, line_chunker)
+    chunk_usecase = ChunkFileUseCase(
+        tree_sitter,
+        line_chunker,
+        sizer=_create_chunk_sizer(config),
+        hierarchical=config.index.chunk == "hierarchical",
+    )
+
+    # Keeps generated, minified and vendored files out of the index
+    file_classifier = None
+    if config.index.skip_generated:
+        from ember.core.indexing.file_classifier import FileClassifier
+
+        file_classifier = FileClassifier(max_file_bytes=config.redaction.max_file_mb * 1024 * 1024)
 
     # Compute project ID (hash of repo root path)
     project_id = blake3.blake3(str(repo_root).encode("utf-8")).hexdigest()
@@ -206,9 +300,292 @@ def _create_indexing_usecase(repo_root: Path, db_path: Path, config):
         file_repo=file_repo,
         meta_repo=meta_repo,
         project_id=project_id,
+        checkpoint_repo=checkpoint_repo,
+        embedding_cache=embedding_cache,
+        ref_repo=ref_repo,
+        max_refs=config.index.max_refs,
+        path_scope=path_scope,
+        file_classifier=file_classifier,
+    )
+
+
+def _shard_layout_key(config) -> str:
+    """Identify the configured shard layout, so changes to it can be detected."""
+    if config.index.sharding == "prefixes":
+        return "prefixes:" + ",".join(sorted(p.strip("/") for p in config.index.shard_prefixes))
+    return config.index.sharding
+
+
+def _resolve_shard_layout(ember_dir: Path, config, vcs=None):
+    """Resolve the shard layout configured for a repository.
+
+    Args:
+        ember_dir: Path to .ember/ directory.
+        config: Configuration object with index settings.
+        vcs: Optional VCS adapter. For top-level sharding it lists the
+            directories to shard; without it, only shards already on disk
+            are used (as when searching).
+
+    Returns:
+        ShardLayout for the repository.
+    """
+    from ember.domain.sharding import ShardLayout
+    from ember.shared.shard_io import list_shards
+
+    if config.index.sharding == "prefixes":
+        return ShardLayout(tuple(config.index.shard_prefixes))
+    if config.index.sharding == "top_level":
+        existing = list_shards(ember_dir)
+        if vcs is None:
+            return ShardLayout(tuple(existing))
+        top_level = ShardLayout.top_level(vcs.list_tracked_files())
+        return ShardLayout((*top_level.prefixes, *existing))
+    return ShardLayout()
+
+
+def _create_indexing_usecase(repo_root: Path, db_path: Path, config):
+    """Create the indexing use case with all dependencies.
+
+    Helper function to avoid code duplication between sync command and auto-sync.
+    Each shard of the index gets its own IndexingUseCase; without sharding
+    there is only the root shard in db_path.
+
+    Args:
+        repo_root: Repository root path.
+        db_path: Path to SQLite database.
+        config: Configuration object with index settings.
+
+    Returns:
+        Initialized ShardedIndexingUseCase instance.
+    """
+    from ember.adapters.git_cmd.git_adapter import GitAdapter
+    from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
+    from ember.adapters.sqlite.schema import init_database
+    from ember.core.indexing.shard_usecase import ShardedIndexingUseCase
+    from ember.domain.sharding import ROOT_SHARD
+    from ember.shared.shard_io import shard_db_path
+
+    ember_dir = db_path.parent
+    vcs = GitAdapter(repo_root)
+    embedder = _create_embedder(config)
+
+    def create_shard(shard: str, path_scope):
+        shard_db = db_path if shard == ROOT_SHARD else shard_db_path(ember_dir, shard)
+        if not shard_db.exists():
+            shard_db.parent.mkdir(parents=True, exist_ok=True)
+            init_database(shard_db, config.index.fts_tokenizer, config.index.trigram_index)
+        return _create_shard_indexing_usecase(repo_root, shard_db, config, embedder, path_scope)
+
+    return ShardedIndexingUseCase(
+        layout=lambda: _resolve_shard_layout(ember_dir, config, vcs),
+        create_shard=create_shard,
+        vcs=vcs,
+        embedder=embedder,
+        meta_repo=SQLiteMetaRepository(db_path),
+        layout_key=_shard_layout_key(config),
     )
 
 
+def _shard_db_paths(ember_dir: Path, config) -> list[Path]:
+    """List the databases of an index's shards, root shard first.
+
+    Args:
+        ember_dir: Path to .ember/ directory.
+        config: Configuration object with index settings.
+
+    Returns:
+        Paths of the shard databases that exist (always including index.db).
+    """
+    from ember.shared.shard_io import shard_db_path
+
+    layout = _resolve_shard_layout(ember_dir, config)
+    paths = [shard_db_path(ember_dir, shard) for shard in layout.shards()]
+    return [paths[0], *(path for path in paths[1:] if path.exists())]
+
+
+def _require_unsharded(config, command: str) -> None:
+    """Refuse a command that only supports single-database indexes.
+
+    Args:
+        config: Configuration object with index settings.
+        command: Name of the command, for the error message.
+
+    Raises:
+        EmberCliError: If the index is sharded.
+    """
+    if config.index.sharding != "none":
+        raise EmberCliError(
+            f"'ember {command}' does not support sharded indexes "
+            f"(index.sharding = {config.index.sharding!r})",
+            hint="Set index.sharding = \"none\" in .ember/config.toml and run 'ember sync'",
+        )
+
+
+def _create_search_usecase(
+    db_path: Path, config, show_progress: bool = True, embedder=None, load_model: bool = True
+):
+    """Create the search use case for an index, fanning out over its shards.
+
+    Args:
+        db_path: Path to the root shard's SQLite database.
+        config: Configuration object with index settings.
+        show_progress: Show progress bar during daemon startup.
+        embedder: Embedder to use (default: created from config).
+        load_model: Create an embedder if none is given. Without one, only
+            "fts" mode queries can be answered, but no model is loaded, the
+            daemon is neither started nor contacted, and vectors are not read.
+
+    Returns:
+        SearchUseCase, or ShardedSearchUseCase if the index is sharded.
+    """
+    from ember.adapters.fts.sqlite_fts import SQLiteFTS
+    from ember.adapters.fts.symbol_search import SQLiteSymbolSearch
+    from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+    from ember.adapters.vss.sqlite_vec_adapter import SqliteVecAdapter
+    from ember.core.retrieval.search_usecase import SearchUseCase
+    from ember.domain.sharding import ROOT_SHARD
+    from ember.shared.shard_io import shard_db_path
+
+    if embedder is None and load_model:
+        embedder = _create_embedder(config, show_progress=show_progress)
+
+    def create(shard_db: Path) -> SearchUseCase:
+        return SearchUseCase(
+            text_search=SQLiteFTS(shard_db),
+            vector_search=SqliteVecAdapter(shard_db) if embedder is not None else None,
+            chunk_repo=SQLiteChunkRepository(shard_db),
+            embedder=embedder,
+            symbol_search=SQLiteSymbolSearch(shard_db),
+        )
+
+    layout = _resolve_shard_layout(db_path.parent, config)
+    if not layout.is_sharded:
+        return create(db_path)
+
+    from ember.core.retrieval.sharded_search import ShardedSearchUseCase
+
+    shards = {ROOT_SHARD: create(db_path)}
+    for shard in layout.prefixes:
+        shard_db = shard_db_path(db_path.parent, shard)
+        if shard_db.exists():
+            shards[shard] = create(shard_db)
+    return ShardedSearchUseCase(shards=shards, layout=layout, embedder=embedder)
+
+
+def _search_literal(db_path: Path, config, query, regex: bool) -> list:
+    """Find chunks containing a substring or regex match, across shards.
+
+    Args:
+        db_path: Path to the root shard's SQLite database.
+        config: Configuration object with index settings.
+        query: Query whose text is the substring or expression.
+        regex: Treat the query text as a regular expression.
+
+    Returns:
+        SearchResults ranked by number of matches.
+    """
+    from ember.adapters.fts.trigram_search import SQLiteTrigramSearch
+    from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+    from ember.core.retrieval.literal_search import LiteralSearchUseCase, merge_results
+    from ember.shared.shard_io import shard_db_path
+
+    layout = _resolve_shard_layout(db_path.parent, config)
+    result_lists = []
+    for shard in layout.shards_for(query.path_filter):
+        shard_db = shard_db_path(db_path.parent, shard)
+        if not shard_db.exists():
+            continue
+        with (
+            SQLiteTrigramSearch(shard_db) as literal_search,
+            SQLiteChunkRepository(shard_db) as chunk_repo,
+        ):
+            result_lists.append(
+                LiteralSearchUseCase(literal_search, chunk_repo).search(query, regex=regex)
+            )
+    return merge_results(result_lists, query.topk)
+
+
+def _search_symbols(db_path: Path, config, query, fuzzy: bool) -> list:
+    """Find the chunks defining a symbol, across shards.
+
+    Args:
+        db_path: Path to the root shard's SQLite database.
+        config: Configuration object with index settings.
+        query: Query whose text is the symbol name.
+        fuzzy: Fall back to similar names if nothing matches exactly or by prefix.
+
+    Returns:
+        SearchResults ranked by symbol score.
+    """
+    from ember.adapters.fts.symbol_search import SQLiteSymbolSearch
+    from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+    from ember.core.retrieval.literal_search import merge_results
+    from ember.core.retrieval.symbol_search import SymbolSearchUseCase
+    from ember.shared.shard_io import shard_db_path
+
+    layout = _resolve_shard_layout(db_path.parent, config)
+    result_lists = []
+    for shard in layout.shards_for(query.path_filter):
+        shard_db = shard_db_path(db_path.parent, shard)
+        if not shard_db.exists():
+            continue
+        with (
+            SQLiteSymbolSearch(shard_db) as symbol_search,
+            SQLiteChunkRepository(shard_db) as chunk_repo,
+        ):
+            result_lists.append(
+                SymbolSearchUseCase(symbol_search, chunk_repo).search(query, fuzzy=fuzzy)
+            )
+    return merge_results(result_lists, query.topk)
+
+
+def _create_federated_search_usecase(
+    repo_roots: list[Path], show_progress: bool = True, load_model: bool = True
+):
+    """Create a search use case over the indexes of several repositories.
+
+    Repositories indexed with the same model share an embedder, so the query
+    is embedded once per model. The first repository's model is served by
+    the embedding daemon (if configured); other models are loaded directly,
+    since the daemon serves a single model.
+
+    Args:
+        repo_roots: Roots of the repositories to search, each with an index.
+        show_progress: Show progress bar during daemon startup.
+        load_model: Create embedders; without them, only "fts" mode
+            queries can be answered.
+
+    Returns:
+        FederatedSearchUseCase over all repositories.
+    """
+    from dataclasses import replace
+
+    from ember.adapters.config.toml_config_provider import TomlConfigProvider
+    from ember.core.retrieval.federated_search import FederatedRepo, FederatedSearchUseCase
+
+    config_provider = TomlConfigProvider()
+    embedders = {}
+    repos = []
+    for root in repo_roots:
+        ember_dir = root / ".ember"
+        config = config_provider.load(ember_dir)
+        model_key = f"{config.index.model}:{config.model.backend}:{config.model.quantize}"
+        if model_key not in embedders:
+            if embedders and config.model.mode == "daemon":
+                config = replace(config, model=replace(config.model, mode="direct"))
+            embedders[model_key] = (
+                _create_embedder(config, show_progress=show_progress) if load_model else None
+            )
+        search_usecase = _create_search_usecase(
+            ember_dir / "index.db",
+            config,
+            embedder=embedders[model_key],
+            load_model=load_model,
+        )
+        repos.append(FederatedRepo(root=root, search=search_usecase, model_key=model_key))
+    return FederatedSearchUseCase(repos=repos, embedders=embedders)
+
+
 @dataclass
 class SyncResult:
     """Result of an ensure_synced() call.
@@ -219,11 +596,47 @@ class SyncResult:
         synced: True if a sync was performed, False if index was already up to date.
         files_indexed: Number of files that were indexed (0 if no sync).
         error: Error message if sync failed, None otherwise.
+        in_progress: True if the index is stale and a background sync is
+            refreshing it (results from the current index may be stale).
     """
 
     synced: bool = False
     files_indexed: int = 0
     error: str | None = None
+    in_progress: bool = False
+
+
+def _spawn_background_sync(repo_root: Path, ember_dir: Path) -> None:
+    """Start a detached worker that syncs the index under the sync lock.
+
+    Args:
+        repo_root: Repository root path.
+        ember_dir: Path to .ember/ directory.
+    """
+    import os
+    import subprocess
+
+    env = os.environ.copy()
+    env.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+    log_path = ember_dir / "sync_worker.log"
+    with log_path.open("ab") as log_file:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "ember.entrypoints.sync_worker",
+                "--repo-root",
+                str(repo_root),
+                "--ember-dir",
+                str(ember_dir),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=log_file,
+            start_new_session=True,  # Outlive the find command
+            env=env,
+        )
 
 
 def ensure_synced(
@@ -233,6 +646,7 @@ def ensure_synced(
     show_progress: bool = True,
     interactive_mode: bool = False,
     verbose: bool = False,
+    background: bool = False,
 ) -> SyncResult:
     """Ensure the index is synced before running a command.
 
@@ -247,6 +661,9 @@ def ensure_synced(
         interactive_mode: If True, show brief status message even without progress bar.
             Use this for TUI commands where progress bar would corrupt display.
         verbose: If True, show warnings on errors.
+        background: If True, don't wait for indexing. A stale index is handed
+            to a detached sync worker and the caller proceeds with the current
+            index (stale-while-revalidate).
 
     Returns:
         SyncResult with information about whether sync was performed.
@@ -262,68 +679,129 @@ def ensure_synced(
         # In JSON output mode (completely silent):
         result = ensure_synced(repo_root, db_path, config, show_progress=False)
     """
+    from ember.shared.sync_lock import SyncLock
+
+    lock = SyncLock(db_path.parent / "sync.lock")
     try:
-        # Import dependencies
-        from ember.adapters.git_cmd.git_adapter import GitAdapter
-        from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
-        from ember.core.indexing.index_usecase import IndexRequest
+        if background:
+            return _ensure_synced_in_background(repo_root, db_path, lock)
 
-        vcs = GitAdapter(repo_root)
-        meta_repo = SQLiteMetaRepository(db_path)
+        # Serialize with background workers; waiting here means we see their result
+        with lock:
+            return _ensure_synced_locked(
+                repo_root, db_path, config, show_progress, interactive_mode
+            )
 
-        # Get current worktree tree SHA
-        current_tree_sha = vcs.get_worktree_tree_sha()
+    except Exception as e:
+        # If staleness check fails, continue with search anyway
+        if verbose:
+            click.echo(f"Warning: Could not check index staleness: {e}", err=True)
+        return SyncResult(synced=False, files_indexed=0, error=str(e))
 
-        # Get last indexed tree SHA
-        last_tree_sha = meta_repo.get("last_tree_sha")
 
-        # If tree SHAs match, index is up to date - no sync needed
-        if last_tree_sha == current_tree_sha:
-            return SyncResult(synced=False, files_indexed=0)
+def _is_index_current(repo_root: Path, db_path: Path) -> bool:
+    """Check whether the last indexed tree SHA matches the worktree.
 
-        # Index is stale - need to sync
+    Args:
+        repo_root: Repository root path.
+        db_path: Path to SQLite database.
 
-        # Show "Syncing..." message for interactive mode (even without progress bar)
-        if interactive_mode and not show_progress:
-            click.echo("Syncing index...", err=True)
+    Returns:
+        True if the index is up to date with the worktree.
+    """
+    from ember.adapters.git_cmd.git_adapter import GitAdapter
+    from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
 
-        # Create indexing use case with all dependencies
-        indexing_usecase = _create_indexing_usecase(repo_root, db_path, config)
+    vcs = GitAdapter(repo_root)
+    meta_repo = SQLiteMetaRepository(db_path)
+    current_tree_sha = vcs.get_worktree_tree_sha()
+    return meta_repo.get("last_tree_sha") == current_tree_sha
 
-        # Execute incremental sync
-        request = IndexRequest(
-            repo_root=repo_root,
-            sync_mode="worktree",
-            path_filters=[],
-            force_reindex=False,
-        )
 
-        # Use progress bars unless in quiet mode
-        quiet_mode = not show_progress
-        with progress_context(quiet_mode=quiet_mode) as progress:
-            if progress:
-                response = indexing_usecase.execute(request, progress=progress)
-            else:
-                # Silent mode
-                response = indexing_usecase.execute(request)
-
-        # Show completion message AFTER progress context exits
-        if show_progress and response.success:
-            if response.files_indexed > 0:
-                click.echo(
-                    f"✓ Synced {response.files_indexed} file(s)",
-                    err=True,
-                )
-            else:
-                click.echo("✓ Index up to date", err=True)
+def _ensure_synced_in_background(repo_root: Path, db_path: Path, lock) -> SyncResult:
+    """Hand a stale index to a detached sync worker without waiting.
 
-        return SyncResult(synced=True, files_indexed=response.files_indexed)
+    Args:
+        repo_root: Repository root path.
+        db_path: Path to SQLite database.
+        lock: SyncLock guarding index writes.
 
-    except Exception as e:
-        # If staleness check fails, continue with search anyway
-        if verbose:
-            click.echo(f"Warning: Could not check index staleness: {e}", err=True)
-        return SyncResult(synced=False, files_indexed=0, error=str(e))
+    Returns:
+        SyncResult with in_progress=True if the index is being refreshed.
+    """
+    # A writer already holds the lock, so the index is being refreshed
+    if lock.is_locked():
+        return SyncResult(in_progress=True)
+
+    if _is_index_current(repo_root, db_path):
+        return SyncResult()
+
+    _spawn_background_sync(repo_root, db_path.parent)
+    return SyncResult(in_progress=True)
+
+
+def _ensure_synced_locked(
+    repo_root: Path,
+    db_path: Path,
+    config,
+    show_progress: bool,
+    interactive_mode: bool,
+) -> SyncResult:
+    """Sync the index in the foreground (caller holds the sync lock).
+
+    Args:
+        repo_root: Repository root path.
+        db_path: Path to SQLite database.
+        config: Configuration object.
+        show_progress: If True, show progress bar during sync.
+        interactive_mode: If True, show brief status message without progress bar.
+
+    Returns:
+        SyncResult with information about whether sync was performed.
+    """
+    from ember.core.indexing.index_usecase import IndexRequest
+
+    # If tree SHAs match, index is up to date - no sync needed
+    if _is_index_current(repo_root, db_path):
+        return SyncResult(synced=False, files_indexed=0)
+
+    # Index is stale - need to sync
+
+    # Show "Syncing..." message for interactive mode (even without progress bar)
+    if interactive_mode and not show_progress:
+        click.echo("Syncing index...", err=True)
+
+    # Create indexing use case with all dependencies
+    indexing_usecase = _create_indexing_usecase(repo_root, db_path, config)
+
+    # Execute incremental sync
+    request = IndexRequest(
+        repo_root=repo_root,
+        sync_mode="worktree",
+        path_filters=[],
+        force_reindex=False,
+    )
+
+    # Use progress bars unless in quiet mode
+    quiet_mode = not show_progress
+    with progress_context(quiet_mode=quiet_mode) as progress:
+        if progress:
+            response = indexing_usecase.execute(request, progress=progress)
+        else:
+            # Silent mode
+            response = indexing_usecase.execute(request)
+
+    # Show completion message AFTER progress context exits
+    if show_progress and response.success:
+        if response.files_indexed > 0:
+            click.echo(
+                f"✓ Synced {response.files_indexed} file(s)",
+                err=True,
+            )
+        else:
+            click.echo("✓ Index up to date", err=True)
+
+    return SyncResult(synced=True, files_indexed=response.files_indexed)
 
 
 def check_and_auto_sync(
@@ -359,6 +837,56 @@ def check_and_auto_sync(
     )
 
 
+def _load_live_watch_state(ember_dir: Path):
+    """Load state published by a running `ember watch` process.
+
+    Args:
+        ember_dir: Path to .ember/ directory.
+
+    Returns:
+        WatchState if a watcher for this repository is alive, None otherwise.
+    """
+    import os
+
+    from ember.shared.state_io import load_watch_state
+
+    state = load_watch_state(ember_dir / "watch.json")
+    if state is None:
+        return None
+    try:
+        os.kill(state.pid, 0)
+    except OSError:
+        return None  # Watcher exited without cleaning up
+    return state
+
+
+def _index_freshness(watch_state, sync_result: SyncResult | None):
+    """Describe how fresh the index was when a search ran.
+
+    Args:
+        watch_state: WatchState of a running `ember watch`, if any.
+        sync_result: Result of the sync run before searching, if any.
+
+    Returns:
+        IndexFreshness, or None if the index was not checked (--no-sync).
+    """
+    from ember.domain.entities import IndexFreshness
+
+    if watch_state is not None:
+        return IndexFreshness(
+            caught_up=watch_state.is_caught_up,
+            pending=watch_state.status != "idle",
+            last_error=watch_state.last_error,
+        )
+    if sync_result is not None:
+        return IndexFreshness(
+            caught_up=not sync_result.in_progress and sync_result.error is None,
+            pending=sync_result.in_progress,
+            last_error=sync_result.error,
+        )
+    return None
+
+
 @click.group()
 @click.version_option(version="1.2.0", prog_name="ember")
 @click.option(
@@ -404,8 +932,15 @@ def cli(ctx: click.Context, verbose: bool, quiet: bool) -> None:
     is_flag=True,
     help="Accept recommended model without prompting.",
 )
+@click.option(
+    "--tune",
+    is_flag=True,
+    help="Calibrate embedding batch size and threads for this machine.",
+)
 @click.pass_context
-def init(ctx: click.Context, force: bool, model: str | None, yes: bool) -> None:
+def init(
+    ctx: click.Context, force: bool, model: str | None, yes: bool, tune: bool
+) -> None:
     """Initialize Ember in the current directory.
 
     Creates .ember/ directory with configuration and database.
@@ -413,6 +948,7 @@ def init(ctx: click.Context, force: bool, model: str | None, yes: bool) -> None:
 
     Detects available system RAM and suggests an appropriate embedding model.
     Use --model to override or --yes to accept the recommendation.
+    Use --tune to calibrate embedding settings (see 'ember config tune').
     """
     # Lazy import - only load when init is actually called
     from ember.adapters.sqlite.initializer import SqliteDatabaseInitializer
@@ -475,7 +1011,6 @@ def init(ctx: click.Context, force: bool, model: str | None, yes: bool) -> None:
             click.echo(f"  ✓ Created {response.db_path.name}")
             click.echo(f"  ✓ Created {response.state_path.name}")
             click.echo(f"  ✓ Using model: {selected_model}")
-            click.echo("\nNext: Run 'ember sync' to index your codebase")
 
     except FileExistsError as e:
         raise EmberCliError(
@@ -488,6 +1023,18 @@ def init(ctx: click.Context, force: bool, model: str | None, yes: bool) -> None:
             hint="Check permissions and try again, or use --force to reinitialize",
         ) from e
 
+    if tune:
+        from ember.adapters.config.toml_config_provider import TomlConfigProvider
+        from ember.shared.config_io import get_global_config_path
+
+        if not quiet:
+            click.echo()
+        config = TomlConfigProvider().load(response.ember_dir)
+        _run_autotune(config, get_global_config_path(), None, quiet)
+
+    if not quiet:
+        click.echo("\nNext: Run 'ember sync' to index your codebase")
+
 
 def _parse_sync_mode(rev: str | None, staged: bool, worktree: bool) -> str:
     """Determine sync mode from CLI options.
@@ -558,23 +1105,96 @@ def _format_sync_results(response) -> None:
     """
     sync_type = "incremental" if response.is_incremental else "full"
 
-    if response.files_indexed == 0 and response.chunks_deleted == 0:
+    if response.files_indexed == 0 and response.chunks_deleted == 0 and not response.files_skipped:
         click.echo(f"✓ No changes detected ({sync_type} scan completed)")
     else:
         click.echo(f"✓ Indexed {response.files_indexed} files ({sync_type} sync)")
 
+    if response.files_resumed > 0:
+        click.echo(f"  • {response.files_resumed} files resumed from interrupted sync")
+    if response.files_restored > 0:
+        click.echo(f"  • {response.files_restored} files restored from another indexed ref")
+    if response.files_skipped > 0:
+        click.echo(
+            f"  • {response.files_skipped} generated, minified or vendored files skipped"
+        )
     if response.chunks_created > 0:
         click.echo(f"  • {response.chunks_created} chunks created")
     if response.chunks_updated > 0:
         click.echo(f"  • {response.chunks_updated} chunks updated")
     if response.chunks_deleted > 0:
         click.echo(f"  • {response.chunks_deleted} chunks deleted")
+    if response.vectors_cached > 0:
+        click.echo(f"  • {response.vectors_cached} embeddings reused from shared cache")
     if response.vectors_stored > 0:
         click.echo(f"  • {response.vectors_stored} vectors stored")
     if response.files_indexed > 0 or response.chunks_deleted > 0:
         click.echo(f"  • Tree SHA: {response.tree_sha[:12]}...")
 
 
+def _ensure_ref_indexed(
+    repo_root: Path, ember_dir: Path, config, rev: str, show_progress: bool
+) -> str:
+    """Make sure a revision is indexed as a ref, indexing it if needed.
+
+    Only files that differ from the live index are read, and file versions
+    already stored for another ref are reused, so this is cheap for branches
+    close to the checked-out one and free for refs synced before.
+
+    Args:
+        repo_root: Repository root path.
+        ember_dir: Path to .ember directory.
+        config: Configuration object with index settings.
+        rev: Git revision (branch, tag, or commit).
+        show_progress: Whether to show a progress bar while indexing.
+
+    Returns:
+        Name of the indexed ref to pass to Query.ref.
+
+    Raises:
+        EmberCliError: If refs are disabled, the rev is unknown, or indexing fails.
+    """
+    from ember.adapters.git_cmd.git_adapter import GitAdapter
+    from ember.adapters.sqlite.ref_repository import SQLiteRefRepository
+    from ember.core.indexing.index_usecase import IndexRequest
+    from ember.shared.sync_lock import SyncLock
+
+    if config.index.max_refs == 0:
+        raise EmberCliError(
+            "Searching other refs is disabled (index.max_refs = 0)",
+            hint="Set index.max_refs in .ember/config.toml to keep refs indexed",
+        )
+
+    try:
+        tree_sha = GitAdapter(repo_root).get_tree_sha(rev)
+    except RuntimeError as e:
+        raise EmberCliError(
+            f"Unknown revision '{rev}'",
+            hint="Use a branch, tag, or commit that exists in this repository",
+        ) from e
+
+    db_path = ember_dir / "index.db"
+    with SQLiteRefRepository(db_path) as ref_repo:
+        existing = ref_repo.find_by_tree(tree_sha)
+        if existing is not None:
+            return existing.name
+
+    indexing_usecase = _create_indexing_usecase(repo_root, db_path, config)
+    request = IndexRequest(repo_root=repo_root, sync_mode=rev, as_ref=True)
+    with (
+        SyncLock(ember_dir / "sync.lock"),
+        progress_context(quiet_mode=not show_progress) as progress,
+    ):
+        if progress:
+            response = indexing_usecase.execute(request, progress=progress)
+        else:
+            response = indexing_usecase.execute(request)
+
+    if not response.success:
+        raise EmberCliError(f"Indexing {rev} failed: {response.error}")
+    return rev
+
+
 @cli.command()
 @click.option(
     "--worktree",
@@ -611,42 +1231,204 @@ def sync(
     Can be run from any subdirectory within the repository.
     """
     from ember.adapters.config.toml_config_provider import TomlConfigProvider
-    from ember.core.indexing.index_usecase import IndexRequest
+    from ember.core.indexing.index_usecase import IndexRequest
+
+    repo_root, ember_dir = get_ember_repo_root()
+    db_path = ember_dir / "index.db"
+    sync_mode = _parse_sync_mode(rev, staged, worktree)
+
+    # Quick check optimization
+    if _quick_check_unchanged(repo_root, db_path, sync_mode, reindex):
+        click.echo("✓ No changes detected (quick check)")
+        return
+
+    # Load config and create indexing use case
+    config = TomlConfigProvider().load(ember_dir)
+    indexing_usecase = _create_indexing_usecase(repo_root, db_path, config)
+
+    # Execute indexing with progress reporting
+    request = IndexRequest(
+        repo_root=repo_root,
+        sync_mode=sync_mode,
+        path_filters=[],
+        force_reindex=reindex,
+    )
+
+    from ember.shared.sync_lock import SyncLock
+
+    with (
+        SyncLock(ember_dir / "sync.lock"),
+        progress_context(quiet_mode=ctx.obj.get("quiet", False)) as progress,
+    ):
+        if progress:
+            response = indexing_usecase.execute(request, progress=progress)
+        else:
+            response = indexing_usecase.execute(request)
+
+    if not response.success:
+        raise EmberCliError(
+            f"Indexing failed: {response.error}",
+            hint="Run 'ember sync --reindex' to force a fresh index",
+        )
+
+    _format_sync_results(response)
+
+
+@cli.command()
+@click.option(
+    "--debounce",
+    type=float,
+    default=0.5,
+    show_default=True,
+    help="Seconds of filesystem quiet before syncing a burst of changes.",
+)
+@click.option(
+    "--poll",
+    "force_polling",
+    is_flag=True,
+    help="Poll for changes instead of using inotify.",
+)
+@click.pass_context
+@handle_cli_errors("watch")
+def watch(ctx: click.Context, debounce: float, force_polling: bool) -> None:
+    """Keep the index in sync as files change (runs until interrupted).
+
+    Watches the worktree for changes, debounces bursts such as branch
+    checkouts, and runs incremental syncs in the background. While a watcher
+    is running, `ember find` skips its inline sync and reports whether the
+    index was fully caught up.
+    """
+    from ember.adapters.config.toml_config_provider import TomlConfigProvider
+    from ember.adapters.fs.watcher import PollingWatcher, create_watcher
+    from ember.core.indexing.watch_usecase import WatchUseCase
+    from ember.shared.state_io import save_watch_state
+    from ember.shared.sync_lock import SyncLock
 
     repo_root, ember_dir = get_ember_repo_root()
     db_path = ember_dir / "index.db"
-    sync_mode = _parse_sync_mode(rev, staged, worktree)
+    state_path = ember_dir / "watch.json"
+    quiet = ctx.obj.get("quiet", False)
 
-    # Quick check optimization
-    if _quick_check_unchanged(repo_root, db_path, sync_mode, reindex):
-        click.echo("✓ No changes detected (quick check)")
-        return
+    existing = _load_live_watch_state(ember_dir)
+    if existing is not None:
+        raise EmberCliError(
+            f"Another watcher is already running (PID {existing.pid})",
+            hint="Stop it before starting a new one",
+        )
 
-    # Load config and create indexing use case
     config = TomlConfigProvider().load(ember_dir)
     indexing_usecase = _create_indexing_usecase(repo_root, db_path, config)
+    watcher = PollingWatcher(repo_root) if force_polling else create_watcher(repo_root)
 
-    # Execute indexing with progress reporting
-    request = IndexRequest(
+    def report_sync(response) -> None:
+        if quiet:
+            return
+        if not response.success:
+            click.echo(f"✗ Sync failed: {response.error}", err=True)
+        elif response.files_indexed > 0 or response.chunks_deleted > 0:
+            click.echo(
+                f"✓ Synced {response.files_indexed} file(s), "
+                f"{response.chunks_deleted} chunk(s) deleted",
+                err=True,
+            )
+
+    watch_usecase = WatchUseCase(
+        watcher=watcher,
+        indexing_usecase=indexing_usecase,
         repo_root=repo_root,
-        sync_mode=sync_mode,
-        path_filters=[],
-        force_reindex=reindex,
+        on_state=lambda state: save_watch_state(state, state_path),
+        on_sync=report_sync,
+        debounce_seconds=debounce,
+        sync_lock=SyncLock(ember_dir / "sync.lock"),
     )
 
-    with progress_context(quiet_mode=ctx.obj.get("quiet", False)) as progress:
-        if progress:
-            response = indexing_usecase.execute(request, progress=progress)
-        else:
-            response = indexing_usecase.execute(request)
+    if not quiet:
+        click.echo(f"Watching {repo_root} for changes (Ctrl-C to stop)", err=True)
+    try:
+        watch_usecase.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        state_path.unlink(missing_ok=True)
+        if not quiet:
+            click.echo("Stopped watching", err=True)
 
-    if not response.success:
-        raise EmberCliError(
-            f"Indexing failed: {response.error}",
-            hint="Run 'ember sync --reindex' to force a fresh index",
+
+def _find_across_repos(
+    ctx: click.Context,
+    query: str,
+    repos_spec: str,
+    topk: int | None,
+    json_output: bool,
+    path_filter: str | None,
+    lang_filter: str | None,
+    context: int,
+    rollup: bool,
+    mode: "SearchMode" = "hybrid",
+) -> None:
+    """Run 'ember find' over the indexes of several repositories.
+
+    Indexes are searched as they are, without auto-sync. Results are cached
+    for 'cat' and 'open' when run inside an Ember repository.
+
+    Args:
+        ctx: Click context.
+        query: Search query text.
+        repos_spec: Value of --repos (comma-separated paths or a group file).
+        topk: Number of results (default: from the first repository's config).
+        json_output: Output results as JSON.
+        path_filter: Path glob applied in every repository.
+        lang_filter: Language filter applied in every repository.
+        context: Number of surrounding lines to show for each result.
+        rollup: Replace matching chunks with the chunks containing them.
+        mode: Search mode ("hybrid", "fts" or "vector").
+    """
+    import json
+
+    from ember.adapters.config.toml_config_provider import TomlConfigProvider
+    from ember.core.repo_utils import find_repo_root
+    from ember.domain.entities import Query
+
+    repo_roots = resolve_repo_list(repos_spec, Path.cwd())
+    config = TomlConfigProvider().load(repo_roots[0] / ".ember")
+    if topk is None:
+        topk = config.search.topk
+
+    search_usecase = _create_federated_search_usecase(
+        repo_roots, show_progress=not json_output, load_model=mode != "fts"
+    )
+    results = search_usecase.search(
+        Query(
+            text=query,
+            topk=topk,
+            path_filter=path_filter,
+            lang_filter=lang_filter,
+            json_output=json_output,
+            rollup=rollup,
+            mode=mode,
         )
+    )
 
-    _format_sync_results(response)
+    try:
+        _, ember_dir = find_repo_root()
+    except RuntimeError:
+        ember_dir = None
+    if ember_dir is not None:
+        try:
+            cache_data = ResultPresenter.serialize_for_cache(query, results)
+            (ember_dir / ".last_search.json").write_text(json.dumps(cache_data, indent=2))
+        except Exception as e:
+            if ctx.obj.get("verbose", False):
+                click.echo(f"Warning: Could not cache results: {e}", err=True)
+
+    presenter = ResultPresenter(LocalFileSystem())
+    if json_output:
+        click.echo(presenter.format_json_output(results, context=context, repo_root=Path.cwd()))
+    else:
+        presenter.format_human_output(
+            results, context=context, repo_root=Path.cwd(), config=config
+        )
 
 
 @cli.command()
@@ -690,6 +1472,58 @@ def sync(
     default=0,
     help="Number of surrounding lines to show for each result.",
 )
+@click.option(
+    "--background-sync/--blocking-sync",
+    "background_sync",
+    default=None,
+    help="Search the current index immediately and refresh a stale index in the "
+    "background, flagging results from changed files (default: from config).",
+)
+@click.option(
+    "--rev",
+    type=str,
+    default=None,
+    help="Search a branch, tag, or commit instead of the worktree (indexed on first use).",
+)
+@click.option(
+    "--repos",
+    "repos_spec",
+    type=str,
+    default=None,
+    help="Search several indexed repositories: comma-separated paths, or a file "
+    "listing one repository per line.",
+)
+@click.option(
+    "--rollup",
+    is_flag=True,
+    help="Show the class or other definition containing each match instead of the "
+    "match itself, merging matches in the same parent.",
+)
+@click.option(
+    "--literal",
+    is_flag=True,
+    help="Find chunks containing QUERY exactly (case-sensitive substring).",
+)
+@click.option(
+    "--regex",
+    is_flag=True,
+    help="Find chunks matching QUERY as a Python regular expression.",
+)
+@click.option(
+    "--symbol/--no-symbol",
+    "symbol",
+    default=None,
+    help="Look QUERY up as a symbol name: exact matches, then names starting with it, "
+    "then similar names (default: automatic for identifiers like parse_config "
+    "or UserRepository).",
+)
+@click.option(
+    "--mode",
+    type=click.Choice(["hybrid", "fts", "vector"]),
+    default=None,
+    help="Retrievers to run: BM25 and embeddings (hybrid, the default), BM25 only "
+    "(fts, no model loaded) or embeddings only (vector).",
+)
 @click.pass_context
 @handle_cli_errors("find")
 def find(
@@ -702,10 +1536,25 @@ def find(
     lang_filter: str | None,
     no_sync: bool,
     context: int,
+    background_sync: bool | None,
+    rev: str | None,
+    repos_spec: str | None,
+    rollup: bool,
+    literal: bool,
+    regex: bool,
+    symbol: bool | None,
+    mode: str | None,
 ) -> None:
     """Search for code matching the query.
 
-    Performs hybrid search (BM25 + semantic embeddings).
+    Performs hybrid search (BM25 + semantic embeddings), or exact substring
+    or regex search with --literal / --regex (ranked by number of matches,
+    without loading the embedding model).
+    Queries written like identifiers (parse_config, UserRepository) are
+    first looked up as symbol names, falling back to hybrid search if no
+    symbol matches; --symbol forces the lookup, --no-symbol skips it.
+    --mode fts runs BM25 alone without loading the embedding model, and
+    --mode vector runs embedding search alone.
     Can be run from any subdirectory within the repository.
 
     If PATH is provided, searches only within that path (relative to current directory).
@@ -713,7 +1562,58 @@ def find(
         ember find "query"           # Search entire repo
         ember find "query" .          # Search current directory subtree
         ember find "query" src/       # Search src/ subtree
+        ember find "query" --rev release/2.x  # Search another branch
+        ember find "query" --repos ../api,../web  # Search several repos
+        ember find "query" --rollup  # Show classes containing matching methods
+        ember find "/v2/users" --literal  # Exact substring
+        ember find "retry_after_[a-z]+" --regex  # Regular expression
+        ember find UserRepo --symbol  # Symbol names starting with UserRepo
+        ember find "retry policy" --mode fts  # Keywords only, no model
     """
+    if literal and regex:
+        raise EmberCliError(
+            "Cannot use both --literal and --regex",
+            hint="Use --literal for a plain substring, or --regex for an expression",
+        )
+    if (literal or regex) and (rollup or repos_spec is not None):
+        raise EmberCliError("Cannot use --rollup or --repos with --literal or --regex")
+    if symbol and (literal or regex or rollup or repos_spec is not None):
+        raise EmberCliError("Cannot use --literal, --regex, --rollup or --repos with --symbol")
+    if mode is not None and (literal or regex or symbol):
+        raise EmberCliError("Cannot use --mode with --literal, --regex or --symbol")
+    # click.Choice has validated the value
+    mode = cast("SearchMode", mode or "hybrid")
+    if regex:
+        import re
+
+        try:
+            re.compile(query)
+        except re.error as e:
+            raise EmberCliError(
+                f"Invalid regular expression: {e}",
+                hint="Use --literal to search for the text as written",
+            ) from e
+
+    if repos_spec is not None:
+        if path is not None or rev is not None:
+            raise EmberCliError(
+                "Cannot use PATH or --rev with --repos",
+                hint="Use --in to filter paths in every repository",
+            )
+        _find_across_repos(
+            ctx,
+            query,
+            repos_spec,
+            topk,
+            json_output,
+            path_filter,
+            lang_filter,
+            context,
+            rollup,
+            mode,
+        )
+        return
+
     repo_root, ember_dir = get_ember_repo_root()
     db_path = ember_dir / "index.db"
 
@@ -749,37 +1649,34 @@ def find(
     if topk is None:
         topk = config.search.topk
 
+    # A running `ember watch` keeps the index fresh in the background, so
+    # skip the inline staleness check and report its freshness instead
+    watch_state = _load_live_watch_state(ember_dir)
+
+    # Searching another ref: index it on first use instead of syncing the worktree
+    ref = None
+    if rev is not None:
+        ref = _ensure_ref_indexed(repo_root, ember_dir, config, rev, not json_output)
+        no_sync = True
+        watch_state = None
+
     # Auto-sync: Check if index is stale and sync if needed (unless --no-sync)
     # Use ensure_synced - show progress unless in JSON output mode
-    if not no_sync:
-        ensure_synced(
+    if background_sync is None:
+        background_sync = config.search.background_sync
+    sync_result = None
+    if not no_sync and watch_state is None:
+        sync_result = ensure_synced(
             repo_root=repo_root,
             db_path=db_path,
             config=config,
             show_progress=not json_output,  # Show progress in human mode
             verbose=ctx.obj.get("verbose", False),
+            background=background_sync,
         )
 
     # Lazy imports - only load heavy dependencies when find is actually called
-    from ember.adapters.fts.sqlite_fts import SQLiteFTS
-    from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
-    from ember.adapters.vss.sqlite_vec_adapter import SqliteVecAdapter
-    from ember.core.retrieval.search_usecase import SearchUseCase
-    from ember.domain.entities import Query
-
-    # Initialize dependencies
-    text_search = SQLiteFTS(db_path)
-    vector_search = SqliteVecAdapter(db_path)
-    chunk_repo = SQLiteChunkRepository(db_path)
-    embedder = _create_embedder(config)
-
-    # Create search use case
-    search_usecase = SearchUseCase(
-        text_search=text_search,
-        vector_search=vector_search,
-        chunk_repo=chunk_repo,
-        embedder=embedder,
-    )
+    from ember.domain.entities import IndexFreshness, Query
 
     # Create query object
     query_obj = Query(
@@ -788,10 +1685,52 @@ def find(
         path_filter=path_filter,
         lang_filter=lang_filter,
         json_output=json_output,
+        ref=ref,
+        rollup=rollup,
+        mode=mode,
     )
 
-    # Execute search
-    results = search_usecase.search(query_obj)
+    # Execute search (literal, regex, symbol and fts search need no embedding model)
+    if literal or regex:
+        results = _search_literal(db_path, config, query_obj, regex=regex)
+    elif symbol:
+        results = _search_symbols(db_path, config, query_obj, fuzzy=True)
+    else:
+        results = []
+        if symbol is None and not rollup and mode != "vector":
+            from ember.core.retrieval.symbol_search import looks_like_symbol
+
+            if looks_like_symbol(query):
+                # Only exact and prefix matches, so typos still get hybrid search
+                results = _search_symbols(db_path, config, query_obj, fuzzy=False)
+        if not results:
+            results = _create_search_usecase(
+                db_path, config, load_model=mode != "fts"
+            ).search(query_obj)
+
+    # Index is being refreshed behind us: flag results from changed files
+    if sync_result is not None and sync_result.in_progress:
+        from ember.adapters.sqlite.file_repository import SQLiteFileRepository
+        from ember.core.retrieval.staleness import StaleResultDetector
+        from ember.shared.shard_io import shard_db_path
+
+        # Each shard tracks the files it indexes in its own database
+        layout = _resolve_shard_layout(ember_dir, config)
+        shard_file_repos: dict[str, SQLiteFileRepository] = {}
+
+        def shard_file_repo(rel_path: Path) -> SQLiteFileRepository:
+            shard = layout.shard_of(rel_path)
+            if shard not in shard_file_repos:
+                shard_file_repos[shard] = SQLiteFileRepository(shard_db_path(ember_dir, shard))
+            return shard_file_repos[shard]
+
+        detector = StaleResultDetector(
+            LocalFileSystem(),
+            SQLiteFileRepository(db_path),
+            repo_root,
+            file_repo_for=shard_file_repo if layout.is_sharded else None,
+        )
+        results = detector.mark(results)
 
     # Cache results for cat/open commands
     cache_path = ember_dir / ".last_search.json"
@@ -808,10 +1747,31 @@ def find(
     # Display results
     presenter = ResultPresenter(LocalFileSystem())
     if json_output:
-        click.echo(presenter.format_json_output(results, context=context, repo_root=repo_root))
+        # A ref is indexed in full before it is searched
+        freshness = (
+            IndexFreshness(caught_up=True)
+            if ref is not None
+            else _index_freshness(watch_state, sync_result)
+        )
+        click.echo(
+            presenter.format_json_output(
+                results, context=context, repo_root=repo_root, freshness=freshness
+            )
+        )
     else:
         presenter.format_human_output(results, context=context, repo_root=repo_root, config=config)
 
+    if watch_state is not None and not watch_state.is_caught_up:
+        reason = watch_state.last_error or "watcher is still indexing recent changes"
+        click.echo(f"Note: index not fully caught up ({reason})", err=True)
+    elif sync_result is not None and sync_result.in_progress:
+        stale_count = sum(1 for r in results if r.stale)
+        click.echo(
+            f"Note: index is being refreshed in the background "
+            f"({stale_count} result(s) from changed files flagged stale)",
+            err=True,
+        )
+
 
 @cli.command()
 @click.argument("path", type=str, required=False, default=None)
@@ -850,6 +1810,13 @@ def find(
     is_flag=True,
     help="Skip auto-sync check before searching.",
 )
+@click.option(
+    "--mode",
+    type=click.Choice(["hybrid", "fts", "vector"]),
+    default="hybrid",
+    help="Initial search mode (cycle with Ctrl-R). In fts mode the embedding model "
+    "is only loaded when switching to another mode.",
+)
 @click.pass_context
 @handle_cli_errors("search")
 def search(
@@ -861,11 +1828,13 @@ def search(
     no_preview: bool,
     no_scores: bool,
     no_sync: bool,
+    mode: str,
 ) -> None:
     """Interactive semantic search interface.
 
     Opens an fzf-style interactive search UI with real-time results,
     keyboard navigation, preview pane, and direct file opening.
+    Ctrl-R cycles between hybrid, fts (keywords only) and vector search.
 
     Can be run from any subdirectory within the repository.
 
@@ -929,34 +1898,37 @@ def search(
         )
 
     # Lazy imports
-    from ember.adapters.fts.sqlite_fts import SQLiteFTS
-    from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+    import threading
+
     from ember.adapters.tui.search_ui import InteractiveSearchUI
-    from ember.adapters.vss.sqlite_vec_adapter import SqliteVecAdapter
-    from ember.core.retrieval.search_usecase import SearchUseCase
     from ember.domain.entities import Query
 
-    # Initialize search dependencies
-    text_search = SQLiteFTS(db_path)
-    vector_search = SqliteVecAdapter(db_path)
-    chunk_repo = SQLiteChunkRepository(db_path)
-    embedder = _create_embedder(config, show_progress=False)  # No progress for interactive
-
-    # Create search use case
-    search_usecase = SearchUseCase(
-        text_search=text_search,
-        vector_search=vector_search,
-        chunk_repo=chunk_repo,
-        embedder=embedder,
+    # No progress for interactive. The model is loaded before the UI starts,
+    # so daemon errors are shown cleanly (#126), unless starting in fts mode
+    search_usecase = _create_search_usecase(
+        db_path, config, show_progress=False, load_model=mode != "fts"
     )
+    model_loaded = mode != "fts"
+    model_lock = threading.Lock()
 
-    # Create search function wrapper
+    # Create search function wrapper, loading the model on first use
     def search_fn(query: Query) -> list:
+        nonlocal search_usecase, model_loaded
+        if query.mode != "fts" and not model_loaded:
+            with model_lock:
+                if not model_loaded:
+                    search_usecase = _create_search_usecase(db_path, config, show_progress=False)
+                    model_loaded = True
         return search_usecase.search(query)
 
+    def text_search_fn(query: Query) -> list:
+        return search_usecase.search_text(query)
+
     # Create and run interactive UI
     ui = InteractiveSearchUI(
         search_fn=search_fn,
+        text_search_fn=text_search_fn,
+        search_mode=cast("SearchMode", mode),  # Validated by click.Choice
         config=config,
         initial_query="",  # Always start with empty query, user types interactively
         topk=topk,
@@ -1010,9 +1982,8 @@ def cat(ctx: click.Context, identifier: str, context: int) -> None:
     else:
         from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
 
-        db_path = ember_dir / "index.db"
-        chunk_repo = SQLiteChunkRepository(db_path)
-        result = lookup_result_by_hash(identifier, chunk_repo)
+        chunk_repos = [SQLiteChunkRepository(path) for path in _shard_db_paths(ember_dir, config)]
+        result = lookup_result_by_hash(identifier, *chunk_repos)
 
     # Display header
     display_index = int(identifier) if is_numeric else None
@@ -1059,8 +2030,8 @@ def open_result(ctx: click.Context, index: int) -> None:
     # Validate and get the result
     result = validate_result_index(index, results)
 
-    # Build absolute file path
-    file_path = repo_root / result["path"]
+    # Build absolute file path (results from 'find --repos' name their repository)
+    file_path = Path(result.get("repo") or repo_root) / result["path"]
     line_num = result["start_line"]
 
     # Show what we're doing (if not quiet)
@@ -1074,32 +2045,229 @@ def open_result(ctx: click.Context, index: int) -> None:
 
 
 @cli.command()
-@click.argument("output_path", type=click.Path())
+@click.argument("output_path", type=click.Path(dir_okay=False))
 @click.option(
     "--no-preview",
     is_flag=True,
     help="Strip content from export (embeddings only).",
 )
+@click.option(
+    "--quantize",
+    is_flag=True,
+    help="Store vectors as int8 (about 4x smaller, negligible ranking change).",
+)
 @click.pass_context
-def export(ctx: click.Context, output_path: str, no_preview: bool) -> None:
+@handle_cli_errors("export")
+def export(ctx: click.Context, output_path: str, no_preview: bool, quantize: bool) -> None:
     """Export index to a bundle.
 
-    Creates a portable bundle for sharing or backup.
+    Creates a portable bundle for sharing or backup. Build it in CI after
+    `ember sync`, then load it elsewhere with `ember import` to skip
+    embedding the whole repository.
+
+    With --no-preview, chunk content is left out: the bundle carries only
+    locations, hashes, and embeddings, so keyword search and previews are
+    unavailable for imported chunks until their files change and are
+    re-indexed locally.
     """
-    click.echo("export command - not yet implemented")
-    click.echo(f"Would export to: {output_path}")
+    from ember.adapters.bundle.jsonl_bundle import JsonlBundleWriter
+    from ember.adapters.config.toml_config_provider import TomlConfigProvider
+    from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
+    from ember.adapters.sqlite.snapshot_repository import SQLiteIndexSnapshotRepository
+    from ember.core.export.export_usecase import ExportRequest, ExportUseCase
+
+    repo_root, ember_dir = get_ember_repo_root()
+    db_path = ember_dir / "index.db"
+    _require_unsharded(TomlConfigProvider().load(ember_dir), "export")
+
+    with (
+        SQLiteIndexSnapshotRepository(db_path) as snapshot_repo,
+        SQLiteMetaRepository(db_path) as meta_repo,
+    ):
+        use_case = ExportUseCase(
+            snapshot_repo=snapshot_repo,
+            meta_repo=meta_repo,
+            bundle_writer=JsonlBundleWriter(Path(output_path)),
+        )
+        response = use_case.execute(
+            ExportRequest(repo_root=repo_root, include_content=not no_preview, quantize=quantize)
+        )
+
+        if not response.success:
+            raise EmberCliError(
+                f"Export failed: {response.error}",
+                hint="Run 'ember sync' first to build the index",
+            )
+
+        if not ctx.obj.get("quiet", False):
+            size_mb = response.bundle_bytes / (1024 * 1024)
+            click.echo(f"✓ Exported {response.chunks_exported} chunks to {output_path} ({size_mb:.1f} MB)")
+            click.echo(f"  • {response.vectors_exported} vectors ({'int8' if quantize else 'float32'})")
+            assert response.tree_sha is not None  # Always set on success
+            click.echo(f"  • Tree SHA: {response.tree_sha[:12]}...")
+            if no_preview:
+                click.echo("  • Content stripped (--no-preview)")
 
 
 @cli.command()
-@click.argument("bundle_path", type=click.Path(exists=True))
+@click.argument("bundle_path", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--no-sync",
+    is_flag=True,
+    help="Skip the incremental sync that catches up with local changes.",
+)
 @click.pass_context
-def import_bundle(ctx: click.Context, bundle_path: str) -> None:
+@handle_cli_errors("import")
+def import_bundle(ctx: click.Context, bundle_path: str, no_sync: bool) -> None:
     """Import index from a bundle.
 
-    Loads a previously exported index bundle.
+    Loads a previously exported index bundle, replacing the current index,
+    then runs an incremental sync to index local changes since the bundle
+    was built. The bundle must have been built with the same embedding
+    model configuration as this repository.
+    """
+    import blake3
+
+    from ember.adapters.bundle.jsonl_bundle import JsonlBundleReader
+    from ember.adapters.config.toml_config_provider import TomlConfigProvider
+    from ember.adapters.git_cmd.git_adapter import GitAdapter
+    from ember.adapters.local_models.registry import create_embedder
+    from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
+    from ember.adapters.sqlite.snapshot_repository import SQLiteIndexSnapshotRepository
+    from ember.core.export.import_usecase import ImportRequest, ImportUseCase
+    from ember.core.indexing.index_usecase import IndexRequest
+    from ember.shared.sync_lock import SyncLock
+
+    repo_root, ember_dir = get_ember_repo_root()
+    db_path = ember_dir / "index.db"
+    quiet = ctx.obj.get("quiet", False)
+    config = TomlConfigProvider().load(ember_dir)
+    _require_unsharded(config, "import")
+
+    # Fingerprint only; the model is not loaded
+    model_fingerprint = create_embedder(
+        model_name=config.index.model,
+        backend=config.model.backend,
+        quantize=config.model.quantize,
+        **_model_tuning(config),
+    ).fingerprint()
+
+    embedding_cache = None
+    if config.index.embedding_cache:
+        from ember.adapters.sqlite.embedding_cache import SQLiteEmbeddingCache
+
+        embedding_cache = SQLiteEmbeddingCache(max_size_mb=config.index.embedding_cache_mb)
+
+    with SyncLock(ember_dir / "sync.lock"):
+        bundle_reader = JsonlBundleReader(Path(bundle_path))
+        with (
+            SQLiteIndexSnapshotRepository(db_path) as snapshot_repo,
+            SQLiteMetaRepository(db_path) as meta_repo,
+        ):
+            use_case = ImportUseCase(
+                snapshot_repo=snapshot_repo,
+                meta_repo=meta_repo,
+                bundle_reader=bundle_reader,
+                vcs=GitAdapter(repo_root),
+                project_id=blake3.blake3(str(repo_root).encode("utf-8")).hexdigest(),
+                embedding_cache=embedding_cache,
+            )
+            try:
+                response = use_case.execute(
+                    ImportRequest(repo_root=repo_root, model_fingerprint=model_fingerprint)
+                )
+            finally:
+                bundle_reader.close()
+                if embedding_cache is not None:
+                    embedding_cache.close()
+
+            if not response.success:
+                raise EmberCliError(
+                    f"Import failed: {response.error}",
+                    hint="The current index was left unchanged",
+                )
+
+            if not quiet:
+                click.echo(f"✓ Imported {response.chunks_imported} chunks from {bundle_path}")
+                click.echo(f"  • {response.vectors_imported} vectors")
+                assert response.tree_sha is not None  # Always set on success
+                click.echo(f"  • Tree SHA: {response.tree_sha[:12]}...")
+                if not response.include_content:
+                    click.echo("  • Bundle has no content (--no-preview); previews are unavailable")
+                if not response.tree_available:
+                    click.echo(
+                        "  • Bundle tree not found locally; next sync is a full one "
+                        "(bundle embeddings are reused from the shared cache)"
+                    )
+
+        if no_sync:
+            return
+        if _quick_check_unchanged(repo_root, db_path, "worktree", reindex=False):
+            if not quiet:
+                click.echo("✓ No local changes since the bundle was built")
+            return
+
+        indexing_usecase = _create_indexing_usecase(repo_root, db_path, config)
+        request = IndexRequest(repo_root=repo_root, sync_mode="worktree", path_filters=[])
+        with progress_context(quiet_mode=quiet) as progress:
+            if progress:
+                sync_response = indexing_usecase.execute(request, progress=progress)
+            else:
+                sync_response = indexing_usecase.execute(request)
+
+    if not sync_response.success:
+        raise EmberCliError(
+            f"Sync after import failed: {sync_response.error}",
+            hint="The bundle was imported; run 'ember sync' to retry",
+        )
+    if not quiet:
+        _format_sync_results(sync_response)
+
+
+@cli.command(name="rebuild-fts")
+@click.option(
+    "--tokenizer",
+    type=click.Choice(["code", "porter"]),
+    default=None,
+    help="Full-text search mode (default: index.fts_tokenizer from config).",
+)
+@click.option(
+    "--trigram/--no-trigram",
+    "trigram_index",
+    default=None,
+    help="Add or drop the trigram index for --literal and --regex searches "
+    "(default: index.trigram_index from config).",
+)
+@click.pass_context
+@handle_cli_errors("rebuild-fts")
+def rebuild_fts(ctx: click.Context, tokenizer: str | None, trigram_index: bool | None) -> None:
+    """Rebuild the full-text indexes with the configured tokenizers.
+
+    Reindexes the stored chunks for keyword search, e.g. to switch an index
+    created before code-aware tokenization to it, or to add the trigram
+    index. Chunks and embeddings are kept, so nothing is re-embedded.
     """
-    click.echo("import command - not yet implemented")
-    click.echo(f"Would import from: {bundle_path}")
+    from ember.adapters.config.toml_config_provider import TomlConfigProvider
+    from ember.adapters.sqlite.schema import rebuild_fts as rebuild_fts_index
+    from ember.shared.sync_lock import SyncLock
+
+    _repo_root, ember_dir = get_ember_repo_root()
+    config = TomlConfigProvider().load(ember_dir)
+    tokenizer = tokenizer or config.index.fts_tokenizer
+    if trigram_index is None:
+        trigram_index = config.index.trigram_index
+
+    with SyncLock(ember_dir / "sync.lock"):
+        chunks = sum(
+            rebuild_fts_index(shard_db, tokenizer, trigram_index)
+            for shard_db in _shard_db_paths(ember_dir, config)
+        )
+
+    if not ctx.obj.get("quiet", False):
+        trigrams = ", with trigram index" if trigram_index else ""
+        click.echo(
+            f"✓ Rebuilt full-text index of {chunks} chunks ({tokenizer} tokenizer{trigrams})"
+        )
 
 
 @cli.command()
@@ -1146,6 +2314,7 @@ def status(ctx: click.Context) -> None:
     vcs = GitAdapter(repo_root)
     chunk_repo = SQLiteChunkRepository(db_path)
     meta_repo = SQLiteMetaRepository(db_path)
+    shard_dbs = _shard_db_paths(ember_dir, config)[1:]
 
     # Execute status use case
     use_case = StatusUseCase(
@@ -1153,6 +2322,7 @@ def status(ctx: click.Context) -> None:
         chunk_repo=chunk_repo,
         meta_repo=meta_repo,
         config=config,
+        shard_repos=[SQLiteChunkRepository(path) for path in shard_dbs],
     )
 
     response = use_case.execute(StatusRequest(repo_root=repo_root))
@@ -1169,6 +2339,8 @@ def status(ctx: click.Context) -> None:
     click.echo("Index Status:")
     click.echo(f"  Indexed files: {response.indexed_files}")
     click.echo(f"  Total chunks: {response.total_chunks}")
+    if shard_dbs:
+        click.echo(f"  Shards: {len(shard_dbs) + 1} ({config.index.sharding})")
 
     if response.last_tree_sha:
         if response.is_stale:
@@ -1180,6 +2352,11 @@ def status(ctx: click.Context) -> None:
         click.echo(f"  Status: {click.style('⚠ Never synced', fg='yellow')}")
         click.echo("    Run 'ember sync' to index your repository")
 
+    watch_state = _load_live_watch_state(ember_dir)
+    if watch_state is not None:
+        watch_label = "caught up" if watch_state.is_caught_up else watch_state.status
+        click.echo(f"  Watcher: running (PID {watch_state.pid}, {watch_label})")
+
     # Show configuration
     if response.config:
         click.echo("\nConfiguration:")
@@ -1272,6 +2449,127 @@ def config_show(
             click.echo(f"  Error loading config: {e}")
 
 
+def _run_autotune(config, config_path: Path, db_path: Path | None, quiet: bool) -> None:
+    """Calibrate embedding settings on this machine and save them to config.
+
+    Args:
+        config: EmberConfig with the model to calibrate
+        config_path: Config file to write the results to
+        db_path: Index database to sample chunks from (None = synthetic samples)
+        quiet: Suppress per-trial output
+    """
+    from ember.adapters.local_models.calibration import LocalEmbedderBenchmark
+    from ember.core.config.autotune_usecase import (
+        AutotuneRequest,
+        AutotuneUseCase,
+        sample_chunk_texts,
+        synthetic_sample_texts,
+    )
+    from ember.shared.config_io import update_config_section
+
+    samples: list[str] = []
+    if db_path is not None and db_path.exists():
+        from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+
+        with SQLiteChunkRepository(db_path) as chunk_repo:
+            samples = sample_chunk_texts([c.content for c in chunk_repo.list_all()])
+    if not samples:
+        samples = synthetic_sample_texts()
+
+    if not quiet:
+        click.echo(f"Calibrating {config.index.model} on {len(samples)} sample chunks...")
+
+    benchmark = LocalEmbedderBenchmark(
+        model_name=config.index.model,
+        backend=config.model.backend,
+        quantize=config.model.quantize,
+    )
+    try:
+        response = AutotuneUseCase(benchmark).execute(AutotuneRequest(sample_texts=samples))
+    finally:
+        benchmark.close()
+
+    if not quiet:
+        for trial in response.trials:
+            result = (
+                click.style("out of memory", fg="red")
+                if trial.out_of_memory
+                else f"{trial.texts_per_second:.1f} chunks/s"
+            )
+            click.echo(
+                f"  batch={trial.batch_size:<4} threads={trial.threads:<3} "
+                f"max_seq_length={trial.max_seq_length:<5} {result}"
+            )
+
+    if not response.success:
+        raise EmberCliError(
+            f"Calibration failed: {response.error}",
+            hint="Try a smaller model with 'ember init --force --model minilm'",
+        )
+
+    values = {
+        "batch_size": response.batch_size,
+        "threads": response.threads,
+        # 0 keeps the model default (and the existing index fingerprint)
+        "max_seq_length": response.max_seq_length if response.max_seq_length_reduced else 0,
+    }
+    try:
+        update_config_section(config_path, "model", values)
+    except (ValueError, TypeError, OSError) as e:
+        raise EmberCliError(
+            f"Failed to save calibration to {config_path}: {e}",
+            hint="Fix the config file with 'ember config edit' and try again",
+        ) from e
+
+    click.echo(
+        f"✓ Saved batch_size={response.batch_size}, threads={response.threads} "
+        f"({response.texts_per_second:.1f} chunks/s) to {config_path}"
+    )
+    if response.max_seq_length_reduced:
+        click.echo(
+            f"  max_seq_length reduced to {response.max_seq_length} to fit in memory; "
+            "the next sync will re-embed the index"
+        )
+    if not quiet:
+        click.echo("  Run 'ember daemon stop' so the daemon restarts with the new settings")
+
+
+@config.command(name="tune")
+@click.option(
+    "--local",
+    "-l",
+    "save_local",
+    is_flag=True,
+    help="Save to the repo's .ember/config.toml instead of the global config.",
+)
+@click.pass_context
+def config_tune(ctx: click.Context, save_local: bool) -> None:
+    """Calibrate embedding batch size and threads for this machine.
+
+    Times the embedding model on sample chunks from the index (or built-in
+    samples) across batch sizes and thread counts, then saves the fastest
+    settings that fit in memory. Results go to the global config by default,
+    since they depend on the hardware rather than the repository.
+    """
+    from ember.adapters.config.toml_config_provider import TomlConfigProvider
+    from ember.shared.config_io import get_global_config_path
+
+    quiet = ctx.obj.get("quiet", False)
+
+    ember_dir = None
+    try:
+        _, ember_dir = get_ember_repo_root()
+    except Exception:
+        if save_local:
+            raise
+    if ember_dir is None:
+        ember_dir = Path.home() / ".ember"
+
+    config = TomlConfigProvider().load(ember_dir)
+    config_path = ember_dir / "config.toml" if save_local else get_global_config_path()
+    _run_autotune(config, config_path, ember_dir / "index.db", quiet)
+
+
 @config.command(name="edit")
 @click.option(
     "--global", "-g", "edit_global", is_flag=True, help="Edit global config file"
@@ -1392,7 +2690,14 @@ def start(ctx: click.Context, foreground: bool) -> None:
         # Foreground mode uses direct lifecycle management
         from ember.adapters.daemon.lifecycle import DaemonLifecycle
 
-        lifecycle = DaemonLifecycle(idle_timeout=config.model.daemon_timeout)
+        lifecycle = DaemonLifecycle(
+            idle_timeout=config.model.daemon_timeout,
+            backend=config.model.backend,
+            quantize=config.model.quantize,
+            workers=config.model.daemon_workers,
+            threads=config.model.threads,
+            **_model_tuning(config),
+        )
 
         if lifecycle.is_running():
             click.echo("✓ Daemon is already running")
@@ -1411,7 +2716,14 @@ def start(ctx: click.Context, foreground: bool) -> None:
         from ember.adapters.daemon.lifecycle import DaemonLifecycle
 
         quiet = ctx.obj.get("quiet", False)
-        daemon_manager = DaemonLifecycle(idle_timeout=config.model.daemon_timeout)
+        daemon_manager = DaemonLifecycle(
+            idle_timeout=config.model.daemon_timeout,
+            backend=config.model.backend,
+            quantize=config.model.quantize,
+            workers=config.model.daemon_workers,
+            threads=config.model.threads,
+            **_model_tuning(config),
+        )
         if ensure_daemon_with_progress(daemon_manager, quiet=quiet):
             if not quiet:
                 click.echo("✓ Daemon started successfully")
@@ -0,0 +1,75 @@
+"""Detached background sync worker.
+
+Spawned by `ember find --background-sync` when the index is stale, so the
+search can answer immediately from the current index while this process
+brings it up to date. Holds .ember/sync.lock for the duration of the sync;
+if another writer already holds it, the worker exits without doing anything.
+
+Usage:
+    python -m ember.entrypoints.sync_worker --repo-root PATH --ember-dir PATH
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def run_sync(repo_root: Path, ember_dir: Path) -> int:
+    """Run an incremental worktree sync under the sync lock.
+
+    Args:
+        repo_root: Repository root path.
+        ember_dir: Path to .ember/ directory.
+
+    Returns:
+        Process exit code (0 on success or if another sync is running).
+    """
+    from ember.adapters.config.toml_config_provider import TomlConfigProvider
+    from ember.core.indexing.index_usecase import IndexRequest
+    from ember.entrypoints.cli import _create_indexing_usecase
+    from ember.shared.sync_lock import SyncLock
+
+    lock = SyncLock(ember_dir / "sync.lock")
+    if not lock.acquire(blocking=False):
+        logger.info("Another sync is already running; exiting")
+        return 0
+
+    try:
+        config = TomlConfigProvider().load(ember_dir)
+        indexing_usecase = _create_indexing_usecase(repo_root, ember_dir / "index.db", config)
+        response = indexing_usecase.execute(IndexRequest(repo_root=repo_root))
+        if not response.success:
+            logger.error(f"Background sync failed: {response.error}")
+            return 1
+        logger.info(f"Background sync indexed {response.files_indexed} file(s)")
+        return 0
+    finally:
+        lock.release()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments and run the background sync.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(description="Ember background sync worker")
+    parser.add_argument("--repo-root", type=Path, required=True, help="Repository root")
+    parser.add_argument("--ember-dir", type=Path, required=True, help="Path to .ember directory")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    return run_sync(args.repo_root.resolve(), args.ember_dir.resolve())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
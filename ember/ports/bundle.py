@@ -0,0 +1,146 @@
+"""Index bundle port for exporting and importing prebuilt indexes.
+
+A bundle is a portable snapshot of an index: chunk metadata, embeddings,
+and per-file hashes, plus the model fingerprint and tree SHA they were built
+from. CI can build one bundle per commit so developers start from it instead
+of embedding the whole repository locally.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from ember.domain.entities import Chunk
+
+# Bundle format version written by this release; readers reject newer ones
+BUNDLE_FORMAT_VERSION = 1
+
+# Supported vector encodings
+VECTOR_ENCODINGS = ("float32", "int8")
+
+
+@dataclass(frozen=True)
+class BundleHeader:
+    """Metadata describing a bundle, written before any records.
+
+    Attributes:
+        format_version: Bundle format version.
+        model_fingerprint: Fingerprint of the model that produced the vectors.
+        tree_sha: Git tree SHA the index was last synced to.
+        sync_mode: Sync mode of that sync (worktree, staged, or commit SHA).
+        vector_encoding: How vectors are stored ("float32" or "int8").
+        include_content: False if chunk content was stripped (--no-preview).
+        created_at: Export timestamp (seconds since the epoch).
+    """
+
+    format_version: int
+    model_fingerprint: str
+    tree_sha: str
+    sync_mode: str
+    vector_encoding: str = "float32"
+    include_content: bool = True
+    created_at: float = 0.0
+
+
+@dataclass(frozen=True)
+class BundleFile:
+    """State of an indexed file, used to detect stale results after import.
+
+    Attributes:
+        path: File path relative to the repository root.
+        file_hash: blake3 hash of the file content when indexed.
+        size: File size in bytes.
+    """
+
+    path: Path
+    file_hash: str
+    size: int
+
+
+class BundleWriter(Protocol):
+    """Streams an index into a bundle.
+
+    Records must be written in order: the header, then all files, then all
+    chunks. Nothing is visible at the destination until close() succeeds.
+    """
+
+    def write_header(self, header: BundleHeader) -> None:
+        """Start the bundle.
+
+        Args:
+            header: Bundle metadata.
+        """
+        ...
+
+    def write_file(self, file: BundleFile) -> None:
+        """Append a file record.
+
+        Args:
+            file: Indexed file state.
+        """
+        ...
+
+    def write_chunk(self, chunk: Chunk, embedding: list[float] | None) -> None:
+        """Append a chunk record.
+
+        Args:
+            chunk: Chunk to store (its id and project_id are not stored).
+            embedding: The chunk's vector, or None if it has none.
+        """
+        ...
+
+    def close(self) -> int:
+        """Finish the bundle and move it into place.
+
+        Returns:
+            Size of the bundle in bytes.
+        """
+        ...
+
+    def abort(self) -> None:
+        """Discard a partially written bundle."""
+        ...
+
+
+class BundleReader(Protocol):
+    """Streams an index out of a bundle.
+
+    Files must be read before chunks, since records are read sequentially.
+    """
+
+    def read_header(self) -> BundleHeader:
+        """Read bundle metadata.
+
+        Returns:
+            The bundle header.
+
+        Raises:
+            ValueError: If the file is not a bundle or its version is unsupported.
+        """
+        ...
+
+    def iter_files(self) -> Iterator[BundleFile]:
+        """Iterate over file records.
+
+        Yields:
+            Indexed file states.
+        """
+        ...
+
+    def iter_chunks(self) -> Iterator[tuple[Chunk, list[float] | None]]:
+        """Iterate over chunk records.
+
+        Chunks have empty id and project_id; the importer assigns them.
+
+        Yields:
+            Tuples of (chunk, embedding or None).
+
+        Raises:
+            ValueError: If the bundle is corrupt or truncated.
+        """
+        ...
+
+    def close(self) -> None:
+        """Close the bundle."""
+        ...
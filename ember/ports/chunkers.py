@@ -4,6 +4,7 @@ This module defines the protocol for chunking code into semantic units.
 Chunkers take file content and return structured chunk data.
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
@@ -60,3 +61,42 @@ class Chunker(Protocol):
             Set of language codes this chunker supports (e.g., {"py", "ts"}).
         """
         ...
+
+
+class StreamingChunker(Chunker, Protocol):
+    """Port for chunkers that can also chunk files too large to hold in memory.
+
+    Streaming chunkers work on the raw bytes of a file (e.g. a memory map) and
+    produce chunks one at a time, so only the current chunk is decoded.
+    """
+
+    def iter_chunks(self, data: bytes, lang: str) -> Iterator[ChunkData]:
+        """Lazily chunk raw file content.
+
+        Args:
+            data: File content as bytes, or a bytes-like memory map.
+            lang: Language identifier (passed through to ChunkData).
+
+        Yields:
+            ChunkData objects in file order.
+        """
+        ...
+
+
+class TokenCounter(Protocol):
+    """Port for counting tokens the way the embedding model will.
+
+    Lets chunking size chunks to the model's context window instead of
+    leaving the embedder to truncate them.
+    """
+
+    def count_tokens(self, texts: list[str]) -> list[int]:
+        """Count the tokens of each text, excluding special tokens.
+
+        Args:
+            texts: Texts to count.
+
+        Returns:
+            Token count per text, in the same order.
+        """
+        ...
@@ -44,3 +44,39 @@ class Embedder(Protocol):
             RuntimeError: If model fails to load or embed.
         """
         ...
+
+
+class EmbeddingBenchmark(Protocol):
+    """Protocol for timing an embedding model under different settings.
+
+    Used to calibrate batch size, thread count, and sequence length for the
+    current machine.
+    """
+
+    @property
+    def default_max_seq_length(self) -> int:
+        """The model's default truncation length in tokens."""
+        ...
+
+    def measure(
+        self,
+        texts: list[str],
+        batch_size: int,
+        max_seq_length: int,
+        threads: int,
+    ) -> float:
+        """Embed texts once with the given settings and time it.
+
+        Args:
+            texts: Sample texts to embed.
+            batch_size: Batch size (sets the per-batch token budget).
+            max_seq_length: Token truncation length.
+            threads: Intra-op inference threads.
+
+        Returns:
+            Throughput in texts per second.
+
+        Raises:
+            MemoryError: If the settings run out of memory.
+        """
+        ...
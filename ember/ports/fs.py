@@ -4,6 +4,7 @@ Defines abstract interface for file system operations.
 Enables testing and potential alternative storage backends.
 """
 
+from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Protocol
 
@@ -25,6 +26,38 @@ class FileSystem(Protocol):
         """
         ...
 
+    def size(self, path: Path) -> int:
+        """Get the size of a file without reading it.
+
+        Args:
+            path: Absolute path to file.
+
+        Returns:
+            File size in bytes.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+        """
+        ...
+
+    def map(self, path: Path) -> AbstractContextManager[bytes]:
+        """Map a file into memory for reading.
+
+        Pages are loaded on access, so large files can be scanned without
+        holding their content in memory.
+
+        Args:
+            path: Absolute path to file.
+
+        Returns:
+            Context manager yielding the file content as a bytes-like object
+            (supports len, slicing and find), valid until the context exits.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+        """
+        ...
+
     def write(self, path: Path, content: bytes) -> None:
         """Write content to file.
 
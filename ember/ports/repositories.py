@@ -4,6 +4,8 @@ These protocols define abstract interfaces for storing and retrieving domain ent
 Implementations should be in adapters/ layer.
 """
 
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
@@ -56,6 +58,21 @@ class ChunkRepository(Protocol):
         """
         ...
 
+    def find_parent(self, chunk: Chunk) -> Chunk | None:
+        """Find the innermost chunk containing the given chunk.
+
+        Chunks are linked to their parents by line containment within the
+        same version of the same file, e.g. a method to its class.
+
+        Args:
+            chunk: The nested chunk.
+
+        Returns:
+            The smallest other chunk of the same file version whose line range
+            contains the chunk's, or None for top-level chunks.
+        """
+        ...
+
     def delete(self, chunk_id: str) -> None:
         """Delete a chunk by ID.
 
@@ -235,3 +252,266 @@ class FileRepository(Protocol):
             List of absolute paths for all tracked files.
         """
         ...
+
+
+class SyncCheckpointRepository(Protocol):
+    """Repository recording per-file progress of an in-flight sync."""
+
+    def get_completed(self, tree_sha: str, model_fingerprint: str) -> set[Path]:
+        """Get files already completed for a target tree and model.
+
+        Args:
+            tree_sha: Tree SHA the sync is indexing.
+            model_fingerprint: Fingerprint of the embedding model in use.
+
+        Returns:
+            Set of paths (relative to repository root) already indexed.
+        """
+        ...
+
+    def mark_completed(
+        self, tree_sha: str, model_fingerprint: str, paths: list[Path]
+    ) -> None:
+        """Durably record a batch of completed files.
+
+        Args:
+            tree_sha: Tree SHA the sync is indexing.
+            model_fingerprint: Fingerprint of the embedding model in use.
+            paths: Paths (relative to repository root) that finished indexing.
+        """
+        ...
+
+    def clear(self) -> None:
+        """Remove all checkpoints (called once a sync completes)."""
+        ...
+
+
+class EmbeddingCache(Protocol):
+    """Content-addressed embedding store shared across repositories.
+
+    Keyed by (model fingerprint, chunk content hash), so identical code in
+    other clones or worktrees is embedded only once per model.
+    """
+
+    def get_many(
+        self, model_fingerprint: str, content_hashes: list[str]
+    ) -> dict[str, list[float]]:
+        """Look up cached embeddings.
+
+        Args:
+            model_fingerprint: Fingerprint of the embedding model.
+            content_hashes: Chunk content hashes to look up.
+
+        Returns:
+            Embeddings for the hashes found in the cache, keyed by hash.
+        """
+        ...
+
+    def put_many(self, model_fingerprint: str, embeddings: dict[str, list[float]]) -> None:
+        """Store embeddings, evicting least recently used entries if over capacity.
+
+        Args:
+            model_fingerprint: Fingerprint of the embedding model.
+            embeddings: Embeddings keyed by chunk content hash.
+        """
+        ...
+
+
+class IndexSnapshotRepository(Protocol):
+    """Bulk access to the whole index, used by export and import.
+
+    Reads stream rows instead of building lists, and loading replaces the
+    index in a single transaction so a failed import leaves it untouched.
+    """
+
+    def iter_chunks(self, model_fingerprint: str) -> Iterator[tuple[Chunk, list[float] | None]]:
+        """Iterate over every live chunk with its vector.
+
+        Args:
+            model_fingerprint: Only vectors from this model are returned.
+
+        Yields:
+            Tuples of (chunk, embedding or None).
+        """
+        ...
+
+    def iter_files(self) -> Iterator[tuple[Path, str, int]]:
+        """Iterate over tracked files.
+
+        Yields:
+            Tuples of (absolute path, file hash, size in bytes).
+        """
+        ...
+
+    def replace_all(
+        self,
+        files: Iterable[tuple[Path, str, int]],
+        chunks: Iterable[tuple[Chunk, list[float] | None]],
+        model_fingerprint: str,
+    ) -> tuple[int, int, int]:
+        """Replace all chunks, vectors, and tracked files.
+
+        Files are consumed before chunks. Sync checkpoints and indexed refs
+        are cleared.
+
+        Args:
+            files: Tuples of (absolute path, file hash, size in bytes).
+            chunks: Tuples of (chunk, embedding or None).
+            model_fingerprint: Fingerprint recorded with the vectors.
+
+        Returns:
+            Tuple of (files stored, chunks stored, vectors stored).
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class IndexedRef:
+    """A ref kept indexed alongside the live index.
+
+    Attributes:
+        name: Branch name, rev, or sync mode the ref was indexed as.
+        tree_sha: Tree SHA the ref was synced at.
+        synced_at: Unix timestamp of the sync.
+        files: Number of indexed files the ref contains.
+    """
+
+    name: str
+    tree_sha: str
+    synced_at: float
+    files: int = 0
+
+
+class RefRepository(Protocol):
+    """Repository keeping several refs indexed with shared chunk storage.
+
+    Chunks belong to a file version, identified by (path, file_hash). The
+    live index holds one version per path; versions that only other refs
+    contain are retained, and each ref records which version of each file it
+    contains. A version shared by several refs is stored (and embedded) once,
+    and switching back to a ref restores its versions instead of re-indexing.
+    """
+
+    def get(self, name: str) -> IndexedRef | None:
+        """Get an indexed ref by name.
+
+        Args:
+            name: Ref name.
+
+        Returns:
+            The ref, or None if it is not indexed.
+        """
+        ...
+
+    def find_by_tree(self, tree_sha: str) -> IndexedRef | None:
+        """Get the most recently synced ref at a tree.
+
+        Args:
+            tree_sha: Tree SHA.
+
+        Returns:
+            The ref, or None if no indexed ref is at this tree.
+        """
+        ...
+
+    def list_refs(self) -> list[IndexedRef]:
+        """List indexed refs, most recently synced first.
+
+        Returns:
+            Indexed refs.
+        """
+        ...
+
+    def live_files(self) -> dict[Path, str]:
+        """Get the file versions in the live index.
+
+        Returns:
+            Mapping of path (relative to repository root) to file hash.
+        """
+        ...
+
+    def has_version(self, path: Path, file_hash: str) -> bool:
+        """Check whether chunks of a file version are stored (live or retained).
+
+        Args:
+            path: File path relative to repository root.
+            file_hash: Hash of the file content.
+
+        Returns:
+            True if the version's chunks are stored.
+        """
+        ...
+
+    def retire(self, path: Path, replacing: str | None = None) -> int:
+        """Take a file's chunks out of the live index, retaining them for other refs.
+
+        Args:
+            path: File path relative to repository root.
+            replacing: Hash of the version about to be indexed in their place.
+                Stored chunks of that version are deleted rather than retained.
+
+        Returns:
+            Number of chunks taken out of the live index.
+        """
+        ...
+
+    def restore(self, path: Path, file_hash: str) -> int:
+        """Make a retained file version live again, retiring the current one.
+
+        Args:
+            path: File path relative to repository root.
+            file_hash: Hash of the version to restore.
+
+        Returns:
+            Number of chunks restored (0 if the version is not retained).
+        """
+        ...
+
+    def store_version(
+        self,
+        chunks: list[Chunk],
+        embeddings: list[list[float]],
+        model_fingerprint: str,
+    ) -> int:
+        """Store chunks of a file version for other refs, outside the live index.
+
+        Args:
+            chunks: Chunks of the version, with versioned ids.
+            embeddings: Embedding per chunk, in order.
+            model_fingerprint: Fingerprint of the embedding model.
+
+        Returns:
+            Number of chunks stored.
+        """
+        ...
+
+    def record(
+        self,
+        name: str,
+        tree_sha: str,
+        files: dict[Path, str] | None = None,
+    ) -> None:
+        """Record a ref and the file versions it contains, replacing any previous record.
+
+        Args:
+            name: Ref name.
+            tree_sha: Tree SHA the ref was synced at.
+            files: Mapping of path to file hash, or None for the versions
+                currently in the live index.
+        """
+        ...
+
+    def prune(self, keep: int) -> int:
+        """Forget the oldest refs and delete chunks no ref or the live index uses.
+
+        Args:
+            keep: Number of most recently synced refs to keep.
+
+        Returns:
+            Number of retained chunks deleted.
+        """
+        ...
+
+    def clear(self) -> None:
+        """Forget all refs and delete all retained chunks."""
+        ...
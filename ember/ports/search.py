@@ -1,6 +1,7 @@
 """Search port interfaces for text and vector retrieval.
 
-Defines abstract interfaces for full-text search (FTS), vector search, reranking, and fusion.
+Defines abstract interfaces for full-text search (FTS), literal and regex search,
+symbol lookup, vector search, reranking, and fusion.
 """
 
 from typing import Protocol
@@ -20,7 +21,11 @@ class TextSearch(Protocol):
         ...
 
     def query(
-        self, q: str, topk: int = 100, path_filter: str | None = None
+        self,
+        q: str,
+        topk: int = 100,
+        path_filter: str | None = None,
+        ref: str | None = None,
     ) -> list[tuple[str, float]]:
         """Query the text search index.
 
@@ -28,6 +33,7 @@ class TextSearch(Protocol):
             q: Query string (may use FTS query syntax).
             topk: Maximum number of results to return.
             path_filter: Optional glob pattern to filter results by path.
+            ref: Optional indexed ref to search instead of the live index.
 
         Returns:
             List of (chunk_id, score) tuples, sorted by relevance (descending).
@@ -35,6 +41,65 @@ class TextSearch(Protocol):
         ...
 
 
+class LiteralSearch(Protocol):
+    """Exact substring and regular expression search over chunk content."""
+
+    def match(
+        self,
+        pattern: str,
+        regex: bool = False,
+        topk: int = 100,
+        path_filter: str | None = None,
+        ref: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """Find the chunks whose content contains a pattern.
+
+        Args:
+            pattern: Substring to find, or a regular expression if regex is set.
+            regex: Treat pattern as a Python regular expression.
+            topk: Maximum number of results to return.
+            path_filter: Optional glob pattern to filter results by path.
+            ref: Optional indexed ref to search instead of the live index.
+
+        Returns:
+            List of (chunk_id, number of matches) tuples, most matches first.
+
+        Raises:
+            re.error: If regex is set and pattern is not a valid expression.
+        """
+        ...
+
+
+class SymbolSearch(Protocol):
+    """Lookup of the chunks defining a symbol by name."""
+
+    def lookup(
+        self,
+        name: str,
+        topk: int = 100,
+        path_filter: str | None = None,
+        ref: str | None = None,
+        prefix: bool = True,
+        fuzzy: bool = True,
+    ) -> list[tuple[str, float]]:
+        """Find the chunks whose symbol matches a name.
+
+        Args:
+            name: Symbol name to look up.
+            topk: Maximum number of results to return.
+            path_filter: Optional glob pattern to filter results by path.
+            ref: Optional indexed ref to search instead of the live index.
+            prefix: Also match symbols starting with the name.
+            fuzzy: If nothing matches exactly or by prefix, match similar names.
+
+        Returns:
+            List of (chunk_id, score) tuples, sorted by score (descending).
+            Exact matches score 2.0 or more (3.0 if the case matches too),
+            prefix matches 1.0 or more, and fuzzy matches below 1.0.
+        """
+        ...
+
+
 class VectorSearch(Protocol):
     """Vector similarity search interface (e.g., FAISS, sqlite-vss)."""
 
@@ -52,6 +117,7 @@ class VectorSearch(Protocol):
         vector: list[float],
         topk: int = 100,
         path_filter: str | None = None,
+        ref: str | None = None,
     ) -> list[tuple[str, float]]:
         """Query for nearest neighbors.
 
@@ -59,6 +125,7 @@ class VectorSearch(Protocol):
             vector: Query embedding vector.
             topk: Maximum number of results to return.
             path_filter: Optional glob pattern to filter results by path.
+            ref: Optional indexed ref to search instead of the live index.
 
         Returns:
             List of (chunk_id, distance) tuples, sorted by distance (ascending).
@@ -41,6 +41,28 @@ class VCS(Protocol):
         """
         ...
 
+    def get_staged_tree_sha(self) -> str:
+        """Get tree SHA representing the current index (staged changes).
+
+        Returns:
+            Tree SHA of the index.
+
+        Raises:
+            RuntimeError: If not a git repository or the index is invalid.
+        """
+        ...
+
+    def get_current_branch(self) -> str | None:
+        """Get the name of the checked-out branch.
+
+        Returns:
+            Short branch name, or None if HEAD is detached.
+
+        Raises:
+            RuntimeError: If not a git repository.
+        """
+        ...
+
     def diff_files(
         self,
         from_sha: str | None,
@@ -74,6 +96,20 @@ class VCS(Protocol):
         """
         ...
 
+    def list_files_at(self, tree_sha: str) -> list[Path]:
+        """Get list of all files recorded in a tree.
+
+        Args:
+            tree_sha: Tree SHA to list.
+
+        Returns:
+            List of paths relative to repository root.
+
+        Raises:
+            RuntimeError: If the tree cannot be read.
+        """
+        ...
+
     def list_tracked_files(self) -> list[Path]:
         """Get list of all files in the repository (including untracked).
 
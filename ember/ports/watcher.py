@@ -0,0 +1,29 @@
+"""File watcher port interface.
+
+Defines abstract interface for receiving filesystem change notifications.
+"""
+
+from pathlib import Path
+from typing import Protocol
+
+
+class FileWatcher(Protocol):
+    """Protocol for filesystem change notification (inotify, polling, etc.)."""
+
+    def wait_for_changes(self, timeout: float | None = None) -> set[Path]:
+        """Block until files change or the timeout elapses.
+
+        Args:
+            timeout: Maximum seconds to wait. None waits indefinitely,
+                0 returns immediately with any already-queued changes.
+
+        Returns:
+            Set of changed paths (absolute). Empty if nothing changed before
+            the timeout. The watched root itself is returned when individual
+            changes were lost (e.g. event queue overflow).
+        """
+        ...
+
+    def close(self) -> None:
+        """Release watcher resources (file descriptors, threads)."""
+        ...
@@ -161,13 +161,24 @@ def save_config(config: EmberConfig, path: Path) -> None:
             "line_window": config.index.line_window,
             "line_stride": config.index.line_stride,
             "overlap_lines": config.index.overlap_lines,
+            "max_chunk_tokens": config.index.max_chunk_tokens,
+            "min_chunk_tokens": config.index.min_chunk_tokens,
             "include": config.index.include,
             "ignore": config.index.ignore,
+            "skip_generated": config.index.skip_generated,
+            "fts_tokenizer": config.index.fts_tokenizer,
+            "trigram_index": config.index.trigram_index,
+            "embedding_cache": config.index.embedding_cache,
+            "embedding_cache_mb": config.index.embedding_cache_mb,
+            "max_refs": config.index.max_refs,
+            "sharding": config.index.sharding,
+            "shard_prefixes": config.index.shard_prefixes,
         },
         "search": {
             "topk": config.search.topk,
             "rerank": config.search.rerank,
             "filters": config.search.filters,
+            "background_sync": config.search.background_sync,
         },
         "redaction": {
             "patterns": config.redaction.patterns,
@@ -177,6 +188,12 @@ def save_config(config: EmberConfig, path: Path) -> None:
             "mode": config.model.mode,
             "daemon_timeout": config.model.daemon_timeout,
             "daemon_startup_timeout": config.model.daemon_startup_timeout,
+            "backend": config.model.backend,
+            "quantize": config.model.quantize,
+            "daemon_workers": config.model.daemon_workers,
+            "batch_size": config.model.batch_size,
+            "threads": config.model.threads,
+            "max_seq_length": config.model.max_seq_length,
         },
         "display": {
             "syntax_highlighting": config.display.syntax_highlighting,
@@ -193,6 +210,32 @@ def save_config(config: EmberConfig, path: Path) -> None:
         tomli_w.dump(data, f)
 
 
+def update_config_section(path: Path, section: str, values: dict[str, Any]) -> None:
+    """Set keys in one section of a config file, keeping all other settings.
+
+    Unlike save_config, only the given keys are written, so settings left
+    at their defaults stay unset and keep following global config.
+    Comments in the file are not preserved.
+
+    Args:
+        path: Path to config.toml (created if missing)
+        section: Section name (e.g. "model")
+        values: Keys and values to set in the section
+
+    Raises:
+        ValueError: If the existing config file is malformed
+    """
+    data = load_config_data(path) if path.exists() else {}
+    data.setdefault(section, {}).update(values)
+
+    # Validate before writing so a bad value never reaches disk
+    config_data_to_ember_config(data)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        tomli_w.dump(data, f)
+
+
 def create_default_config_file(path: Path, model: str = "local-default-code-embed") -> None:
     """Create a default config.toml file with sensible defaults and comments.
 
@@ -212,7 +255,8 @@ def create_default_config_file(path: Path, model: str = "local-default-code-embe
 #          minilm (lightweight, ~100MB), auto (detect hardware)
 model = "{model}"
 
-# Chunking strategy: "symbol" (tree-sitter) or "lines" (sliding window)
+# Chunking strategy: "symbol" (tree-sitter), "hierarchical" (tree-sitter, with
+# classes reduced to skeletons so method bodies are embedded once) or "lines"
 chunk = "symbol"
 
 # Lines per chunk when using line-based chunking
@@ -221,9 +265,15 @@ line_window = 120
 # Stride between chunks (line-based chunking)
 line_stride = 100
 
-# Overlap lines between chunks for context preservation
+# Overlap lines between the parts of a definition too long for the model
 overlap_lines = 15
 
+# Token limit per chunk; longer definitions are split (0 = model's max_seq_length)
+max_chunk_tokens = 0
+
+# Adjacent definitions shorter than this many tokens are packed together (0 = off)
+min_chunk_tokens = 32
+
 # File patterns to include (glob syntax)
 include = [
     "**/*.py",
@@ -253,6 +303,18 @@ ignore = [
     ".DS_Store",
 ]
 
+# Skip generated, minified and vendored files, and files over max_file_mb
+skip_generated = true
+
+# Full-text search: "code" matches identifiers across camelCase and snake_case
+# without stemming, "porter" stems English words (run 'ember rebuild-fts' after
+# changing it)
+fts_tokenizer = "code"
+
+# Trigram index for fast 'ember find --literal' / '--regex' (about doubles the
+# size of the content; run 'ember rebuild-fts' after changing it)
+trigram_index = false
+
 [search]
 # Default number of results to return
 topk = 20
@@ -263,6 +325,10 @@ rerank = false
 # Default filters to apply (key=value format)
 filters = []
 
+# Answer `ember find` immediately from the current index and refresh a stale
+# index in the background (results from changed files are flagged)
+background_sync = false
+
 [redaction]
 # Regex patterns to redact before embedding (prevents secrets in embeddings)
 patterns = [
@@ -0,0 +1,45 @@
+"""Storage locations of index shards.
+
+The root shard is the regular .ember/index.db; every other shard has its own
+database under .ember/shards/, in a directory named after its URL-quoted
+prefix (so "services/api" lives in .ember/shards/services%2Fapi/index.db).
+"""
+
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from ember.domain.sharding import ROOT_SHARD
+
+SHARDS_DIR = "shards"
+
+
+def shard_db_path(ember_dir: Path, shard: str) -> Path:
+    """Get the database path of a shard.
+
+    Args:
+        ember_dir: Path to .ember/ directory.
+        shard: Shard name (a directory prefix, or ROOT_SHARD).
+
+    Returns:
+        Path to the shard's SQLite database.
+    """
+    if shard == ROOT_SHARD:
+        return ember_dir / "index.db"
+    return ember_dir / SHARDS_DIR / quote(shard, safe="") / "index.db"
+
+
+def list_shards(ember_dir: Path) -> list[str]:
+    """List the non-root shards that have a database on disk.
+
+    Args:
+        ember_dir: Path to .ember/ directory.
+
+    Returns:
+        Sorted shard prefixes.
+    """
+    shards_dir = ember_dir / SHARDS_DIR
+    if not shards_dir.is_dir():
+        return []
+    return sorted(
+        unquote(entry.name) for entry in shards_dir.iterdir() if (entry / "index.db").exists()
+    )
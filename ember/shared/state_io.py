@@ -1,14 +1,15 @@
-"""State file I/O utilities for reading and writing state.json.
+"""State file I/O utilities for reading and writing state.json and watch.json.
 
 This module handles serialization/deserialization of RepoState to/from JSON.
 The state file tracks what has been indexed and enables incremental sync.
+watch.json is published by `ember watch` to report index freshness.
 """
 
 import json
 from datetime import UTC
 from pathlib import Path
 
-from ember.domain.entities import RepoState
+from ember.domain.entities import RepoState, WatchState
 
 
 def load_state(path: Path) -> RepoState:
@@ -84,3 +85,53 @@ def create_initial_state(path: Path, version: str = "0.1.0") -> None:
     )
 
     save_state(state, path)
+
+
+def load_watch_state(path: Path) -> WatchState | None:
+    """Load watcher state from watch.json.
+
+    Args:
+        path: Path to watch.json file
+
+    Returns:
+        Parsed WatchState, or None if the file is missing or unreadable
+        (a watcher may be rewriting it concurrently).
+    """
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return WatchState(
+            pid=int(data["pid"]),
+            status=data["status"],
+            last_tree_sha=data.get("last_tree_sha", ""),
+            updated_at=float(data.get("updated_at", 0.0)),
+            last_error=data.get("last_error"),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_watch_state(state: WatchState, path: Path) -> None:
+    """Atomically save watcher state to watch.json.
+
+    Written via a temporary file and rename so readers never observe a
+    partially written file.
+
+    Args:
+        state: WatchState to save
+        path: Destination path for watch.json
+    """
+    data = {
+        "pid": state.pid,
+        "status": state.status,
+        "last_tree_sha": state.last_tree_sha,
+        "updated_at": state.updated_at,
+        "last_error": state.last_error,
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    tmp_path.replace(path)
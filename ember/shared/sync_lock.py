@@ -0,0 +1,104 @@
+"""Inter-process lock serializing index writers.
+
+Foreground syncs, background sync workers, and the watcher all write the same
+index. The lock lives at .ember/sync.lock and is held with an advisory
+flock(), so it is released automatically if the holder dies.
+"""
+
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Placeholder descriptor when there is no lock directory to lock in
+_NO_FD = -1
+
+
+class SyncLock:
+    """Advisory file lock held for the duration of an index sync."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize lock (not acquired).
+
+        Args:
+            path: Lock file path (typically .ember/sync.lock).
+        """
+        self.path = path
+        self._fd: int | None = None
+
+    @property
+    def held(self) -> bool:
+        """True if this instance currently holds the lock."""
+        return self._fd is not None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Acquire the lock.
+
+        Args:
+            blocking: Wait for the current holder to release it. If False,
+                return immediately when the lock is held elsewhere.
+
+        Returns:
+            True if the lock was acquired.
+        """
+        if self._fd is not None:
+            return True
+
+        if not self.path.parent.is_dir():
+            # No .ember directory means no index to protect
+            self._fd = _NO_FD
+            return True
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is None:
+            self._fd = fd
+            return True
+
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        # Record holder for diagnostics (lock state itself lives in the kernel)
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """Release the lock if held."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        if fd == _NO_FD:
+            return
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def is_locked(self) -> bool:
+        """Check whether another process currently holds the lock.
+
+        Returns:
+            True if the lock is held by someone else.
+        """
+        if self._fd is not None:
+            return False
+        if not self.acquire(blocking=False):
+            return True
+        self.release()
+        return False
+
+    def __enter__(self) -> "SyncLock":
+        """Acquire the lock (blocking)."""
+        self.acquire(blocking=True)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the lock."""
+        self.release()
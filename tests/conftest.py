@@ -160,6 +160,25 @@ def cleanup_database_connections():
     gc.collect()
 
 
+@pytest.fixture(autouse=True)
+def isolated_embedding_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Point the shared embedding cache at a temporary file for every test.
+
+    Without this, syncs run by tests would read and write the developer's
+    real ~/.ember/cache/embeddings.db.
+
+    Returns:
+        Path of the cache database used during the test.
+    """
+    from ember.adapters.sqlite import embedding_cache
+
+    cache_path = tmp_path_factory.mktemp("embedding_cache") / "embeddings.db"
+    monkeypatch.setattr(embedding_cache, "DEFAULT_CACHE_PATH", cache_path)
+    return cache_path
+
+
 @pytest.fixture
 def temp_dir() -> Path:
     """Create a temporary directory for tests.
@@ -0,0 +1,84 @@
+"""Integration tests for SQLite SyncCheckpointRepository adapter.
+
+These tests exercise resumable-sync bookkeeping with a real SQLite database.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.sqlite.checkpoint_repository import SQLiteSyncCheckpointRepository
+from ember.adapters.sqlite.schema import SCHEMA_VERSION, check_schema_version
+
+# Note: db_path fixture is in tests/conftest.py
+
+
+@pytest.fixture
+def checkpoint_repo(db_path: Path) -> SQLiteSyncCheckpointRepository:
+    """Create a SyncCheckpointRepository instance for testing."""
+    repo = SQLiteSyncCheckpointRepository(db_path)
+    yield repo
+    repo.close()
+
+
+def test_get_completed_empty(checkpoint_repo: SQLiteSyncCheckpointRepository):
+    """Test a fresh database has no completed files."""
+    assert checkpoint_repo.get_completed("tree1", "model1") == set()
+
+
+def test_mark_completed_roundtrip(checkpoint_repo: SQLiteSyncCheckpointRepository):
+    """Test marked files are returned for the same tree and model."""
+    checkpoint_repo.mark_completed("tree1", "model1", [Path("a.py"), Path("src/b.py")])
+    checkpoint_repo.mark_completed("tree1", "model1", [Path("a.py")])
+
+    assert checkpoint_repo.get_completed("tree1", "model1") == {
+        Path("a.py"),
+        Path("src/b.py"),
+    }
+
+
+def test_checkpoints_scoped_to_tree_and_model(
+    checkpoint_repo: SQLiteSyncCheckpointRepository,
+):
+    """Test progress for another tree or model is not reused."""
+    checkpoint_repo.mark_completed("tree1", "model1", [Path("a.py")])
+
+    assert checkpoint_repo.get_completed("tree2", "model1") == set()
+    assert checkpoint_repo.get_completed("tree1", "model2") == set()
+
+
+def test_checkpoints_survive_reopen(db_path: Path):
+    """Test checkpoints are durable across connections (simulated crash)."""
+    repo = SQLiteSyncCheckpointRepository(db_path)
+    repo.mark_completed("tree1", "model1", [Path("a.py")])
+    repo.close()
+
+    with SQLiteSyncCheckpointRepository(db_path) as reopened:
+        assert reopened.get_completed("tree1", "model1") == {Path("a.py")}
+
+
+def test_clear_removes_all(checkpoint_repo: SQLiteSyncCheckpointRepository):
+    """Test clear drops every checkpoint."""
+    checkpoint_repo.mark_completed("tree1", "model1", [Path("a.py")])
+    checkpoint_repo.mark_completed("tree2", "model1", [Path("b.py")])
+
+    checkpoint_repo.clear()
+
+    assert checkpoint_repo.get_completed("tree1", "model1") == set()
+    assert checkpoint_repo.get_completed("tree2", "model1") == set()
+
+
+def test_migrates_v2_database(db_path: Path):
+    """Test opening a pre-checkpoint database adds the table."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP TABLE sync_checkpoints")
+    conn.execute("UPDATE meta SET value = '2' WHERE key = 'schema_version'")
+    conn.commit()
+    conn.close()
+
+    with SQLiteSyncCheckpointRepository(db_path) as repo:
+        repo.mark_completed("tree1", "model1", [Path("a.py")])
+        assert repo.get_completed("tree1", "model1") == {Path("a.py")}
+
+    assert check_schema_version(db_path) == SCHEMA_VERSION
@@ -9,6 +9,7 @@ Tests the complete CLI flow end-to-end to verify:
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
@@ -448,6 +449,167 @@ class TestFindCommand:
         assert "mutually exclusive" in result.output.lower() or "cannot use both" in result.output.lower()
 
 
+class TestFindLiteralCommand:
+    """Tests for 'ember find --literal' and '--regex'."""
+
+    def test_find_literal_matches_substring(
+        self, runner: CliRunner, git_repo_isolated: Path, monkeypatch
+    ) -> None:
+        """Test that --literal finds exact substrings in the index."""
+        from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+        from ember.domain.entities import Chunk
+
+        monkeypatch.chdir(git_repo_isolated)
+        runner.invoke(cli, ["init"], catch_exceptions=False)
+        content = "def goodbye():\n    return 'Goodbye!'"
+        with SQLiteChunkRepository(git_repo_isolated / ".ember" / "index.db") as repo:
+            repo.add(
+                Chunk(
+                    id=Chunk.compute_id("proj", Path("example.py"), 6, 7),
+                    project_id="proj",
+                    path=Path("example.py"),
+                    lang="py",
+                    symbol="goodbye",
+                    start_line=6,
+                    end_line=7,
+                    content=content,
+                    content_hash=Chunk.compute_content_hash(content),
+                    file_hash="hash",
+                    tree_sha="tree",
+                    rev="worktree",
+                )
+            )
+
+        result = runner.invoke(
+            cli, ["find", "'Goodbye!'", "--literal", "--no-sync", "--json"],
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0
+        results = json.loads(result.output)
+        assert [r["symbol"] for r in results] == ["goodbye"]
+
+    def test_find_invalid_regex_fails(
+        self, runner: CliRunner, git_repo_isolated: Path, monkeypatch
+    ) -> None:
+        """Test that an invalid --regex pattern is reported."""
+        monkeypatch.chdir(git_repo_isolated)
+        runner.invoke(cli, ["init"], catch_exceptions=False)
+
+        result = runner.invoke(cli, ["find", "retry(", "--regex", "--no-sync"])
+
+        assert result.exit_code != 0
+        assert "Invalid regular expression" in result.output
+
+
+class TestFindSymbolCommand:
+    """Tests for 'ember find --symbol' and automatic symbol lookup."""
+
+    def _add_chunk(self, repo_root: Path, symbol: str) -> None:
+        from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+        from ember.domain.entities import Chunk
+
+        content = f"class {symbol}:\n    pass"
+        with SQLiteChunkRepository(repo_root / ".ember" / "index.db") as repo:
+            repo.add(
+                Chunk(
+                    id=Chunk.compute_id("proj", Path("repo.py"), 1, 2),
+                    project_id="proj",
+                    path=Path("repo.py"),
+                    lang="py",
+                    symbol=symbol,
+                    start_line=1,
+                    end_line=2,
+                    content=content,
+                    content_hash=Chunk.compute_content_hash(content),
+                    file_hash="hash",
+                    tree_sha="tree",
+                    rev="worktree",
+                )
+            )
+
+    def test_find_symbol_matches_prefix_and_typos(
+        self, runner: CliRunner, git_repo_isolated: Path, monkeypatch
+    ) -> None:
+        """Test that --symbol finds names by prefix and similar spelling."""
+        monkeypatch.chdir(git_repo_isolated)
+        runner.invoke(cli, ["init"], catch_exceptions=False)
+        self._add_chunk(git_repo_isolated, "UserRepository")
+
+        for query in ("UserRepo", "UserRepositroy"):
+            result = runner.invoke(
+                cli, ["find", query, "--symbol", "--no-sync", "--json"],
+                catch_exceptions=False,
+            )
+
+            assert result.exit_code == 0
+            assert [r["symbol"] for r in json.loads(result.output)] == ["UserRepository"]
+
+    def test_find_identifier_uses_symbol_lookup(
+        self, runner: CliRunner, git_repo_isolated: Path, monkeypatch
+    ) -> None:
+        """Test that identifier-like queries are answered without embedding."""
+        monkeypatch.chdir(git_repo_isolated)
+        runner.invoke(cli, ["init"], catch_exceptions=False)
+        self._add_chunk(git_repo_isolated, "UserRepository")
+
+        with patch("ember.entrypoints.cli._create_search_usecase") as create:
+            result = runner.invoke(
+                cli, ["find", "UserRepository", "--no-sync", "--json"],
+                catch_exceptions=False,
+            )
+
+        assert result.exit_code == 0
+        assert [r["symbol"] for r in json.loads(result.output)] == ["UserRepository"]
+        create.assert_not_called()
+
+    def test_find_symbol_rejects_literal(
+        self, runner: CliRunner, git_repo_isolated: Path, monkeypatch
+    ) -> None:
+        """Test that --symbol cannot be combined with --literal."""
+        monkeypatch.chdir(git_repo_isolated)
+        runner.invoke(cli, ["init"], catch_exceptions=False)
+
+        result = runner.invoke(cli, ["find", "Foo", "--symbol", "--literal", "--no-sync"])
+
+        assert result.exit_code != 0
+        assert "Cannot use" in result.output
+
+
+class TestFindModeCommand:
+    """Tests for 'ember find --mode'."""
+
+    def test_find_fts_mode_loads_no_model(
+        self, runner: CliRunner, git_repo_isolated: Path, monkeypatch
+    ) -> None:
+        """Test that --mode fts answers from BM25 without creating an embedder."""
+        monkeypatch.chdir(git_repo_isolated)
+        runner.invoke(cli, ["init"], catch_exceptions=False)
+        TestFindSymbolCommand()._add_chunk(git_repo_isolated, "UserRepository")
+
+        with patch("ember.entrypoints.cli._create_embedder") as create_embedder:
+            result = runner.invoke(
+                cli, ["find", "pass", "--mode", "fts", "--no-sync", "--json"],
+                catch_exceptions=False,
+            )
+
+        assert result.exit_code == 0
+        assert [r["symbol"] for r in json.loads(result.output)] == ["UserRepository"]
+        create_embedder.assert_not_called()
+
+    def test_find_mode_rejects_literal(
+        self, runner: CliRunner, git_repo_isolated: Path, monkeypatch
+    ) -> None:
+        """Test that --mode cannot be combined with --literal."""
+        monkeypatch.chdir(git_repo_isolated)
+        runner.invoke(cli, ["init"], catch_exceptions=False)
+
+        result = runner.invoke(cli, ["find", "foo", "--mode", "fts", "--literal", "--no-sync"])
+
+        assert result.exit_code != 0
+        assert "Cannot use --mode" in result.output
+
+
 class TestSearchCommand:
     """Tests for 'ember search' command filter handling."""
 
@@ -819,6 +981,33 @@ class TestStatusCommand:
         assert "chunk" in result.output.lower() or "Chunking" in result.output
 
 
+class TestRebuildFtsCommand:
+    """Tests for 'ember rebuild-fts' command."""
+
+    def test_rebuild_fts_switches_tokenizer(
+        self, runner: CliRunner, git_repo_isolated: Path, monkeypatch
+    ) -> None:
+        """Test that rebuild-fts records the new tokenizer in the index."""
+        import sqlite3
+
+        from ember.adapters.sqlite.schema import get_fts_tokenizer
+
+        monkeypatch.chdir(git_repo_isolated)
+        runner.invoke(cli, ["init"], catch_exceptions=False)
+
+        result = runner.invoke(
+            cli, ["rebuild-fts", "--tokenizer", "porter"], catch_exceptions=False
+        )
+
+        assert result.exit_code == 0
+        assert "porter tokenizer" in result.output
+        conn = sqlite3.connect(git_repo_isolated / ".ember" / "index.db")
+        try:
+            assert get_fts_tokenizer(conn) == "porter"
+        finally:
+            conn.close()
+
+
 class TestVerboseQuietFlags:
     """Tests for global --verbose and --quiet flags."""
 
@@ -0,0 +1,153 @@
+"""Integration tests for code-aware full-text search and FTS rebuilds."""
+
+import sqlite3
+from pathlib import Path
+
+from ember.adapters.fts.sqlite_fts import SQLiteFTS
+from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+from ember.adapters.sqlite.schema import (
+    SCHEMA_VERSION,
+    check_schema_version,
+    init_database,
+    rebuild_fts,
+)
+from ember.adapters.sqlite.vector_repository import SQLiteVectorRepository
+from ember.domain.entities import Chunk
+
+FINGERPRINT = "fake-model:v1"
+
+
+def _chunk(path: str, content: str) -> Chunk:
+    return Chunk(
+        id=Chunk.compute_id("proj", Path(path), 1, 2),
+        project_id="proj",
+        path=Path(path),
+        lang="py",
+        symbol=None,
+        start_line=1,
+        end_line=2,
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash=f"hash-{path}",
+        tree_sha="tree1",
+        rev="worktree",
+    )
+
+
+def _add(db_path: Path, *chunks: Chunk) -> None:
+    with SQLiteChunkRepository(db_path) as repo:
+        for chunk in chunks:
+            repo.add(chunk)
+
+
+def _search(db_path: Path, q: str) -> set[str]:
+    with SQLiteFTS(db_path) as fts:
+        return {chunk_id for chunk_id, _ in fts.query(q)}
+
+
+def _update_trigger_sql(db_path: Path) -> str:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'chunks_au'"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _integrity_check(db_path: Path) -> None:
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("INSERT INTO chunk_text(chunk_text) VALUES ('integrity-check')")
+    finally:
+        conn.close()
+
+
+def test_identifiers_match_across_styles(db_path: Path) -> None:
+    """camelCase, snake_case and single-word queries find each other."""
+    camel = _chunk("a.py", "def getUserById(uid): return db.fetch(uid)")
+    snake = _chunk("b.py", "def get_user_by_id(uid): pass")
+    _add(db_path, camel, snake)
+
+    assert _search(db_path, "getUserById") == {camel.id, snake.id}
+    assert _search(db_path, "get_user_by_id") == {camel.id, snake.id}
+    assert _search(db_path, "user") == {camel.id, snake.id}
+
+    with SQLiteFTS(db_path) as fts:
+        assert fts.query("getUserById")[0][0] == camel.id  # Exact match ranks first
+
+
+def test_code_mode_does_not_stem(db_path: Path) -> None:
+    """Identifiers are matched as written, not by their stems."""
+    chunk = _chunk("a.py", "for runner in runners: runner.start()")
+    _add(db_path, chunk)
+
+    assert _search(db_path, "runner") == {chunk.id}
+    assert _search(db_path, "run") == set()
+
+
+def test_updates_and_deletes_keep_index_consistent(db_path: Path) -> None:
+    """Rewritten and deleted chunks leave no stale full-text entries."""
+    chunk = _chunk("a.py", "def parseConfig(): pass")
+    _add(db_path, chunk)
+    _add(db_path, _chunk("a.py", "def loadSettings(): pass"))
+
+    assert _search(db_path, "config") == set()
+    assert _search(db_path, "settings") == {chunk.id}
+    with SQLiteChunkRepository(db_path) as repo:
+        repo.delete_all_for_path(Path("a.py"))
+    assert _search(db_path, "settings") == set()
+    _integrity_check(db_path)
+
+
+def test_retiring_chunks_does_not_reindex_them(db_path: Path) -> None:
+    """Only updates of indexed columns re-tokenize a chunk."""
+    chunk = _chunk("a.py", "def parseConfig(): pass")
+    _add(db_path, chunk)
+
+    assert "UPDATE OF content, terms, path, symbol, lang" in _update_trigger_sql(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE chunks SET live = 0")
+    conn.execute("UPDATE chunks SET live = 1")
+    conn.commit()
+    conn.close()
+    assert _search(db_path, "config") == {chunk.id}
+    _integrity_check(db_path)
+
+
+def test_migrated_database_keeps_porter_until_rebuilt(tmp_path: Path) -> None:
+    """A database from before code-aware search migrates, then rebuilds in place."""
+    db_path = tmp_path / "index.db"
+    init_database(db_path, fts_tokenizer="porter")
+    conn = sqlite3.connect(db_path)
+    conn.execute("ALTER TABLE chunks DROP COLUMN terms")
+    conn.execute("DELETE FROM meta WHERE key = 'fts_tokenizer'")
+    conn.execute("DROP TRIGGER chunks_au")
+    conn.execute("""
+        CREATE TRIGGER chunks_au AFTER UPDATE ON chunks BEGIN
+            DELETE FROM chunk_text WHERE rowid = old.id;
+            INSERT INTO chunk_text(rowid, content, path, symbol, lang)
+            VALUES (new.id, new.content, new.path, new.symbol, new.lang);
+        END
+    """)
+    conn.execute("UPDATE meta SET value = '4' WHERE key = 'schema_version'")
+    conn.commit()
+    conn.close()
+
+    chunk = _chunk("a.py", "def getUserById(uid): return running")
+    _add(db_path, chunk)
+    assert check_schema_version(db_path) == SCHEMA_VERSION
+    assert "UPDATE OF content, path, symbol, lang" in _update_trigger_sql(db_path)
+    assert _search(db_path, "run") == {chunk.id}  # Still stemmed
+    assert _search(db_path, "user") == set()
+    with SQLiteVectorRepository(db_path) as vectors:
+        vectors.add(chunk.id, [1.0, 0.0, 0.0], FINGERPRINT)
+
+    assert rebuild_fts(db_path, "code") == 1
+
+    assert _search(db_path, "user") == {chunk.id}
+    assert _search(db_path, "run") == set()
+    assert "UPDATE OF content, terms" in _update_trigger_sql(db_path)
+    with SQLiteVectorRepository(db_path) as vectors:
+        assert vectors.get(chunk.id) == [1.0, 0.0, 0.0]  # Not re-embedded
+    _integrity_check(db_path)
@@ -0,0 +1,95 @@
+"""Integration tests for the shared SQLite embedding cache."""
+
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.sqlite.embedding_cache import SQLiteEmbeddingCache
+
+
+class FakeClock:
+    """Clock that advances one second per call."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 1.0
+        return self.now
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> SQLiteEmbeddingCache:
+    """Create an embedding cache in a temporary directory."""
+    cache = SQLiteEmbeddingCache(tmp_path / "cache" / "embeddings.db", clock=FakeClock())
+    yield cache
+    cache.close()
+
+
+def test_roundtrip(cache: SQLiteEmbeddingCache):
+    """Test stored embeddings are returned for the same model."""
+    cache.put_many("model1", {"h1": [0.5, -1.0], "h2": [2.0, 3.0]})
+
+    assert cache.get_many("model1", ["h1", "h2", "h3"]) == {
+        "h1": [0.5, -1.0],
+        "h2": [2.0, 3.0],
+    }
+
+
+def test_keyed_by_model_fingerprint(cache: SQLiteEmbeddingCache):
+    """Test embeddings from another model are never returned."""
+    cache.put_many("model1", {"h1": [1.0]})
+
+    assert cache.get_many("model2", ["h1"]) == {}
+
+
+def test_shared_between_instances(tmp_path: Path):
+    """Test a second process (e.g. another clone's sync) sees stored entries."""
+    db_path = tmp_path / "embeddings.db"
+    with SQLiteEmbeddingCache(db_path) as first:
+        first.put_many("model1", {"h1": [1.0, 2.0]})
+
+    with SQLiteEmbeddingCache(db_path) as second:
+        assert second.get_many("model1", ["h1"]) == {"h1": [1.0, 2.0]}
+
+
+def test_large_lookup_is_batched(cache: SQLiteEmbeddingCache):
+    """Test lookups beyond SQLite's parameter limit succeed."""
+    cache.put_many("model1", {f"h{i}": [float(i)] for i in range(1200)})
+
+    found = cache.get_many("model1", [f"h{i}" for i in range(1200)])
+
+    assert len(found) == 1200
+    assert found["h1199"] == [1199.0]
+
+
+def test_evicts_least_recently_used(tmp_path: Path):
+    """Test entries not read recently are evicted first when over the cap."""
+    cache = SQLiteEmbeddingCache(tmp_path / "embeddings.db", max_size_mb=1, clock=FakeClock())
+    vector = [0.0] * 256  # 1 KiB per entry
+    try:
+        cache.put_many("m", {f"old{i}": vector for i in range(500)})
+        cache.put_many("m", {f"hot{i}": vector for i in range(400)})
+        # Reading makes the first old entries recent again
+        cache.get_many("m", [f"old{i}" for i in range(100)])
+
+        cache.put_many("m", {f"new{i}": vector for i in range(300)})
+
+        assert cache.size_bytes() <= 1024 * 1024
+        assert len(cache.get_many("m", [f"old{i}" for i in range(100)])) == 100
+        assert len(cache.get_many("m", [f"new{i}" for i in range(300)])) == 300
+        assert len(cache.get_many("m", [f"hot{i}" for i in range(400)])) == 400
+        # Only never-read old entries were evicted
+        assert len(cache.get_many("m", [f"old{i}" for i in range(100, 500)])) < 400
+    finally:
+        cache.close()
+
+
+def test_default_path_is_isolated_in_tests(isolated_embedding_cache: Path):
+    """Test the default cache location is redirected away from the home directory."""
+    cache = SQLiteEmbeddingCache()
+    try:
+        assert cache.db_path == isolated_embedding_cache
+        assert Path.home() not in cache.db_path.parents
+    finally:
+        cache.close()
@@ -0,0 +1,263 @@
+"""Integration tests for exporting and importing index bundles."""
+
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.bundle.jsonl_bundle import JsonlBundleReader, JsonlBundleWriter
+from ember.adapters.fts.sqlite_fts import SQLiteFTS
+from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+from ember.adapters.sqlite.embedding_cache import SQLiteEmbeddingCache
+from ember.adapters.sqlite.file_repository import SQLiteFileRepository
+from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
+from ember.adapters.sqlite.schema import init_database
+from ember.adapters.sqlite.snapshot_repository import SQLiteIndexSnapshotRepository
+from ember.adapters.sqlite.vector_repository import SQLiteVectorRepository
+from ember.core.export.export_usecase import ExportRequest, ExportUseCase
+from ember.core.export.import_usecase import ImportRequest, ImportUseCase
+from ember.domain.entities import Chunk
+
+FINGERPRINT = "test-model:v2:abc"
+SOURCE_ROOT = Path("/ci/checkout")
+LOCAL_ROOT = Path("/home/dev/project")
+
+
+class FakeVCS:
+    """VCS that knows a fixed set of trees."""
+
+    def __init__(self, known_trees: set[str]) -> None:
+        self.known_trees = known_trees
+
+    def list_files_at(self, tree_sha: str) -> list[Path]:
+        if tree_sha not in self.known_trees:
+            raise RuntimeError(f"unknown tree {tree_sha}")
+        return []
+
+
+def _make_chunk(project_id: str, path: str, symbol: str, content: str) -> Chunk:
+    return Chunk(
+        id=Chunk.compute_id(project_id, Path(path), 1, 3),
+        project_id=project_id,
+        path=Path(path),
+        lang="py",
+        symbol=symbol,
+        start_line=1,
+        end_line=3,
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash=f"hash-{path}",
+        tree_sha="tree-ci",
+        rev="worktree",
+    )
+
+
+@pytest.fixture
+def source_db(db_path: Path) -> Path:
+    """An index with two chunks, vectors, tracked files, and sync metadata."""
+    chunks = [
+        _make_chunk("ci", "src/auth.py", "login", "def login(user):\n    check_password(user)"),
+        _make_chunk("ci", "src/cache.py", "evict", "def evict(cache):\n    cache.clear()"),
+    ]
+    with (
+        SQLiteChunkRepository(db_path) as chunk_repo,
+        SQLiteVectorRepository(db_path) as vector_repo,
+        SQLiteFileRepository(db_path) as file_repo,
+        SQLiteMetaRepository(db_path) as meta_repo,
+    ):
+        for i, chunk in enumerate(chunks):
+            chunk_repo.add(chunk)
+            vector_repo.add(chunk.id, [float(i), 0.5, -0.5], FINGERPRINT)
+            file_repo.track_file(SOURCE_ROOT / chunk.path, chunk.file_hash, 100 + i, 1.0)
+        meta_repo.set("last_tree_sha", "tree-ci")
+        meta_repo.set("last_sync_mode", "worktree")
+        meta_repo.set("model_fingerprint", FINGERPRINT)
+    return db_path
+
+
+def _export(db: Path, bundle: Path, **options) -> None:
+    with (
+        SQLiteIndexSnapshotRepository(db) as snapshot_repo,
+        SQLiteMetaRepository(db) as meta_repo,
+    ):
+        response = ExportUseCase(snapshot_repo, meta_repo, JsonlBundleWriter(bundle)).execute(
+            ExportRequest(repo_root=SOURCE_ROOT, **options)
+        )
+    assert response.success, response.error
+
+
+def _import(db: Path, bundle: Path, fingerprint=FINGERPRINT, known_trees=None, cache=None):
+    reader = JsonlBundleReader(bundle)
+    with (
+        SQLiteIndexSnapshotRepository(db) as snapshot_repo,
+        SQLiteMetaRepository(db) as meta_repo,
+    ):
+        use_case = ImportUseCase(
+            snapshot_repo=snapshot_repo,
+            meta_repo=meta_repo,
+            bundle_reader=reader,
+            vcs=FakeVCS(known_trees if known_trees is not None else {"tree-ci"}),
+            project_id="local",
+            embedding_cache=cache,
+        )
+        response = use_case.execute(
+            ImportRequest(repo_root=LOCAL_ROOT, model_fingerprint=fingerprint)
+        )
+    reader.close()
+    return response
+
+
+@pytest.fixture
+def target_db(tmp_path: Path) -> Path:
+    """An empty index in another location."""
+    db = tmp_path / "target" / "index.db"
+    db.parent.mkdir()
+    init_database(db)
+    return db
+
+
+def test_roundtrip_restores_chunks_vectors_and_fts(source_db, target_db, tmp_path):
+    """Imported chunks get local ids and are searchable by vector and keyword."""
+    bundle = tmp_path / "index.ember"
+    _export(source_db, bundle)
+
+    response = _import(target_db, bundle)
+
+    assert response.success, response.error
+    assert (response.chunks_imported, response.vectors_imported, response.files_imported) == (
+        2,
+        2,
+        2,
+    )
+    local_id = Chunk.compute_id("local", Path("src/auth.py"), 1, 3)
+    with (
+        SQLiteChunkRepository(target_db) as chunk_repo,
+        SQLiteVectorRepository(target_db) as vector_repo,
+        SQLiteFTS(target_db) as fts,
+    ):
+        chunk = chunk_repo.get(local_id)
+        assert chunk is not None
+        assert chunk.project_id == "local"
+        assert "check_password" in chunk.content
+        assert vector_repo.get(local_id) == [0.0, 0.5, -0.5]
+        assert [chunk_id for chunk_id, _ in fts.query("check_password")] == [local_id]
+
+
+def test_import_sets_sync_state_and_file_paths(source_db, target_db, tmp_path):
+    """The bundle's tree becomes the last synced tree; files are rebased locally."""
+    bundle = tmp_path / "index.ember"
+    _export(source_db, bundle)
+
+    _import(target_db, bundle)
+
+    with (
+        SQLiteMetaRepository(target_db) as meta_repo,
+        SQLiteFileRepository(target_db) as file_repo,
+    ):
+        assert meta_repo.get("last_tree_sha") == "tree-ci"
+        assert meta_repo.get("model_fingerprint") == FINGERPRINT
+        state = file_repo.get_file_state(LOCAL_ROOT / "src/auth.py")
+        assert state is not None
+        assert state["file_hash"] == "hash-src/auth.py"
+
+
+def test_unknown_tree_forces_full_sync(source_db, target_db, tmp_path):
+    """Without the bundle's tree locally, the next sync starts from scratch."""
+    bundle = tmp_path / "index.ember"
+    _export(source_db, bundle)
+
+    response = _import(target_db, bundle, known_trees=set())
+
+    assert response.success
+    assert not response.tree_available
+    with SQLiteMetaRepository(target_db) as meta_repo:
+        assert meta_repo.get("last_tree_sha") is None
+
+
+def test_fingerprint_mismatch_leaves_index_untouched(source_db, target_db, tmp_path):
+    """Vectors from another model are never imported."""
+    bundle = tmp_path / "index.ember"
+    _export(source_db, bundle)
+    _import(target_db, bundle)
+
+    response = _import(target_db, bundle, fingerprint="other-model:v2:def")
+
+    assert not response.success
+    assert "other-model" in response.error
+    with SQLiteChunkRepository(target_db) as chunk_repo:
+        assert chunk_repo.count_chunks() == 2
+
+
+def test_truncated_bundle_rolls_back(source_db, target_db, tmp_path):
+    """A corrupt bundle does not replace an existing index."""
+    bundle = tmp_path / "index.ember"
+    _export(source_db, bundle)
+    _import(target_db, bundle)
+    bundle.write_bytes(bundle.read_bytes()[:-20])
+
+    response = _import(target_db, bundle)
+
+    assert not response.success
+    with SQLiteChunkRepository(target_db) as chunk_repo:
+        assert chunk_repo.count_chunks() == 2
+
+
+def test_no_preview_quantized_export(source_db, target_db, tmp_path):
+    """--no-preview strips content; int8 vectors stay close to the originals."""
+    bundle = tmp_path / "index.ember"
+    _export(source_db, bundle, include_content=False, quantize=True)
+
+    response = _import(target_db, bundle)
+
+    assert response.success
+    assert not response.include_content
+    local_id = Chunk.compute_id("local", Path("src/cache.py"), 1, 3)
+    with (
+        SQLiteChunkRepository(target_db) as chunk_repo,
+        SQLiteVectorRepository(target_db) as vector_repo,
+    ):
+        assert chunk_repo.get(local_id).content == ""
+        vector = vector_repo.get(local_id)
+        assert vector == pytest.approx([1.0, 0.5, -0.5], abs=0.01)
+
+
+def test_import_seeds_shared_embedding_cache(source_db, target_db, tmp_path):
+    """Bundle vectors are reusable by later syncs through the shared cache."""
+    bundle = tmp_path / "index.ember"
+    _export(source_db, bundle)
+    content = "def login(user):\n    check_password(user)"
+
+    with SQLiteEmbeddingCache(tmp_path / "cache.db") as cache:
+        _import(target_db, bundle, cache=cache)
+        cached = cache.get_many(FINGERPRINT, [Chunk.compute_content_hash(content)])
+
+    assert list(cached.values()) == [[0.0, 0.5, -0.5]]
+
+
+def test_quantized_import_does_not_seed_cache(source_db, target_db, tmp_path):
+    """Lossy int8 vectors are not stored as exact model outputs."""
+    bundle = tmp_path / "index.ember"
+    _export(source_db, bundle, quantize=True)
+    content = "def login(user):\n    check_password(user)"
+
+    with SQLiteEmbeddingCache(tmp_path / "cache.db") as cache:
+        response = _import(target_db, bundle, cache=cache)
+        cached = cache.get_many(FINGERPRINT, [Chunk.compute_content_hash(content)])
+
+    assert response.success
+    assert response.vectors_imported > 0
+    assert cached == {}
+
+
+def test_export_requires_synced_index(db_path, tmp_path):
+    """An index that was never synced cannot be exported."""
+    bundle = tmp_path / "index.ember"
+    with (
+        SQLiteIndexSnapshotRepository(db_path) as snapshot_repo,
+        SQLiteMetaRepository(db_path) as meta_repo,
+    ):
+        response = ExportUseCase(snapshot_repo, meta_repo, JsonlBundleWriter(bundle)).execute(
+            ExportRequest(repo_root=SOURCE_ROOT)
+        )
+
+    assert not response.success
+    assert not bundle.exists()
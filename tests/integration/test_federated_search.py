@@ -0,0 +1,165 @@
+"""Integration tests for searching several repositories at once."""
+
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.fs.local import LocalFileSystem
+from ember.adapters.fts.sqlite_fts import SQLiteFTS
+from ember.adapters.git_cmd.git_adapter import GitAdapter
+from ember.adapters.parsers.line_chunker import LineChunker
+from ember.adapters.parsers.tree_sitter_chunker import TreeSitterChunker
+from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+from ember.adapters.sqlite.file_repository import SQLiteFileRepository
+from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
+from ember.adapters.sqlite.schema import init_database
+from ember.adapters.sqlite.vector_repository import SQLiteVectorRepository
+from ember.core.chunking.chunk_usecase import ChunkFileUseCase
+from ember.core.indexing.index_usecase import IndexingUseCase, IndexRequest
+from ember.core.retrieval.federated_search import (
+    FederatedRepo,
+    FederatedSearchUseCase,
+    merge_ranked,
+)
+from ember.core.retrieval.search_usecase import SearchUseCase
+from ember.domain.entities import Chunk, Query, SearchResult
+from tests.conftest import create_git_repo
+
+
+class CountingEmbedder:
+    """Deterministic embedder that counts embedding calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    @property
+    def dim(self) -> int:
+        return 3
+
+    def fingerprint(self) -> str:
+        return "fake-model:v1"
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        return [[float(len(t)), 1.0, 0.5] for t in texts]
+
+
+class NoVectorSearch:
+    """Vector search without results (sqlite-vec is not needed for merging)."""
+
+    def add(self, chunk_id: str, embedding: list[float]) -> None:
+        pass
+
+    def query(self, vector, topk=100, path_filter=None, ref=None):
+        return []
+
+
+def _index_repo(root: Path) -> Path:
+    db = root / ".ember" / "index.db"
+    db.parent.mkdir()
+    init_database(db)
+    response = IndexingUseCase(
+        vcs=GitAdapter(root),
+        fs=LocalFileSystem(),
+        chunk_usecase=ChunkFileUseCase(TreeSitterChunker(), LineChunker()),
+        embedder=CountingEmbedder(),
+        chunk_repo=SQLiteChunkRepository(db),
+        vector_repo=SQLiteVectorRepository(db),
+        file_repo=SQLiteFileRepository(db),
+        meta_repo=SQLiteMetaRepository(db),
+        project_id=root.name,
+    ).execute(IndexRequest(repo_root=root))
+    assert response.success, response.error
+    return db
+
+
+def _repo(root: Path, embedder: CountingEmbedder, model_key: str) -> FederatedRepo:
+    db = root / ".ember" / "index.db"
+    search = SearchUseCase(
+        text_search=SQLiteFTS(db),
+        vector_search=NoVectorSearch(),
+        chunk_repo=SQLiteChunkRepository(db),
+        embedder=embedder,
+    )
+    return FederatedRepo(root=root, search=search, model_key=model_key)
+
+
+@pytest.fixture
+def repos(tmp_path: Path) -> tuple[Path, Path]:
+    """Two indexed repositories with a matching function each."""
+    api = create_git_repo(
+        tmp_path / "api",
+        files={"handler.py": "def handle_request(req):\n    return respond(req)\n"},
+    )
+    web = create_git_repo(
+        tmp_path / "web",
+        files={"page.py": "def render_page(ctx):\n    return template(ctx)\n"},
+    )
+    _index_repo(api)
+    _index_repo(web)
+    return api, web
+
+
+def _result(path: str, score: float) -> SearchResult:
+    chunk = Chunk(
+        id=Chunk.compute_id("proj", Path(path), 1, 1),
+        project_id="proj",
+        path=Path(path),
+        lang="py",
+        symbol=None,
+        start_line=1,
+        end_line=1,
+        content="x",
+        content_hash=Chunk.compute_content_hash("x"),
+        file_hash="f",
+        tree_sha="t",
+        rev="worktree",
+    )
+    return SearchResult(chunk=chunk, score=score, rank=1)
+
+
+def test_merge_ranked_interleaves_rankings() -> None:
+    """Results are merged by rank, since scores of different indexes differ."""
+    first = [_result("a1.py", 0.9), _result("a2.py", 0.8)]
+    second = [_result("b1.py", 0.02), _result("b2.py", 0.01)]
+
+    merged = merge_ranked([first, second], topk=3)
+
+    assert [str(r.chunk.path) for r in merged] == ["a1.py", "b1.py", "a2.py"]
+    assert [r.rank for r in merged] == [1, 2, 3]
+
+
+def test_results_are_tagged_with_their_repo(repos: tuple[Path, Path]) -> None:
+    """Each repository is searched and its results name the repository."""
+    api, web = repos
+    embedder = CountingEmbedder()
+    usecase = FederatedSearchUseCase(
+        repos=[_repo(api, embedder, "fake"), _repo(web, embedder, "fake")],
+        embedders={"fake": embedder},
+    )
+
+    results = usecase.search(Query(text="return", topk=5))
+
+    assert {(r.repo, str(r.chunk.path)) for r in results} == {
+        (api, "handler.py"),
+        (web, "page.py"),
+    }
+    assert embedder.calls == 1
+
+
+def test_query_is_embedded_once_per_model(repos: tuple[Path, Path]) -> None:
+    """Repositories indexed with different models get their own embedding."""
+    api, web = repos
+    first, second = CountingEmbedder(), CountingEmbedder()
+    usecase = FederatedSearchUseCase(
+        repos=[_repo(api, first, "model-a"), _repo(web, second, "model-b")],
+        embedders={"model-a": first, "model-b": second},
+    )
+
+    usecase.search(Query(text="return", topk=5))
+
+    assert (first.calls, second.calls) == (1, 1)
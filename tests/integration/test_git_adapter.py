@@ -191,6 +191,89 @@ def test_get_file_content_invalid_ref(git_adapter: GitAdapter):
         git_adapter.get_file_content(Path("file1.txt"), "invalid-ref")
 
 
+def test_get_file_content_at_tree_sha(git_adapter: GitAdapter, git_repo: Path):
+    """Test getting file content addressed by tree SHA ignores the worktree."""
+    tree_sha = git_adapter.get_tree_sha("HEAD")
+    (git_repo / "file1.txt").write_text("changed on disk\n")
+
+    assert git_adapter.get_file_content(Path("file1.txt"), tree_sha) == b"Hello world\n"
+
+
+def test_get_file_content_reuses_cat_file_process(
+    git_adapter: GitAdapter, monkeypatch: pytest.MonkeyPatch
+):
+    """Test repeated reads share a single git cat-file process."""
+    spawned: list[list[str]] = []
+    real_popen = subprocess.Popen
+
+    def counting_popen(cmd, *args, **kwargs):
+        spawned.append(cmd)
+        return real_popen(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", counting_popen)
+
+    for _ in range(5):
+        assert git_adapter.get_file_content(Path("file1.txt"), "HEAD") == b"Hello world\n"
+        assert git_adapter.get_file_content(Path("file2.py"), "HEAD") == b"print('hello')\n"
+
+    assert len(spawned) == 1
+    assert spawned[0][-2:] == ["cat-file", "--batch"]
+    git_adapter.close()
+
+
+def test_get_file_content_binary_blob(git_repo: Path):
+    """Test binary content (including newlines and NULs) round-trips exactly."""
+    payload = bytes(range(256)) * 4 + b"\n\n"
+    (git_repo / "blob.bin").write_bytes(payload)
+    git_add_and_commit(git_repo, message="Add binary")
+
+    with GitAdapter(git_repo) as adapter:
+        assert adapter.get_file_content(Path("blob.bin"), "HEAD") == payload
+        # Reader stays in sync for subsequent requests
+        assert adapter.get_file_content(Path("file1.txt"), "HEAD") == b"Hello world\n"
+
+
+def test_get_file_content_after_close_restarts_reader(git_adapter: GitAdapter):
+    """Test closing the adapter doesn't prevent later reads."""
+    git_adapter.get_file_content(Path("file1.txt"), "HEAD")
+    git_adapter.close()
+    assert git_adapter.get_file_content(Path("file1.txt"), "HEAD") == b"Hello world\n"
+    git_adapter.close()
+
+
+def test_get_file_content_directory_raises(git_repo: Path):
+    """Test requesting a directory (tree object) raises FileNotFoundError."""
+    (git_repo / "pkg").mkdir()
+    (git_repo / "pkg" / "mod.py").write_text("x = 1\n")
+    git_add_and_commit(git_repo, message="Add package")
+
+    with GitAdapter(git_repo) as adapter, pytest.raises(FileNotFoundError, match="not found"):
+        adapter.get_file_content(Path("pkg"), "HEAD")
+
+
+def test_list_files_at_tree(git_adapter: GitAdapter, git_repo: Path):
+    """Test listing files recorded in a tree ignores untracked files."""
+    (git_repo / "untracked.py").write_text("x = 1\n")
+
+    files = git_adapter.list_files_at(git_adapter.get_tree_sha("HEAD"))
+
+    assert set(files) == {Path("file1.txt"), Path("file2.py")}
+
+
+def test_get_staged_tree_sha(git_adapter: GitAdapter, git_repo: Path):
+    """Test staged tree SHA reflects the index, not unstaged edits."""
+    head_tree = git_adapter.get_tree_sha("HEAD")
+    assert git_adapter.get_staged_tree_sha() == head_tree
+
+    (git_repo / "file1.txt").write_text("unstaged\n")
+    assert git_adapter.get_staged_tree_sha() == head_tree
+
+    subprocess.run(["git", "-C", str(git_repo), "add", "file1.txt"], check=True)
+    staged_tree = git_adapter.get_staged_tree_sha()
+    assert staged_tree != head_tree
+    assert git_adapter.get_file_content(Path("file1.txt"), staged_tree) == b"unstaged\n"
+
+
 def test_diff_files_returns_empty_for_identical_trees(git_adapter: GitAdapter):
     """Test diff returns empty list when trees are identical."""
     tree = git_adapter.get_tree_sha("HEAD")
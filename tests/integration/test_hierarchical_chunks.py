@@ -0,0 +1,137 @@
+"""Integration tests for hierarchical chunking and rolling results up to parents."""
+
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.fs.local import LocalFileSystem
+from ember.adapters.fts.sqlite_fts import SQLiteFTS
+from ember.adapters.git_cmd.git_adapter import GitAdapter
+from ember.adapters.parsers.line_chunker import LineChunker
+from ember.adapters.parsers.tree_sitter_chunker import TreeSitterChunker
+from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+from ember.adapters.sqlite.file_repository import SQLiteFileRepository
+from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
+from ember.adapters.sqlite.schema import init_database
+from ember.adapters.sqlite.vector_repository import SQLiteVectorRepository
+from ember.core.chunking.chunk_usecase import ChunkFileUseCase
+from ember.core.indexing.index_usecase import IndexingUseCase, IndexRequest
+from ember.core.retrieval.search_usecase import SearchUseCase
+from ember.domain.entities import Query
+from tests.conftest import create_git_repo
+
+SOURCE = '''class Inventory:
+    """Tracks stock levels."""
+
+    def restock(self, item, amount):
+        self.levels[item] += amount
+        self.audit("restock", item)
+
+    def withdraw(self, item, amount):
+        self.levels[item] -= amount
+        self.audit("withdraw", item)
+
+
+def report():
+    return "restock summary"
+'''
+
+
+class FakeEmbedder:
+    """Deterministic embedder without a model."""
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    @property
+    def dim(self) -> int:
+        return 3
+
+    def fingerprint(self) -> str:
+        return "fake-model:v1"
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        return [[float(len(t)), 1.0, 0.5] for t in texts]
+
+
+class NoVectorSearch:
+    """Vector search without results, so ranking comes from BM25 alone."""
+
+    def add(self, chunk_id: str, embedding: list[float]) -> None:
+        pass
+
+    def query(self, vector, topk=100, path_filter=None, ref=None):
+        return []
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Path:
+    """Repository indexed with hierarchical chunking."""
+    root = create_git_repo(tmp_path / "repo", files={"inventory.py": SOURCE})
+    db = root / ".ember" / "index.db"
+    db.parent.mkdir()
+    init_database(db)
+    response = IndexingUseCase(
+        vcs=GitAdapter(root),
+        fs=LocalFileSystem(),
+        chunk_usecase=ChunkFileUseCase(TreeSitterChunker(), LineChunker(), hierarchical=True),
+        embedder=FakeEmbedder(),
+        chunk_repo=SQLiteChunkRepository(db),
+        vector_repo=SQLiteVectorRepository(db),
+        file_repo=SQLiteFileRepository(db),
+        meta_repo=SQLiteMetaRepository(db),
+        project_id="repo",
+    ).execute(IndexRequest(repo_root=root))
+    assert response.success, response.error
+    return db
+
+
+def _search(db: Path, text: str, rollup: bool) -> list[tuple[str | None, float]]:
+    usecase = SearchUseCase(
+        text_search=SQLiteFTS(db),
+        vector_search=NoVectorSearch(),
+        chunk_repo=SQLiteChunkRepository(db),
+        embedder=FakeEmbedder(),
+    )
+    results = usecase.search(Query(text=text, topk=10, rollup=rollup))
+    return [(r.chunk.symbol, r.explanation["rolled_up"] if rollup else 0) for r in results]
+
+
+def test_method_bodies_are_stored_once(db: Path) -> None:
+    """The class chunk holds signatures only; bodies live in method chunks."""
+    chunks = {c.symbol: c for c in SQLiteChunkRepository(db).list_all()}
+
+    assert "self.audit" not in chunks["Inventory"].content
+    assert "def restock(self, item, amount):" in chunks["Inventory"].content
+    assert "self.audit" in chunks["restock"].content
+
+
+def test_find_parent_links_method_to_class(db: Path) -> None:
+    """Methods are linked to the class containing them; top-level chunks are not."""
+    repo = SQLiteChunkRepository(db)
+    chunks = {c.symbol: c for c in repo.list_all()}
+
+    parent = repo.find_parent(chunks["withdraw"])
+
+    assert parent is not None
+    assert parent.symbol == "Inventory"
+    assert repo.find_parent(chunks["Inventory"]) is None
+    assert repo.find_parent(chunks["report"]) is None
+
+
+def test_rollup_merges_methods_into_class(db: Path) -> None:
+    """Matching methods are replaced by their class, once."""
+    assert {symbol for symbol, _ in _search(db, "audit", rollup=False)} == {
+        "restock",
+        "withdraw",
+    }
+
+    assert _search(db, "audit", rollup=True) == [("Inventory", 2)]
+
+
+def test_rollup_keeps_top_level_matches(db: Path) -> None:
+    """Top-level functions stand for themselves when rolled up."""
+    results = dict(_search(db, "restock", rollup=True))
+
+    assert results == {"Inventory": 1, "report": 0}
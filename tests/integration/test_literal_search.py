@@ -0,0 +1,112 @@
+"""Integration tests for trigram-backed literal and regex search."""
+
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.fts.trigram_search import SQLiteTrigramSearch
+from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+from ember.adapters.sqlite.schema import init_database, rebuild_fts
+from ember.core.retrieval.literal_search import LiteralSearchUseCase
+from ember.domain.entities import Chunk, Query
+
+
+def _chunk(path: str, content: str, start_line: int = 1) -> Chunk:
+    return Chunk(
+        id=Chunk.compute_id("proj", Path(path), start_line, start_line + 1),
+        project_id="proj",
+        path=Path(path),
+        lang="py",
+        symbol=None,
+        start_line=start_line,
+        end_line=start_line + content.count("\n"),
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash=f"hash-{path}",
+        tree_sha="tree1",
+        rev="worktree",
+    )
+
+
+CLIENT = _chunk(
+    "api/client.py",
+    "def fetch_users(session):\n    return session.get('/v2/users')\n",
+    start_line=10,
+)
+RETRY = _chunk(
+    "api/retry.py",
+    "def backoff(resp):\n    wait = resp.headers['Retry-After']\n"
+    "    return max_retry_after_s(wait) + max_retry_after_s(1)\n",
+)
+DOCS = _chunk("docs/notes.py", "# Users of /v1/users should migrate")
+
+
+@pytest.fixture(params=[True, False], ids=["trigram", "scan"])
+def index_db(request, tmp_path: Path) -> Path:
+    """Database with sample chunks, with and without the trigram index."""
+    db_path = tmp_path / "index.db"
+    init_database(db_path, trigram_index=request.param)
+    with SQLiteChunkRepository(db_path) as repo:
+        for chunk in (CLIENT, RETRY, DOCS):
+            repo.add(chunk)
+    return db_path
+
+
+def _match(db_path: Path, pattern: str, **kwargs) -> list[tuple[str, float]]:
+    with SQLiteTrigramSearch(db_path) as search:
+        return search.match(pattern, **kwargs)
+
+
+def test_literal_finds_substrings(index_db: Path) -> None:
+    """Partial identifiers and path fragments match, case-sensitively."""
+    assert _match(index_db, "retry_after") == [(RETRY.id, 2.0)]
+    assert _match(index_db, "/v2/users") == [(CLIENT.id, 1.0)]
+    assert _match(index_db, "/V2/USERS") == []
+
+
+def test_regex_is_verified_after_prefilter(index_db: Path) -> None:
+    """Regex candidates sharing the literal parts must still match."""
+    assert _match(index_db, r"/v\d/users", regex=True) == [
+        (CLIENT.id, 1.0),
+        (DOCS.id, 1.0),
+    ]
+    assert _match(index_db, r"/v2/users\d", regex=True) == []
+    assert _match(index_db, r"(?i)retry.after", regex=True) == [(RETRY.id, 3.0)]
+
+
+def test_path_filter_and_short_patterns(index_db: Path) -> None:
+    """Path filters apply, and patterns too short for trigrams still match."""
+    assert _match(index_db, "users", path_filter="docs/*") == [(DOCS.id, 1.0)]
+    assert _match(index_db, "1)") == [(RETRY.id, 1.0)]
+
+
+def test_use_case_reports_first_match_line(index_db: Path) -> None:
+    """Results point at the line of the first match in the chunk."""
+    with (
+        SQLiteTrigramSearch(index_db) as search,
+        SQLiteChunkRepository(index_db) as repo,
+    ):
+        results = LiteralSearchUseCase(search, repo).search(Query(text="/v2/users"))
+
+    assert [r.chunk.id for r in results] == [CLIENT.id]
+    assert results[0].explanation == {"matches": 1.0, "match_line": 11}
+    assert results[0].preview.startswith("    return session.get('/v2/users')")
+
+
+def test_trigram_index_follows_chunk_changes(tmp_path: Path) -> None:
+    """Triggers keep the trigram index in sync, and rebuilds add it in place."""
+    db_path = tmp_path / "index.db"
+    init_database(db_path)
+    with SQLiteChunkRepository(db_path) as repo:
+        repo.add(CLIENT)
+    assert rebuild_fts(db_path, "code", trigram_index=True) == 1
+    with SQLiteTrigramSearch(db_path) as search:
+        assert search.has_index()
+
+    rewritten = _chunk("api/client.py", "def fetch_users(session):\n    return []\n", 10)
+    with SQLiteChunkRepository(db_path) as repo:
+        repo.add(rewritten)
+        assert _match(db_path, "/v2/users") == []
+        assert _match(db_path, "return []") == [(CLIENT.id, 1.0)]
+        repo.delete(CLIENT.id)
+    assert _match(db_path, "return []") == []
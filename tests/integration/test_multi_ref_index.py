@@ -0,0 +1,277 @@
+"""Integration tests for keeping several refs indexed with shared chunk storage."""
+
+import sqlite3
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.fs.local import LocalFileSystem
+from ember.adapters.fts.sqlite_fts import SQLiteFTS
+from ember.adapters.git_cmd.git_adapter import GitAdapter
+from ember.adapters.parsers.line_chunker import LineChunker
+from ember.adapters.parsers.tree_sitter_chunker import TreeSitterChunker
+from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+from ember.adapters.sqlite.file_repository import SQLiteFileRepository
+from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
+from ember.adapters.sqlite.ref_repository import SQLiteRefRepository
+from ember.adapters.sqlite.schema import SCHEMA_VERSION, check_schema_version
+from ember.adapters.sqlite.vector_repository import SQLiteVectorRepository
+from ember.adapters.vss.sqlite_vec_adapter import SqliteVecAdapter
+from ember.core.chunking.chunk_usecase import ChunkFileUseCase
+from ember.core.indexing.index_usecase import IndexingUseCase, IndexRequest
+from ember.domain.entities import Chunk
+from tests.conftest import create_git_repo, git_add_and_commit
+
+FINGERPRINT = "fake-model:v1"
+
+
+class CountingEmbedder:
+    """Deterministic embedder that counts the texts it embeds."""
+
+    def __init__(self) -> None:
+        self.embedded = 0
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    @property
+    def dim(self) -> int:
+        return 3
+
+    def fingerprint(self) -> str:
+        return FINGERPRINT
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.embedded += len(texts)
+        return [[float(len(t)), 1.0, 0.0] for t in texts]
+
+
+def _chunk(path: str, content: str, file_hash: str, tree_sha: str = "tree1") -> Chunk:
+    return Chunk(
+        id=Chunk.compute_id("proj", Path(path), 1, 2),
+        project_id="proj",
+        path=Path(path),
+        lang="py",
+        symbol=None,
+        start_line=1,
+        end_line=2,
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash=file_hash,
+        tree_sha=tree_sha,
+        rev="worktree",
+    )
+
+
+def _add_live(db_path: Path, chunk: Chunk) -> None:
+    with (
+        SQLiteChunkRepository(db_path) as chunk_repo,
+        SQLiteVectorRepository(db_path) as vector_repo,
+    ):
+        chunk_repo.add(chunk)
+        vector_repo.add(chunk.id, [0.5, 0.5, 0.5], FINGERPRINT)
+
+
+class TestRefRepository:
+    """Tests for retaining, restoring, and pruning file versions."""
+
+    def test_retire_and_restore(self, db_path: Path) -> None:
+        """A retired version leaves the live index and comes back with its vector."""
+        chunk = _chunk("auth.py", "def login(): pass", "h1")
+        _add_live(db_path, chunk)
+
+        with (
+            SQLiteRefRepository(db_path) as ref_repo,
+            SQLiteChunkRepository(db_path) as chunk_repo,
+            SQLiteVectorRepository(db_path) as vector_repo,
+        ):
+            assert ref_repo.retire(Path("auth.py")) == 1
+            assert chunk_repo.count_chunks() == 0
+            assert chunk_repo.get(chunk.id) is None
+            assert ref_repo.has_version(Path("auth.py"), "h1")
+
+            assert ref_repo.restore(Path("auth.py"), "h1") == 1
+            assert chunk_repo.count_chunks() == 1
+            assert vector_repo.get(chunk.id) == [0.5, 0.5, 0.5]
+
+    def test_restore_unknown_version(self, db_path: Path) -> None:
+        """Restoring a version that was never retained changes nothing."""
+        _add_live(db_path, _chunk("auth.py", "def login(): pass", "h1"))
+
+        with (
+            SQLiteRefRepository(db_path) as ref_repo,
+            SQLiteChunkRepository(db_path) as chunk_repo,
+        ):
+            assert ref_repo.restore(Path("auth.py"), "h2") == 0
+            assert chunk_repo.count_chunks() == 1
+
+    def test_ref_scoped_text_search(self, db_path: Path) -> None:
+        """Queries see the live index by default and a ref's versions when asked."""
+        _add_live(db_path, _chunk("auth.py", "def login_legacy(): pass", "h1"))
+        with SQLiteRefRepository(db_path) as ref_repo:
+            ref_repo.record("release", "tree1")
+            ref_repo.retire(Path("auth.py"), replacing="h2")
+        _add_live(db_path, _chunk("auth.py", "def login_modern(): pass", "h2", "tree2"))
+
+        with SQLiteFTS(db_path) as fts, SQLiteChunkRepository(db_path) as chunk_repo:
+            assert fts.query("login_legacy") == []
+            assert len(fts.query("login_modern")) == 1
+            assert fts.query("login_modern", ref="release") == []
+            [(chunk_id, _)] = fts.query("login_legacy", ref="release")
+            assert chunk_repo.get(chunk_id).file_hash == "h1"
+
+    def test_ref_scoped_vector_search(self, db_path: Path) -> None:
+        """Vector queries see the live index by default and a ref's versions when asked."""
+        _add_live(db_path, _chunk("auth.py", "def login_legacy(): pass", "h1"))
+        with SQLiteRefRepository(db_path) as ref_repo:
+            ref_repo.record("release", "tree1")
+            ref_repo.retire(Path("auth.py"), replacing="h2")
+        _add_live(db_path, _chunk("auth.py", "def login_modern(): pass", "h2", "tree2"))
+
+        with (
+            SqliteVecAdapter(db_path, vector_dim=3) as vec,
+            SQLiteChunkRepository(db_path) as chunk_repo,
+        ):
+            [(live_id, score)] = vec.query([0.5, 0.5, 0.5], topk=10)
+            assert chunk_repo.get(live_id).file_hash == "h2"
+            assert score == pytest.approx(1.0)
+
+            [(ref_id, _)] = vec.query([0.5, 0.5, 0.5], topk=10, ref="release")
+            assert chunk_repo.get(ref_id).file_hash == "h1"
+            assert vec.query([0.5, 0.5, 0.5], topk=10, ref="unknown") == []
+
+    def test_prune_forgets_oldest_refs(self, db_path: Path) -> None:
+        """Versions only an evicted ref contained are deleted."""
+        _add_live(db_path, _chunk("auth.py", "def login(): pass", "h1"))
+        with SQLiteRefRepository(db_path) as ref_repo:
+            ref_repo.record("old", "tree1")
+            ref_repo.retire(Path("auth.py"), replacing="h2")
+            _add_live(db_path, _chunk("auth.py", "def login(): return", "h2", "tree2"))
+            ref_repo.record("new", "tree2")
+
+            assert ref_repo.prune(keep=2) == 0
+            assert ref_repo.prune(keep=1) == 1
+
+            assert [r.name for r in ref_repo.list_refs()] == ["new"]
+            assert not ref_repo.has_version(Path("auth.py"), "h1")
+            assert ref_repo.has_version(Path("auth.py"), "h2")
+
+    def test_store_version_is_not_live(self, db_path: Path) -> None:
+        """Chunks stored for another ref stay out of the live index."""
+        base = _chunk("auth.py", "def login(): pass", "h9", "tree9")
+        chunk = Chunk(**{**base.__dict__, "id": Chunk.compute_id("proj", base.path, 1, 2, "h9")})
+
+        with (
+            SQLiteRefRepository(db_path) as ref_repo,
+            SQLiteChunkRepository(db_path) as chunk_repo,
+        ):
+            assert ref_repo.store_version([chunk], [[1.0, 0.0, 0.0]], FINGERPRINT) == 1
+            assert ref_repo.store_version([chunk], [[1.0, 0.0, 0.0]], FINGERPRINT) == 0
+            ref_repo.record("feature", "tree9", {Path("auth.py"): "h9"})
+
+            assert chunk_repo.count_chunks() == 0
+            assert ref_repo.get("feature").files == 1
+            assert ref_repo.find_by_tree("tree9").name == "feature"
+
+    def test_migrates_v3_database(self, db_path: Path) -> None:
+        """Opening a database from before multi-ref support adds the ref tables."""
+        _add_live(db_path, _chunk("auth.py", "def login(): pass", "h1"))
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP TABLE ref_files")
+        conn.execute("DROP TABLE refs")
+        conn.execute("DROP INDEX idx_chunks_retained")
+        conn.execute("ALTER TABLE chunks DROP COLUMN live")
+        conn.execute("UPDATE meta SET value = '3' WHERE key = 'schema_version'")
+        conn.commit()
+        conn.close()
+
+        with SQLiteRefRepository(db_path) as ref_repo:
+            assert ref_repo.live_files() == {Path("auth.py"): "h1"}
+
+        assert check_schema_version(db_path) == SCHEMA_VERSION
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, timeout=5)
+
+
+@pytest.fixture
+def branchy_repo(tmp_path: Path) -> Path:
+    """Repository with a main and a feature branch that differ in one file."""
+    repo = create_git_repo(
+        tmp_path / "repo",
+        files={
+            "auth.py": "def login(user):\n    return check(user)\n",
+            "cache.py": "def evict(cache):\n    cache.clear()\n",
+        },
+    )
+    _git(repo, "branch", "-M", "main")
+    _git(repo, "checkout", "-b", "feature")
+    (repo / "auth.py").write_text("def login(user, token):\n    return verify(token)\n")
+    git_add_and_commit(repo, message="Token login")
+    _git(repo, "checkout", "main")
+    return repo
+
+
+def _usecase(repo: Path, db_path: Path, embedder: CountingEmbedder) -> IndexingUseCase:
+    return IndexingUseCase(
+        vcs=GitAdapter(repo),
+        fs=LocalFileSystem(),
+        chunk_usecase=ChunkFileUseCase(TreeSitterChunker(), LineChunker()),
+        embedder=embedder,
+        chunk_repo=SQLiteChunkRepository(db_path),
+        vector_repo=SQLiteVectorRepository(db_path),
+        file_repo=SQLiteFileRepository(db_path),
+        meta_repo=SQLiteMetaRepository(db_path),
+        project_id="proj",
+        ref_repo=SQLiteRefRepository(db_path),
+    )
+
+
+class TestBranchSwitching:
+    """Tests for syncing across branch switches."""
+
+    def test_switching_back_reuses_chunks(self, branchy_repo: Path, db_path: Path) -> None:
+        """Only the first sync of each branch embeds anything."""
+        embedder = CountingEmbedder()
+        usecase = _usecase(branchy_repo, db_path, embedder)
+        request = IndexRequest(repo_root=branchy_repo)
+
+        assert usecase.execute(request).success
+        _git(branchy_repo, "checkout", "feature")
+        assert usecase.execute(request).success
+        embedded = embedder.embedded
+
+        _git(branchy_repo, "checkout", "main")
+        back = usecase.execute(request)
+        _git(branchy_repo, "checkout", "feature")
+        again = usecase.execute(request)
+
+        assert (back.files_restored, again.files_restored) == (1, 1)
+        assert embedder.embedded == embedded
+        with SQLiteFTS(db_path) as fts:
+            assert len(fts.query("verify")) == 1
+            assert fts.query("check") == []
+            assert len(fts.query("check", ref="main")) == 1
+
+    def test_index_rev_as_ref(self, branchy_repo: Path, db_path: Path) -> None:
+        """A rev is indexed alongside the live index, embedding only its differences."""
+        embedder = CountingEmbedder()
+        usecase = _usecase(branchy_repo, db_path, embedder)
+        assert usecase.execute(IndexRequest(repo_root=branchy_repo)).success
+        embedded = embedder.embedded
+
+        response = usecase.execute(
+            IndexRequest(repo_root=branchy_repo, sync_mode="feature", as_ref=True)
+        )
+
+        assert response.success, response.error
+        assert response.files_indexed == 1
+        assert embedder.embedded > embedded
+        with SQLiteFTS(db_path) as fts, SQLiteMetaRepository(db_path) as meta_repo:
+            assert fts.query("verify") == []
+            assert len(fts.query("verify", ref="feature")) == 1
+            assert len(fts.query("evict", ref="feature")) == 1
+            assert meta_repo.get("last_sync_mode") == "worktree"
@@ -609,3 +609,75 @@ def test_missing_chunks_logged(db_path: Path, caplog: pytest.LogCaptureFixture)
     # Should include recovery guidance (issue #146)
     assert "ember sync --force" in log_record.message
     assert "report an issue" in log_record.message.lower()
+
+
+def test_search_text_skips_embedding(db_path: Path, sample_chunks: list[Chunk]) -> None:
+    """Test that text-only search ranks BM25 matches without embedding the query."""
+    chunk_repo = SQLiteChunkRepository(db_path)
+    for chunk in sample_chunks:
+        chunk_repo.add(chunk)
+    embedder = MagicMock()
+    vector_search = MagicMock()
+
+    use_case = SearchUseCase(
+        text_search=SQLiteFTS(db_path),
+        vector_search=vector_search,
+        chunk_repo=chunk_repo,
+        embedder=embedder,
+    )
+    results = use_case.search_text(Query(text="multiply", topk=2))
+
+    assert [r.chunk.symbol for r in results] == ["multiply"]
+    assert results[0].explanation["bm25_score"] > 0
+    assert results[0].explanation["vector_score"] == 0.0
+    embedder.embed_texts.assert_not_called()
+    vector_search.query.assert_not_called()
+
+
+def test_search_modes_skip_unused_retrievers(
+    db_path: Path, sample_chunks: list[Chunk]
+) -> None:
+    """Test that fts mode never embeds and vector mode never queries BM25."""
+    chunk_repo = SQLiteChunkRepository(db_path)
+    for chunk in sample_chunks:
+        chunk_repo.add(chunk)
+    text_search = MagicMock(wraps=SQLiteFTS(db_path))
+    vector_search = MagicMock()
+    vector_search.query.return_value = [(sample_chunks[2].id, 0.1)]
+    embedder = MagicMock()
+    embedder.embed_texts.return_value = [[0.0]]
+
+    use_case = SearchUseCase(
+        text_search=text_search,
+        vector_search=vector_search,
+        chunk_repo=chunk_repo,
+        embedder=embedder,
+    )
+
+    fts_results = use_case.search(Query(text="multiply", topk=2, mode="fts"))
+    assert [r.chunk.symbol for r in fts_results] == ["multiply"]
+    embedder.embed_texts.assert_not_called()
+    vector_search.query.assert_not_called()
+
+    text_search.query.reset_mock()
+    vector_results = use_case.search(Query(text="multiply", topk=2, mode="vector"))
+    assert [r.chunk.symbol for r in vector_results] == ["greet"]
+    assert vector_results[0].explanation["bm25_score"] == 0.0
+    text_search.query.assert_not_called()
+
+
+def test_fts_mode_works_without_embedder(db_path: Path, sample_chunks: list[Chunk]) -> None:
+    """Test that a use case without an embedder answers fts queries only."""
+    chunk_repo = SQLiteChunkRepository(db_path)
+    for chunk in sample_chunks:
+        chunk_repo.add(chunk)
+    use_case = SearchUseCase(
+        text_search=SQLiteFTS(db_path),
+        vector_search=MagicMock(),
+        chunk_repo=chunk_repo,
+        embedder=None,
+    )
+
+    assert use_case.search(Query(text="greet", mode="fts"))[0].chunk.symbol == "greet"
+    with pytest.raises(ValueError, match="requires an embedder"):
+        use_case.search(Query(text="greet"))
@@ -0,0 +1,278 @@
+"""Integration tests for directory-sharded indexes."""
+
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.fs.local import LocalFileSystem
+from ember.adapters.fts.sqlite_fts import SQLiteFTS
+from ember.adapters.git_cmd.git_adapter import GitAdapter
+from ember.adapters.parsers.line_chunker import LineChunker
+from ember.adapters.parsers.tree_sitter_chunker import TreeSitterChunker
+from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+from ember.adapters.sqlite.file_repository import SQLiteFileRepository
+from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
+from ember.adapters.sqlite.schema import init_database
+from ember.adapters.sqlite.vector_repository import SQLiteVectorRepository
+from ember.core.chunking.chunk_usecase import ChunkFileUseCase
+from ember.core.indexing.index_usecase import IndexingUseCase, IndexRequest
+from ember.core.indexing.shard_usecase import LAYOUT_META_KEY, ShardedIndexingUseCase
+from ember.core.retrieval.search_usecase import SearchUseCase
+from ember.core.retrieval.sharded_search import ShardedSearchUseCase
+from ember.domain.entities import Query
+from ember.domain.sharding import ROOT_SHARD, ShardLayout
+from ember.shared.shard_io import list_shards, shard_db_path
+from tests.conftest import create_git_repo, git_add_and_commit
+
+
+class CountingEmbedder:
+    """Deterministic embedder that counts queries and embedded texts."""
+
+    def __init__(self) -> None:
+        self.embedded = 0
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    @property
+    def dim(self) -> int:
+        return 3
+
+    def fingerprint(self) -> str:
+        return "fake-model:v1"
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        self.embedded += len(texts)
+        return [[float(len(t)), 1.0, 0.5] for t in texts]
+
+
+@pytest.fixture
+def monorepo(tmp_path: Path) -> Path:
+    """Repository with two top-level directories and a file at the root."""
+    return create_git_repo(
+        tmp_path / "repo",
+        files={
+            "main.py": "def bootstrap():\n    start_services()\n",
+            "api/handler.py": "def handle_request(req):\n    return respond(req)\n",
+            "web/page.py": "def render_page(ctx):\n    return template(ctx)\n",
+        },
+    )
+
+
+def _sharded_usecase(
+    repo: Path,
+    ember_dir: Path,
+    embedder: CountingEmbedder,
+    layout: str = "top_level",
+    hierarchical: bool = False,
+) -> ShardedIndexingUseCase:
+    vcs = GitAdapter(repo)
+    root_db = shard_db_path(ember_dir, ROOT_SHARD)
+    if not root_db.exists():
+        init_database(root_db)
+
+    def create_shard(shard, path_scope):
+        db = shard_db_path(ember_dir, shard)
+        if not db.exists():
+            db.parent.mkdir(parents=True, exist_ok=True)
+            init_database(db)
+        return IndexingUseCase(
+            vcs=GitAdapter(repo),
+            fs=LocalFileSystem(),
+            chunk_usecase=ChunkFileUseCase(
+                TreeSitterChunker(), LineChunker(), hierarchical=hierarchical
+            ),
+            embedder=embedder,
+            chunk_repo=SQLiteChunkRepository(db),
+            vector_repo=SQLiteVectorRepository(db),
+            file_repo=SQLiteFileRepository(db),
+            meta_repo=SQLiteMetaRepository(db),
+            project_id="proj",
+            path_scope=path_scope,
+        )
+
+    def resolve_layout() -> ShardLayout:
+        if layout == "none":
+            return ShardLayout()
+        return ShardLayout.top_level(vcs.list_tracked_files())
+
+    return ShardedIndexingUseCase(
+        layout=resolve_layout,
+        create_shard=create_shard,
+        vcs=vcs,
+        embedder=embedder,
+        meta_repo=SQLiteMetaRepository(root_db),
+        layout_key=layout,
+    )
+
+
+class NoVectorSearch:
+    """Vector search without results (sqlite-vec is not needed for merging)."""
+
+    def add(self, chunk_id: str, embedding: list[float]) -> None:
+        pass
+
+    def query(self, vector, topk=100, path_filter=None, ref=None):
+        return []
+
+
+def _indexed_paths(ember_dir: Path, shard: str) -> set[str]:
+    with SQLiteChunkRepository(shard_db_path(ember_dir, shard)) as chunk_repo:
+        return {str(chunk.path) for chunk in chunk_repo.list_all()}
+
+
+def _search_usecase(ember_dir: Path, embedder: CountingEmbedder) -> ShardedSearchUseCase:
+    shards = {
+        shard: SearchUseCase(
+            text_search=SQLiteFTS(shard_db_path(ember_dir, shard)),
+            vector_search=NoVectorSearch(),
+            chunk_repo=SQLiteChunkRepository(shard_db_path(ember_dir, shard)),
+            embedder=embedder,
+        )
+        for shard in [ROOT_SHARD, *list_shards(ember_dir)]
+    }
+    return ShardedSearchUseCase(
+        shards=shards, layout=ShardLayout(tuple(list_shards(ember_dir))), embedder=embedder
+    )
+
+
+class TestShardedSync:
+    """Tests for syncing a sharded index."""
+
+    def test_files_go_to_their_shard(self, monorepo: Path, tmp_path: Path) -> None:
+        """Each top-level directory is indexed in its own database."""
+        ember_dir = tmp_path / ".ember"
+        ember_dir.mkdir()
+
+        response = _sharded_usecase(monorepo, ember_dir, CountingEmbedder()).execute(
+            IndexRequest(repo_root=monorepo)
+        )
+
+        assert response.success, response.error
+        assert response.files_indexed == 3
+        assert list_shards(ember_dir) == ["api", "web"]
+        assert _indexed_paths(ember_dir, ROOT_SHARD) == {"main.py"}
+        assert _indexed_paths(ember_dir, "api") == {"api/handler.py"}
+        assert _indexed_paths(ember_dir, "web") == {"web/page.py"}
+        with SQLiteMetaRepository(shard_db_path(ember_dir, ROOT_SHARD)) as meta_repo:
+            assert meta_repo.get("last_tree_sha") == response.tree_sha
+            assert meta_repo.get(LAYOUT_META_KEY) == "top_level"
+
+    def test_incremental_sync_only_touches_changed_shard(
+        self, monorepo: Path, tmp_path: Path
+    ) -> None:
+        """Changing one directory re-embeds only that directory's files."""
+        ember_dir = tmp_path / ".ember"
+        ember_dir.mkdir()
+        embedder = CountingEmbedder()
+        usecase = _sharded_usecase(monorepo, ember_dir, embedder)
+        usecase.execute(IndexRequest(repo_root=monorepo))
+        embedded = embedder.embedded
+
+        (monorepo / "web" / "page.py").write_text("def render_page(ctx):\n    return html(ctx)\n")
+        git_add_and_commit(monorepo, message="Change page")
+        response = usecase.execute(IndexRequest(repo_root=monorepo))
+
+        assert response.success, response.error
+        assert response.files_indexed == 1
+        assert response.is_incremental
+        assert embedder.embedded == embedded + 1
+
+    def test_layout_change_rebuilds_shards(self, monorepo: Path, tmp_path: Path) -> None:
+        """Switching on sharding moves files out of the root shard."""
+        ember_dir = tmp_path / ".ember"
+        ember_dir.mkdir()
+        _sharded_usecase(monorepo, ember_dir, CountingEmbedder(), layout="none").execute(
+            IndexRequest(repo_root=monorepo)
+        )
+        assert len(_indexed_paths(ember_dir, ROOT_SHARD)) == 3
+
+        response = _sharded_usecase(monorepo, ember_dir, CountingEmbedder()).execute(
+            IndexRequest(repo_root=monorepo)
+        )
+
+        assert response.success, response.error
+        assert _indexed_paths(ember_dir, ROOT_SHARD) == {"main.py"}
+        assert _indexed_paths(ember_dir, "api") == {"api/handler.py"}
+
+
+class TestShardedSearch:
+    """Tests for querying a sharded index."""
+
+    @pytest.fixture
+    def ember_dir(self, monorepo: Path, tmp_path: Path) -> Path:
+        ember_dir = tmp_path / ".ember"
+        ember_dir.mkdir()
+        response = _sharded_usecase(monorepo, ember_dir, CountingEmbedder()).execute(
+            IndexRequest(repo_root=monorepo)
+        )
+        assert response.success, response.error
+        return ember_dir
+
+    def test_query_fans_out_and_embeds_once(self, ember_dir: Path) -> None:
+        """Results from every shard are merged and re-ranked."""
+        embedder = CountingEmbedder()
+
+        results = _search_usecase(ember_dir, embedder).search(
+            Query(text="return", topk=5)
+        )
+
+        assert embedder.calls == 1
+        assert {str(r.chunk.path) for r in results} == {"api/handler.py", "web/page.py"}
+        assert [r.rank for r in results] == list(range(1, len(results) + 1))
+        assert results == sorted(results, key=lambda r: r.score, reverse=True)
+
+    def test_path_filter_prunes_shards(self, ember_dir: Path) -> None:
+        """A query restricted to one directory only searches its shard."""
+        usecase = _search_usecase(ember_dir, CountingEmbedder())
+        for shard, search in usecase.shards.items():
+            if shard != "web":
+                search.search = None  # Fails if the shard is queried
+
+        results = usecase.search(Query(text="render_page", topk=5, path_filter="web/**"))
+
+        assert [str(r.chunk.path) for r in results] == ["web/page.py"]
+
+    def test_rollup_ranks_parents_by_their_children(self, tmp_path: Path) -> None:
+        """A parent standing for matching children outranks a weak match in another shard."""
+        repo = create_git_repo(
+            tmp_path / "repo",
+            files={
+                "api/inventory.py": (
+                    "class Inventory:\n"
+                    "    def restock(self, item):\n"
+                    "        self.audit(item)\n"
+                    "\n"
+                    "    def withdraw(self, item):\n"
+                    "        self.audit(item)\n"
+                ),
+                "api/helpers.py": "".join(
+                    f"def helper_{i}(value):\n    return value + {i}\n\n\n" for i in range(6)
+                ),
+                "web/page.py": (
+                    "def render_page(ctx):\n"
+                    "    header = build_header(ctx)\n"
+                    "    body = build_body(ctx, header)\n"
+                    "    footer = build_footer(ctx, body)\n"
+                    "    log_audit = ctx.audit\n"
+                    "    return template(header, body, footer, log_audit)\n"
+                ),
+            },
+        )
+        ember_dir = tmp_path / ".ember"
+        ember_dir.mkdir()
+        response = _sharded_usecase(
+            repo, ember_dir, CountingEmbedder(), hierarchical=True
+        ).execute(IndexRequest(repo_root=repo))
+        assert response.success, response.error
+
+        results = _search_usecase(ember_dir, CountingEmbedder()).search(
+            Query(text="audit", topk=5, rollup=True)
+        )
+
+        assert [r.chunk.symbol for r in results] == ["Inventory", "render_page"]
+        assert results[0].explanation["rolled_up"] == 2
+        assert results[0].score > results[1].score > 0.0
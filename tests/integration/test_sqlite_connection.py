@@ -0,0 +1,165 @@
+"""Integration tests for shared SQLite connections.
+
+Tests that adapters of a database share one writer connection and a pool of
+reader connections, and that searches can read while a sync is writing.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.fts.sqlite_fts import SQLiteFTS
+from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+from ember.adapters.sqlite.connection import (
+    BUSY_TIMEOUT_MS,
+    ConnectionManager,
+    get_manager,
+)
+from ember.adapters.sqlite.meta_repository import SQLiteMetaRepository
+from ember.adapters.sqlite.ref_repository import SQLiteRefRepository
+from ember.adapters.sqlite.schema import init_database
+from ember.domain.entities import Chunk
+
+
+def _chunk(symbol: str) -> Chunk:
+    """Create a chunk defining a function."""
+    content = f"def {symbol}(): pass"
+    return Chunk(
+        id=Chunk.compute_id("test-project", Path("test.py"), 1, 1),
+        project_id="test-project",
+        path=Path("test.py"),
+        lang="py",
+        symbol=symbol,
+        start_line=1,
+        end_line=1,
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash="file-hash",
+        tree_sha="tree-sha",
+        rev="worktree",
+    )
+
+
+class TestConnectionSettings:
+    """Tests for database and connection settings."""
+
+    def test_new_database_uses_wal(self, db_path: Path) -> None:
+        """Test that init_database switches the database to WAL mode."""
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_writer_settings(self, db_path: Path) -> None:
+        """Test that the writer has foreign keys and a busy timeout."""
+        with SQLiteChunkRepository(db_path) as repo:
+            conn = repo._get_connection()
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == BUSY_TIMEOUT_MS
+            # synchronous = NORMAL
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_reader_is_query_only(self, db_path: Path) -> None:
+        """Test that reader connections refuse writes."""
+        manager = ConnectionManager(db_path)
+        conn = manager.acquire_reader()
+        try:
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        finally:
+            manager.release(conn)
+            manager.close()
+
+
+class TestConnectionSharing:
+    """Tests for sharing connections between adapters."""
+
+    def test_repositories_share_writer(self, db_path: Path) -> None:
+        """Test that repositories of a database use the same connection."""
+        chunk_repo = SQLiteChunkRepository(db_path)
+        meta_repo = SQLiteMetaRepository(db_path)
+        try:
+            assert chunk_repo._get_connection() is meta_repo._get_connection()
+        finally:
+            chunk_repo.close()
+            meta_repo.close()
+
+    def test_writer_stays_open_until_last_release(self, db_path: Path) -> None:
+        """Test that closing one repository leaves the writer usable by others."""
+        chunk_repo = SQLiteChunkRepository(db_path)
+        meta_repo = SQLiteMetaRepository(db_path)
+        chunk_repo._get_connection()
+        meta_repo._get_connection()
+
+        chunk_repo.close()
+        meta_repo.set("key", "value")
+        assert meta_repo.get("key") == "value"
+        meta_repo.close()
+
+        # A new repository opens a new writer
+        with SQLiteMetaRepository(db_path) as repo:
+            assert repo.get("key") == "value"
+
+    def test_transactional_repository_has_own_writer(self, db_path: Path) -> None:
+        """Test that a rollback in the ref repository cannot discard others' writes."""
+        chunk_repo = SQLiteChunkRepository(db_path)
+        ref_repo = SQLiteRefRepository(db_path)
+        try:
+            conn = ref_repo._get_connection()
+            assert conn is not chunk_repo._get_connection()
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        finally:
+            chunk_repo.close()
+            ref_repo.close()
+
+        # Released private writers are closed, not pooled
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_readers_are_pooled(self, db_path: Path) -> None:
+        """Test that released reader connections are reused."""
+        manager = ConnectionManager(db_path, max_idle_readers=1)
+        first = manager.acquire_reader()
+        second = manager.acquire_reader()
+        assert first is not second
+
+        manager.release(first)
+        manager.release(second)  # Pool is full, so this one is closed
+        assert manager.acquire_reader() is first
+        assert manager.acquire_reader() is not second
+        manager.close()
+
+    def test_replaced_database_gets_new_manager(self, tmp_path: Path) -> None:
+        """Test that a recreated database file is not read through old connections."""
+        db = tmp_path / "test.db"
+        init_database(db)
+        manager = get_manager(db)
+        conn = manager.acquire_writer()
+
+        manager.release(conn)
+        Path(f"{db}-wal").unlink(missing_ok=True)
+        Path(f"{db}-shm").unlink(missing_ok=True)
+        db.rename(tmp_path / "old.db")
+        init_database(db)
+
+        assert get_manager(db) is not manager
+
+
+class TestConcurrentAccess:
+    """Tests for reading while writing."""
+
+    def test_search_reads_during_write(self, db_path: Path) -> None:
+        """Test that a search is not blocked by an open write transaction."""
+        with SQLiteChunkRepository(db_path) as repo:
+            repo.add(_chunk("authenticate"))
+
+            conn = repo._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("UPDATE chunks SET symbol = 'changed'")
+                with SQLiteFTS(db_path) as fts:
+                    # Sees the last committed state without waiting for the writer
+                    assert len(fts.query("authenticate", topk=10)) == 1
+            finally:
+                conn.rollback()
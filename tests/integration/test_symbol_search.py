@@ -0,0 +1,98 @@
+"""Integration tests for exact, prefix and fuzzy symbol lookup."""
+
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.fts.symbol_search import SQLiteSymbolSearch
+from ember.adapters.sqlite.chunk_repository import SQLiteChunkRepository
+from ember.adapters.sqlite.schema import init_database
+from ember.core.retrieval.symbol_search import SymbolSearchUseCase
+from ember.domain.entities import Chunk, Query
+
+
+def _chunk(path: str, symbol: str | None, start_line: int = 1, lang: str = "py") -> Chunk:
+    content = f"# {symbol or 'module'}\npass\n"
+    return Chunk(
+        id=Chunk.compute_id("proj", Path(path), start_line, start_line + 1),
+        project_id="proj",
+        path=Path(path),
+        lang=lang,
+        symbol=symbol,
+        start_line=start_line,
+        end_line=start_line + 1,
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash=f"hash-{path}",
+        tree_sha="tree1",
+        rev="worktree",
+    )
+
+
+REPO = _chunk("repo/user.py", "UserRepository")
+REPO_TS = _chunk("web/user.ts", "userRepository", lang="ts")
+REPO_BASE = _chunk("repo/base.py", "UserRepositoryBase")
+HELPERS = _chunk("repo/helpers.py", "load_user, save_user")
+MODULE = _chunk("repo/__init__.py", None)
+
+
+@pytest.fixture(params=["code", "porter"])
+def index_db(request, tmp_path: Path) -> Path:
+    """Database with sample chunks, for both full-text tokenizers."""
+    db_path = tmp_path / "index.db"
+    init_database(db_path, fts_tokenizer=request.param)
+    with SQLiteChunkRepository(db_path) as repo:
+        for chunk in (REPO, REPO_TS, REPO_BASE, HELPERS, MODULE):
+            repo.add(chunk)
+    return db_path
+
+
+def _lookup(db_path: Path, name: str, **kwargs) -> list[tuple[str, float]]:
+    with SQLiteSymbolSearch(db_path) as search:
+        return search.lookup(name, **kwargs)
+
+
+def test_exact_matches_rank_by_case_then_prefix(index_db: Path) -> None:
+    """Same-case exact matches come first, then other cases, then prefixes."""
+    results = _lookup(index_db, "UserRepository")
+
+    assert [cid for cid, _ in results] == [REPO.id, REPO_TS.id, REPO_BASE.id]
+    assert [score for _, score in results[:2]] == [3.0, 2.0]
+    assert 1.0 <= results[2][1] < 2.0
+
+
+def test_exact_only_and_packed_symbols(index_db: Path) -> None:
+    """Each name of a packed chunk matches, and prefix=False drops prefixes."""
+    assert _lookup(index_db, "save_user", prefix=False) == [(HELPERS.id, 3.0)]
+    assert _lookup(index_db, "UserRepo", prefix=False, fuzzy=False) == []
+
+
+def test_fuzzy_fallback_only_without_matches(index_db: Path) -> None:
+    """Misspelt names find similar symbols, scored below any prefix match."""
+    results = _lookup(index_db, "UserRepositroy")
+
+    assert [cid for cid, _ in results][:2] == [REPO.id, REPO_TS.id]
+    assert all(score < 1.0 for _, score in results)
+    assert _lookup(index_db, "UserRepositroy", fuzzy=False) == []
+    assert _lookup(index_db, "completely_unrelated") == []
+
+
+def test_path_filter_and_ref_scope(index_db: Path) -> None:
+    """Lookups respect path filters, and refs without files match nothing."""
+    assert _lookup(index_db, "userrepository", path_filter="web/*") == [(REPO_TS.id, 2.0)]
+    assert _lookup(index_db, "UserRepository", ref="release/2.x") == []
+
+
+def test_use_case_filters_language_and_explains(index_db: Path) -> None:
+    """Results report the kind of match and honour the language filter."""
+    with (
+        SQLiteSymbolSearch(index_db) as search,
+        SQLiteChunkRepository(index_db) as repo,
+    ):
+        usecase = SymbolSearchUseCase(search, repo)
+        results = usecase.search(Query(text="UserRepo", lang_filter="py"))
+
+    assert [r.chunk.id for r in results] == [REPO.id, REPO_BASE.id]
+    assert [r.rank for r in results] == [1, 2]
+    assert results[0].explanation["symbol_match"] == "prefix"
+    assert results[0].preview == "# UserRepository\npass\n"
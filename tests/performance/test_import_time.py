@@ -0,0 +1,64 @@
+"""Import-time budget for the CLI.
+
+Agents run commands like `ember cat 1` and `ember status` many times, so
+startup cost lands on every call. Heavy dependencies must load on demand,
+only in the commands that need them.
+"""
+
+import re
+import subprocess
+import sys
+
+# Modules that must not be imported just to start the CLI
+HEAVY_MODULES = [
+    "blake3",
+    "numpy",
+    "prompt_toolkit",
+    "pygments",
+    "rich.progress",
+    "sentence_transformers",
+    "sqlite_vec",
+    "torch",
+    "tree_sitter",
+    "tree_sitter_python",
+]
+
+# Cumulative import time budget for ember.entrypoints.cli, in microseconds.
+# Well above the ~60ms it takes today, but far below any heavy dependency.
+CLI_IMPORT_BUDGET_US = 250_000
+
+
+def _run_python(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_cli_import_does_not_load_heavy_modules() -> None:
+    """Importing the CLI leaves grammars, models and UI libraries unloaded."""
+    result = _run_python(
+        "import sys, ember.entrypoints.cli; "
+        f"print('\\n'.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+
+    assert result.stdout.split() == []
+
+
+def test_cli_import_time_within_budget() -> None:
+    """`python -X importtime` reports the CLI importing within budget."""
+    timings = []
+    for _ in range(3):
+        result = _run_python("import ember.entrypoints.cli", "-X", "importtime")
+        match = re.search(
+            r"import time:\s+\d+ \|\s+(\d+) \| ember\.entrypoints\.cli$",
+            result.stderr,
+            re.MULTILINE,
+        )
+        assert match, result.stderr[-2000:]
+        timings.append(int(match.group(1)))
+
+    # Best of three, so a busy machine does not fail the test
+    assert min(timings) < CLI_IMPORT_BUDGET_US, f"CLI import took {min(timings)}us"
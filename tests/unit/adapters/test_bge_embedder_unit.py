@@ -133,6 +133,13 @@ class TestEmbedderProperties:
         embedder = BGESmallEmbedder()
         assert embedder.dim == 384
 
+    def test_max_seq_length_property(self) -> None:
+        """Test max_seq_length property returns the truncation length."""
+        from ember.adapters.local_models.bge_embedder import BGESmallEmbedder
+
+        assert BGESmallEmbedder().max_seq_length == 512
+        assert BGESmallEmbedder(max_seq_length=128).max_seq_length == 128
+
     def test_fingerprint_format(self) -> None:
         """Test fingerprint has correct format."""
         from ember.adapters.local_models.bge_embedder import BGESmallEmbedder
@@ -165,6 +172,20 @@ class TestEmbedderProperties:
 
         assert embedder1.fingerprint() == embedder2.fingerprint()
 
+    def test_fingerprint_encodes_backend_and_quantization(self) -> None:
+        """Test onnx variants get distinct fingerprints; torch is unchanged."""
+        from ember.adapters.local_models.bge_embedder import BGESmallEmbedder
+
+        torch_default = BGESmallEmbedder().fingerprint()
+        fingerprints = {
+            BGESmallEmbedder(backend="torch", quantize=False).fingerprint(),
+            BGESmallEmbedder(backend="onnx", quantize=True).fingerprint(),
+            BGESmallEmbedder(backend="onnx", quantize=False).fingerprint(),
+        }
+
+        assert len(fingerprints) == 3
+        assert torch_default in fingerprints
+
 
 class TestEmbedTextsWithMock:
     """Tests for embed_texts using mocked model."""
@@ -185,7 +206,8 @@ class TestEmbedTextsWithMock:
             "sentence_transformers.SentenceTransformer"
         ) as mock_st:
             mock_model = MagicMock()
-            mock_model.encode.return_value = np.array([[0.1] * 384, [0.2] * 384])
+            mock_model.tokenizer.return_value = {"input_ids": [[1, 2], [1, 2, 3]]}
+            mock_model.encode.return_value = np.array([[0.2] * 384, [0.1] * 384])
             mock_st.return_value = mock_model
 
             from ember.adapters.local_models.bge_embedder import BGESmallEmbedder
@@ -195,15 +217,19 @@ class TestEmbedTextsWithMock:
 
             result = embedder.embed_texts(["text1", "text2"])
 
+            # Longest input first; both fit in one token-budgeted batch
             mock_model.encode.assert_called_once_with(
-                ["text1", "text2"],
-                batch_size=16,
+                ["text2", "text1"],
+                batch_size=2,
                 show_progress_bar=False,
                 convert_to_numpy=True,
                 normalize_embeddings=True,
             )
             assert len(result) == 2
             assert len(result[0]) == 384
+            # Original input order is restored
+            assert result[0][0] == 0.1
+            assert result[1][0] == 0.2
 
     def test_embed_texts_error_handling(self) -> None:
         """Test embed_texts wraps model errors in RuntimeError."""
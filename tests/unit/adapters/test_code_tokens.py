@@ -0,0 +1,45 @@
+"""Unit tests for code-aware full-text search tokenization."""
+
+import pytest
+
+from ember.adapters.fts.code_tokens import expand_query, identifier_terms, split_identifier
+
+
+@pytest.mark.parametrize(
+    ("identifier", "parts"),
+    [
+        ("getUserById", ["get", "user", "by", "id"]),
+        ("get_user_by_id", ["get", "user", "by", "id"]),
+        ("HTTPServer", ["http", "server"]),
+        ("parseJSON2Yaml", ["parse", "json", "2", "yaml"]),
+        ("MAX_RETRIES", ["max", "retries"]),
+        ("__init__", ["init"]),
+        ("user", ["user"]),
+    ],
+)
+def test_split_identifier(identifier: str, parts: list[str]) -> None:
+    """Identifiers split at snake_case, camelCase and digit boundaries."""
+    assert split_identifier(identifier) == parts
+
+
+def test_identifier_terms_lists_compound_identifiers() -> None:
+    """Each compound identifier contributes one line of parts; plain words none."""
+    text = "def getUserById(user_id):\n    return user"
+
+    assert identifier_terms(text) == "get user by id\nuser id"
+
+
+def test_expand_query_matches_identifier_or_parts() -> None:
+    """Compound identifiers match themselves or their parts as a phrase."""
+    assert expand_query("getUserById cache") == '(getUserById OR "get user by id") cache'
+
+
+def test_expand_query_splits_identifiers_in_phrases() -> None:
+    """Inside a quoted phrase, identifiers are replaced by their parts."""
+    assert expand_query('"load userProfile"') == '"load user profile"'
+
+
+def test_expand_query_leaves_prefix_and_column_queries() -> None:
+    """Prefix queries and column filters keep the identifier as written."""
+    assert expand_query("getUser*") == "getUser*"
+    assert expand_query("symbol:getUser") == "symbol:getUser"
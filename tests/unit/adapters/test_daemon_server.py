@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from ember.adapters.daemon.server import DaemonServer
+from ember.core.hardware import SystemResources
 
 
 class TestHealthEndpoint:
@@ -314,3 +315,45 @@ class TestModelCleanup:
 
             # Verify cleanup was still called
             mock_cleanup.assert_called_once()
+
+
+class TestWorkerPool:
+    """Tests for choosing between an in-process model and a worker pool."""
+
+    def test_single_worker_loads_in_process(self, tmp_path: Path) -> None:
+        """The default keeps the model in the daemon process."""
+        server = DaemonServer(socket_path=tmp_path / "test.sock", idle_timeout=0)
+
+        assert server._worker_layout() is None
+
+    def test_pool_used_for_multiple_workers(self, tmp_path: Path) -> None:
+        """A worker pool replaces the single embedder when workers > 1."""
+        server = DaemonServer(
+            socket_path=tmp_path / "test.sock",
+            idle_timeout=0,
+            model_name="minilm",
+            model_workers=3,
+        )
+
+        resources = SystemResources(available_ram_gb=16.0, total_ram_gb=32.0, cpu_count=12)
+        with (
+            patch("ember.core.hardware.detect_system_resources", return_value=resources),
+            patch("ember.adapters.daemon.worker_pool.EmbeddingWorkerPool") as mock_pool,
+        ):
+            server.load_model()
+
+        assert mock_pool.call_args.kwargs["workers"] == 3
+        assert mock_pool.call_args.kwargs["threads_per_worker"] == 4
+        assert server.max_concurrent_clients == 3
+        mock_pool.return_value.ensure_loaded.assert_called_once()
+
+    def test_cleanup_closes_pool(self, tmp_path: Path) -> None:
+        """Cleanup stops worker processes."""
+        server = DaemonServer(socket_path=tmp_path / "test.sock", idle_timeout=0)
+        pool = MagicMock()
+        server.embedder = pool
+        server.server_socket = MagicMock(spec=socket.socket)
+
+        server.cleanup()
+
+        pool.close.assert_called_once()
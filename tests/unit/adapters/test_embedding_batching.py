@@ -0,0 +1,131 @@
+"""Unit tests for length-bucketed embedding batches (no model loading required)."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from ember.adapters.local_models.batching import (
+    encode_bucketed,
+    estimate_token_lengths,
+    plan_batches,
+)
+
+
+class TestPlanBatches:
+    """Tests for grouping inputs under a token budget."""
+
+    def test_sorts_longest_first(self) -> None:
+        """Batches contain inputs in descending length order."""
+        batches = plan_batches([10, 500, 20], max_batch_tokens=10_000)
+
+        assert batches == [[1, 2, 0]]
+
+    def test_long_input_does_not_pad_short_ones(self) -> None:
+        """A long input gets its own batch instead of padding short inputs."""
+        lengths = [500] + [10] * 32
+
+        batches = plan_batches(lengths, max_batch_tokens=512)
+
+        assert batches[0] == [0]
+        assert all(len(b) * 10 <= 512 for b in batches[1:])
+        assert sorted(i for b in batches for i in b) == list(range(33))
+
+    def test_short_inputs_share_large_batches(self) -> None:
+        """Short inputs fill batches up to the budget."""
+        batches = plan_batches([8] * 100, max_batch_tokens=400)
+
+        assert [len(b) for b in batches] == [50, 50]
+
+    def test_oversized_input_gets_own_batch(self) -> None:
+        """An input longer than the budget is still encoded."""
+        assert plan_batches([1000, 5], max_batch_tokens=100) == [[0], [1]]
+
+    def test_empty_input(self) -> None:
+        """No inputs produce no batches."""
+        assert plan_batches([], max_batch_tokens=100) == []
+
+
+class TestEstimateTokenLengths:
+    """Tests for token counting."""
+
+    def test_uses_model_tokenizer(self) -> None:
+        """Token counts come from the model's tokenizer with truncation."""
+        model = MagicMock()
+        model.tokenizer.return_value = {"input_ids": [[1, 2, 3], [1]]}
+
+        lengths = estimate_token_lengths(model, ["a b", "c"], max_seq_length=128)
+
+        assert lengths == [3, 1]
+        assert model.tokenizer.call_args.kwargs["max_length"] == 128
+        assert model.tokenizer.call_args.kwargs["truncation"] is True
+
+    def test_falls_back_without_tokenizer(self) -> None:
+        """Character-based estimate is used when there is no tokenizer."""
+        model = MagicMock(spec=["encode"])
+
+        lengths = estimate_token_lengths(model, ["x" * 40, "x" * 4000], max_seq_length=256)
+
+        assert lengths == [12, 256]
+
+
+class TestEncodeBucketed:
+    """Tests for order-preserving bucketed encoding."""
+
+    def test_restores_input_order(self) -> None:
+        """Embeddings are returned in input order regardless of batching."""
+        texts = ["short", "a much longer text", "mid text"]
+        lengths = {"short": 2, "a much longer text": 60, "mid text": 30}
+
+        model = MagicMock()
+        model.tokenizer.side_effect = lambda batch, **_: {
+            "input_ids": [[0] * lengths[t] for t in batch]
+        }
+        model.encode.side_effect = lambda batch, **_: np.array(
+            [[float(lengths[t])] for t in batch]
+        )
+
+        result = encode_bucketed(model, texts, max_seq_length=64, max_batch_tokens=64)
+
+        assert result == [[2.0], [60.0], [30.0]]
+        # 60 tokens fills the budget alone; the rest share a batch
+        assert [len(c.args[0]) for c in model.encode.call_args_list] == [1, 2]
+
+    def test_splits_batch_on_out_of_memory(self) -> None:
+        """A batch that runs out of memory is split and the budget kept low."""
+        texts = [f"text {i}" for i in range(8)]
+        model = MagicMock()
+        model.tokenizer.side_effect = lambda batch, **_: {"input_ids": [[0] * 10 for _ in batch]}
+
+        def encode(batch, **_):
+            if len(batch) > 2:
+                raise RuntimeError("CUDA out of memory. Tried to allocate 2.00 GiB")
+            return np.array([[float(t.split()[1])] for t in batch])
+
+        model.encode.side_effect = encode
+        budgets: list[int] = []
+
+        result = encode_bucketed(
+            model, texts, max_seq_length=64, max_batch_tokens=80, on_backoff=budgets.append
+        )
+
+        assert result == [[float(i)] for i in range(8)]
+        assert budgets == [40, 20]
+        assert all(len(c.args[0]) <= 2 for c in model.encode.call_args_list[2:])
+
+    def test_single_input_out_of_memory_raises(self) -> None:
+        """An input that cannot fit alone is not retried forever."""
+        model = MagicMock(spec=["encode"])
+        model.encode.side_effect = MemoryError()
+
+        with pytest.raises(MemoryError):
+            encode_bucketed(model, ["x"], max_seq_length=64, max_batch_tokens=64)
+
+    def test_other_errors_are_not_retried(self) -> None:
+        """Errors unrelated to memory propagate unchanged."""
+        model = MagicMock(spec=["encode"])
+        model.encode.side_effect = ValueError("bad input")
+
+        with pytest.raises(ValueError, match="bad input"):
+            encode_bucketed(model, ["a", "b"], max_seq_length=64, max_batch_tokens=640)
+        assert model.encode.call_count == 1
@@ -0,0 +1,47 @@
+"""Unit tests for the local embedding benchmark (no model loading required)."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from ember.adapters.local_models.calibration import LocalEmbedderBenchmark
+
+
+def _fake_embedder(max_seq_length: int = 512) -> MagicMock:
+    """Create an embedder whose model returns zero vectors."""
+    model = MagicMock(spec=["encode"])
+    model.encode.side_effect = lambda texts, **kwargs: np.zeros((len(texts), 4))
+    embedder = MagicMock()
+    embedder.max_seq_length = max_seq_length
+    embedder.load.return_value = model
+    return embedder
+
+
+class TestLocalEmbedderBenchmark:
+    """Tests for timing embedders through their public interface."""
+
+    def test_default_max_seq_length_from_embedder(self) -> None:
+        """The default truncation length is the default embedder's."""
+        with patch(
+            "ember.adapters.local_models.calibration.create_embedder",
+            return_value=_fake_embedder(max_seq_length=256),
+        ):
+            benchmark = LocalEmbedderBenchmark(model_name="minilm")
+
+            assert benchmark.default_max_seq_length == 256
+
+    def test_measure_reuses_loaded_model(self) -> None:
+        """Batch sizes at the same settings share one loaded model."""
+        ticks = iter([0.0, 0.5, 1.0, 1.25])
+        embedder = _fake_embedder()
+        with patch(
+            "ember.adapters.local_models.calibration.create_embedder",
+            return_value=embedder,
+        ) as create:
+            benchmark = LocalEmbedderBenchmark(clock=lambda: next(ticks))
+
+            assert benchmark.measure(["a", "b"], 8, 128, 0) == 4.0
+            assert benchmark.measure(["a", "b"], 16, 128, 0) == 8.0
+
+        create.assert_called_once()
+        embedder.embed_texts.assert_called_once_with(["warm up"])
@@ -0,0 +1,81 @@
+"""Unit tests for the daemon's embedding worker pool (no model loading required)."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from ember.adapters.daemon import worker_pool
+from ember.adapters.daemon.worker_pool import EmbeddingWorkerPool
+
+
+class FakeEmbedder:
+    """Embeds each text as [len(text)] so order is easy to check."""
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        return [[float(len(t))] for t in texts]
+
+
+def _thread_executor(max_workers: int, **_kwargs) -> ThreadPoolExecutor:
+    """Stand-in for ProcessPoolExecutor that skips model loading."""
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> EmbeddingWorkerPool:
+    """Create a pool whose workers are threads sharing a fake embedder."""
+    monkeypatch.setattr(worker_pool, "ProcessPoolExecutor", _thread_executor)
+    monkeypatch.setattr(worker_pool, "_worker_embedder", FakeEmbedder())
+    pool = EmbeddingWorkerPool(workers=4, threads_per_worker=2, model_name="minilm")
+    yield pool
+    pool.close()
+
+
+class TestSharding:
+    """Tests for splitting requests across workers."""
+
+    def test_small_request_stays_whole(self, pool: EmbeddingWorkerPool) -> None:
+        """Queries and tiny batches are not split."""
+        assert pool._shard(["a", "b"]) == [["a", "b"]]
+
+    def test_large_request_spread_over_workers(self, pool: EmbeddingWorkerPool) -> None:
+        """Large batches are split into one contiguous shard per worker."""
+        texts = [str(i) for i in range(40)]
+
+        shards = pool._shard(texts)
+
+        assert len(shards) == 4
+        assert [t for shard in shards for t in shard] == texts
+
+
+class TestEmbedTexts:
+    """Tests for embedding through the pool."""
+
+    def test_results_reassembled_in_order(self, pool: EmbeddingWorkerPool) -> None:
+        """Embeddings come back in input order across shards."""
+        texts = ["x" * n for n in range(1, 30)]
+
+        result = pool.embed_texts(texts)
+
+        assert result == [[float(n)] for n in range(1, 30)]
+
+    def test_empty_input(self, pool: EmbeddingWorkerPool) -> None:
+        """Empty input returns no embeddings without starting workers."""
+        assert pool.embed_texts([]) == []
+        assert pool._executor is None
+
+    def test_fingerprint_matches_single_embedder(self, pool: EmbeddingWorkerPool) -> None:
+        """The pool indexes with the same fingerprint as a single embedder."""
+        from ember.adapters.local_models.registry import create_embedder
+
+        assert pool.fingerprint() == create_embedder(model_name="minilm").fingerprint()
+        assert pool.dim == 384
+
+    def test_worker_failure_raises_runtime_error(self, pool: EmbeddingWorkerPool) -> None:
+        """Worker errors are wrapped like single-embedder errors."""
+        pool.ensure_loaded()
+        with (
+            patch.object(worker_pool, "_worker_embedder", None),
+            pytest.raises(RuntimeError, match="Failed to embed"),
+        ):
+            pool.embed_texts(["a"])
@@ -0,0 +1,89 @@
+"""Unit tests for file watcher adapters."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.fs.watcher import InotifyWatcher, PollingWatcher, create_watcher
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Create a small directory tree with an ignored .git directory."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("x = 1\n")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "index").write_text("")
+    return tmp_path
+
+
+def test_polling_watcher_detects_modification(tree: Path) -> None:
+    """PollingWatcher reports modified files."""
+    watcher = PollingWatcher(tree, interval=0.01)
+    (tree / "src" / "app.py").write_text("x = 2 # longer\n")
+
+    changed = watcher.wait_for_changes(timeout=1.0)
+
+    assert tree.resolve() / "src" / "app.py" in changed
+
+
+def test_polling_watcher_detects_deletion_and_ignores_git(tree: Path) -> None:
+    """PollingWatcher reports deletions and skips ignored directories."""
+    watcher = PollingWatcher(tree, interval=0.01)
+    (tree / ".git" / "index").write_text("changed")
+    assert watcher.wait_for_changes(timeout=0) == set()
+
+    (tree / "src" / "app.py").unlink()
+    assert watcher.wait_for_changes(timeout=1.0) == {tree.resolve() / "src" / "app.py"}
+
+
+def test_polling_watcher_times_out(tree: Path) -> None:
+    """PollingWatcher returns an empty set when nothing changes."""
+    watcher = PollingWatcher(tree, interval=0.01)
+    assert watcher.wait_for_changes(timeout=0.05) == set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+class TestInotifyWatcher:
+    """Tests for the inotify-backed watcher."""
+
+    def test_detects_write(self, tree: Path) -> None:
+        """File writes are reported."""
+        watcher = InotifyWatcher(tree)
+        try:
+            (tree / "src" / "app.py").write_text("x = 2\n")
+            changed = watcher.wait_for_changes(timeout=1.0)
+            assert tree.resolve() / "src" / "app.py" in changed
+        finally:
+            watcher.close()
+
+    def test_watches_new_directories(self, tree: Path) -> None:
+        """Files inside newly created directories are reported."""
+        watcher = InotifyWatcher(tree)
+        try:
+            (tree / "pkg").mkdir()
+            watcher.wait_for_changes(timeout=1.0)
+            (tree / "pkg" / "mod.py").write_text("y = 1\n")
+            changed = watcher.wait_for_changes(timeout=1.0)
+            assert tree.resolve() / "pkg" / "mod.py" in changed
+        finally:
+            watcher.close()
+
+    def test_ignores_git_directory(self, tree: Path) -> None:
+        """Changes under .git are not reported."""
+        watcher = InotifyWatcher(tree)
+        try:
+            (tree / ".git" / "index").write_text("changed")
+            assert watcher.wait_for_changes(timeout=0.1) == set()
+        finally:
+            watcher.close()
+
+
+def test_create_watcher_returns_usable_watcher(tree: Path) -> None:
+    """create_watcher picks an implementation that works on this platform."""
+    watcher = create_watcher(tree, polling_interval=0.01)
+    try:
+        assert watcher.wait_for_changes(timeout=0) == set()
+    finally:
+        watcher.close()
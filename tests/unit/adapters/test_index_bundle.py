@@ -0,0 +1,179 @@
+"""Unit tests for the gzip JSON Lines index bundle format."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from ember.adapters.bundle.jsonl_bundle import (
+    JsonlBundleReader,
+    JsonlBundleWriter,
+    decode_vector,
+    encode_vector,
+)
+from ember.domain.entities import Chunk
+from ember.ports.bundle import BUNDLE_FORMAT_VERSION, BundleFile, BundleHeader
+
+
+def _chunk(i: int) -> Chunk:
+    content = f"def func_{i}():\n    return {i}"
+    return Chunk(
+        id=f"id_{i}",
+        project_id="project",
+        path=Path(f"src/mod_{i}.py"),
+        lang="py",
+        symbol=f"func_{i}",
+        start_line=1,
+        end_line=2,
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash=f"file_{i}",
+        tree_sha="tree123",
+        rev="worktree",
+    )
+
+
+def _header(**overrides) -> BundleHeader:
+    fields = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "model_fingerprint": "model:v2:abc",
+        "tree_sha": "tree123",
+        "sync_mode": "worktree",
+    }
+    fields.update(overrides)
+    return BundleHeader(**fields)
+
+
+def _write_bundle(path: Path, header: BundleHeader, chunks: int = 3) -> None:
+    writer = JsonlBundleWriter(path)
+    writer.write_header(header)
+    writer.write_file(BundleFile(Path("src/mod_0.py"), "file_0", 42))
+    for i in range(chunks):
+        writer.write_chunk(_chunk(i), [0.25 * i, -0.5, 1.0] if i != 1 else None)
+    writer.close()
+
+
+class TestVectorEncoding:
+    """Tests for float32 and int8 vector encoding."""
+
+    def test_float32_roundtrip_is_exact(self) -> None:
+        """float32 vectors decode to the same values."""
+        vector = [0.5, -0.25, 0.125]
+
+        data, scale = encode_vector(vector, "float32")
+
+        assert scale is None
+        assert decode_vector(data, "float32") == vector
+
+    def test_int8_roundtrip_is_close(self) -> None:
+        """int8 vectors decode to within one quantization step."""
+        vector = [0.9, -0.3, 0.01, -0.9]
+
+        data, scale = encode_vector(vector, "int8")
+        decoded = decode_vector(data, "int8", scale)
+
+        assert len(decoded) == len(vector)
+        assert all(abs(a - b) <= scale for a, b in zip(decoded, vector, strict=True))
+
+    def test_int8_zero_vector(self) -> None:
+        """An all-zero vector survives quantization."""
+        data, scale = encode_vector([0.0, 0.0], "int8")
+
+        assert decode_vector(data, "int8", scale) == [0.0, 0.0]
+
+
+class TestBundleRoundtrip:
+    """Tests for writing and reading bundles."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Header, files, and chunks are read back in order."""
+        path = tmp_path / "index.ember"
+        _write_bundle(path, _header())
+
+        reader = JsonlBundleReader(path)
+        header = reader.read_header()
+        files = list(reader.iter_files())
+        chunks = list(reader.iter_chunks())
+        reader.close()
+
+        assert header == _header()
+        assert files == [BundleFile(Path("src/mod_0.py"), "file_0", 42)]
+        assert [c.symbol for c, _ in chunks] == ["func_0", "func_1", "func_2"]
+        assert chunks[0][0].content == _chunk(0).content
+        assert chunks[0][0].id == ""
+        assert chunks[1][1] is None
+        assert chunks[2][1] == [0.5, -0.5, 1.0]
+
+    def test_chunks_can_be_read_without_files(self, tmp_path: Path) -> None:
+        """Unread file records are skipped when iterating chunks."""
+        path = tmp_path / "index.ember"
+        _write_bundle(path, _header())
+
+        reader = JsonlBundleReader(path)
+        chunks = list(reader.iter_chunks())
+        reader.close()
+
+        assert len(chunks) == 3
+
+    def test_no_preview_omits_content(self, tmp_path: Path) -> None:
+        """Content is not written when the header excludes it."""
+        path = tmp_path / "index.ember"
+        _write_bundle(path, _header(include_content=False))
+
+        with gzip.open(path, "rt") as f:
+            records = [json.loads(line) for line in f]
+        reader = JsonlBundleReader(path)
+        chunks = list(reader.iter_chunks())
+        reader.close()
+
+        assert all("content" not in r for r in records if r.get("type") == "chunk")
+        assert all(chunk.content == "" for chunk, _ in chunks)
+
+    def test_abort_leaves_no_file(self, tmp_path: Path) -> None:
+        """An aborted export leaves neither the bundle nor a partial file."""
+        path = tmp_path / "index.ember"
+        writer = JsonlBundleWriter(path)
+        writer.write_header(_header())
+        writer.write_chunk(_chunk(0), [1.0])
+        writer.abort()
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestBundleValidation:
+    """Tests for rejecting invalid bundles."""
+
+    def test_truncated_bundle(self, tmp_path: Path) -> None:
+        """A bundle without its trailer is reported as truncated."""
+        path = tmp_path / "index.ember"
+        _write_bundle(path, _header())
+        with gzip.open(path, "rt") as f:
+            lines = f.readlines()
+        with gzip.open(path, "wt") as f:
+            f.writelines(lines[:-1])
+
+        reader = JsonlBundleReader(path)
+        with pytest.raises(ValueError, match="truncated"):
+            list(reader.iter_chunks())
+        reader.close()
+
+    def test_newer_version_rejected(self, tmp_path: Path) -> None:
+        """Bundles from a newer format version are refused."""
+        path = tmp_path / "index.ember"
+        _write_bundle(path, _header(format_version=BUNDLE_FORMAT_VERSION + 1))
+
+        reader = JsonlBundleReader(path)
+        with pytest.raises(ValueError, match="not supported"):
+            reader.read_header()
+        reader.close()
+
+    def test_not_a_bundle(self, tmp_path: Path) -> None:
+        """Arbitrary files are not accepted as bundles."""
+        path = tmp_path / "index.ember"
+        path.write_text("hello")
+
+        reader = JsonlBundleReader(path)
+        with pytest.raises(ValueError):
+            reader.read_header()
+        reader.close()
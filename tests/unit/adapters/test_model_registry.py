@@ -160,6 +160,22 @@ class TestCreateEmbedder:
         call_kwargs = mock_minilm.call_args[1]
         assert call_kwargs["device"] == "cuda"
 
+    @patch("ember.adapters.local_models.minilm_embedder.MiniLMEmbedder")
+    def test_create_embedder_passes_backend(self, mock_minilm):
+        """Test that a non-default backend and quantization are passed to embedder."""
+        mock_minilm.return_value = MagicMock()
+
+        create_embedder(model_name="minilm", backend="onnx", quantize=False)
+
+        call_kwargs = mock_minilm.call_args[1]
+        assert call_kwargs["backend"] == "onnx"
+        assert call_kwargs["quantize"] is False
+
+    def test_create_embedder_unknown_backend_raises_error(self):
+        """Test that unknown backends raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown inference backend"):
+            create_embedder(model_name="minilm", backend="tensorrt")
+
     def test_create_embedder_unknown_model_raises_error(self):
         """Test that unknown model names raise ValueError."""
         with pytest.raises(ValueError) as exc_info:
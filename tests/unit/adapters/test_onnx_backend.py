@@ -0,0 +1,75 @@
+"""Unit tests for the ONNX inference backend (no model export required)."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ember.adapters.local_models import onnx_backend
+from ember.adapters.local_models.onnx_backend import load_onnx_encoder, model_cache_dir
+
+
+class TestModelCacheDir:
+    """Tests for the per-model cache location."""
+
+    def test_default_root_is_ember_models(self) -> None:
+        """Exported graphs live under ~/.ember/models."""
+        path = model_cache_dir("BAAI/bge-small-en-v1.5")
+
+        assert path == Path.home() / ".ember" / "models" / "BAAI__bge-small-en-v1.5"
+
+    def test_custom_root(self, tmp_path: Path) -> None:
+        """A custom cache root is respected."""
+        assert model_cache_dir("a/b", tmp_path) == tmp_path / "a__b"
+
+
+class TestLoadOnnxEncoder:
+    """Tests for export caching and dependency handling."""
+
+    def test_missing_onnxruntime_raises_import_error(self, tmp_path: Path) -> None:
+        """A clear install hint is given when onnxruntime is absent."""
+        with (
+            patch.dict(sys.modules, {"onnxruntime": None}),
+            pytest.raises(ImportError, match=r"ember\[onnx\]"),
+        ):
+            load_onnx_encoder("a/b", max_seq_length=128, cache_dir=tmp_path)
+
+    def test_exports_and_quantizes_once(self, tmp_path: Path) -> None:
+        """First use exports and quantizes; later uses reuse the cache."""
+        model_dir = model_cache_dir("a/b", tmp_path)
+
+        def fake_export(model_name: str, target: Path) -> dict:
+            target.mkdir(parents=True)
+            (target / "model.onnx").write_bytes(b"graph")
+            metadata = {"export_version": onnx_backend.EXPORT_VERSION, "pooling": "mean"}
+            (target / "ember_onnx.json").write_text(json.dumps(metadata))
+            return metadata
+
+        def fake_quantize(target: Path) -> None:
+            (target / "model_int8.onnx").write_bytes(b"int8")
+
+        with (
+            patch.dict(sys.modules, {"onnxruntime": MagicMock()}),
+            patch.object(onnx_backend, "export_model", side_effect=fake_export) as export,
+            patch.object(onnx_backend, "quantize_model", side_effect=fake_quantize) as quant,
+            patch.object(onnx_backend, "OnnxEncoder") as encoder_cls,
+        ):
+            load_onnx_encoder("a/b", max_seq_length=128, cache_dir=tmp_path)
+            load_onnx_encoder("a/b", max_seq_length=128, cache_dir=tmp_path)
+
+        export.assert_called_once_with("a/b", model_dir)
+        quant.assert_called_once_with(model_dir)
+        assert encoder_cls.call_args.kwargs["quantize"] is True
+
+    def test_embedder_wraps_backend_errors(self) -> None:
+        """Embedders surface backend failures as RuntimeError."""
+        from ember.adapters.local_models.minilm_embedder import MiniLMEmbedder
+
+        embedder = MiniLMEmbedder(backend="onnx")
+        with (
+            patch.dict(sys.modules, {"onnxruntime": None}),
+            pytest.raises(RuntimeError, match=r"\(onnx\)"),
+        ):
+            embedder.ensure_loaded()
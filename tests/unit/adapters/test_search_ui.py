@@ -3,14 +3,16 @@
 Tests for:
 - Preview pane syntax highlighting
 - Error handling when search functions fail
+- Staged, cancellable search while typing
 """
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
 from ember.adapters.tui.search_ui import InteractiveSearchUI
-from ember.core.retrieval.interactive import InteractiveSearchSession
+from ember.core.retrieval.interactive import InteractiveSearchSession, PrefixCache
 from ember.domain.config import DisplayConfig, EmberConfig
 from ember.domain.entities import Chunk, Query, SearchResult
 
@@ -683,3 +685,114 @@ class TestInteractiveSearchUIResultsListColorSeparation:
         # Full text should not contain score values
         full_text = "".join(text for _, text in results_text)
         assert "0.950" not in full_text, "Score value should not appear in results list"
+
+
+def _result(chunk_id: str, content: str, rank: int = 1) -> SearchResult:
+    chunk = Chunk(
+        id=chunk_id,
+        project_id="test",
+        path=Path(f"{chunk_id}.py"),
+        lang="py",
+        symbol=None,
+        start_line=1,
+        end_line=1,
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash="hash",
+        tree_sha="abc123",
+        rev="worktree",
+    )
+    return SearchResult(chunk=chunk, score=1.0, rank=rank)
+
+
+class TestPrefixCache:
+    """Tests for reusing results while a query is extended."""
+
+    def test_candidates_filter_longest_prefix(self) -> None:
+        """Results of the longest cached prefix are kept if they still match."""
+        cache = PrefixCache()
+        cache.put("au", [_result("a", "autumn leaves")])
+        cache.put("auth", [_result("b", "check_auth(user)"), _result("c", "Authenticate()", 2)])
+
+        candidates = cache.candidates("authen")
+
+        assert candidates is not None
+        assert [(r.chunk.id, r.rank) for r in candidates] == [("c", 1)]
+        assert cache.candidates("xauth") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Only the most recently used queries are kept."""
+        cache = PrefixCache(max_entries=2)
+        cache.put("one", [])
+        cache.put("two", [])
+        cache.get("one")
+        cache.put("three", [])
+
+        assert cache.get("two") is None
+        assert cache.get("one") == []
+
+
+class TestIncrementalSearch:
+    """Tests for staged search execution in the interactive UI."""
+
+    def test_text_results_shown_before_full_results(self, mock_config: EmberConfig) -> None:
+        """Full-text results are displayed while the full search runs."""
+        import threading
+
+        release = threading.Event()
+        text_results = [_result("text", "def auth(): pass")]
+        full_results = [_result("full", "def login(): pass")]
+        seen: list[list[str]] = []
+
+        def search_fn(query: Query) -> list[SearchResult]:
+            release.wait(5)
+            return full_results
+
+        ui = InteractiveSearchUI(
+            search_fn=search_fn,
+            text_search_fn=lambda query: text_results,
+            config=mock_config,
+        )
+        ui.session.update_query("auth")
+
+        async def run() -> None:
+            await ui._execute_search()
+            while ui.session.current_results is None:
+                await asyncio.sleep(0.01)
+            seen.append([r.chunk.id for r in ui.session.current_results])
+            assert ui.refining
+            release.set()
+            await ui.current_search_task
+            seen.append([r.chunk.id for r in ui.session.current_results])
+
+        asyncio.run(run())
+
+        assert seen == [["text"], ["full"]]
+        assert not ui.refining
+        assert ui.prefix_cache.get("auth") == full_results
+
+    def test_superseded_full_search_is_cancelled(self, mock_config: EmberConfig) -> None:
+        """A queued full search for an outdated query never runs."""
+        import threading
+
+        release = threading.Event()
+        searched: list[str] = []
+
+        def search_fn(query: Query) -> list[SearchResult]:
+            searched.append(query.text)
+            release.wait(5)
+            return []
+
+        ui = InteractiveSearchUI(search_fn=search_fn, config=mock_config)
+
+        async def run() -> None:
+            for text in ("au", "aut", "auth"):
+                ui.session.update_query(text)
+                await ui._execute_search()
+                await asyncio.sleep(0.05)
+            release.set()
+            await ui.current_search_task
+
+        asyncio.run(run())
+
+        assert searched == ["au", "auth"]
@@ -0,0 +1,22 @@
+"""Unit tests for symbol match scoring."""
+
+import pytest
+
+from ember.adapters.fts.symbol_search import score_symbol
+
+
+@pytest.mark.parametrize(
+    ("name", "symbol", "score"),
+    [
+        ("UserRepository", "UserRepository", 3.0),
+        ("userrepository", "UserRepository", 2.0),
+        ("parse", "load, parse", 3.0),
+        ("User", "UserRepo", 1.25),
+        ("User", "UserRepository", 1.0 + 0.5 * 4 / 14),
+        ("Repository", "UserRepository", 0.0),
+        ("parse", "parser_for, parse_all", 1.0 + 0.5 * 5 / 9),
+    ],
+)
+def test_score_symbol(name: str, symbol: str, score: float) -> None:
+    """Exact matches beat prefix matches, which favour shorter names."""
+    assert score_symbol(name, symbol) == pytest.approx(score)
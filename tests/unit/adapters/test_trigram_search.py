@@ -0,0 +1,25 @@
+"""Unit tests for regex literal extraction in trigram search."""
+
+import pytest
+
+from ember.adapters.fts.trigram_search import required_literals
+
+
+@pytest.mark.parametrize(
+    ("pattern", "literals"),
+    [
+        ("retry_after", ["retry_after"]),
+        (r"def \w+_handler\(", ["def ", "_handler("]),
+        (r"/v2/users/\d+", ["/v2/users/"]),
+        ("colou?r_map", ["colo", "r_map"]),
+        ("timeout{0,1}_ms", ["timeou", "_ms"]),
+        ("max_(retries|attempts)_count", ["max_", "_count"]),
+        ("[Cc]onfigLoader", ["onfigLoader"]),
+        ("get|set", []),
+        ("(?x) foo bar", []),
+        ("ab.cd", []),
+    ],
+)
+def test_required_literals(pattern: str, literals: list[str]) -> None:
+    """Only substrings every match must contain are extracted."""
+    assert required_literals(pattern) == literals
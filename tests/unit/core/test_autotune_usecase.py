@@ -0,0 +1,158 @@
+"""Unit tests for AutotuneUseCase calibration (no model loading required)."""
+
+from ember.core.config.autotune_usecase import (
+    AutotuneRequest,
+    AutotuneUseCase,
+    sample_chunk_texts,
+    synthetic_sample_texts,
+    thread_candidates,
+)
+from ember.core.hardware import SystemResources
+
+
+class FakeBenchmark:
+    """EmbeddingBenchmark with throughput given by a formula."""
+
+    def __init__(self, throughput, oom_batch_tokens: int | None = None, default_length=512):
+        self.throughput = throughput
+        self.oom_batch_tokens = oom_batch_tokens
+        self.default_max_seq_length = default_length
+        self.calls: list[tuple[int, int, int]] = []
+
+    def measure(self, texts, batch_size, max_seq_length, threads):
+        self.calls.append((batch_size, max_seq_length, threads))
+        if self.oom_batch_tokens is not None and batch_size * max_seq_length > self.oom_batch_tokens:
+            raise MemoryError("out of memory")
+        return self.throughput(batch_size, threads)
+
+
+def _resources(available: float = 16.0, cpus: int = 8) -> SystemResources:
+    return SystemResources(available_ram_gb=available, total_ram_gb=32.0, cpu_count=cpus)
+
+
+def _execute(benchmark: FakeBenchmark, resources: SystemResources | None = None):
+    use_case = AutotuneUseCase(benchmark, resource_probe=lambda: resources or _resources())
+    return use_case.execute(AutotuneRequest(sample_texts=["def f(): pass"] * 4))
+
+
+class TestAutotuneUseCase:
+    """Tests for the batch size / thread / sequence length sweep."""
+
+    def test_picks_fastest_batch_size(self) -> None:
+        """The batch size with the highest throughput wins."""
+        rates = {8: 10.0, 16: 20.0, 32: 40.0, 64: 30.0, 128: 25.0}
+        response = _execute(FakeBenchmark(lambda b, t: rates[b]))
+
+        assert response.success
+        assert response.batch_size == 32
+        assert response.max_seq_length == 512
+        assert not response.max_seq_length_reduced
+
+    def test_stops_growing_after_throughput_drops(self) -> None:
+        """Larger batches are not tried once throughput falls off."""
+        rates = {8: 10.0, 16: 20.0, 32: 12.0, 64: 50.0, 128: 60.0}
+        benchmark = FakeBenchmark(lambda b, t: rates[b])
+
+        response = _execute(benchmark)
+
+        assert response.batch_size == 16
+        assert 64 not in {call[0] for call in benchmark.calls}
+
+    def test_prefers_smaller_batch_within_tolerance(self) -> None:
+        """A marginally faster large batch is not worth the memory."""
+        rates = {8: 10.0, 16: 40.0, 32: 40.5, 64: 41.0, 128: 20.0}
+        response = _execute(FakeBenchmark(lambda b, t: rates[b]))
+
+        assert response.batch_size == 16
+
+    def test_out_of_memory_caps_batch_size(self) -> None:
+        """Growth stops at the first batch size that runs out of memory."""
+        benchmark = FakeBenchmark(lambda b, t: float(b), oom_batch_tokens=32 * 512)
+
+        response = _execute(benchmark)
+
+        assert response.batch_size == 32
+        assert [t.out_of_memory for t in response.trials[:4]] == [False, False, False, True]
+        assert 128 not in {call[0] for call in benchmark.calls}
+
+    def test_low_memory_stops_growth(self) -> None:
+        """Batches stop growing when free RAM is nearly exhausted."""
+        benchmark = FakeBenchmark(lambda b, t: float(b))
+
+        response = _execute(benchmark, _resources(available=1.0))
+
+        assert response.batch_size == 8
+
+    def test_reduces_max_seq_length_only_when_nothing_fits(self) -> None:
+        """Sequence length is halved when even the smallest batch runs out of memory."""
+        benchmark = FakeBenchmark(lambda b, t: float(b), oom_batch_tokens=8 * 256)
+
+        response = _execute(benchmark)
+
+        assert response.success
+        assert response.max_seq_length == 256
+        assert response.max_seq_length_reduced
+        assert response.batch_size == 8
+
+    def test_fails_when_model_never_fits(self) -> None:
+        """Calibration reports failure instead of recommending unusable settings."""
+        benchmark = FakeBenchmark(lambda b, t: float(b), oom_batch_tokens=1)
+
+        response = _execute(benchmark)
+
+        assert not response.success
+        assert "out of memory" in response.error.lower()
+
+    def test_prefers_fewer_threads_within_tolerance(self) -> None:
+        """Threads beyond the point of diminishing returns are not used."""
+        benchmark = FakeBenchmark(lambda b, t: 100.0 if t >= 4 else 50.0)
+
+        response = _execute(benchmark, _resources(cpus=8))
+
+        assert response.threads == 4
+        assert {call[2] for call in benchmark.calls} == {8, 4, 2, 1}
+
+    def test_benchmark_errors_are_reported(self) -> None:
+        """Unexpected benchmark errors fail the response."""
+
+        def broken(batch_size, threads):
+            raise RuntimeError("model download failed")
+
+        response = _execute(FakeBenchmark(broken))
+
+        assert not response.success
+        assert "model download failed" in response.error
+
+    def test_requires_samples(self) -> None:
+        """Calibration needs at least one sample text."""
+        use_case = AutotuneUseCase(FakeBenchmark(lambda b, t: 1.0), resource_probe=_resources)
+
+        response = use_case.execute(AutotuneRequest(sample_texts=[]))
+
+        assert not response.success
+
+
+class TestSampling:
+    """Tests for thread candidates and sample selection."""
+
+    def test_thread_candidates_halve_down(self) -> None:
+        """Thread counts are the CPU count and its halvings."""
+        assert thread_candidates(8) == [8, 4, 2, 1]
+        assert thread_candidates(1) == [1]
+        assert thread_candidates(64) == [64, 32, 16, 8]
+
+    def test_sample_chunk_texts_spreads_across_index(self) -> None:
+        """Samples are spread evenly and skip blank chunks."""
+        contents = [f"chunk {i}" for i in range(100)] + ["   "]
+
+        samples = sample_chunk_texts(contents, count=10)
+
+        assert samples == [f"chunk {i}" for i in range(0, 100, 10)]
+
+    def test_synthetic_samples_vary_in_length(self) -> None:
+        """Synthetic samples cover short and long chunks."""
+        samples = synthetic_sample_texts(16)
+
+        lengths = sorted(len(s) for s in samples)
+        assert len(samples) == 16
+        assert lengths[-1] > 4 * lengths[0]
@@ -20,6 +20,7 @@ from ember.core.cli_utils import (
     no_search_results_error,
     path_not_in_repo_error,
     repo_not_found_error,
+    resolve_repo_list,
 )
 
 
@@ -223,6 +224,45 @@ class TestDisplayContentWithContext:
         assert success is False
 
 
+class TestResolveRepoList:
+    """Tests for resolve_repo_list function."""
+
+    @staticmethod
+    def _make_repo(path: Path) -> Path:
+        (path / ".ember").mkdir(parents=True)
+        (path / ".ember" / "index.db").touch()
+        return path
+
+    def test_resolves_comma_separated_paths(self, tmp_path: Path) -> None:
+        """Should resolve each path against the working directory, once."""
+        api = self._make_repo(tmp_path / "api")
+        web = self._make_repo(tmp_path / "web")
+
+        repos = resolve_repo_list("api, web,api", cwd=tmp_path)
+
+        assert repos == [api.resolve(), web.resolve()]
+
+    def test_reads_group_file(self, tmp_path: Path) -> None:
+        """Should read one repo per line relative to the file, skipping comments."""
+        api = self._make_repo(tmp_path / "repos" / "api")
+        group = tmp_path / "repos" / "backend.txt"
+        group.write_text("# Backend services\n\napi\n")
+
+        repos = resolve_repo_list("repos/backend.txt", cwd=tmp_path)
+
+        assert repos == [api.resolve()]
+
+    def test_raises_for_repo_without_index(self, tmp_path: Path) -> None:
+        """Should raise EmberCliError naming the repository without an index."""
+        (tmp_path / "plain").mkdir()
+
+        with pytest.raises(EmberCliError) as exc_info:
+            resolve_repo_list("plain", cwd=tmp_path)
+
+        assert "No Ember index" in exc_info.value.message
+        assert "ember init" in exc_info.value.hint
+
+
 class TestDisplayContentWithHighlighting:
     """Tests for display_content_with_highlighting function."""
 
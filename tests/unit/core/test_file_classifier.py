@@ -0,0 +1,94 @@
+"""Tests for detecting generated, minified and vendored files."""
+
+import base64
+import random
+from pathlib import Path
+
+import pytest
+
+from ember.core.indexing.file_classifier import FileClassifier, shannon_entropy
+
+SOURCE = b'''"""Order processing."""
+
+
+def total(order):
+    """Sum the price of every line item."""
+    return sum(item.price * item.quantity for item in order.items)
+
+
+class Processor:
+    def __init__(self, gateway):
+        self.gateway = gateway
+
+    def charge(self, order):
+        return self.gateway.charge(order.customer, total(order))
+'''
+
+
+@pytest.fixture
+def classifier() -> FileClassifier:
+    return FileClassifier(max_file_bytes=100_000)
+
+
+def test_source_code_is_indexed(classifier: FileClassifier) -> None:
+    """Hand-written code is not classified."""
+    assert classifier.classify(Path("src/orders.py"), SOURCE) is None
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["vendor/lib/util.go", "third_party/zlib/inflate.c", "src/ThirdParty/x.py"],
+)
+def test_vendored_directories(classifier: FileClassifier, path: str) -> None:
+    """Files under vendor directories are vendored."""
+    assert classifier.classify(Path(path), SOURCE) == "vendored"
+
+
+@pytest.mark.parametrize(
+    "path", ["static/app.min.js", "api/orders_pb2.py", "api/orders.pb.go"]
+)
+def test_generated_file_names(classifier: FileClassifier, path: str) -> None:
+    """Bundles and protobuf stubs are recognised by name."""
+    assert classifier.classify(Path(path), SOURCE) == "generated"
+
+
+def test_generated_marker_in_header(classifier: FileClassifier) -> None:
+    """A generator's header comment marks the file as generated."""
+    content = b"// Code generated by mockgen. DO NOT EDIT.\n" + SOURCE
+
+    assert classifier.classify(Path("mocks/store.go"), content) == "generated"
+
+
+def test_marker_outside_header_is_ignored(classifier: FileClassifier) -> None:
+    """Code that merely mentions the marker deep in the file is indexed."""
+    content = SOURCE * 40 + b'MARKER = "@generated"\n'
+
+    assert classifier.classify(Path("tools/check.py"), content) is None
+
+
+def test_oversized_file(classifier: FileClassifier) -> None:
+    """Files above the size cap are skipped."""
+    assert classifier.classify(Path("src/big.py"), SOURCE * 1000) == "oversized"
+
+
+def test_minified_content(classifier: FileClassifier) -> None:
+    """Very long lines mark a file as minified."""
+    content = b"function a(b){return b+1};" * 500
+
+    assert classifier.classify(Path("static/app.js"), content) == "minified"
+
+
+def test_encoded_content(classifier: FileClassifier) -> None:
+    """High-entropy data embedded as source is skipped."""
+    rng = random.Random(0)
+    blob = base64.b64encode(bytes(rng.randrange(256) for _ in range(30_000)))
+    lines = b"\n".join(blob[i : i + 76] for i in range(0, len(blob), 76))
+
+    assert classifier.classify(Path("assets/fonts.ts"), lines) == "encoded"
+
+
+def test_shannon_entropy() -> None:
+    """Entropy ranges from 0 for uniform data to 8 bits for all byte values."""
+    assert shannon_entropy(b"") == 0.0
+    assert shannon_entropy(b"aaaa") == 0.0
+    assert shannon_entropy(bytes(range(256))) == pytest.approx(8.0)
@@ -11,6 +11,7 @@ from ember.core.hardware import (
     detect_system_resources,
     get_model_recommendation_reason,
     recommend_model,
+    recommend_worker_layout,
 )
 
 
@@ -171,3 +172,35 @@ class TestAutoModelInRegistry:
         assert resolved == "sentence-transformers/all-MiniLM-L6-v2"  # MiniLM
 
         mock_detect.assert_called_once()
+
+
+class TestRecommendWorkerLayout:
+    """Tests for recommend_worker_layout function."""
+
+    def test_explicit_workers_split_cpus_evenly(self):
+        """Test threads per worker come from dividing the CPUs."""
+        resources = SystemResources(available_ram_gb=64.0, total_ram_gb=128.0, cpu_count=32)
+        layout = recommend_worker_layout("minilm", workers=8, resources=resources)
+        assert layout.workers == 8
+        assert layout.threads_per_worker == 4
+
+    def test_auto_workers_scale_with_cpus(self):
+        """Test auto mode gives large machines several workers."""
+        resources = SystemResources(available_ram_gb=64.0, total_ram_gb=128.0, cpu_count=32)
+        layout = recommend_worker_layout("minilm", workers=0, resources=resources)
+        assert layout.workers == 8
+        assert layout.threads_per_worker == 4
+
+    def test_auto_workers_limited_by_ram(self):
+        """Test auto mode does not start more model copies than RAM allows."""
+        resources = SystemResources(available_ram_gb=4.0, total_ram_gb=8.0, cpu_count=32)
+        layout = recommend_worker_layout("jina-code-v2", workers=0, resources=resources)
+        assert layout.workers == 1
+        assert layout.threads_per_worker == 32
+
+    def test_workers_capped_at_cpu_count(self):
+        """Test more workers than CPUs are not started."""
+        resources = SystemResources(available_ram_gb=64.0, total_ram_gb=128.0, cpu_count=2)
+        layout = recommend_worker_layout("minilm", workers=8, resources=resources)
+        assert layout.workers == 2
+        assert layout.threads_per_worker == 1
@@ -0,0 +1,109 @@
+"""Tests for hierarchical chunking of nested definitions."""
+
+from pathlib import Path
+
+from ember.adapters.parsers.line_chunker import LineChunker
+from ember.adapters.parsers.tree_sitter_chunker import TreeSitterChunker
+from ember.core.chunking.chunk_usecase import ChunkFileRequest, ChunkFileUseCase
+from ember.core.chunking.hierarchy import build_skeletons, direct_children
+from ember.core.chunking.token_sizing import ChunkSizer, TokenBudget
+from ember.ports.chunkers import ChunkData
+
+SOURCE = '''class Store:
+    """Key-value store."""
+
+    backend = "memory"
+
+    def get(self, key):
+        """Return the value of a key."""
+        return self.data[key]
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.flush()
+
+
+def main():
+    return Store()'''
+
+
+def _chunk(start: int, end: int, symbol: str) -> ChunkData:
+    lines = SOURCE.split("\n")
+    return ChunkData(
+        start_line=start,
+        end_line=end,
+        content="\n".join(lines[start - 1 : end]),
+        symbol=symbol,
+        lang="py",
+    )
+
+
+CHUNKS = [
+    _chunk(1, 12, "Store"),
+    _chunk(6, 8, "get"),
+    _chunk(10, 12, "put"),
+    _chunk(15, 16, "main"),
+]
+
+
+class WordCounter:
+    """Token counter treating every whitespace-separated word as a token."""
+
+    def count_tokens(self, texts: list[str]) -> list[int]:
+        return [len(text.split()) for text in texts]
+
+
+def test_direct_children_follow_nesting() -> None:
+    """Only chunks nested in another chunk are its children."""
+    children = direct_children(CHUNKS)
+
+    assert {index: [c.symbol for c in nested] for index, nested in children.items()} == {
+        0: ["get", "put"]
+    }
+
+
+def test_container_becomes_skeleton() -> None:
+    """A class keeps its docstring, fields and method signatures only."""
+    chunks = build_skeletons(CHUNKS, SOURCE)
+
+    assert chunks[0].content == "\n".join(
+        [
+            "class Store:",
+            '    """Key-value store."""',
+            "",
+            '    backend = "memory"',
+            "",
+            "    def get(self, key):",
+            "        ...",
+            "",
+            "    def put(self, key, value):",
+            "        ...",
+        ]
+    )
+    assert (chunks[0].start_line, chunks[0].end_line) == (1, 12)
+    assert chunks[1:] == CHUNKS[1:]
+
+
+def test_sizer_keeps_skeletons_intact() -> None:
+    """Skeletons are neither split nor packed back into full source."""
+    chunks = build_skeletons(CHUNKS, SOURCE)
+    sizer = ChunkSizer(WordCounter(), TokenBudget(max_tokens=12, min_tokens=100))
+
+    fitted = sizer.fit(chunks, SOURCE)
+
+    assert fitted[0] == chunks[0]
+    assert all("self.flush()" not in c.content for c in fitted if c.symbol == "Store")
+
+
+def test_chunk_usecase_hierarchical_mode() -> None:
+    """Tree-sitter chunks are reduced to skeletons in hierarchical mode."""
+    use_case = ChunkFileUseCase(TreeSitterChunker(), LineChunker(), hierarchical=True)
+
+    response = use_case.execute(
+        ChunkFileRequest(content=SOURCE, path=Path("store.py"), lang="py")
+    )
+
+    by_symbol = {c.symbol: c for c in response.chunks}
+    assert "self.flush()" not in by_symbol["Store"].content
+    assert "def put(self, key, value):" in by_symbol["Store"].content
+    assert "self.flush()" in by_symbol["put"].content
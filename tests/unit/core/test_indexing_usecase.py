@@ -7,9 +7,16 @@ covering all edge cases before refactoring the method for lower complexity.
 from pathlib import Path
 from unittest.mock import Mock
 
+import blake3
 import pytest
 
-from ember.core.indexing.index_usecase import IndexingUseCase
+from ember.adapters.fs.local import LocalFileSystem
+from ember.adapters.parsers.line_chunker import LineChunker
+from ember.adapters.parsers.tree_sitter_chunker import TreeSitterChunker
+from ember.core.chunking.chunk_usecase import ChunkFileUseCase
+from ember.core.indexing.file_classifier import FileClassifier
+from ember.core.indexing.index_usecase import STREAM_BATCH_CHUNKS, IndexingUseCase
+from ember.domain.entities import Chunk
 
 
 @pytest.fixture
@@ -93,6 +100,56 @@ class TestGetFilesToIndexFullReindex:
         assert len(files) == 2
         mock_deps["meta_repo"].get.assert_called_once_with("last_tree_sha")
 
+    def test_rev_sync_lists_files_from_tree(self, mock_deps: dict) -> None:
+        """Full rev/staged syncs list files from the tree, not the worktree."""
+        usecase = IndexingUseCase(**mock_deps)
+        mock_deps["meta_repo"].get.return_value = None
+        mock_deps["vcs"].list_files_at.return_value = [Path("main.py")]
+        repo_root = Path("/repo")
+
+        files, is_incremental = usecase._get_files_to_index(
+            repo_root=repo_root,
+            tree_sha="abc123",
+            path_filters=[],
+            force_reindex=False,
+            sync_mode="staged",
+        )
+
+        assert files == [repo_root / "main.py"]
+        mock_deps["vcs"].list_files_at.assert_called_once_with("abc123")
+        mock_deps["vcs"].list_tracked_files.assert_not_called()
+
+
+class TestReadFileContent:
+    """Tests for choosing the content source by sync mode."""
+
+    def test_worktree_reads_from_filesystem(self, mock_deps: dict) -> None:
+        """Worktree syncs read file content from disk."""
+        usecase = IndexingUseCase(**mock_deps)
+        mock_deps["fs"].read.return_value = b"disk"
+
+        content = usecase._read_file_content(
+            Path("/repo/a.py"), Path("a.py"), "tree123", "worktree"
+        )
+
+        assert content == b"disk"
+        mock_deps["vcs"].get_file_content.assert_not_called()
+
+    def test_rev_reads_blob_at_tree(self, mock_deps: dict) -> None:
+        """Rev syncs read the blob from the indexed tree via VCS."""
+        usecase = IndexingUseCase(**mock_deps)
+        mock_deps["vcs"].get_file_content.return_value = b"blob"
+
+        content = usecase._read_file_content(
+            Path("/repo/a.py"), Path("a.py"), "tree123", "HEAD~1"
+        )
+
+        assert content == b"blob"
+        mock_deps["vcs"].get_file_content.assert_called_once_with(
+            Path("a.py"), ref="tree123"
+        )
+        mock_deps["fs"].read.assert_not_called()
+
 
 class TestGetFilesToIndexNoChanges:
     """Tests for no-changes scenario."""
@@ -478,3 +535,247 @@ class TestGetFilesToIndexCombined:
 
         assert all(f.is_absolute() for f in files)
         assert all(str(f).startswith(str(repo_root)) for f in files)
+
+
+class TestSyncCheckpoints:
+    """Tests for resuming interrupted syncs from checkpoints."""
+
+    def _usecase(self, mock_deps: dict, **kwargs) -> IndexingUseCase:
+        mock_deps["embedder"].fingerprint.return_value = "model-fp"
+        return IndexingUseCase(**mock_deps, checkpoint_repo=Mock(), **kwargs)
+
+    def test_skips_files_completed_for_same_tree(self, mock_deps: dict) -> None:
+        """Files recorded for this tree and model are not indexed again."""
+        usecase = self._usecase(mock_deps)
+        usecase.checkpoint_repo.get_completed.return_value = {Path("a.py")}
+        repo_root = Path("/repo")
+        files = [repo_root / "a.py", repo_root / "b.py"]
+
+        remaining, skipped = usecase._skip_checkpointed_files(files, repo_root, "tree1")
+
+        assert remaining == [repo_root / "b.py"]
+        assert skipped == 1
+        usecase.checkpoint_repo.get_completed.assert_called_once_with("tree1", "model-fp")
+
+    def test_without_checkpoint_repo_nothing_skipped(self, mock_deps: dict) -> None:
+        """Without a checkpoint repository every file is indexed."""
+        usecase = IndexingUseCase(**mock_deps)
+        files = [Path("/repo/a.py")]
+
+        assert usecase._skip_checkpointed_files(files, Path("/repo"), "t") == (files, 0)
+
+    def test_flushes_in_batches(self, mock_deps: dict) -> None:
+        """Completed files are recorded every checkpoint_interval files."""
+        usecase = self._usecase(mock_deps, checkpoint_interval=2)
+        usecase._index_file = Mock(
+            return_value={
+                "chunks_created": 1,
+                "chunks_updated": 0,
+                "vectors_stored": 1,
+                "vectors_cached": 0,
+                "failed": 0,
+                "restored": 0,
+                "skipped": 0,
+            }
+        )
+        repo_root = Path("/repo")
+        files = [repo_root / f"f{i}.py" for i in range(5)]
+
+        usecase._index_files_with_progress(files, repo_root, "tree1", "worktree", "full", None)
+
+        batches = [c.args[2] for c in usecase.checkpoint_repo.mark_completed.call_args_list]
+        assert batches == [
+            [Path("f0.py"), Path("f1.py")],
+            [Path("f2.py"), Path("f3.py")],
+            [Path("f4.py")],
+        ]
+
+    def test_flushes_completed_files_on_interrupt(self, mock_deps: dict) -> None:
+        """Files finished before an interruption are still recorded."""
+        usecase = self._usecase(mock_deps, checkpoint_interval=10)
+        ok = {
+            "chunks_created": 1,
+            "chunks_updated": 0,
+            "vectors_stored": 1,
+            "vectors_cached": 0,
+            "failed": 0,
+            "restored": 0,
+            "skipped": 0,
+        }
+        usecase._index_file = Mock(side_effect=[ok, KeyboardInterrupt()])
+        repo_root = Path("/repo")
+        files = [repo_root / "a.py", repo_root / "b.py"]
+
+        with pytest.raises(KeyboardInterrupt):
+            usecase._index_files_with_progress(files, repo_root, "tree1", "worktree", "full", None)
+
+        usecase.checkpoint_repo.mark_completed.assert_called_once_with(
+            "tree1", "model-fp", [Path("a.py")]
+        )
+
+    def test_checkpoints_cleared_after_metadata_update(self, mock_deps: dict) -> None:
+        """A completed sync discards its progress records."""
+        usecase = self._usecase(mock_deps)
+
+        usecase._update_metadata("tree1", "worktree")
+
+        usecase.checkpoint_repo.clear.assert_called_once()
+
+
+class TestEmbeddingCache:
+    """Tests for reusing embeddings from the shared cache."""
+
+    @staticmethod
+    def _chunk(content: str) -> Chunk:
+        return Chunk(
+            id=Chunk.compute_id("p", Path("a.py"), 1, 1),
+            project_id="p",
+            path=Path("a.py"),
+            lang="py",
+            symbol=None,
+            start_line=1,
+            end_line=1,
+            content=content,
+            content_hash=Chunk.compute_content_hash(content),
+            file_hash="f",
+            tree_sha="t",
+            rev="worktree",
+        )
+
+    def _usecase(self, mock_deps: dict, cached: dict) -> IndexingUseCase:
+        cache = Mock()
+        cache.get_many.return_value = cached
+        mock_deps["embedder"].embed_texts.side_effect = lambda texts: [
+            [float(len(t))] for t in texts
+        ]
+        return IndexingUseCase(**mock_deps, embedding_cache=cache)
+
+    def test_cache_hits_skip_embedder(self, mock_deps: dict) -> None:
+        """Chunks found in the cache are not embedded again."""
+        a, b = self._chunk("aa"), self._chunk("bbbb")
+        usecase = self._usecase(mock_deps, {a.content_hash: [9.0]})
+
+        embeddings, cached = usecase._embed_chunks([a, b], "fp")
+
+        assert embeddings == [[9.0], [4.0]]
+        assert cached == 1
+        mock_deps["embedder"].embed_texts.assert_called_once_with(["bbbb"])
+        usecase.embedding_cache.put_many.assert_called_once_with("fp", {b.content_hash: [4.0]})
+
+    def test_duplicate_content_embedded_once(self, mock_deps: dict) -> None:
+        """Identical chunks in one file share a single embedding call."""
+        usecase = self._usecase(mock_deps, {})
+        chunks = [self._chunk("same"), self._chunk("same")]
+
+        embeddings, cached = usecase._embed_chunks(chunks, "fp")
+
+        assert embeddings == [[4.0], [4.0]]
+        assert cached == 0
+        mock_deps["embedder"].embed_texts.assert_called_once_with(["same"])
+
+    def test_all_hits_never_call_embedder(self, mock_deps: dict) -> None:
+        """A fully cached file needs no embedding model at all."""
+        a = self._chunk("aa")
+        usecase = self._usecase(mock_deps, {a.content_hash: [1.0]})
+
+        assert usecase._embed_chunks([a], "fp") == ([[1.0]], 1)
+        mock_deps["embedder"].embed_texts.assert_not_called()
+        usecase.embedding_cache.put_many.assert_not_called()
+
+    def test_cache_errors_fall_back_to_embedder(self, mock_deps: dict) -> None:
+        """A broken cache never fails the sync."""
+        a = self._chunk("aa")
+        usecase = self._usecase(mock_deps, {})
+        usecase.embedding_cache.get_many.side_effect = RuntimeError("database is locked")
+        usecase.embedding_cache.put_many.side_effect = RuntimeError("disk full")
+
+        assert usecase._embed_chunks([a], "fp") == ([[2.0]], 0)
+
+
+class TestFileClassifier:
+    """Tests for skipping generated, minified and vendored files."""
+
+    def _index(self, mock_deps: dict, rel_path: str, content: bytes) -> dict[str, int]:
+        mock_deps["fs"].read.return_value = content
+        mock_deps["fs"].size.return_value = len(content)
+        usecase = IndexingUseCase(
+            **mock_deps, file_classifier=FileClassifier(max_file_bytes=1024 * 1024)
+        )
+        return usecase._index_file(
+            file_path=Path("/repo") / rel_path,
+            repo_root=Path("/repo"),
+            tree_sha="abc123",
+            sync_mode="worktree",
+        )
+
+    def test_minified_file_is_skipped(self, mock_deps: dict) -> None:
+        """A minified bundle is tracked but never chunked or embedded."""
+        bundle = b"var a=1;" * 2000
+
+        result = self._index(mock_deps, "static/app.js", bundle)
+
+        assert result["skipped"] == 1
+        assert result["chunks_created"] == 0
+        mock_deps["chunk_usecase"].execute.assert_not_called()
+        mock_deps["embedder"].embed_texts.assert_not_called()
+        mock_deps["chunk_repo"].delete_all_for_path.assert_called_once_with(
+            path=Path("static/app.js")
+        )
+        mock_deps["file_repo"].track_file.assert_called_once()
+
+    def test_source_file_is_chunked(self, mock_deps: dict) -> None:
+        """Hand-written code goes through chunking as usual."""
+        mock_deps["chunk_usecase"].execute.return_value = Mock(success=True, chunks=[])
+
+        result = self._index(mock_deps, "src/app.py", b"def main():\n    return 0\n")
+
+        assert result["skipped"] == 0
+        mock_deps["chunk_usecase"].execute.assert_called_once()
+
+
+class TestLargeFileStreaming:
+    """Tests for indexing very large files in bounded memory."""
+
+    def test_large_file_is_streamed_in_batches(self, mock_deps: dict, tmp_path: Path) -> None:
+        """A file over the threshold is mapped, never read whole, and embedded in batches."""
+        content = "\n".join(f"value_{i} = {i}" for i in range(400)).encode()
+        file_path = tmp_path / "data.py"
+        file_path.write_bytes(content)
+        mock_deps["fs"] = Mock(wraps=LocalFileSystem())
+        mock_deps["chunk_usecase"] = ChunkFileUseCase(
+            TreeSitterChunker(), LineChunker(window_size=5, stride=5)
+        )
+        mock_deps["chunk_repo"].find_by_content_hash.return_value = []
+        mock_deps["embedder"].embed_texts.side_effect = lambda texts: [[1.0] for _ in texts]
+        usecase = IndexingUseCase(**mock_deps, stream_threshold_bytes=1024)
+
+        result = usecase._index_file(
+            file_path=file_path, repo_root=tmp_path, tree_sha="abc123", sync_mode="worktree"
+        )
+
+        assert result["chunks_created"] == 80
+        assert result["vectors_stored"] == 80
+        mock_deps["fs"].read.assert_not_called()
+        batch_sizes = [len(c.args[0]) for c in mock_deps["embedder"].embed_texts.call_args_list]
+        assert max(batch_sizes) <= STREAM_BATCH_CHUNKS
+        assert sum(batch_sizes) == 80
+        tracked = mock_deps["file_repo"].track_file.call_args.kwargs
+        assert tracked["file_hash"] == blake3.blake3(content).hexdigest()
+        assert tracked["size"] == len(content)
+
+    def test_small_file_is_read_whole(self, mock_deps: dict) -> None:
+        """Files under the threshold take the in-memory path."""
+        mock_deps["fs"].size.return_value = 10
+        mock_deps["fs"].read.return_value = b"x = 1\n"
+        mock_deps["chunk_usecase"].execute.return_value = Mock(success=True, chunks=[])
+        usecase = IndexingUseCase(**mock_deps, stream_threshold_bytes=1024)
+
+        usecase._index_file(
+            file_path=Path("/repo/a.py"),
+            repo_root=Path("/repo"),
+            tree_sha="t",
+            sync_mode="worktree",
+        )
+
+        mock_deps["fs"].map.assert_not_called()
+        mock_deps["fs"].read.assert_called_once()
@@ -16,6 +16,7 @@ from ember.core.presentation.context_renderer import ContextRenderer
 from ember.core.presentation.json_formatter import JsonResultFormatter
 from ember.core.presentation.result_presenter import ResultPresenter
 from ember.domain.config import DisplayConfig, EmberConfig
+from ember.domain.entities import IndexFreshness
 
 
 @dataclass
@@ -45,6 +46,7 @@ class MockSearchResult:
     rank: int = 1
     preview: str = "def test_function():"
     explanation: dict = field(default_factory=dict)
+    stale: bool = False
 
     def format_preview(self, max_lines: int = 3) -> str:
         """Generate preview text from chunk content."""
@@ -637,6 +639,21 @@ class TestJsonResultFormatter:
 
         assert len(parsed) == 1
         assert "context" not in parsed[0]
+        assert "index_freshness" not in parsed[0]
+
+    def test_format_output_with_freshness(self, json_formatter):
+        """Index freshness is reported with each result."""
+        freshness = IndexFreshness(caught_up=False, pending=True)
+        json_str = json_formatter.format_output(
+            [MockSearchResult(), MockSearchResult()], freshness=freshness
+        )
+
+        import json
+        parsed = json.loads(json_str)
+
+        assert [item["index_freshness"] for item in parsed] == [
+            {"caught_up": False, "pending": True, "last_error": None}
+        ] * 2
 
     def test_get_context_method(self, tmp_path, json_formatter):
         """Get context returns proper structure."""
@@ -0,0 +1,112 @@
+"""Unit tests for StaleResultDetector."""
+
+from pathlib import Path
+
+import blake3
+
+from ember.core.retrieval.staleness import StaleResultDetector
+from ember.domain.entities import Chunk, SearchResult
+
+
+class InMemoryFileRepository:
+    """Minimal FileRepository storing states in a dict."""
+
+    def __init__(self) -> None:
+        self.states: dict[Path, dict] = {}
+
+    def track(self, path: Path, content: bytes) -> None:
+        self.states[path] = {
+            "file_hash": blake3.blake3(content).hexdigest(),
+            "size": len(content),
+            "mtime": 0.0,
+            "last_indexed_at": 0.0,
+        }
+
+    def get_file_state(self, path: Path) -> dict | None:
+        return self.states.get(path)
+
+
+class DictFileSystem:
+    """Minimal FileSystem backed by a dict."""
+
+    def __init__(self, files: dict[Path, bytes]) -> None:
+        self.files = files
+
+    def read(self, path: Path) -> bytes:
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return self.files[path]
+
+
+def _result(path: str, rank: int = 1) -> SearchResult:
+    content = "def f(): pass"
+    chunk = Chunk(
+        id=Chunk.compute_id("proj", Path(path), 1, 1),
+        project_id="proj",
+        path=Path(path),
+        lang="py",
+        symbol="f",
+        start_line=1,
+        end_line=1,
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash="x",
+        tree_sha="t",
+        rev="worktree",
+    )
+    return SearchResult(chunk=chunk, score=1.0, rank=rank)
+
+
+def test_marks_modified_deleted_and_untracked_files() -> None:
+    """Only files that differ from the indexed copy are flagged."""
+    root = Path("/repo")
+    file_repo = InMemoryFileRepository()
+    file_repo.track(root / "same.py", b"same")
+    file_repo.track(root / "edited.py", b"old")
+    file_repo.track(root / "deleted.py", b"gone")
+    fs = DictFileSystem({root / "same.py": b"same", root / "edited.py": b"new"})
+
+    detector = StaleResultDetector(fs, file_repo, root)
+    results = detector.mark(
+        [_result("same.py", 1), _result("edited.py", 2), _result("deleted.py", 3), _result("new.py", 4)]
+    )
+
+    assert [r.stale for r in results] == [False, True, True, True]
+
+
+def test_checks_file_against_its_own_repository() -> None:
+    """Files are looked up in the repository returned for their path."""
+    root = Path("/repo")
+    root_repo = InMemoryFileRepository()
+    shard_repo = InMemoryFileRepository()
+    shard_repo.track(root / "lib/a.py", b"same")
+    fs = DictFileSystem({root / "lib/a.py": b"same", root / "b.py": b"same"})
+
+    detector = StaleResultDetector(
+        fs,
+        root_repo,
+        root,
+        file_repo_for=lambda path: shard_repo if path.parts[0] == "lib" else root_repo,
+    )
+    results = detector.mark([_result("lib/a.py", 1), _result("b.py", 2)])
+
+    assert [r.stale for r in results] == [False, True]
+
+
+def test_each_file_checked_once() -> None:
+    """Multiple results from one file share a single check."""
+    root = Path("/repo")
+    file_repo = InMemoryFileRepository()
+    file_repo.track(root / "a.py", b"v1")
+    reads: list[Path] = []
+
+    class CountingFs(DictFileSystem):
+        def read(self, path: Path) -> bytes:
+            reads.append(path)
+            return super().read(path)
+
+    detector = StaleResultDetector(CountingFs({root / "a.py": b"v2"}), file_repo, root)
+    results = detector.mark([_result("a.py", 1), _result("a.py", 2)])
+
+    assert all(r.stale for r in results)
+    assert reads == [root / "a.py"]
@@ -0,0 +1,110 @@
+"""Unit tests for symbol query detection and the hybrid symbol boost."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from ember.core.retrieval.search_usecase import SearchUseCase
+from ember.core.retrieval.symbol_search import is_identifier, looks_like_symbol, match_kind
+from ember.domain.entities import Chunk, Query
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("parse_config", True),
+        ("UserRepository", True),
+        ("getUserById", True),
+        ("HTTPServer", True),
+        ("sha256", True),
+        ("_private_helper", True),
+        ("authentication", False),
+        ("User", False),
+        ("MAX", False),
+        ("_", False),
+        ("user repository", False),
+        ("/v2/users", False),
+        ("cache.evict", False),
+    ],
+)
+def test_looks_like_symbol(text: str, expected: bool) -> None:
+    """Only identifiers written in a code style are treated as symbols."""
+    assert looks_like_symbol(text) is expected
+
+
+def test_is_identifier_accepts_plain_words() -> None:
+    """Any single identifier can name a symbol, even without code style."""
+    assert is_identifier(" add ")
+    assert not is_identifier("add numbers")
+
+
+def test_match_kind() -> None:
+    """Scores map back to the kind of match."""
+    assert [match_kind(s) for s in (3.0, 2.0, 1.2, 0.8)] == ["exact", "exact", "prefix", "fuzzy"]
+
+
+def _chunk(symbol: str, start_line: int) -> Chunk:
+    content = f"def {symbol}():\n    pass"
+    return Chunk(
+        id=Chunk.compute_id("proj", Path("mod.py"), start_line, start_line + 1),
+        project_id="proj",
+        path=Path("mod.py"),
+        lang="py",
+        symbol=symbol,
+        start_line=start_line,
+        end_line=start_line + 1,
+        content=content,
+        content_hash=Chunk.compute_content_hash(content),
+        file_hash="hash",
+        tree_sha="tree",
+        rev="worktree",
+    )
+
+
+def _usecase(symbol_search: MagicMock | None) -> tuple[SearchUseCase, Chunk, Chunk]:
+    caller = _chunk("call_add", 1)
+    definition = _chunk("add", 10)
+    chunks = {c.id: c for c in (caller, definition)}
+
+    text_search = MagicMock()
+    text_search.query.return_value = [(caller.id, 5.0), (definition.id, 1.0)]
+    vector_search = MagicMock()
+    vector_search.query.return_value = [(caller.id, 0.9), (definition.id, 0.8)]
+    chunk_repo = MagicMock()
+    chunk_repo.get.side_effect = chunks.get
+    embedder = MagicMock()
+    embedder.embed_texts.return_value = [[0.0]]
+
+    usecase = SearchUseCase(
+        text_search, vector_search, chunk_repo, embedder, symbol_search=symbol_search
+    )
+    return usecase, caller, definition
+
+
+def test_identifier_query_boosts_definition() -> None:
+    """Exact symbol matches are fused in as a third ranking."""
+    symbol_search = MagicMock()
+    usecase, caller, definition = _usecase(symbol_search)
+    symbol_search.lookup.return_value = [(definition.id, 3.0)]
+
+    results = usecase.search(Query(text="add", topk=2))
+
+    assert [r.chunk.id for r in results] == [definition.id, caller.id]
+    assert results[0].explanation["symbol_score"] == 3.0
+    assert results[1].explanation["symbol_score"] == 0.0
+    symbol_search.lookup.assert_called_once_with(
+        "add", topk=100, path_filter=None, ref=None, prefix=False, fuzzy=False
+    )
+
+
+def test_descriptive_query_skips_symbol_lookup() -> None:
+    """Queries of several words are not looked up as symbols."""
+    symbol_search = MagicMock()
+    usecase, caller, _definition = _usecase(symbol_search)
+
+    results = usecase.search(Query(text="add numbers", topk=2))
+
+    assert results[0].chunk.id == caller.id
+    assert "symbol_score" not in results[0].explanation
+    symbol_search.lookup.assert_not_called()
@@ -0,0 +1,103 @@
+"""Tests for token-aware chunk sizing."""
+
+from pathlib import Path
+
+from ember.adapters.parsers.line_chunker import LineChunker
+from ember.adapters.parsers.tree_sitter_chunker import TreeSitterChunker
+from ember.core.chunking.chunk_usecase import ChunkFileRequest, ChunkFileUseCase
+from ember.core.chunking.token_sizing import ChunkSizer, TokenBudget
+from ember.ports.chunkers import ChunkData
+
+
+class WordCounter:
+    """Token counter treating every whitespace-separated word as a token."""
+
+    def count_tokens(self, texts: list[str]) -> list[int]:
+        return [len(text.split()) for text in texts]
+
+
+def _chunk(start: int, end: int, lines: list[str], symbol: str) -> ChunkData:
+    return ChunkData(
+        start_line=start,
+        end_line=end,
+        content="\n".join(lines[start - 1 : end]),
+        symbol=symbol,
+        lang="py",
+    )
+
+
+def test_fitting_chunk_is_unchanged() -> None:
+    """A definition within the token limit is kept as is."""
+    content = "def f():\n    return 1"
+    chunk = _chunk(1, 2, content.split("\n"), "f")
+
+    fitted = ChunkSizer(WordCounter(), TokenBudget(max_tokens=50)).fit([chunk], content)
+
+    assert fitted == [chunk]
+
+
+def test_oversized_chunk_is_split_with_overlap() -> None:
+    """A long definition becomes overlapping sub-chunks sharing its symbol."""
+    lines = ["def long():"] + [f"    x{i} = value + {i}" for i in range(20)]
+    content = "\n".join(lines)
+    chunk = _chunk(1, len(lines), lines, "long")
+
+    # Each body line is 4 words + 1 newline token = 5 tokens
+    fitted = ChunkSizer(
+        WordCounter(), TokenBudget(max_tokens=27, overlap_lines=1)
+    ).fit([chunk], content)
+
+    assert len(fitted) > 1
+    assert {c.symbol for c in fitted} == {"long"}
+    assert fitted[0].start_line == 1
+    assert fitted[-1].end_line == len(lines)
+    for previous, current in zip(fitted, fitted[1:], strict=False):
+        assert current.start_line == previous.end_line  # One line of overlap
+    for sub in fitted:
+        assert sum(len(line.split()) + 1 for line in sub.content.split("\n")) <= 25
+
+
+def test_tiny_adjacent_chunks_are_packed() -> None:
+    """Runs of tiny definitions are merged until they reach min_tokens."""
+    lines = [
+        "def a(): return 1",
+        "def b(): return 2",
+        "",
+        "def c(): return 3",
+        "def big():",
+        "    " + " ".join(["word"] * 20),
+    ]
+    content = "\n".join(lines)
+    chunks = [
+        _chunk(1, 1, lines, "a"),
+        _chunk(2, 2, lines, "b"),
+        _chunk(4, 4, lines, "c"),
+        _chunk(5, 6, lines, "big"),
+    ]
+
+    fitted = ChunkSizer(
+        WordCounter(), TokenBudget(max_tokens=100, min_tokens=10)
+    ).fit(chunks, content)
+
+    assert [(c.start_line, c.end_line, c.symbol) for c in fitted] == [
+        (1, 2, "a, b"),
+        (4, 4, "c"),
+        (5, 6, "big"),
+    ]
+    assert fitted[0].content == "def a(): return 1\ndef b(): return 2"
+
+
+def test_chunk_usecase_applies_sizer() -> None:
+    """Tree-sitter chunks are resized when the use case has a sizer."""
+    body = "\n".join(f"    total = total + {i}" for i in range(40))
+    content = f"def accumulate():\n    total = 0\n{body}\n    return total\n"
+    sizer = ChunkSizer(WordCounter(), TokenBudget(max_tokens=60, overlap_lines=2))
+    use_case = ChunkFileUseCase(TreeSitterChunker(), LineChunker(), sizer=sizer)
+
+    response = use_case.execute(
+        ChunkFileRequest(content=content, path=Path("acc.py"), lang="py")
+    )
+
+    assert response.strategy == "tree-sitter"
+    assert len(response.chunks) > 1
+    assert all(c.symbol == "accumulate" for c in response.chunks)
@@ -0,0 +1,137 @@
+"""Unit tests for WatchUseCase debouncing and state publishing."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+from ember.core.indexing.index_usecase import IndexResponse
+from ember.core.indexing.watch_usecase import WatchUseCase
+from ember.domain.entities import WatchState
+
+
+class ScriptedWatcher:
+    """FileWatcher that replays a fixed sequence of change batches."""
+
+    def __init__(self, batches: list[set[Path]]) -> None:
+        self.batches = list(batches)
+        self.timeouts: list[float | None] = []
+
+    def wait_for_changes(self, timeout: float | None = None) -> set[Path]:
+        self.timeouts.append(timeout)
+        return self.batches.pop(0) if self.batches else set()
+
+    def close(self) -> None:
+        pass
+
+
+def _response(success: bool = True, tree_sha: str = "tree1", error: str | None = None):
+    return IndexResponse(
+        files_indexed=1,
+        chunks_created=1,
+        chunks_updated=0,
+        chunks_deleted=0,
+        vectors_stored=1,
+        tree_sha=tree_sha,
+        success=success,
+        error=error,
+    )
+
+
+def _make_usecase(watcher: ScriptedWatcher, indexing: Mock, states: list[WatchState]):
+    return WatchUseCase(
+        watcher=watcher,
+        indexing_usecase=indexing,
+        repo_root=Path("/repo"),
+        on_state=states.append,
+        debounce_seconds=0.01,
+        max_delay_seconds=1.0,
+    )
+
+
+def test_burst_is_debounced_into_single_sync() -> None:
+    """Several change batches in a row result in one sync."""
+    watcher = ScriptedWatcher([{Path("/repo/b.py")}, {Path("/repo/c.py")}])
+    indexing = Mock()
+    indexing.execute.return_value = _response()
+    states: list[WatchState] = []
+
+    usecase = _make_usecase(watcher, indexing, states)
+    usecase.sync_after_burst({Path("/repo/a.py")})
+
+    assert indexing.execute.call_count == 1
+    request = indexing.execute.call_args.args[0]
+    assert request.sync_mode == "worktree"
+    assert [s.status for s in states] == ["pending", "syncing", "idle"]
+    assert states[-1].is_caught_up
+    assert states[-1].last_tree_sha == "tree1"
+
+
+def test_changes_during_sync_trigger_another_sync() -> None:
+    """Changes that arrive mid-sync keep the watcher from reporting idle."""
+    # Empty batch ends the first debounce; next batch is seen right after sync
+    watcher = ScriptedWatcher([set(), {Path("/repo/late.py")}])
+    indexing = Mock()
+    indexing.execute.side_effect = [_response(tree_sha="t1"), _response(tree_sha="t2")]
+    states: list[WatchState] = []
+
+    usecase = _make_usecase(watcher, indexing, states)
+    response = usecase.sync_after_burst({Path("/repo/a.py")})
+
+    assert indexing.execute.call_count == 2
+    assert response.tree_sha == "t2"
+    assert [s.status for s in states] == ["pending", "syncing", "pending", "syncing", "idle"]
+
+
+def test_sync_holds_lock() -> None:
+    """Each sync runs while holding the sync lock."""
+    watcher = ScriptedWatcher([])
+    lock = MagicMock()
+    indexing = Mock()
+
+    def execute(request):
+        lock.__enter__.assert_called_once()
+        lock.__exit__.assert_not_called()
+        return _response()
+
+    indexing.execute.side_effect = execute
+    usecase = WatchUseCase(
+        watcher=watcher, indexing_usecase=indexing, repo_root=Path("/repo"), sync_lock=lock
+    )
+    usecase.sync()
+
+    assert indexing.execute.call_count == 1
+    lock.__exit__.assert_called_once()
+
+
+def test_failed_sync_is_not_caught_up() -> None:
+    """A failed sync publishes idle state carrying the error."""
+    watcher = ScriptedWatcher([])
+    indexing = Mock()
+    indexing.execute.return_value = _response(success=False, tree_sha="", error="boom")
+    states: list[WatchState] = []
+
+    usecase = _make_usecase(watcher, indexing, states)
+    usecase.sync()
+
+    assert states[-1].status == "idle"
+    assert states[-1].last_error == "boom"
+    assert not states[-1].is_caught_up
+
+
+def test_run_performs_initial_sync_and_stops() -> None:
+    """run() syncs once up front and exits when the stop event is set."""
+    import threading
+
+    stop = threading.Event()
+    watcher = ScriptedWatcher([])
+    indexing = Mock()
+
+    def execute(request):
+        stop.set()
+        return _response()
+
+    indexing.execute.side_effect = execute
+    usecase = WatchUseCase(watcher=watcher, indexing_usecase=indexing, repo_root=Path("/repo"))
+
+    usecase.run(stop_event=stop, poll_timeout=0.01)
+
+    assert indexing.execute.call_count == 1
@@ -57,6 +57,25 @@ class TestIndexConfigValidation:
         with pytest.raises(ValueError, match="overlap_lines cannot be negative"):
             IndexConfig(overlap_lines=-1)
 
+    def test_index_config_chunk_token_limits_negative_raises_error(self):
+        """Test that negative chunk token limits raise ValueError."""
+        with pytest.raises(ValueError, match="max_chunk_tokens cannot be negative"):
+            IndexConfig(max_chunk_tokens=-1)
+        with pytest.raises(ValueError, match="min_chunk_tokens cannot be negative"):
+            IndexConfig(min_chunk_tokens=-1)
+
+    def test_index_config_unknown_chunk_strategy_raises_error(self):
+        """Test that an unknown chunk strategy raises ValueError."""
+        assert IndexConfig(chunk="hierarchical").chunk == "hierarchical"
+        with pytest.raises(ValueError, match="chunk must be"):
+            IndexConfig(chunk="paragraphs")
+
+    def test_index_config_unknown_fts_tokenizer_raises_error(self):
+        """Test that an unknown full-text search tokenizer raises ValueError."""
+        assert IndexConfig().fts_tokenizer == "code"
+        with pytest.raises(ValueError, match="fts_tokenizer must be"):
+            IndexConfig(fts_tokenizer="trigram")
+
     def test_index_config_overlap_lines_zero_valid(self):
         """Test that overlap_lines=0 is valid (no overlap)."""
         config = IndexConfig(overlap_lines=0)
@@ -70,6 +89,14 @@ class TestIndexConfigValidation:
         with pytest.raises(ValueError, match="overlap_lines.*must be less than.*line_window"):
             IndexConfig(line_window=100, overlap_lines=150)
 
+    def test_index_config_shard_prefix_outside_repo_raises_error(self):
+        """Test that shard prefixes must stay inside the repository."""
+        with pytest.raises(ValueError, match="shard_prefixes"):
+            IndexConfig(sharding="prefixes", shard_prefixes=["../other"])
+
+        with pytest.raises(ValueError, match="shard_prefixes"):
+            IndexConfig(sharding="prefixes", shard_prefixes=["/abs"])
+
 
 # =============================================================================
 # SearchConfig validation tests
@@ -176,6 +203,39 @@ class TestModelConfigValidation:
         with pytest.raises(ValueError, match="daemon_startup_timeout must be positive"):
             ModelConfig(daemon_startup_timeout=-1)
 
+    def test_model_config_backend_defaults_to_torch(self):
+        """Test that the torch backend is the default."""
+        config = ModelConfig()
+        assert config.backend == "torch"
+        assert config.quantize is True
+
+    def test_model_config_invalid_backend_raises_error(self):
+        """Test that an unknown backend raises ValueError."""
+        with pytest.raises(ValueError, match="backend must be"):
+            ModelConfig(backend="tensorrt")
+
+    def test_model_config_tuning_defaults(self):
+        """Test that untuned settings defer to the model and library defaults."""
+        config = ModelConfig()
+        assert config.batch_size == 32
+        assert config.threads == 0
+        assert config.max_seq_length == 0
+
+    def test_model_config_batch_size_zero_raises_error(self):
+        """Test that batch_size=0 raises ValueError."""
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            ModelConfig(batch_size=0)
+
+    def test_model_config_negative_threads_raises_error(self):
+        """Test that negative threads raises ValueError."""
+        with pytest.raises(ValueError, match="threads must be non-negative"):
+            ModelConfig(threads=-1)
+
+    def test_model_config_negative_max_seq_length_raises_error(self):
+        """Test that negative max_seq_length raises ValueError."""
+        with pytest.raises(ValueError, match="max_seq_length must be non-negative"):
+            ModelConfig(max_seq_length=-1)
+
 
 # =============================================================================
 # DisplayConfig validation tests (no validation needed, just literal types)
@@ -88,6 +88,15 @@ class TestQueryValidation:
         query = Query(text="search", topk=100)
         assert query.topk == 100
 
+    def test_query_default_mode_is_hybrid(self):
+        """Test Query runs both retrievers by default."""
+        assert Query(text="search").mode == "hybrid"
+
+    def test_query_unknown_mode_raises_error(self):
+        """Test that an unknown search mode raises ValueError."""
+        with pytest.raises(ValueError, match="mode must be one of"):
+            Query(text="search", mode="bm25")
+
 
 # =============================================================================
 # Chunk validation tests
@@ -0,0 +1,59 @@
+"""Tests for assigning paths to index shards."""
+
+from pathlib import Path
+
+from ember.domain.sharding import ROOT_SHARD, ShardLayout
+
+
+class TestShardLayout:
+    """Tests for ShardLayout."""
+
+    def test_prefixes_are_normalized(self) -> None:
+        """Slashes are stripped and duplicates removed."""
+        layout = ShardLayout(("web/", "/services/api", "web"))
+
+        assert layout.prefixes == ("services/api", "web")
+        assert layout.shards() == [ROOT_SHARD, "services/api", "web"]
+
+    def test_top_level(self) -> None:
+        """Top-level sharding makes one shard per top-level directory."""
+        layout = ShardLayout.top_level(
+            [Path("setup.py"), Path("web/app.ts"), Path("api/x/y.py"), Path(".github/ci.py")]
+        )
+
+        assert layout.prefixes == ("api", "web")
+
+    def test_shard_of_uses_longest_prefix(self) -> None:
+        """Nested prefixes take the files under them."""
+        layout = ShardLayout(("services", "services/api"))
+
+        assert layout.shard_of(Path("services/api/handler.py")) == "services/api"
+        assert layout.shard_of(Path("services/billing/invoice.py")) == "services"
+        assert layout.shard_of(Path("services_old/main.py")) == ROOT_SHARD
+        assert layout.shard_of(Path("main.py")) == ROOT_SHARD
+
+    def test_shards_for_without_filter(self) -> None:
+        """Unfiltered queries go to every shard."""
+        layout = ShardLayout(("api", "web"))
+
+        assert layout.shards_for(None) == [ROOT_SHARD, "api", "web"]
+        assert layout.shards_for("*.py") == [ROOT_SHARD, "api", "web"]
+
+    def test_shards_for_prunes_by_directory(self) -> None:
+        """A filter inside a shard's directory only queries that shard."""
+        layout = ShardLayout(("services", "services/api", "web"))
+
+        assert layout.shards_for("web/**") == ["web"]
+        assert layout.shards_for("services/api/*.py") == ["services/api"]
+        assert layout.shards_for("services/**") == ["services", "services/api"]
+        assert layout.shards_for("docs/**") == [ROOT_SHARD]
+
+    def test_shards_for_partial_name(self) -> None:
+        """A wildcard inside a directory name keeps every shard it could match."""
+        layout = ShardLayout(("services/api", "services/auth", "web"))
+
+        assert layout.shards_for("services/a*/**") == [
+            ROOT_SHARD,
+            "services/api",
+            "services/auth",
+        ]
@@ -266,3 +266,15 @@ def test_chunk_usecase_preserves_metadata():
     # Check metadata is preserved
     for chunk in response.chunks:
         assert chunk.lang == "rs"
+
+
+def test_chunk_usecase_stream_matches_line_windows():
+    """Test streamed chunks match line-based chunks of the decoded file."""
+    line_chunker = LineChunker(window_size=4, stride=3)
+    use_case = ChunkFileUseCase(TreeSitterChunker(), line_chunker)
+    content = "\n".join(f"row_{i} = {i}  # é" for i in range(23)) + "\n"
+
+    streamed = list(use_case.stream(content.encode("utf-8"), "py"))
+
+    assert streamed == line_chunker.chunk_file(content, Path("rows.py"), "py")
+    assert streamed[-1].end_line == 24  # Trailing newline ends in an empty line
@@ -3,8 +3,10 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from ember.adapters.config.toml_config_provider import TomlConfigProvider
-from ember.shared.config_io import create_default_config_file
+from ember.shared.config_io import create_default_config_file, update_config_section
 
 
 def test_load_config_with_valid_file():
@@ -154,3 +156,39 @@ topk = 100
         # Defaults for missing sections
         assert config.index.line_window == 120
         assert config.redaction.max_file_mb == 5
+
+
+def test_update_config_section_keeps_other_settings():
+    """Test that saving tuned model settings leaves other keys alone."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ember_dir = Path(tmpdir) / ".ember"
+        ember_dir.mkdir()
+        config_path = ember_dir / "config.toml"
+        config_path.write_text("""
+[search]
+topk = 50
+
+[model]
+backend = "onnx"
+""")
+
+        update_config_section(config_path, "model", {"batch_size": 64, "threads": 4})
+
+        config = TomlConfigProvider().load(ember_dir)
+        assert config.search.topk == 50
+        assert config.model.backend == "onnx"
+        assert config.model.batch_size == 64
+        assert config.model.threads == 4
+        # Untouched sections are not filled in with defaults
+        assert "index" not in config_path.read_text()
+
+
+def test_update_config_section_rejects_invalid_values():
+    """Test that invalid values are not written to disk."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.toml"
+
+        with pytest.raises(ValueError, match="batch_size"):
+            update_config_section(config_path, "model", {"batch_size": 0})
+
+        assert not config_path.exists()
@@ -337,3 +337,88 @@ class TestEnsureSyncedReturnsStatus:
             assert result.synced is False
             assert result.error is not None
             assert "Git error" in result.error
+
+
+class TestEnsureSyncedBackground:
+    """Tests for stale-while-revalidate mode (background=True)."""
+
+    def test_spawns_worker_and_returns_immediately_when_stale(self, tmp_path: Path) -> None:
+        """A stale index is handed to a background worker without indexing inline."""
+        from ember.entrypoints.cli import ensure_synced
+
+        ember_dir = tmp_path / ".ember"
+        ember_dir.mkdir()
+
+        with (
+            patch("ember.adapters.git_cmd.git_adapter.GitAdapter") as mock_git,
+            patch("ember.adapters.sqlite.meta_repository.SQLiteMetaRepository") as mock_meta,
+            patch("ember.entrypoints.cli._create_indexing_usecase") as mock_usecase,
+            patch("ember.entrypoints.cli._spawn_background_sync") as mock_spawn,
+        ):
+            mock_git.return_value.get_worktree_tree_sha.return_value = "new_sha"
+            mock_meta.return_value.get.return_value = "old_sha"
+
+            result = ensure_synced(
+                repo_root=tmp_path,
+                db_path=ember_dir / "index.db",
+                config=MagicMock(),
+                background=True,
+            )
+
+            assert result.in_progress is True
+            assert result.synced is False
+            mock_spawn.assert_called_once_with(tmp_path, ember_dir)
+            mock_usecase.assert_not_called()
+
+    def test_no_worker_when_up_to_date(self, tmp_path: Path) -> None:
+        """No worker is spawned when the index is current."""
+        from ember.entrypoints.cli import ensure_synced
+
+        ember_dir = tmp_path / ".ember"
+        ember_dir.mkdir()
+
+        with (
+            patch("ember.adapters.git_cmd.git_adapter.GitAdapter") as mock_git,
+            patch("ember.adapters.sqlite.meta_repository.SQLiteMetaRepository") as mock_meta,
+            patch("ember.entrypoints.cli._spawn_background_sync") as mock_spawn,
+        ):
+            mock_git.return_value.get_worktree_tree_sha.return_value = "same_sha"
+            mock_meta.return_value.get.return_value = "same_sha"
+
+            result = ensure_synced(
+                repo_root=tmp_path,
+                db_path=ember_dir / "index.db",
+                config=MagicMock(),
+                background=True,
+            )
+
+            assert result.in_progress is False
+            mock_spawn.assert_not_called()
+
+    def test_reports_in_progress_when_lock_held(self, tmp_path: Path) -> None:
+        """A sync already holding the lock means results may be stale; no new worker."""
+        from ember.entrypoints.cli import ensure_synced
+        from ember.shared.sync_lock import SyncLock
+
+        ember_dir = tmp_path / ".ember"
+        ember_dir.mkdir()
+        holder = SyncLock(ember_dir / "sync.lock")
+        assert holder.acquire(blocking=False)
+
+        try:
+            with (
+                patch("ember.adapters.git_cmd.git_adapter.GitAdapter") as mock_git,
+                patch("ember.entrypoints.cli._spawn_background_sync") as mock_spawn,
+            ):
+                result = ensure_synced(
+                    repo_root=tmp_path,
+                    db_path=ember_dir / "index.db",
+                    config=MagicMock(),
+                    background=True,
+                )
+
+                assert result.in_progress is True
+                mock_spawn.assert_not_called()
+                mock_git.return_value.get_worktree_tree_sha.assert_not_called()
+        finally:
+            holder.release()
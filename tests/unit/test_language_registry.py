@@ -240,3 +240,14 @@ def test_lazy_init_memory_efficiency():
     # Other languages not loaded
     assert "go" not in registry._parser_cache
     assert "rust" not in registry._parser_cache
+
+
+def test_get_query_compiles_once():
+    """Test the definition query of a language is compiled once and reused."""
+    registry = LanguageRegistry()
+
+    query = registry.get_query("python")
+
+    assert query is not None
+    assert registry.get_query("python") is query
+    assert registry.get_query("cobol") is None
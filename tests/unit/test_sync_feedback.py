@@ -19,6 +19,10 @@ class MockIndexResponse:
     vectors_stored: int = 0
     tree_sha: str = "abc123def456"
     files_failed: int = 0
+    files_resumed: int = 0
+    vectors_cached: int = 0
+    files_restored: int = 0
+    files_skipped: int = 0
     is_incremental: bool = False
     success: bool = True
     error: str | None = None
@@ -138,3 +142,33 @@ class TestFormatSyncResults:
             _format_sync_results(response)
             calls = [call.args[0] for call in mock_echo.call_args_list]
             assert not any("Tree SHA" in call for call in calls)
+
+    def test_resumed_files_shown(self) -> None:
+        """Files carried over from an interrupted sync are reported."""
+        from ember.entrypoints.cli import _format_sync_results
+
+        response = MockIndexResponse(files_indexed=2, files_resumed=3, chunks_created=4)
+        with patch("click.echo") as mock_echo:
+            _format_sync_results(response)
+            calls = [call.args[0] for call in mock_echo.call_args_list]
+            assert any("3 files resumed" in c for c in calls)
+
+    def test_restored_files_shown(self) -> None:
+        """Files restored from another indexed ref are reported."""
+        from ember.entrypoints.cli import _format_sync_results
+
+        response = MockIndexResponse(files_indexed=5, files_restored=4, chunks_created=2)
+        with patch("click.echo") as mock_echo:
+            _format_sync_results(response)
+            calls = [call.args[0] for call in mock_echo.call_args_list]
+            assert any("4 files restored" in c for c in calls)
+
+    def test_skipped_files_shown(self) -> None:
+        """Generated, minified and vendored files left out are reported."""
+        from ember.entrypoints.cli import _format_sync_results
+
+        response = MockIndexResponse(files_indexed=3, files_skipped=2, chunks_created=5)
+        with patch("click.echo") as mock_echo:
+            _format_sync_results(response)
+            calls = [call.args[0] for call in mock_echo.call_args_list]
+            assert any("2 generated, minified or vendored files skipped" in c for c in calls)
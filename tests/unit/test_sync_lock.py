@@ -0,0 +1,73 @@
+"""Tests for the inter-process sync lock."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from ember.shared.sync_lock import SyncLock
+
+
+def test_acquire_and_release(tmp_path: Path) -> None:
+    """Lock can be acquired, reports held, and released."""
+    lock = SyncLock(tmp_path / "sync.lock")
+
+    assert lock.acquire(blocking=False)
+    assert lock.held
+    lock.release()
+    assert not lock.held
+
+
+def test_second_holder_is_rejected(tmp_path: Path) -> None:
+    """A second non-blocking acquire fails while the lock is held."""
+    first = SyncLock(tmp_path / "sync.lock")
+    second = SyncLock(tmp_path / "sync.lock")
+
+    with first:
+        assert second.is_locked()
+        assert not second.acquire(blocking=False)
+
+    assert not second.is_locked()
+    assert second.acquire(blocking=False)
+    second.release()
+
+
+def test_lock_is_visible_across_processes(tmp_path: Path) -> None:
+    """A lock held by this process blocks another process."""
+    lock_path = tmp_path / "sync.lock"
+    code = (
+        "import sys; from pathlib import Path; from ember.shared.sync_lock import SyncLock; "
+        f"sys.exit(0 if SyncLock(Path({str(lock_path)!r})).acquire(blocking=False) else 3)"
+    )
+
+    with SyncLock(lock_path):
+        held = subprocess.run([sys.executable, "-c", code])
+    free = subprocess.run([sys.executable, "-c", code])
+
+    assert held.returncode == 3
+    assert free.returncode == 0
+
+
+def test_missing_directory_is_uncontended(tmp_path: Path) -> None:
+    """Without a lock directory there is nothing to protect; acquire succeeds."""
+    lock = SyncLock(tmp_path / "missing" / "sync.lock")
+
+    assert lock.acquire(blocking=False)
+    lock.release()
+    assert not (tmp_path / "missing").exists()
+
+
+def test_sync_worker_exits_when_lock_held(tmp_path: Path) -> None:
+    """The background worker does nothing if another sync holds the lock."""
+    from unittest.mock import patch
+
+    from ember.entrypoints.sync_worker import run_sync
+
+    ember_dir = tmp_path / ".ember"
+    ember_dir.mkdir()
+
+    with (
+        SyncLock(ember_dir / "sync.lock"),
+        patch("ember.entrypoints.cli._create_indexing_usecase") as mock_usecase,
+    ):
+        assert run_sync(tmp_path, ember_dir) == 0
+        mock_usecase.assert_not_called()
@@ -295,6 +295,17 @@ def valid():
     assert isinstance(chunks, list)
 
 
+def test_tree_sitter_missing_query(monkeypatch, caplog):
+    """Test a language whose query cannot be initialized yields no chunks."""
+    chunker = TreeSitterChunker()
+    monkeypatch.setattr(chunker._registry, "get_query", lambda name: None)
+
+    chunks = chunker.chunk_file("def f():\n    return 1\n", Path("test.py"), "py")
+
+    assert chunks == []
+    assert "Failed to initialize query for python" in caplog.text
+
+
 def test_tree_sitter_java_functions():
     """Test tree-sitter extracts Java classes and methods."""
     chunker = TreeSitterChunker()
@@ -2181,3 +2192,42 @@ fn sync_function() -> i32 {
     assert "fetch_user" in symbols
     assert "process_data" in symbols
     assert "sync_function" in symbols
+
+
+def _chunk_spans(chunks):
+    return [(c.start_line, c.end_line, c.symbol, c.content) for c in chunks]
+
+
+def test_tree_sitter_incremental_reparse_matches_fresh_parse():
+    """Test re-chunking an edited file reuses its tree and matches a fresh parse."""
+    chunker = TreeSitterChunker()
+    path = Path("service.py")
+    versions = [
+        "def alpha():\n    return 1\n\n\ndef beta():\n    return 2\n",
+        # Edit in the middle, changing line count
+        "def alpha():\n    x = 1\n    return x\n\n\ndef beta():\n    return 2\n",
+        # Insert a definition at the start
+        "def zero():\n    pass\n\n\ndef alpha():\n    x = 1\n    return x\n\n\ndef beta():\n"
+        "    return 2\n",
+        # Delete the end, with non-ASCII text before the edit
+        "def zero():\n    pass  # ünïcode\n\n\ndef alpha():\n    return 'é'\n",
+        # Unchanged content
+        "def zero():\n    pass  # ünïcode\n\n\ndef alpha():\n    return 'é'\n",
+    ]
+
+    for content in versions:
+        incremental = chunker.chunk_file(content, path, "py")
+        fresh = TreeSitterChunker(tree_cache_size=0).chunk_file(content, path, "py")
+        assert _chunk_spans(incremental) == _chunk_spans(fresh)
+
+    assert len(chunker._trees) == 1
+
+
+def test_tree_sitter_tree_cache_is_bounded():
+    """Test only the most recently chunked files keep their trees."""
+    chunker = TreeSitterChunker(tree_cache_size=2)
+
+    for name in ["a.py", "b.py", "c.py"]:
+        chunker.chunk_file("def f():\n    pass\n", Path(name), "py")
+
+    assert [key[0] for key in chunker._trees] == ["b.py", "c.py"]
@@ -0,0 +1,59 @@
+"""Tests for watch.json state I/O and live-watcher detection."""
+
+import os
+from pathlib import Path
+
+from ember.domain.entities import IndexFreshness, WatchState
+from ember.entrypoints.cli import SyncResult, _index_freshness, _load_live_watch_state
+from ember.shared.state_io import load_watch_state, save_watch_state
+
+
+def test_watch_state_round_trip(tmp_path: Path) -> None:
+    """Saved watch state loads back unchanged."""
+    state = WatchState(pid=123, status="syncing", last_tree_sha="abc", updated_at=1.5)
+    path = tmp_path / "watch.json"
+
+    save_watch_state(state, path)
+
+    assert load_watch_state(path) == state
+    assert not path.with_suffix(".json.tmp").exists()
+
+
+def test_load_watch_state_missing_or_corrupt(tmp_path: Path) -> None:
+    """Missing or corrupt state files load as None."""
+    path = tmp_path / "watch.json"
+    assert load_watch_state(path) is None
+
+    path.write_text("{not json")
+    assert load_watch_state(path) is None
+
+
+def test_live_watch_state_requires_running_process(tmp_path: Path) -> None:
+    """State from a dead watcher process is ignored."""
+    live = WatchState(pid=os.getpid(), status="idle", last_tree_sha="abc", updated_at=0.0)
+    save_watch_state(live, tmp_path / "watch.json")
+    assert _load_live_watch_state(tmp_path) == live
+
+    # PIDs above the kernel maximum can never be alive
+    dead = WatchState(pid=2**22 + 1, status="idle", last_tree_sha="abc", updated_at=0.0)
+    save_watch_state(dead, tmp_path / "watch.json")
+    assert _load_live_watch_state(tmp_path) is None
+
+
+def test_index_freshness_from_watcher_or_sync() -> None:
+    """Freshness comes from a running watcher, else from the pre-search sync."""
+    watching = WatchState(
+        pid=1, status="pending", last_tree_sha="abc", updated_at=0.0, last_error="boom"
+    )
+    assert _index_freshness(watching, None) == IndexFreshness(
+        caught_up=False, pending=True, last_error="boom"
+    )
+
+    assert _index_freshness(None, SyncResult(synced=True)) == IndexFreshness(caught_up=True)
+    assert _index_freshness(None, SyncResult(in_progress=True)) == IndexFreshness(
+        caught_up=False, pending=True
+    )
+    assert _index_freshness(None, SyncResult(error="disk full")) == IndexFreshness(
+        caught_up=False, last_error="disk full"
+    )
+    assert _index_freshness(None, None) is None  # --no-sync